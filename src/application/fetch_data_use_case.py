@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from typing import TYPE_CHECKING
 
+from src.application.materialize_rollups_use_case import MaterializeRollupsUseCase
 from src.domain.models import Channel, VideoPoint
 from src.domain.services.scoring_service import score_and_rank_video_points
-from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
-from src.infrastructure.storage.video_repository import VideoRepository
 from src.shared.logging import get_logger
 
 if TYPE_CHECKING:
     from src.adapters.youtube_source import YouTubeSource
     from src.config.settings import AppSettings
+    from src.domain.ports import (
+        DailySnapshotWriter,
+        TimeSeriesExportWriter,
+        TimeSeriesReader,
+        TimeSeriesRollupReader,
+        TimeSeriesRollupWriter,
+        TimeSeriesStore,
+        VideoMetadataWriter,
+    )
 
 logger = get_logger(__name__)
 
@@ -25,16 +32,26 @@ class FetchDataUseCase:
     def __init__(
         self,
         youtube_source: YouTubeSource,
-        video_repo: VideoRepository,
-        timeseries_repo: TimeSeriesRepository,
+        video_repo: VideoMetadataWriter,
+        timeseries_repo: TimeSeriesStore,
         settings: AppSettings | None = None,
         force_fetch: bool = False,
+        *,
+        snapshot_writer: DailySnapshotWriter | None = None,
+        rollup_reader: TimeSeriesRollupReader | None = None,
+        rollup_writer: TimeSeriesRollupWriter | None = None,
+        timeseries_export: TimeSeriesExportWriter | None = None,
     ) -> None:
+        """Initialize with the stores of the configured backend; derived stores left out are not written."""
         self.youtube_source = youtube_source
         self.video_repo = video_repo
         self.timeseries_repo = timeseries_repo
         self.settings = settings
         self.force_fetch = force_fetch
+        self.snapshot_writer = snapshot_writer
+        self.rollup_reader = rollup_reader
+        self.rollup_writer = rollup_writer
+        self.timeseries_export = timeseries_export
 
     async def execute(self) -> list[VideoPoint]:
         """Execute the fetch data workflow.
@@ -43,26 +60,19 @@ class FetchDataUseCase:
             List of VideoPoint objects that were added to timeseries.
         """
         settings = self.settings or self._get_settings()
-        db_video_file = settings.db_video_file
-        db_timeseries_file = settings.db_timeseries_file
 
-        # Repositories are already injected, but we need to ensure they use correct paths
-        # This maintains backward compatibility with existing repository constructors
-        video_repo = VideoRepository(Path(db_video_file))
-        timeseries_repo = TimeSeriesRepository(db_timeseries_file)
-
-        if not self.force_fetch and not self._is_passed_enough_time_from_last_fetch(timeseries_repo):
+        if not self.force_fetch and not self._is_passed_enough_time_from_last_fetch(self.timeseries_repo):
             logger.debug("Not enough time elapsed since last fetch")
             return []
 
         if self.force_fetch:
             logger.info("fetch_data.manual_force_enabled")
 
-        last_timestamp = timeseries_repo.get_last_timestamp()
+        last_timestamp = self.timeseries_repo.get_last_timestamp()
         if last_timestamp:
             from_dt = last_timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
             until_dt = from_dt + timedelta(days=1)
-            last_timeseries_videos_fetched = timeseries_repo.get_video_points_by_date_range(from_dt, until_dt)
+            last_timeseries_videos_fetched = self.timeseries_repo.get_video_points_by_date_range(from_dt, until_dt)
         else:
             last_timeseries_videos_fetched = []
 
@@ -76,10 +86,11 @@ class FetchDataUseCase:
 
         # Step 2: fetch full video details in batch
         details = await self.youtube_source.fetch_video_details_batch(video_id_list)
+        # One atomic rewrite of the video table instead of one per video.
+        self.video_repo.upsert_many(details)
 
         for video_item in details:
             logger.debug("video details", video_details=video_item.model_dump())
-            video_repo.upsert(video_item)
 
             last_video_point = VideoPoint(
                 time=datetime.now(UTC),
@@ -104,8 +115,10 @@ class FetchDataUseCase:
             zero_growth_count=zero_growth_count,
         )
 
-        for video_point in scored_points:
-            timeseries_repo.add_video_point(video_point=video_point)
+        self.timeseries_repo.add_video_points(scored_points)
+
+        if scored_points:
+            self._write_derived_stores(scored_points, last_timestamp)
 
         logger.info(
             "Finish fetch YT Data",
@@ -113,13 +126,47 @@ class FetchDataUseCase:
         )
         return scored_points
 
+    def _write_derived_stores(self, scored_points: list[VideoPoint], previous_last_timestamp: datetime | None) -> None:
+        """Bring the stores derived from the timeseries up to date with the points just added."""
+        day = scored_points[0].time.date()
+        if self.timeseries_export is not None:
+            # Memory-mapped copy of the whole timeseries served read-only by the web process.
+            # Written first: the web has no fallback once it exists, so it must never miss a batch.
+            self._update_timeseries_export(self.timeseries_export, scored_points, previous_last_timestamp)
+        if self.snapshot_writer is not None:
+            # Columnar copy of the day for array-based ranking (see FetchTopVideosUseCase).
+            self.snapshot_writer.write_day(day, scored_points)
+        if self.rollup_reader is not None and self.rollup_writer is not None:
+            # Per-video daily/weekly closes, read by ranking as previous-period baselines.
+            MaterializeRollupsUseCase(self.timeseries_repo, self.rollup_reader, self.rollup_writer).execute(day)
+
+    def _update_timeseries_export(
+        self,
+        timeseries_export: TimeSeriesExportWriter,
+        scored_points: list[VideoPoint],
+        previous_last_timestamp: datetime | None,
+    ) -> None:
+        """Append the batch to the export, or rebuild it when it does not end where the timeseries did."""
+        if timeseries_export.exists():
+            export_last_timestamp = timeseries_export.get_last_timestamp()
+            if export_last_timestamp == previous_last_timestamp:
+                timeseries_export.append(scored_points)
+                return
+            # A previous run stopped between the timeseries write and the export update.
+            logger.warning(
+                "fetch_data.timeseries_export_out_of_sync",
+                export_last_timestamp=str(export_last_timestamp),
+                timeseries_last_timestamp=str(previous_last_timestamp),
+            )
+        timeseries_export.rebuild_from(self.timeseries_repo)
+
     def _get_settings(self) -> AppSettings:
         """Get application settings."""
         from src.config.settings import get_app_settings
 
         return get_app_settings()
 
-    def _is_passed_enough_time_from_last_fetch(self, timeseries_repo: TimeSeriesRepository, min_days: int = 1) -> bool:
+    def _is_passed_enough_time_from_last_fetch(self, timeseries_repo: TimeSeriesReader, min_days: int = 1) -> bool:
         """Check if enough calendar days have passed since last fetch.
 
         Uses calendar-day comparison instead of strict elapsed seconds to prevent
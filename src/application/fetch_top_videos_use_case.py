@@ -7,14 +7,20 @@ from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from src.domain.exceptions import ScoringError
-from src.domain.models import Channel, TimeseriesRange, Video, VideoPoint
-from src.domain.services.scoring_service import datetime_range_start, score_and_rank_video_points
+from src.domain.models import Channel, TimeseriesRange, Video, VideoPoint, VideoPointRecord
+from src.domain.services.scoring_service import datetime_range_start, score_and_rank_video_records
 from src.shared.logging import get_logger
 
 if TYPE_CHECKING:
     from pydantic import PastDate
 
-    from src.domain.ports import TimeSeriesReader, VideoMetadataReader
+    from src.domain.models import CanonicalVideo
+    from src.domain.ports import (
+        DailySnapshotReader,
+        TimeSeriesReader,
+        TimeSeriesRollupReader,
+        VideoMetadataReader,
+    )
 
 logger = get_logger(__name__)
 
@@ -49,23 +55,71 @@ class FetchTopVideosUseCase:
     2. Fetch current period's videos
     3. Calculate growth, assign ranking and status (NEW/UP/DOWN/EQUAL)
     4. Return ranked list
+
+    When a snapshot reader is available and both days have snapshots, the
+    reader ranks the whole day itself (on columnar arrays); otherwise ranking
+    runs on lightweight timeseries records. Either way only the top-N rows are
+    turned into models. The previous-period baseline is read from the
+    materialized daily closes when a rollup reader has them, which avoids
+    scanning the baseline day.
     """
 
     def __init__(
         self,
         timeseries_repo: TimeSeriesReader,
         video_metadata_repo: VideoMetadataReader,
+        snapshot_reader: DailySnapshotReader | None = None,
+        rollup_reader: TimeSeriesRollupReader | None = None,
     ) -> None:
         """Initialize with repository."""
         self._timeseries_repo = timeseries_repo
         self._video_metadata_repo = video_metadata_repo
+        self._snapshot_reader = snapshot_reader
+        self._rollup_reader = rollup_reader
 
     async def execute(self, request: FetchTopVideosRequest) -> FetchTopVideosResult:
         """Execute ranking workflow."""
         day = request.day or datetime.now(UTC).date()
 
+        ranked = self._rank_from_snapshots(request, day)
+        if ranked is None:
+            ranked = self._rank_from_timeseries(request, day)
+
+        # Hydrate ranked points with canonical metadata from the video repository, in one lookup.
+        top_ranked = ranked[: request.limit]
+        canonical_videos = self._video_metadata_repo.get_many(video_point.video_id for video_point in top_ranked)
+        hydrated_ranked = [
+            self._hydrate_video_metadata(video_point, canonical_videos.get(video_point.video_id))
+            for video_point in top_ranked
+        ]
+        videos = tuple(Video.model_validate(video_point.model_dump()) for video_point in hydrated_ranked)
+
+        return FetchTopVideosResult(videos=videos)
+
+    def _rank_from_snapshots(self, request: FetchTopVideosRequest, day: PastDate) -> list[VideoPoint] | None:
+        """Rank top-N points from the daily snapshots, or None when they are unavailable."""
+        if self._snapshot_reader is None:
+            return None
+
+        current_day = self._calculate_datetime_for_range(TimeseriesRange.DAILY, day + timedelta(days=1)).date()
+        previous_day = self._calculate_datetime_for_range(request.timeseries_range, day).date()
+        ranked = self._snapshot_reader.rank_day(
+            current_day,
+            previous_day,
+            baseline=self._read_previous_closes(request.timeseries_range, day),
+            limit=request.limit,
+        )
+        if ranked is None:
+            # A snapshot is missing (e.g. the baseline day predates them); fall back to raw points.
+            return None
+        return [record.to_video_point() for record in ranked]
+
+    def _rank_from_timeseries(self, request: FetchTopVideosRequest, day: PastDate) -> list[VideoPoint]:
+        """Rank records read from the timeseries repository and return the top-N as models."""
         # Fetch previous period
-        previous_list = self._get_defined_range_timeseries_videos(request.timeseries_range, day)
+        previous_list = self._read_previous_closes(request.timeseries_range, day)
+        if previous_list is None:
+            previous_list = self._get_defined_range_timeseries_videos(request.timeseries_range, day)
 
         # Fetch current period (today)
         current_list = self._get_defined_range_timeseries_videos(TimeseriesRange.DAILY, day + timedelta(days=1))
@@ -76,17 +130,26 @@ class FetchTopVideosUseCase:
             raise ScoringError(error_msg)
 
         # Rank and compare
-        ranked = score_and_rank_video_points(current_list, previous_list)
+        ranked = score_and_rank_video_records(current_list, previous_list)
+        return [record.to_video_point() for record in ranked[: request.limit]]
 
-        # Hydrate ranked points with canonical metadata from the video repository.
-        hydrated_ranked = [self._hydrate_video_metadata(video_point) for video_point in ranked[: request.limit]]
-        videos = tuple(Video.model_validate(video_point.model_dump()) for video_point in hydrated_ranked)
-
-        return FetchTopVideosResult(videos=videos)
+    def _read_previous_closes(
+        self,
+        timeseries_range: TimeseriesRange,
+        day: PastDate,
+    ) -> list[VideoPointRecord] | None:
+        """Return the materialized closes of the baseline day, or None when not available."""
+        if self._rollup_reader is None:
+            return None
+        previous_day = self._calculate_datetime_for_range(timeseries_range, day).date()
+        closes = self._rollup_reader.read_daily(previous_day)
+        if closes is None:
+            return None
+        return [close.to_record() for close in closes]
 
-    def _hydrate_video_metadata(self, video_point: VideoPoint) -> VideoPoint:
+    @staticmethod
+    def _hydrate_video_metadata(video_point: VideoPoint, canonical_video: CanonicalVideo | None) -> VideoPoint:
         """Enrich a timeseries point with canonical metadata when available."""
-        canonical_video = self._video_metadata_repo.get(video_point.video_id)
         if canonical_video is None:
             return video_point
 
@@ -110,11 +173,11 @@ class FetchTopVideosUseCase:
         self,
         timeseries_range: TimeseriesRange,
         day: PastDate,
-    ) -> list[VideoPoint]:
-        """Fetch VideoPoints from a specific date range."""
+    ) -> list[VideoPointRecord]:
+        """Fetch timeseries records from a specific date range."""
         from_dt = self._calculate_datetime_for_range(timeseries_range, day)
         until_dt = from_dt + timedelta(days=1)
-        return self._timeseries_repo.get_video_points_by_date_range(from_dt, until_dt)
+        return self._timeseries_repo.get_video_records_by_date_range(from_dt, until_dt)
 
     @staticmethod
     def _calculate_datetime_for_range(
@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
-import re
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from src.domain.models import Platform, ReleaseKind, TaskMethod, TaskRunStatus
 from src.shared.logging import get_logger
 
 if TYPE_CHECKING:
-    from src.domain.ports import ReleaseStore, TaskRunStateReader
+    from src.domain.models import TaskRunSnapshot
+    from src.domain.ports import ReleaseStore, TaskRunStateReader, VideoArtifactIndex
 
 logger = get_logger(__name__)
 _RUNNING_WINDOW = timedelta(minutes=3)
+_TIMELINE_WINDOW = timedelta(days=7)
+
+
+def is_task_complete(task_run_state_reader: TaskRunStateReader, task_method: str) -> bool:
+    """Return whether the task has run and is not running now, from its latest event alone."""
+    try:
+        method = TaskMethod(task_method)
+    except ValueError:
+        return False
+    latest = task_run_state_reader.get_latest_task_event(task_method=method)
+    return latest is not None and latest.status != TaskRunStatus.QUEUED
 
 
 @dataclass(frozen=True)
@@ -41,10 +53,10 @@ class TaskStatusResult:
     """Latest daily vertical publish timestamp per platform (unix seconds)."""
 
     latest_video_artifact_path: str | None = None
-    """Most recent generated mp4 artifact path under videos folder, if any."""
+    """Most recent rendered mp4 artifact path under videos folder, if any."""
 
     latest_video_artifact_timestamp: float | None = None
-    """Filesystem mtime (unix seconds) for latest generated mp4 artifact, if any."""
+    """Filesystem mtime (unix seconds) for latest rendered mp4 artifact, if any."""
 
     running_methods: set[str] = field(default_factory=set)
     """Methods whose latest status is 'queued' (task is currently executing)."""
@@ -57,19 +69,21 @@ class GetAdminTaskStatusUseCase:
     """
     Read current task execution status from repositories.
 
-    Reads from TaskRunStateRepository (TinyFlux): queued/success/failed events.
+    Reads from TaskRunStateRepository (TinyFlux): queued/success/failed events,
+    all taken from one ``snapshot()`` of the store per call. The latest
+    rendered video comes from the VideoArtifactIndex, not a folder walk.
     """
 
     def __init__(
         self,
         task_run_state_reader: TaskRunStateReader,
         release_store: ReleaseStore,
-        video_generated_folder: str,
+        artifact_index: VideoArtifactIndex,
     ) -> None:
         """Initialize with repository ports."""
         self._task_run_state_reader = task_run_state_reader
         self._release_store = release_store
-        self._video_generated_folder = video_generated_folder
+        self._artifact_index = artifact_index
 
     def execute(self) -> TaskStatusResult:
         """
@@ -78,25 +92,18 @@ class GetAdminTaskStatusUseCase:
         Returns:
             TaskStatusResult with fetch timestamp and release statuses by platform.
         """
-        fetch_last = self._task_run_state_reader.get_latest_task_event(
-            task_method=TaskMethod.FETCH,
-            status=TaskRunStatus.SUCCESS,
-        )
-        daily_last = self._task_run_state_reader.get_latest_task_event(
-            task_method=TaskMethod.DAILY,
-            status=TaskRunStatus.SUCCESS,
-        )
-        weekly_last = self._task_run_state_reader.get_latest_task_event(
-            task_method=TaskMethod.WEEKLY,
-            status=TaskRunStatus.SUCCESS,
-        )
+        now = datetime.now(UTC)
+        snapshot = self._task_run_state_reader.snapshot(since=now - _TIMELINE_WINDOW)
+        fetch_last = snapshot.latest(TaskMethod.FETCH, TaskRunStatus.SUCCESS)
+        daily_last = snapshot.latest(TaskMethod.DAILY, TaskRunStatus.SUCCESS)
+        weekly_last = snapshot.latest(TaskMethod.WEEKLY, TaskRunStatus.SUCCESS)
 
-        latest_status_by_method = self._build_latest_status_by_method()
-        latest_error_by_method = self._build_latest_error_by_method()
+        latest_status_by_method = self._build_latest_status_by_method(snapshot)
+        latest_error_by_method = self._build_latest_error_by_method(snapshot)
         daily_publish_timestamps_by_platform = self._build_daily_publish_timestamps_by_platform()
-        latest_artifact_path, latest_artifact_timestamp = self._resolve_latest_video_artifact()
-        running_methods = self._build_running_methods()
-        timeline_data = self._build_timeline_data()
+        latest_artifact = self._artifact_index.latest_artifact()
+        running_methods = self._build_running_methods(snapshot, now)
+        timeline_data = self._build_timeline_data(snapshot)
 
         logger.debug(
             "admin_task_status_fetched",
@@ -106,7 +113,7 @@ class GetAdminTaskStatusUseCase:
             methods_with_status=len(latest_status_by_method),
             methods_with_errors=len(latest_error_by_method),
             daily_publish_platforms=len(daily_publish_timestamps_by_platform),
-            latest_video_artifact_path=latest_artifact_path,
+            latest_video_artifact_path=latest_artifact.path if latest_artifact else None,
             running_methods=list(running_methods),
             timeline_events_count=sum(len(events) for events in timeline_data.values()),
         )
@@ -118,24 +125,26 @@ class GetAdminTaskStatusUseCase:
             latest_status_by_method=latest_status_by_method,
             latest_error_by_method=latest_error_by_method,
             daily_publish_timestamps_by_platform=daily_publish_timestamps_by_platform,
-            latest_video_artifact_path=latest_artifact_path,
-            latest_video_artifact_timestamp=latest_artifact_timestamp,
+            latest_video_artifact_path=latest_artifact.path if latest_artifact else None,
+            latest_video_artifact_timestamp=latest_artifact.mtime if latest_artifact else None,
             running_methods=running_methods,
             timeline_data=timeline_data,
         )
 
-    def _build_latest_status_by_method(self) -> dict[str, str]:
+    @staticmethod
+    def _build_latest_status_by_method(snapshot: TaskRunSnapshot) -> dict[str, str]:
         latest_status_by_method: dict[str, str] = {}
         for task_method in TaskMethod:
-            latest = self._task_run_state_reader.get_latest_task_event(task_method=task_method)
+            latest = snapshot.latest(task_method)
             if latest is not None:
                 latest_status_by_method[task_method.value] = latest.status.value
         return latest_status_by_method
 
-    def _build_latest_error_by_method(self) -> dict[str, str]:
+    @staticmethod
+    def _build_latest_error_by_method(snapshot: TaskRunSnapshot) -> dict[str, str]:
         latest_error_by_method: dict[str, str] = {}
         for task_method in TaskMethod:
-            latest = self._task_run_state_reader.get_latest_task_event(task_method=task_method)
+            latest = snapshot.latest(task_method)
             if latest is not None and latest.error_message:
                 latest_error_by_method[task_method.value] = latest.error_message
         return latest_error_by_method
@@ -152,25 +161,19 @@ class GetAdminTaskStatusUseCase:
             daily_publish_timestamps_by_platform[platform.value] = latest_release.published_at
         return daily_publish_timestamps_by_platform
 
-    def _build_running_methods(self) -> set[str]:
+    @staticmethod
+    def _build_running_methods(snapshot: TaskRunSnapshot, now: datetime) -> set[str]:
         running_methods: set[str] = set()
-        now = datetime.now(UTC)
 
         for task_method in TaskMethod:
-            latest = self._task_run_state_reader.get_latest_task_event(task_method=task_method)
+            latest = snapshot.latest(task_method)
             if latest is None or latest.status != TaskRunStatus.QUEUED:
                 continue
             if now - latest.event_at > _RUNNING_WINDOW:
                 continue
 
-            latest_success = self._task_run_state_reader.get_latest_task_event(
-                task_method=task_method,
-                status=TaskRunStatus.SUCCESS,
-            )
-            latest_failed = self._task_run_state_reader.get_latest_task_event(
-                task_method=task_method,
-                status=TaskRunStatus.FAILED,
-            )
+            latest_success = snapshot.latest(task_method, TaskRunStatus.SUCCESS)
+            latest_failed = snapshot.last_error(task_method)
 
             latest_terminal_at = None
             if latest_success is not None:
@@ -185,49 +188,43 @@ class GetAdminTaskStatusUseCase:
 
         return running_methods
 
-    def _build_timeline_data(self) -> dict[str, list[dict]]:
-        timeline_data: dict[str, list[dict]] = {}
-        now = datetime.now(UTC)
-        seven_days_ago = now - timedelta(days=7)
-        for task_method in TaskMethod:
-            events = self._task_run_state_reader.get_task_events_since(
-                task_method=task_method,
-                since=seven_days_ago,
-            )
-            timeline_data[task_method.value] = [
+    @staticmethod
+    def _build_timeline_data(snapshot: TaskRunSnapshot) -> dict[str, list[dict]]:
+        return {
+            task_method.value: [
                 {
                     "status": event.status.value,
                     "timestamp": event.event_at.timestamp(),
                     "error_message": event.error_message,
                 }
-                for event in events
+                for event in snapshot.events_since.get(task_method, [])
             ]
-        return timeline_data
-
-    def _resolve_latest_video_artifact(self) -> tuple[str | None, float | None]:
-        root = Path(self._video_generated_folder)
-        if not root.exists() or not root.is_dir():
-            return None, None
-
-        date_dirs = [path for path in root.iterdir() if path.is_dir() and re.fullmatch(r"\d{8}", path.name)]
-        if date_dirs:
-            # Folder names are YYYYMMDD, so lexical max is latest day.
-            target_dir = max(date_dirs, key=lambda path: path.name)
-            latest_in_dir = self._latest_mp4_in_tree(target_dir)
-            if latest_in_dir is not None:
-                return str(latest_in_dir), latest_in_dir.stat().st_mtime
-
-        latest_any = self._latest_mp4_in_tree(root)
-        if latest_any is None:
-            return None, None
-        return str(latest_any), latest_any.stat().st_mtime
+            for task_method in TaskMethod
+        }
 
-    @staticmethod
-    def _latest_mp4_in_tree(root: Path) -> Path | None:
-        candidates: list[Path] = [path for path in root.rglob("*.mp4") if path.is_file()]
-        if not candidates:
-            return None
-        return max(candidates, key=lambda path: path.stat().st_mtime)
+    def data_version(self) -> str:
+        """
+        Digest of the data ``execute()`` reads, without reading the task events.
+
+        Combines the task run store's version marker with the latest daily
+        release per platform and the latest artifact, which scheduled runs
+        write without recording task events; all three are index lookups.
+        Stable across processes, so it can back an HTTP ETag.
+        """
+        latest_artifact = self._artifact_index.latest_artifact()
+        payload = json.dumps(
+            [
+                self._task_run_state_reader.data_version(),
+                self._build_daily_publish_timestamps_by_platform(),
+                [latest_artifact.path, latest_artifact.mtime] if latest_artifact else None,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+    def is_task_complete(self, task_method: str) -> bool:
+        """Return whether the task has run and is not running now; reads its latest event only."""
+        return is_task_complete(self._task_run_state_reader, task_method)
 
     def get_task_started_at(self, task_method: str) -> float | None:
         """Return the unix timestamp when the task was queued (start of current run)."""
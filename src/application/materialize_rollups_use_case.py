@@ -0,0 +1,111 @@
+"""Use case for materializing per-video daily/weekly rollups from the timeseries."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from src.domain.services.rollup_service import (
+    ROLLING_WINDOWS_DAYS,
+    build_daily_rollups,
+    build_weekly_rollups,
+    week_days,
+    week_key,
+)
+from src.domain.services.scoring_service import datetime_range_start
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from src.domain.models import VideoPoint, VideoRollup
+    from src.domain.ports import TimeSeriesRollupReader, TimeSeriesRollupWriter, TimeSeriesStreamReader
+
+logger = get_logger(__name__)
+
+_ROLLUP_FIELDS = ("views", "likes", "score", "score_status")
+
+
+@dataclass(frozen=True)
+class MaterializeRollupsResult:
+    """Summary of a rollup materialization run."""
+
+    days: int
+    daily_rows: int
+    weeks: tuple[str, ...]
+
+
+class MaterializeRollupsUseCase:
+    """
+    Recompute daily closes (with 7/30-day growth) and weekly closes for a day range.
+
+    Days are processed oldest first so growth baselines inside the range come
+    from freshly computed closes; baselines before the range are read from
+    the stored tables, falling back to raw timeseries points when missing.
+    Day boundaries match the ranking windows (UTC midnight to midnight).
+    """
+
+    def __init__(
+        self,
+        timeseries_reader: TimeSeriesStreamReader,
+        rollup_reader: TimeSeriesRollupReader,
+        rollup_writer: TimeSeriesRollupWriter,
+    ) -> None:
+        """Initialize with the raw timeseries source and the rollup tables."""
+        self._timeseries_reader = timeseries_reader
+        self._rollup_reader = rollup_reader
+        self._rollup_writer = rollup_writer
+
+    def execute(self, start_day: date, end_day: date | None = None) -> MaterializeRollupsResult:
+        """Materialize rollups for every day in ``[start_day, end_day]`` (default: one day)."""
+        end_day = end_day or start_day
+        if end_day < start_day:
+            msg = f"end_day {end_day} is before start_day {start_day}"
+            raise ValueError(msg)
+
+        closes: dict[date, list[VideoRollup]] = {}
+        daily_rows = 0
+        day = start_day
+        while day <= end_day:
+            baselines = [self._closes_by_video(day - timedelta(days=days), closes) for days in ROLLING_WINDOWS_DAYS]
+            rollups = build_daily_rollups(self._day_points(day), *baselines)
+            self._rollup_writer.write_daily(day, rollups)
+            closes[day] = rollups
+            daily_rows += len(rollups)
+            day += timedelta(days=1)
+
+        weeks: dict[str, date] = {}
+        for materialized_day in closes:
+            weeks.setdefault(week_key(materialized_day), materialized_day)
+        for week_day in weeks.values():
+            daily_closes = [self._stored_closes(day, closes) for day in week_days(week_day)]
+            self._rollup_writer.write_weekly(week_day, build_weekly_rollups(daily_closes))
+
+        logger.info(
+            "rollups.materialized",
+            start_day=start_day.isoformat(),
+            end_day=end_day.isoformat(),
+            daily_rows=daily_rows,
+            weeks=list(weeks),
+        )
+        return MaterializeRollupsResult(days=len(closes), daily_rows=daily_rows, weeks=tuple(weeks))
+
+    def _day_points(self, day: date) -> Iterator[VideoPoint]:
+        """Stream raw points of ``day``, using the same window as ranking baselines."""
+        from_dt = datetime_range_start(0, reference=day)
+        return self._timeseries_reader.iter_video_points(from_dt, from_dt + timedelta(days=1), fields=_ROLLUP_FIELDS)
+
+    def _stored_closes(self, day: date, closes: dict[date, list[VideoRollup]]) -> list[VideoRollup]:
+        if day in closes:
+            return closes[day]
+        return self._rollup_reader.read_daily(day) or []
+
+    def _closes_by_video(self, day: date, closes: dict[date, list[VideoRollup]]) -> dict[str, VideoRollup]:
+        """Return the closes of ``day``, computing them from raw points when not materialized."""
+        closes_of_day = closes.get(day)
+        if closes_of_day is None:
+            closes_of_day = self._rollup_reader.read_daily(day)
+        if closes_of_day is None:
+            closes_of_day = build_daily_rollups(self._day_points(day), {}, {})
+        return {rollup.video_id: rollup for rollup in closes_of_day}
@@ -23,6 +23,19 @@ class Environment(StrEnum):
     DEVELOPMENT = "development"
 
 
+class TimeSeriesSegmentPeriod(StrEnum):
+    NONE = "none"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+class StorageBackend(StrEnum):
+    FILES = "files"
+    SQLITE = "sqlite"
+
+
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=(str(PROJECT_ROOT / ".env"), str(PROJECT_ROOT / ".env.local")),
@@ -53,6 +66,9 @@ class AppSettings(BaseSettings):
     scheduler_weekly_publish_hour: int = 17
     scheduler_weekly_publish_minute: int = 0
     scheduler_weekly_publish_day_of_week: int = 5
+    scheduler_compaction_hour: int = 4
+    scheduler_compaction_minute: int = 0
+    scheduler_compaction_day_of_week: int = 6
 
     yt_client_secret_file: str | None = None
     yt_redirect_uri: str | None = None
@@ -80,11 +96,20 @@ class AppSettings(BaseSettings):
     instagram_client_session_file: str | None = None
     instagram_client_totp_seed: SecretStr | None = None
 
+    storage_backend: StorageBackend = StorageBackend.FILES
+    db_sqlite_file: str = "db/db_top_video.sqlite3"
+    # Unix socket of the storage-service daemon; when set, the shared stores are accessed through it.
+    storage_service_socket: str | None = None
     db_timeseries_file: str = "db/db_timeseries.csv"
+    timeseries_segment_period: TimeSeriesSegmentPeriod = TimeSeriesSegmentPeriod.MONTH
+    db_metrics_file: str = "db/db_metrics.csv"
+    db_task_runs_file: str = "db/db_task_runs.csv"
     db_video_file: str = "db/db_video.json"
     db_auth_file: str = "db/db_auth.json"
     db_release_file: str = "db/db_release.json"
     operational_metrics_retention_days: int = 90
+    task_run_state_retention_days: int = 180
+    timeseries_video_full_resolution_days: int = 90
     operational_metrics_window_hours: int = 24
     # Deprecated legacy shared store path. Keep for backward compatibility only.
     db_data_file: str = "db/db_data.json"
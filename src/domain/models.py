@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import StrEnum
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, computed_field
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 _NOISE_TOKENS: frozenset[str] = frozenset(
     {
         "(Video)",
@@ -189,6 +194,74 @@ class TaskRunState(BaseModel, frozen=True):
     error_message: str | None = None
 
 
+class VideoArtifactKind(StrEnum):
+    """Rendered video outputs, by file name pattern."""
+
+    HORIZONTAL = "horizontal"
+    VERTICAL = "vertical"
+    HORIZONTAL_COMPILATION = "horizontal_compilation"
+    VERTICAL_COMPILATION = "vertical_compilation"
+
+
+class VideoArtifact(BaseModel, frozen=True):
+    """A rendered mp4 under the generated videos folder."""
+
+    path: str
+    kind: VideoArtifactKind
+    size: int
+    mtime: float
+    duration: float | None = None
+    """Clip length in seconds, known when recorded by the renderer."""
+
+
+class TaskRunSnapshot(BaseModel, frozen=True):
+    """
+    Everything the admin task status needs, read from the task run store at once.
+
+    Holds the latest event per method, the latest event per (method, status)
+    and, in time order, every event after ``since``. Events with equal times
+    resolve to the one recorded last.
+    """
+
+    since: datetime
+    latest_by_method: dict[TaskMethod, TaskRunState] = {}
+    latest_by_status: dict[TaskMethod, dict[TaskRunStatus, TaskRunState]] = {}
+    events_since: dict[TaskMethod, list[TaskRunState]] = {}
+
+    @classmethod
+    def from_events(cls, events: Iterable[TaskRunState], *, since: datetime) -> TaskRunSnapshot:
+        """
+        Build a snapshot from events in recording order.
+
+        ``events`` may omit older events, as long as it keeps the latest one
+        of every (method, status) and every event after ``since``.
+        """
+        latest_by_method: dict[TaskMethod, TaskRunState] = {}
+        latest_by_status: dict[TaskMethod, dict[TaskRunStatus, TaskRunState]] = {}
+        events_since: dict[TaskMethod, list[TaskRunState]] = {}
+        for event in sorted(events, key=lambda event: event.event_at):
+            latest_by_method[event.task_method] = event
+            latest_by_status.setdefault(event.task_method, {})[event.status] = event
+            if event.event_at > since:
+                events_since.setdefault(event.task_method, []).append(event)
+        return cls(
+            since=since,
+            latest_by_method=latest_by_method,
+            latest_by_status=latest_by_status,
+            events_since=events_since,
+        )
+
+    def latest(self, task_method: TaskMethod, status: TaskRunStatus | None = None) -> TaskRunState | None:
+        """Return the latest event of ``task_method``, optionally only among events with ``status``."""
+        if status is None:
+            return self.latest_by_method.get(task_method)
+        return self.latest_by_status.get(task_method, {}).get(status)
+
+    def last_error(self, task_method: TaskMethod) -> TaskRunState | None:
+        """Return the latest failed event of ``task_method``."""
+        return self.latest(task_method, TaskRunStatus.FAILED)
+
+
 class Video(BaseModel):
     """Video metadata (persisted in TinyDB)."""
 
@@ -245,6 +318,62 @@ class VideoPoint(BaseModel):
     duration: int | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class VideoPointRecord:
+    """
+    Lightweight timeseries row returned by bulk repository reads.
+
+    Holds only the numeric attributes ranking needs, without pydantic
+    validation; convert the final top-N rows with ``to_video_point``.
+    """
+
+    time: datetime
+    video_id: str
+    views: int = 0
+    likes: int = 0
+    views_growth: int | None = None
+    score: int | None = None
+    score_previous: int | None = None
+    score_status: VideoScoreStatus | None = None
+
+    def to_video_point(self) -> VideoPoint:
+        """Validate the row into a VideoPoint model."""
+        return VideoPoint(
+            time=self.time,
+            video_id=self.video_id,
+            views=self.views,
+            likes=self.likes,
+            views_growth=self.views_growth,
+            score=self.score,
+            score_previous=self.score_previous,
+            score_status=self.score_status,
+        )
+
+
+class VideoRollup(BaseModel, frozen=True):
+    """Per-video close of a day or ISO week, with rolling view growth as of that close."""
+
+    video_id: str
+    close_time: datetime
+    views: int = 0
+    likes: int = 0
+    score: int | None = None
+    score_status: VideoScoreStatus | None = None
+    views_growth_7d: int | None = None
+    views_growth_30d: int | None = None
+
+    def to_record(self) -> VideoPointRecord:
+        """Return the closing point, usable as a ranking baseline."""
+        return VideoPointRecord(
+            time=self.close_time,
+            video_id=self.video_id,
+            views=self.views,
+            likes=self.likes,
+            score=self.score,
+            score_status=self.score_status,
+        )
+
+
 def _clean_title(raw_title: str | None) -> str:
     """Shared title cleaner used by canonical and legacy video models."""
     if not raw_title:
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Protocol, TypeVar
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Iterable, Iterator, Sequence
     from datetime import date, datetime
 
     from .models import (
@@ -17,11 +17,15 @@ if TYPE_CHECKING:
         PublishingResult,
         Release,
         TaskMethod,
+        TaskRunSnapshot,
         TaskRunState,
         TaskRunStatus,
         TikTokAuth,
         Video,
+        VideoArtifact,
         VideoPoint,
+        VideoPointRecord,
+        VideoRollup,
         VideoVerificationResult,
         YtAuth,
     )
@@ -67,6 +71,62 @@ class TimeSeriesReader(Protocol):
 
     def get_video_points_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPoint]: ...
 
+    def get_video_records_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPointRecord]: ...
+
+
+class TimeSeriesStreamReader(Protocol):
+    def iter_video_points(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[VideoPoint]: ...
+
+
+class TimeSeriesWriter(Protocol):
+    def add_video_points(self, video_points: Sequence[VideoPoint]) -> None: ...
+
+
+class TimeSeriesStore(TimeSeriesReader, TimeSeriesStreamReader, TimeSeriesWriter, Protocol): ...
+
+
+class TimeSeriesExportWriter(Protocol):
+    def exists(self) -> bool: ...
+
+    def get_last_timestamp(self) -> datetime | None: ...
+
+    def append(self, points: Sequence[VideoPoint]) -> None: ...
+
+    def rebuild_from(self, reader: TimeSeriesStreamReader) -> None: ...
+
+
+class DailySnapshotReader(Protocol):
+    def rank_day(
+        self,
+        day: date,
+        baseline_day: date,
+        *,
+        baseline: Sequence[VideoPointRecord] | None,
+        limit: int,
+    ) -> list[VideoPointRecord] | None: ...
+
+
+class DailySnapshotWriter(Protocol):
+    def write_day(self, day: date, points: Sequence[VideoPoint]) -> None: ...
+
+
+class TimeSeriesRollupReader(Protocol):
+    def read_daily(self, day: date) -> list[VideoRollup] | None: ...
+
+    def read_weekly(self, day: date) -> list[VideoRollup] | None: ...
+
+
+class TimeSeriesRollupWriter(Protocol):
+    def write_daily(self, day: date, rollups: Sequence[VideoRollup]) -> None: ...
+
+    def write_weekly(self, day: date, rollups: Sequence[VideoRollup]) -> None: ...
+
 
 class OperationalMetricsWriter(Protocol):
     def record_metric_event(
@@ -85,6 +145,16 @@ class OperationalMetricsReader(Protocol):
 class VideoMetadataReader(Protocol):
     def get(self, video_id: str) -> CanonicalVideo | None: ...
 
+    def get_many(self, video_ids: Iterable[str]) -> dict[str, CanonicalVideo]: ...
+
+
+class VideoMetadataWriter(Protocol):
+    def upsert_many(self, videos: Iterable[CanonicalVideo]) -> int: ...
+
+
+class VideoSearcher(Protocol):
+    def search_text(self, query: str, *, limit: int = 20) -> list[CanonicalVideo]: ...
+
 
 class AuthCredentialStore(Protocol):
     def get_tiktok_auth(self, client_id: str) -> TikTokAuth | None: ...
@@ -136,6 +206,14 @@ class TaskRunStateReader(Protocol):
         since: datetime,
     ) -> list[TaskRunState]: ...
 
+    def snapshot(self, *, since: datetime) -> TaskRunSnapshot: ...
+
+    def data_version(self) -> str: ...
+
+
+class VideoArtifactIndex(Protocol):
+    def latest_artifact(self) -> VideoArtifact | None: ...
+
 
 class VerticalVideoPipeline(Protocol):
     async def build_vertical_video(self, video_list: Sequence[Video]) -> str: ...
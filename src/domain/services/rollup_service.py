@@ -0,0 +1,84 @@
+"""Domain service for per-video daily/weekly rollups of timeseries points."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from src.domain.models import VideoRollup
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from src.domain.models import VideoPoint
+
+ROLLING_WINDOWS_DAYS = (7, 30)
+
+
+def week_key(day: date) -> str:
+    """Return the ISO week key (``YYYY-Www``) a day belongs to."""
+    iso_year, iso_week, _ = day.isocalendar()
+    return f"{iso_year:04d}-W{iso_week:02d}"
+
+
+def week_days(day: date) -> list[date]:
+    """Return the Monday..Sunday days of the ISO week containing ``day``."""
+    monday = day - timedelta(days=day.weekday())
+    return [monday + timedelta(days=offset) for offset in range(7)]
+
+
+def build_daily_rollups(
+    day_points: Iterable[VideoPoint],
+    closes_7d_ago: Mapping[str, VideoRollup],
+    closes_30d_ago: Mapping[str, VideoRollup],
+) -> list[VideoRollup]:
+    """
+    Reduce one day of points to its per-video close.
+
+    The close is the latest point of each video, the same row ranking keeps
+    when it builds its baseline. Rolling growth compares the close views with
+    the close 7/30 days earlier; it is None when the video had no close then.
+    ``day_points`` is consumed once, so it may be a stream.
+
+    Pure function: does not mutate input arguments, returns new list.
+    """
+    last_by_video: dict[str, VideoPoint] = {}
+    for point in day_points:
+        current = last_by_video.get(point.video_id)
+        if current is None or point.time >= current.time:
+            last_by_video[point.video_id] = point
+
+    return [
+        VideoRollup(
+            video_id=video_id,
+            close_time=point.time,
+            views=point.views,
+            likes=point.likes,
+            score=point.score,
+            score_status=point.score_status,
+            views_growth_7d=_growth(point, closes_7d_ago.get(video_id)),
+            views_growth_30d=_growth(point, closes_30d_ago.get(video_id)),
+        )
+        for video_id, point in last_by_video.items()
+    ]
+
+
+def build_weekly_rollups(daily_closes: Iterable[Sequence[VideoRollup]]) -> list[VideoRollup]:
+    """
+    Merge the daily closes of one week into the weekly close (latest close per video).
+
+    Pure function: does not mutate input arguments, returns new list.
+    """
+    latest_by_video: dict[str, VideoRollup] = {}
+    for closes in daily_closes:
+        for rollup in closes:
+            current = latest_by_video.get(rollup.video_id)
+            if current is None or rollup.close_time >= current.close_time:
+                latest_by_video[rollup.video_id] = rollup
+    return sorted(latest_by_video.values(), key=lambda rollup: rollup.video_id)
+
+
+def _growth(point: VideoPoint, baseline: VideoRollup | None) -> int | None:
+    if baseline is None:
+        return None
+    return point.views - baseline.views
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from src.domain.exceptions import ScoringError
-from src.domain.models import CanonicalVideo, Video, VideoPoint, VideoScoreStatus
+from src.domain.models import CanonicalVideo, Video, VideoPoint, VideoPointRecord, VideoScoreStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+type _RankedRow = tuple[int, int, int | None, VideoScoreStatus]
 
 
 def calculate_views_growth(current: CanonicalVideo, previous: CanonicalVideo | None) -> int:
@@ -100,41 +106,89 @@ def score_and_rank_video_points(
 
     Pure function: does not mutate input arguments, returns new list.
     """
-    if not current:
-        raise ScoringError("current video list is empty")
-
-    previous_by_id: dict[str, VideoPoint] = {video.video_id: video for video in previous}
+    return [
+        current[index].model_copy(
+            update={
+                "views_growth": views_growth,
+                "score": rank,
+                "score_previous": score_previous,
+                "score_status": score_status,
+            }
+        )
+        for rank, (index, views_growth, score_previous, score_status) in enumerate(
+            _rank_by_growth(current, previous), start=1
+        )
+    ]
 
-    # Enrich with views_growth (pure)
-    enriched = []
-    for video_point in current:
-        prev = previous_by_id.get(video_point.video_id)
-        views_growth = abs(video_point.views - prev.views) if prev else (video_point.views_growth or video_point.views)
-        enriched.append(video_point.model_copy(update={"views_growth": views_growth}))
 
-    # Rank by views_growth DESC (most growth = rank #1)
-    ranked = sorted(enriched, key=lambda item: item.views_growth or 0, reverse=True)
+def score_and_rank_video_records(
+    current: Sequence[VideoPointRecord],
+    previous: Iterable[VideoPointRecord],
+) -> list[VideoPointRecord]:
+    """Record counterpart of ``score_and_rank_video_points`` for bulk timeseries reads.
 
-    # Assign scores and compute status (pure)
-    result: list[VideoPoint] = []
-    for rank, video_point in enumerate(ranked, start=1):
-        prev = previous_by_id.get(video_point.video_id)
-        prev_score = prev.score if prev and prev.score is not None else None
+    Produces the same ranking, but builds one slotted record per row instead
+    of copying a pydantic model per row.
+    """
+    result: list[VideoPointRecord] = []
+    for rank, (index, views_growth, score_previous, score_status) in enumerate(
+        _rank_by_growth(current, previous), start=1
+    ):
+        record = current[index]
         result.append(
-            video_point.model_copy(
-                update={
-                    "score": rank,
-                    "score_previous": prev_score,
-                    "score_status": calculate_score_status(
-                        float(rank),
-                        prev_score,
-                    ),
-                }
+            VideoPointRecord(
+                time=record.time,
+                video_id=record.video_id,
+                views=record.views,
+                likes=record.likes,
+                views_growth=views_growth,
+                score=rank,
+                score_previous=score_previous,
+                score_status=score_status,
             )
         )
     return result
 
 
+def _rank_by_growth(
+    current: Sequence[VideoPoint | VideoPointRecord],
+    previous: Iterable[VideoPoint | VideoPointRecord],
+) -> list[_RankedRow]:
+    """
+    Ranking rule shared by the timeseries rankers.
+
+    Growth is the absolute view change since the video's last ``previous``
+    row, or its stored views_growth (else its views) when it has none. Rows
+    are ordered by growth descending, ties keeping input order.
+
+    Returns:
+        One ``(index in current, views_growth, score_previous, score_status)``
+        per row, in rank order (rank #1 first).
+
+    Raises:
+        ScoringError: If current list is empty.
+    """
+    if not current:
+        raise ScoringError("current video list is empty")
+
+    previous_by_id = {item.video_id: item for item in previous}
+
+    views_growth: list[int] = []
+    for item in current:
+        prev = previous_by_id.get(item.video_id)
+        views_growth.append(abs(item.views - prev.views) if prev else (item.views_growth or item.views))
+
+    # sorted() is stable with reverse=True too, so ties keep insertion order.
+    order = sorted(range(len(current)), key=views_growth.__getitem__, reverse=True)
+
+    ranked: list[_RankedRow] = []
+    for rank, index in enumerate(order, start=1):
+        prev = previous_by_id.get(current[index].video_id)
+        prev_score = prev.score if prev and prev.score is not None else None
+        ranked.append((index, views_growth[index], prev_score, calculate_score_status(float(rank), prev_score)))
+    return ranked
+
+
 def rank_videos_by_score(videos: list[Video]) -> list[Video]:
     """Return a new list sorted by score DESC with score=None values at the end."""
     return sorted(
@@ -0,0 +1,135 @@
+"""Benchmark ranking reads: pydantic VideoPoints vs slotted VideoPointRecords.
+
+Writes a synthetic one-day window of video rows to a temporary timeseries CSV,
+then times and measures the peak allocations of "read the window and rank the
+top-N" through ``get_video_points_by_date_range`` + ``score_and_rank_video_points``
+and through ``get_video_records_by_date_range`` + ``score_and_rank_video_records``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.config.settings import get_app_settings
+from src.domain.models import VideoPoint, VideoScoreStatus
+from src.domain.services.scoring_service import score_and_rank_video_points, score_and_rank_video_records
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+from src.shared.logging import get_logger, setup_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = get_logger(__name__)
+
+DEFAULT_ROW_COUNTS = (10_000, 100_000)
+_TOP_N = 25
+_WINDOW_START = datetime(2026, 1, 1, tzinfo=UTC)
+_WINDOW = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class ReadBenchmark:
+    rows: int
+    method: str
+    seconds: float
+    peak_bytes: int
+
+
+def benchmark_timeseries_reads(directory: Path, row_counts: Sequence[int]) -> list[ReadBenchmark]:
+    """Run both read paths over a fresh timeseries file per row count."""
+    results: list[ReadBenchmark] = []
+    for rows in row_counts:
+        repo = TimeSeriesRepository(str(directory / f"benchmark_{rows}.csv"))
+        try:
+            repo.add_video_points(_synthetic_points(rows))
+            start, end = _WINDOW_START - timedelta(seconds=1), _WINDOW_START + _WINDOW
+            results.append(_measure(rows, "video_points", lambda: _rank_points(repo, start, end)))
+            results.append(_measure(rows, "video_records", lambda: _rank_records(repo, start, end)))
+        finally:
+            repo.close()
+    return results
+
+
+def _synthetic_points(rows: int) -> list[VideoPoint]:
+    step = _WINDOW / rows
+    return [
+        VideoPoint(
+            time=_WINDOW_START + step * row,
+            video_id=f"video_{row:07d}",
+            views=1_000 + row * 7,
+            likes=row % 500,
+            views_growth=row % 1_000 or None,
+            score=row + 1,
+            score_status=VideoScoreStatus.NEW,
+        )
+        for row in range(rows)
+    ]
+
+
+def _rank_points(repo: TimeSeriesRepository, start: datetime, end: datetime) -> int:
+    ranked = score_and_rank_video_points(repo.get_video_points_by_date_range(start, end), [])
+    return len(ranked[:_TOP_N])
+
+
+def _rank_records(repo: TimeSeriesRepository, start: datetime, end: datetime) -> int:
+    ranked = score_and_rank_video_records(repo.get_video_records_by_date_range(start, end), [])
+    return len([record.to_video_point() for record in ranked[:_TOP_N]])
+
+
+def _measure(rows: int, method: str, run: Callable[[], int]) -> ReadBenchmark:
+    # Timed and traced separately: tracemalloc itself slows allocation-heavy code down.
+    gc.collect()
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return ReadBenchmark(rows=rows, method=method, seconds=elapsed, peak_bytes=peak_bytes)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare VideoPoint and VideoPointRecord ranking reads")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_ROW_COUNTS),
+        help="Row counts of the benchmarked one-day window (default: 10000 100000)",
+    )
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+
+    args = _build_parser().parse_args()
+    with tempfile.TemporaryDirectory(prefix="timeseries-benchmark-") as directory:
+        results = benchmark_timeseries_reads(Path(directory), args.rows)
+
+    for result in results:
+        logger.info(
+            "timeseries_read_benchmark.result",
+            rows=result.rows,
+            method=result.method,
+            seconds=round(result.seconds, 3),
+            peak_mib=round(result.peak_bytes / 2**20, 1),
+        )
+
+
+if __name__ == "__main__":
+    main()
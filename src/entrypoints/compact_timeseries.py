@@ -0,0 +1,346 @@
+"""Compact the TinyFlux timeseries files: retention, downsampling and de-duplication.
+
+Each file is streamed once and rewritten atomically (tempfile + fsync + rename)
+while its CSV write lock is held:
+
+- "Operational metrics" and "Task run state" rows older than their retention
+  window are dropped;
+- "Video visualizations" rows older than the full-resolution window are
+  downsampled to one daily close per video (the last point of the UTC day,
+  the same row rankings and rollups use);
+- duplicate points (same measurement, time and tags) keep their last write.
+
+The task error messages log next to the task run CSV is rewritten with the
+messages of the kept rows only, and their ``error_ref`` fields are remapped.
+
+Rows of unknown measurements and rows with unreadable times are kept as-is.
+Without ``--apply`` the command only reports what would be reclaimed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.config.settings import AppSettings, get_app_settings
+from src.domain.services.scoring_service import datetime_range_start
+from src.infrastructure.storage.operational_metrics_repository import OPERATIONAL_METRICS_MEASUREMENT
+from src.infrastructure.storage.storage_backend import operational_metrics_file, task_runs_file
+from src.infrastructure.storage.task_run_state_repository import TASK_RUN_STATE_MEASUREMENT, TaskErrorMessageLog
+from src.infrastructure.storage.timeseries_export import TimeSeriesExport
+from src.infrastructure.storage.timeseries_files import (
+    TimedRecord,
+    csv_write_lock,
+    iter_complete_records,
+    write_records_atomically,
+)
+from src.infrastructure.storage.timeseries_index import (
+    deserialize_row,
+    parse_csv_record,
+    row_field,
+    row_tag,
+    row_time,
+    serialize_point,
+)
+from src.infrastructure.storage.timeseries_repository import VIDEO_MEASUREMENT, TimeSeriesRepository
+from src.infrastructure.storage.timeseries_segments import TimeSeriesSegment, TimeSeriesSegmentLayout
+from src.shared.execution_lock import FileExecutionLock
+from src.shared.logging import get_logger, setup_logging
+from src.shared.utils import resolve_project_path
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping, Sequence
+
+logger = get_logger(__name__)
+
+_MIN_ROW_COLUMNS = 2
+_MIN_TIME = datetime.min.replace(tzinfo=UTC)
+_TAG_PREFIXES = ("_tag_", "t_")
+
+
+@dataclass(frozen=True)
+class CompactionPolicy:
+    """Cutoffs applied to one compaction run (None disables the rule)."""
+
+    video_full_resolution_cutoff: datetime | None = None
+    retention_cutoffs: Mapping[str, datetime] = field(default_factory=dict)
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings, now: datetime) -> CompactionPolicy:
+        """Build the policy from retention settings, relative to ``now``."""
+        retention_days = {
+            OPERATIONAL_METRICS_MEASUREMENT: settings.operational_metrics_retention_days,
+            TASK_RUN_STATE_MEASUREMENT: settings.task_run_state_retention_days,
+        }
+        video_days = settings.timeseries_video_full_resolution_days
+        return cls(
+            # Aligned to UTC midnight so a day is never partially downsampled.
+            video_full_resolution_cutoff=(
+                datetime_range_start(video_days, reference=now.astimezone(UTC).date()) if video_days > 0 else None
+            ),
+            retention_cutoffs={
+                measurement: now.astimezone(UTC) - timedelta(days=days)
+                for measurement, days in retention_days.items()
+                if days > 0
+            },
+        )
+
+
+@dataclass
+class FileCompactionSummary:
+    path: Path
+    rows_before: int = 0
+    rows_after: int = 0
+    expired_rows: int = 0
+    downsampled_rows: int = 0
+    duplicate_rows: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+@dataclass
+class CompactionSummary:
+    apply_changes: bool
+    files: list[FileCompactionSummary] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return sum(file_summary.bytes_reclaimed for file_summary in self.files)
+
+    @property
+    def rows_removed(self) -> int:
+        return sum(file_summary.rows_before - file_summary.rows_after for file_summary in self.files)
+
+
+def compact_timeseries(
+    paths: Sequence[Path],
+    policy: CompactionPolicy,
+    *,
+    apply_changes: bool,
+) -> CompactionSummary:
+    """Compact every existing file in ``paths`` with the same policy."""
+    summary = CompactionSummary(apply_changes=apply_changes)
+    started = time.perf_counter()
+    for path in paths:
+        if not path.is_file():
+            continue
+        try:
+            summary.files.append(compact_timeseries_file(path, policy, apply_changes=apply_changes))
+        except OSError as exc:
+            summary.errors.append(f"Failed to compact {path}: {exc}")
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
+
+
+def compact_timeseries_file(path: Path, policy: CompactionPolicy, *, apply_changes: bool) -> FileCompactionSummary:
+    """Compact one TinyFlux CSV; in dry-run mode ``bytes_after`` is the size the file would have."""
+    summary = FileCompactionSummary(path=path)
+    with csv_write_lock(path):
+        summary.bytes_before = path.stat().st_size
+        records = _compact_records(path, policy, summary)
+        summary.rows_after = len(records)
+        summary.bytes_after = sum(len(record) for record in records)
+        if apply_changes and summary.rows_after < summary.rows_before:
+            records = _compact_error_log(path, records)
+            write_records_atomically(path, records)
+            TimeSeriesSegment(path, VIDEO_MEASUREMENT).discard_sidecars()
+            summary.bytes_after = path.stat().st_size
+        elif summary.rows_after == summary.rows_before:
+            summary.bytes_after = summary.bytes_before
+    return summary
+
+
+def _compact_records(path: Path, policy: CompactionPolicy, summary: FileCompactionSummary) -> list[bytes]:
+    kept: list[TimedRecord] = []
+    slots: dict[Hashable, int] = {}
+    last_time = _MIN_TIME
+    for record in iter_complete_records(path):
+        summary.rows_before += 1
+        row = parse_csv_record(record)
+        point_time = row_time(row) if len(row) >= _MIN_ROW_COLUMNS else None
+        if point_time is None:
+            # Keep the row where it was: sorting places it right after its predecessor.
+            kept.append((last_time, record))
+            continue
+        last_time = point_time
+
+        measurement = row[1]
+        retention_cutoff = policy.retention_cutoffs.get(measurement)
+        if retention_cutoff is not None and point_time < retention_cutoff:
+            summary.expired_rows += 1
+            continue
+
+        downsample_cutoff = policy.video_full_resolution_cutoff
+        downsampled = (
+            measurement == VIDEO_MEASUREMENT and downsample_cutoff is not None and point_time < downsample_cutoff
+        )
+        key: Hashable = (
+            (measurement, row_tag(row, "video_id"), point_time.date())
+            if downsampled
+            else (measurement, point_time, _tag_pairs(row))
+        )
+        slot = slots.get(key)
+        if slot is None:
+            slots[key] = len(kept)
+            kept.append((point_time, record))
+            continue
+        if downsampled:
+            summary.downsampled_rows += 1
+        else:
+            summary.duplicate_rows += 1
+        # Same key: the later point (or the later write of the same point) wins.
+        if point_time >= kept[slot][0]:
+            kept[slot] = (point_time, record)
+
+    kept.sort(key=lambda timed_record: timed_record[0])
+    return [record for _, record in kept]
+
+
+def _compact_error_log(path: Path, records: list[bytes]) -> list[bytes]:
+    """Keep only the error messages the kept rows reference and point the rows at their new offsets."""
+    error_log = TaskErrorMessageLog(path)
+    if not error_log.path.exists():
+        return records
+    error_refs = [int(row_field(parse_csv_record(record), "error_ref") or 0) for record in records]
+    remapped = error_log.compact(error_refs)
+    compacted: list[bytes] = []
+    for record, error_ref in zip(records, error_refs, strict=True):
+        if not error_ref:
+            compacted.append(record)
+            continue
+        point = deserialize_row(parse_csv_record(record))
+        point.fields["error_ref"] = remapped.get(error_ref, 0)
+        compacted.append(serialize_point(point))
+    return compacted
+
+
+def _tag_pairs(row: list[str]) -> tuple[tuple[str, str], ...]:
+    return tuple(
+        (row[position], row[position + 1])
+        for position in range(2, len(row) - 1, 2)
+        if row[position].startswith(_TAG_PREFIXES)
+    )
+
+
+def _compaction_targets(settings: AppSettings) -> list[Path]:
+    """Timeseries base CSV, its segments, and the metrics and task run CSVs (each once).
+
+    Paths come from the same helpers the repositories are opened with, so the
+    files compacted are the files the jobs write (``.test`` outside production).
+    """
+    db_timeseries_file = resolve_project_path(settings.db_timeseries_file)
+    layout = TimeSeriesSegmentLayout(db_timeseries_file, VIDEO_MEASUREMENT, settings.timeseries_segment_period)
+    candidates = [
+        db_timeseries_file,
+        *(segment.path for segment in layout.segments()),
+        resolve_project_path(operational_metrics_file(settings)),
+        resolve_project_path(task_runs_file(settings)),
+    ]
+    return list(dict.fromkeys(candidates))
+
+
+def _refresh_export(settings: AppSettings, summary: CompactionSummary) -> None:
+    """Rebuild the web export when compaction removed rows it may still serve."""
+    db_timeseries_file = resolve_project_path(settings.db_timeseries_file)
+    export = TimeSeriesExport.for_timeseries_file(db_timeseries_file)
+    if not summary.apply_changes or not summary.rows_removed or not export.exists():
+        return
+    repo = TimeSeriesRepository(str(db_timeseries_file), segment_period=settings.timeseries_segment_period)
+    try:
+        export.rebuild_from(repo)
+    finally:
+        repo.close()
+
+
+def _log_summary(summary: CompactionSummary) -> None:
+    for file_summary in summary.files:
+        logger.info(
+            "compact_timeseries.file",
+            path=str(file_summary.path),
+            rows_before=file_summary.rows_before,
+            rows_after=file_summary.rows_after,
+            expired_rows=file_summary.expired_rows,
+            downsampled_rows=file_summary.downsampled_rows,
+            duplicate_rows=file_summary.duplicate_rows,
+            bytes_reclaimed=file_summary.bytes_reclaimed,
+        )
+    logger.info(
+        "compact_timeseries.summary",
+        apply_changes=summary.apply_changes,
+        files=len(summary.files),
+        rows_removed=summary.rows_removed,
+        bytes_before=sum(file_summary.bytes_before for file_summary in summary.files),
+        bytes_reclaimed=summary.bytes_reclaimed,
+        elapsed_seconds=round(summary.elapsed_seconds, 3),
+        error_count=len(summary.errors),
+    )
+    for error in summary.errors[:20]:
+        logger.error("compact_timeseries.error", error=error)
+
+
+async def main_async() -> None:
+    """Scheduled job: apply compaction to every timeseries file."""
+    settings = get_app_settings()
+    with FileExecutionLock(Path(settings.scheduler_lock_file), "compact_timeseries") as execution_lock:
+        if not execution_lock.acquired:
+            return
+        policy = CompactionPolicy.from_settings(settings, datetime.now(UTC))
+        summary = await asyncio.to_thread(
+            compact_timeseries,
+            _compaction_targets(settings),
+            policy,
+            apply_changes=True,
+        )
+        await asyncio.to_thread(_refresh_export, settings, summary)
+    _log_summary(summary)
+    if summary.has_errors:
+        msg = f"Timeseries compaction failed for {len(summary.errors)} file(s)"
+        raise RuntimeError(msg)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compact timeseries CSV files (retention, downsampling, dedup)")
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Apply changes. Without this flag the command runs in dry-run mode.",
+    )
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    with FileExecutionLock(Path(settings.scheduler_lock_file), "compact_timeseries") as execution_lock:
+        if not execution_lock.acquired:
+            raise SystemExit(1)
+        policy = CompactionPolicy.from_settings(settings, datetime.now(UTC))
+        summary = compact_timeseries(_compaction_targets(settings), policy, apply_changes=args.apply)
+        _refresh_export(settings, summary)
+
+    _log_summary(summary)
+    if summary.has_errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
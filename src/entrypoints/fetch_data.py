@@ -6,9 +6,14 @@ from pathlib import Path
 from src.adapters.youtube_source import YouTubeSource
 from src.application.fetch_data_use_case import FetchDataUseCase
 from src.config.settings import AppSettings, get_app_settings
-from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
-from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
-from src.infrastructure.storage.video_repository import VideoRepository
+from src.infrastructure.storage.storage_backend import (
+    open_daily_snapshot_store,
+    open_operational_metrics_repository,
+    open_timeseries_export,
+    open_timeseries_repository,
+    open_timeseries_rollup_store,
+    open_video_repository,
+)
 from src.shared.execution_lock import FileExecutionLock
 from src.shared.logging import get_logger, setup_logging
 from src.shared.utils import resolve_project_path
@@ -28,14 +33,14 @@ async def _run_fetch_data_job(settings: AppSettings | None = None, *, force_fetc
     settings = settings if settings is not None else get_app_settings()
     db_video_file = resolve_project_path(settings.db_video_file)
     db_timeseries_file = resolve_project_path(settings.db_timeseries_file)
+    db_metrics_file = resolve_project_path(settings.db_metrics_file)
 
     youtube_source = YouTubeSource(settings=settings)
-    video_repo = VideoRepository(db_video_file)
-    timeseries_repo = TimeSeriesRepository(str(db_timeseries_file))
-    metrics_repo = OperationalMetricsRepository(
-        str(db_timeseries_file),
-        retention_days=settings.operational_metrics_retention_days,
-    )
+    video_repo = open_video_repository(settings, db_video_file)
+    timeseries_repo = open_timeseries_repository(settings, db_timeseries_file)
+    # Stores derived from the TinyFlux files: the factories return None on SQLite, which keeps only the timeseries.
+    rollup_store = open_timeseries_rollup_store(settings, db_timeseries_file)
+    metrics_repo = open_operational_metrics_repository(settings, db_metrics_file)
 
     fetch_data_use_case = FetchDataUseCase(
         youtube_source=youtube_source,
@@ -43,6 +48,10 @@ async def _run_fetch_data_job(settings: AppSettings | None = None, *, force_fetc
         timeseries_repo=timeseries_repo,
         settings=settings,
         force_fetch=force_fetch,
+        snapshot_writer=open_daily_snapshot_store(settings, db_timeseries_file),
+        rollup_reader=rollup_store,
+        rollup_writer=rollup_store,
+        timeseries_export=open_timeseries_export(settings, db_timeseries_file),
     )
 
     try:
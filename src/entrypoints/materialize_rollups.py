@@ -0,0 +1,68 @@
+"""Recompute per-video daily/weekly rollups of the video timeseries for a date range.
+
+Rollups are refreshed automatically after each fetch; run this to backfill
+days fetched before rollups existed, or after editing timeseries history.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+from src.application.materialize_rollups_use_case import MaterializeRollupsUseCase
+from src.config.settings import get_app_settings
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+from src.infrastructure.storage.timeseries_rollup_store import TimeSeriesRollupStore
+from src.shared.execution_lock import FileExecutionLock
+from src.shared.logging import get_logger, setup_logging
+from src.shared.utils import resolve_project_path
+
+logger = get_logger(__name__)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Recompute daily/weekly video rollups for a date range")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First day, YYYY-MM-DD (default: today)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Last day, YYYY-MM-DD (default: --start)")
+    parser.add_argument("--source", type=str, default=None, help="Timeseries CSV path")
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    start_day = args.start or datetime.now(UTC).date()
+    end_day = args.end or start_day
+    if end_day < start_day:
+        parser.error("--end must not be before --start")
+    db_timeseries_file = resolve_project_path(args.source or settings.db_timeseries_file)
+
+    with FileExecutionLock(Path(settings.scheduler_lock_file), "materialize_rollups") as execution_lock:
+        if not execution_lock.acquired:
+            raise SystemExit(1)
+        timeseries_repo = TimeSeriesRepository(
+            str(db_timeseries_file), segment_period=settings.timeseries_segment_period
+        )
+        rollup_store = TimeSeriesRollupStore.for_timeseries_file(db_timeseries_file)
+        try:
+            result = MaterializeRollupsUseCase(timeseries_repo, rollup_store, rollup_store).execute(start_day, end_day)
+        finally:
+            timeseries_repo.close()
+
+    logger.info(
+        "materialize_rollups.summary",
+        start_day=start_day.isoformat(),
+        end_day=end_day.isoformat(),
+        days=result.days,
+        daily_rows=result.daily_rows,
+        weeks=list(result.weeks),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -298,21 +298,22 @@ def _apply_parsed_records(
     auth_repo = AuthenticationRepository(auth_db)
     release_repo = ReleaseRepository(str(release_db))
     try:
-        for video in videos:
-            video_repo.upsert(video)
-            summary.written_video += 1
-
-        for tiktok_auth in tiktok_auths:
-            auth_repo.add_or_update_tiktok_auth(tiktok_auth)
-            summary.written_tiktok_auth += 1
-
-        for yt_auth in yt_auths:
-            auth_repo.add_or_update_yt_auth(yt_auth)
-            summary.written_yt_auth += 1
-
-        for release in releases:
-            release_repo.add_or_update_release(release)
-            summary.written_release += 1
+        # Each destination file is written once, after all of its records were applied.
+        summary.written_video += video_repo.upsert_many(videos)
+
+        with auth_repo.buffered():
+            for tiktok_auth in tiktok_auths:
+                auth_repo.add_or_update_tiktok_auth(tiktok_auth)
+                summary.written_tiktok_auth += 1
+
+            for yt_auth in yt_auths:
+                auth_repo.add_or_update_yt_auth(yt_auth)
+                summary.written_yt_auth += 1
+
+        with release_repo.buffered():
+            for release in releases:
+                release_repo.add_or_update_release(release)
+                summary.written_release += 1
     finally:
         video_repo.close()
         auth_repo.close()
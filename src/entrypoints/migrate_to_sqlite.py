@@ -0,0 +1,367 @@
+"""One-shot migration: copy the TinyDB/TinyFlux files into the SQLite backend database.
+
+Reads every store of the files backend through its repository (or the raw
+TinyDB tables where the repository has no bulk read) and writes it through
+the SQLite repositories. The destination must not hold data yet, so the
+command cannot duplicate rows when run twice. Sources are only read; switch
+``TOP_MUSIC_STORAGE_BACKEND=sqlite`` once the summary looks right.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import batched
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+from tinydb import TinyDB
+from tinyflux import TinyFlux
+
+from src.config.settings import TimeSeriesSegmentPeriod, get_app_settings
+from src.domain.models import Release, TaskMethod, TikTokAuth, YtAuth
+from src.infrastructure.storage.operational_metrics_repository import OPERATIONAL_METRICS_MEASUREMENT
+from src.infrastructure.storage.publisher_state_repository import PublisherStateRepository
+from src.infrastructure.storage.sqlite_auth_repository import SqliteAuthenticationRepository
+from src.infrastructure.storage.sqlite_database import SqliteDatabase
+from src.infrastructure.storage.sqlite_operational_metrics_repository import SqliteOperationalMetricsRepository
+from src.infrastructure.storage.sqlite_publisher_state_repository import SqlitePublisherStateRepository
+from src.infrastructure.storage.sqlite_release_repository import SqliteReleaseRepository
+from src.infrastructure.storage.sqlite_task_run_state_repository import SqliteTaskRunStateRepository
+from src.infrastructure.storage.sqlite_timeseries_repository import SqliteTimeSeriesRepository
+from src.infrastructure.storage.sqlite_video_repository import SqliteVideoRepository
+from src.infrastructure.storage.storage_backend import sqlite_database_path
+from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+from src.infrastructure.storage.tinydb_storage import BufferedJSONStorage
+from src.infrastructure.storage.video_repository import VideoRepository
+from src.shared.execution_lock import FileExecutionLock
+from src.shared.logging import get_logger, setup_logging
+from src.shared.utils import resolve_project_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pydantic import BaseModel
+
+    from src.domain.models import CanonicalVideo, TaskRunState, VideoPoint
+
+logger = get_logger(__name__)
+
+_ALL_TIME = (datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC))
+_VIDEO_POINT_BATCH_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class FileStoreSources:
+    video_db: Path
+    auth_db: Path
+    release_db: Path
+    publishers_db: Path
+    timeseries_csv: Path
+    metrics_csv: Path
+    task_runs_csv: Path
+    segment_period: TimeSeriesSegmentPeriod = TimeSeriesSegmentPeriod.NONE
+
+
+@dataclass
+class SqliteMigrationSummary:
+    apply_changes: bool
+    sqlite_db: Path
+    videos: int = 0
+    video_points: int = 0
+    releases: int = 0
+    tiktok_auths: int = 0
+    yt_auths: int = 0
+    publisher_states: int = 0
+    task_runs: int = 0
+    metric_events: int = 0
+    destination_counts: dict[str, int] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
+
+
+def migrate_to_sqlite(sources: FileStoreSources, sqlite_db: Path, *, apply_changes: bool) -> SqliteMigrationSummary:
+    summary = SqliteMigrationSummary(apply_changes=apply_changes, sqlite_db=sqlite_db)
+
+    if sqlite_db.exists():
+        database = SqliteDatabase(sqlite_db)
+        try:
+            existing_counts = database.row_counts()
+        finally:
+            database.close()
+        if any(existing_counts.values()):
+            summary.errors.append(f"Destination SQLite database already holds data: {sqlite_db}")
+            summary.destination_counts = existing_counts
+            return summary
+
+    if not apply_changes:
+        _count_sources(sources, summary)
+        return summary
+
+    _copy_videos(sources, sqlite_db, summary)
+    _copy_video_points(sources, sqlite_db, summary)
+    _copy_releases(sources, sqlite_db, summary)
+    _copy_auths(sources, sqlite_db, summary)
+    _copy_publisher_states(sources, sqlite_db, summary)
+    _copy_task_runs(sources, sqlite_db, summary)
+    _copy_metric_events(sources, sqlite_db, summary)
+
+    database = SqliteDatabase(sqlite_db)
+    try:
+        summary.destination_counts = database.row_counts()
+    finally:
+        database.close()
+    return summary
+
+
+def _count_sources(sources: FileStoreSources, summary: SqliteMigrationSummary) -> None:
+    summary.videos = len(_read_videos(sources))
+    summary.video_points = sum(1 for _ in _iter_video_points(sources))
+    summary.releases = len(_read_models(sources.release_db, "release", Release, summary))
+    summary.tiktok_auths = len(_read_models(sources.auth_db, "tiktok_auth", TikTokAuth, summary))
+    summary.yt_auths = len(_read_models(sources.auth_db, "yt_auth", YtAuth, summary))
+    summary.publisher_states = len(_read_publisher_states(sources))
+    summary.task_runs = sum(1 for _ in _iter_task_runs(sources))
+    summary.metric_events = sum(count for _, _, _, count in _iter_metric_events(sources))
+
+
+def _copy_videos(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    repo = SqliteVideoRepository(str(sqlite_db))
+    try:
+        summary.videos = repo.upsert_many(_read_videos(sources))
+    finally:
+        repo.close()
+
+
+def _copy_video_points(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    repo = SqliteTimeSeriesRepository(str(sqlite_db))
+    try:
+        for batch in batched(_iter_video_points(sources), _VIDEO_POINT_BATCH_SIZE, strict=False):
+            repo.add_video_points(batch)
+            summary.video_points += len(batch)
+    finally:
+        repo.close()
+
+
+def _copy_releases(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    repo = SqliteReleaseRepository(str(sqlite_db))
+    try:
+        with repo.buffered():
+            for release in _read_models(sources.release_db, "release", Release, summary):
+                repo.add_or_update_release(release)
+                summary.releases += 1
+    finally:
+        repo.close()
+
+
+def _copy_auths(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    repo = SqliteAuthenticationRepository(sqlite_db)
+    try:
+        with repo.buffered():
+            for tiktok_auth in _read_models(sources.auth_db, "tiktok_auth", TikTokAuth, summary):
+                repo.add_or_update_tiktok_auth(tiktok_auth)
+                summary.tiktok_auths += 1
+            for yt_auth in _read_models(sources.auth_db, "yt_auth", YtAuth, summary):
+                repo.add_or_update_yt_auth(yt_auth)
+                summary.yt_auths += 1
+    finally:
+        repo.close()
+
+
+def _copy_publisher_states(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    repo = SqlitePublisherStateRepository(str(sqlite_db))
+    try:
+        for platform, enabled in _read_publisher_states(sources).items():
+            repo.set_enabled(platform, enabled)
+            summary.publisher_states += 1
+    finally:
+        repo.close()
+
+
+def _copy_task_runs(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    repo = SqliteTaskRunStateRepository(str(sqlite_db))
+    try:
+        for state in _iter_task_runs(sources):
+            repo.record_task_event(
+                task_method=state.task_method,
+                status=state.status,
+                error_message=state.error_message,
+                event_time=state.event_at,
+            )
+            summary.task_runs += 1
+    finally:
+        repo.close()
+
+
+def _copy_metric_events(sources: FileStoreSources, sqlite_db: Path, summary: SqliteMigrationSummary) -> None:
+    # No retention: events are copied as they are; the repository prunes on later writes.
+    repo = SqliteOperationalMetricsRepository(str(sqlite_db))
+    try:
+        for event_time, stage, is_error, count in _iter_metric_events(sources):
+            try:
+                for _ in range(count):
+                    repo.record_metric_event(stage=stage, is_error=is_error, event_time=event_time)
+            except ValueError as exc:
+                summary.warnings.append(f"Skipped metric event at {event_time.isoformat()}: {exc}")
+                continue
+            summary.metric_events += count
+    finally:
+        repo.close()
+
+
+def _read_videos(sources: FileStoreSources) -> list[CanonicalVideo]:
+    if not sources.video_db.exists():
+        return []
+    repo = VideoRepository(sources.video_db)
+    try:
+        return repo.all()
+    finally:
+        repo.close()
+
+
+def _iter_video_points(sources: FileStoreSources) -> Iterator[VideoPoint]:
+    if not sources.timeseries_csv.exists():
+        return
+    repo = TimeSeriesRepository(str(sources.timeseries_csv), segment_period=sources.segment_period)
+    try:
+        yield from repo.iter_video_points(*_ALL_TIME)
+    finally:
+        repo.close()
+
+
+def _read_models[ModelT: BaseModel](
+    db_path: Path,
+    table_name: str,
+    model: type[ModelT],
+    summary: SqliteMigrationSummary,
+) -> list[ModelT]:
+    """Read every document of a TinyDB table, in insertion order, skipping invalid ones."""
+    if not db_path.exists():
+        return []
+    db = TinyDB(str(db_path), storage=BufferedJSONStorage)
+    try:
+        documents = db.table(table_name).all()
+    finally:
+        db.close()
+    models: list[ModelT] = []
+    for document in documents:
+        try:
+            models.append(model.model_validate(document))
+        except ValidationError as exc:
+            summary.warnings.append(f"Skipped invalid {table_name} document {document.doc_id}: {exc}")
+    return models
+
+
+def _read_publisher_states(sources: FileStoreSources) -> dict[str, bool]:
+    if not sources.publishers_db.exists():
+        return {}
+    repo = PublisherStateRepository(str(sources.publishers_db))
+    try:
+        return repo.get_all()
+    finally:
+        repo.close()
+
+
+def _iter_task_runs(sources: FileStoreSources) -> Iterator[TaskRunState]:
+    if not sources.task_runs_csv.exists():
+        return
+    repo = TaskRunStateRepository(str(sources.task_runs_csv))
+    try:
+        for task_method in TaskMethod:
+            yield from repo.get_task_events_since(task_method=task_method, since=_ALL_TIME[0])
+    finally:
+        repo.close()
+
+
+def _iter_metric_events(sources: FileStoreSources) -> Iterator[tuple[datetime, str, bool, int]]:
+    if not sources.metrics_csv.exists():
+        return
+    db = TinyFlux(str(sources.metrics_csv))
+    try:
+        points = db.all()
+    finally:
+        db.close()
+    for point in points:
+        if point.measurement != OPERATIONAL_METRICS_MEASUREMENT or point.time is None:
+            continue
+        yield (
+            point.time.astimezone(UTC),
+            point.tags.get("stage") or "",
+            point.tags.get("outcome") == "error",
+            int(point.fields.get("count", 1) or 1),
+        )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Copy the TinyDB/TinyFlux files into the SQLite backend database")
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Apply changes. Without this flag the command runs in dry-run mode.",
+    )
+    parser.add_argument(
+        "--sqlite-db", type=str, default=None, help="Destination SQLite database path (default: the one the app opens)"
+    )
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    sources = FileStoreSources(
+        video_db=resolve_project_path(settings.db_video_file),
+        auth_db=resolve_project_path(settings.db_auth_file),
+        release_db=resolve_project_path(settings.db_release_file),
+        publishers_db=resolve_project_path(settings.db_release_file.replace("db_release", "db_publishers")),
+        timeseries_csv=resolve_project_path(settings.db_timeseries_file),
+        metrics_csv=resolve_project_path(settings.db_metrics_file),
+        task_runs_csv=resolve_project_path(settings.db_task_runs_file),
+        segment_period=settings.timeseries_segment_period,
+    )
+    sqlite_db = resolve_project_path(args.sqlite_db) if args.sqlite_db else sqlite_database_path(settings)
+
+    with FileExecutionLock(Path(settings.scheduler_lock_file), "migrate_to_sqlite") as execution_lock:
+        if not execution_lock.acquired:
+            raise SystemExit(1)
+        summary = migrate_to_sqlite(sources, sqlite_db, apply_changes=args.apply)
+
+    logger.info(
+        "sqlite_migration.summary",
+        apply_changes=summary.apply_changes,
+        sqlite_db=str(summary.sqlite_db),
+        videos=summary.videos,
+        video_points=summary.video_points,
+        releases=summary.releases,
+        tiktok_auths=summary.tiktok_auths,
+        yt_auths=summary.yt_auths,
+        publisher_states=summary.publisher_states,
+        task_runs=summary.task_runs,
+        metric_events=summary.metric_events,
+        destination_counts=summary.destination_counts,
+        warning_count=len(summary.warnings),
+        error_count=len(summary.errors),
+    )
+
+    for warning in summary.warnings[:20]:
+        logger.warning("sqlite_migration.warning", warning=warning)
+
+    for error in summary.errors[:20]:
+        logger.error("sqlite_migration.error", error=error)
+
+    if summary.has_errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
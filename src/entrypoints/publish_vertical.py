@@ -15,12 +15,17 @@ from src.application.publish_vertical_use_case import (
     PublishVerticalUseCase,
 )
 from src.config.settings import AppSettings, get_app_settings
+from src.domain.ports import ReleaseStore, TimeSeriesReader, VideoMetadataReader
 from src.infrastructure.publisher_registry import build_publishers
-from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
-from src.infrastructure.storage.publisher_state_repository import PublisherStateRepository
-from src.infrastructure.storage.release_repository import ReleaseRepository
-from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
-from src.infrastructure.storage.video_repository import VideoRepository
+from src.infrastructure.storage.storage_backend import (
+    open_daily_snapshot_store,
+    open_operational_metrics_repository,
+    open_publisher_state_repository,
+    open_release_repository,
+    open_timeseries_repository,
+    open_timeseries_rollup_store,
+    open_video_repository,
+)
 from src.shared.execution_lock import FileExecutionLock
 from src.shared.logging import get_logger, setup_logging
 
@@ -33,9 +38,9 @@ _VALID_PUBLISHER_SLUGS: frozenset[str] = frozenset({"instagram", "youtube", "tik
 class VerticalPublishJobContext:
     """Dependencies and configuration for vertical publish job."""
 
-    timeseries_repo: TimeSeriesRepository
-    video_repo: VideoRepository
-    release_repo: ReleaseRepository
+    timeseries_repo: TimeSeriesReader
+    video_repo: VideoMetadataReader
+    release_repo: ReleaseStore
     publishers: list
     publish_vertical_use_case: PublishVerticalUseCase
     vertical_video_pipeline: VerticalVideoPipelineAdapter
@@ -43,7 +48,7 @@ class VerticalPublishJobContext:
     fetch_videos_use_case: FetchTopVideosUseCase
 
 
-def _build_repositories(settings: AppSettings) -> tuple[TimeSeriesRepository, VideoRepository, ReleaseRepository]:
+def _build_repositories(settings: AppSettings) -> tuple[TimeSeriesReader, VideoMetadataReader, ReleaseStore]:
     """Factory: build all storage repositories with correct file paths."""
     db_video_file = settings.db_video_file
     db_release_file = settings.db_release_file
@@ -55,16 +60,16 @@ def _build_repositories(settings: AppSettings) -> tuple[TimeSeriesRepository, Vi
         db_timeseries_file += ".test"
 
     return (
-        TimeSeriesRepository(db_timeseries_file),
-        VideoRepository(Path(db_video_file)),
-        ReleaseRepository(db_release_file),
+        open_timeseries_repository(settings, db_timeseries_file),
+        open_video_repository(settings, db_video_file),
+        open_release_repository(settings, db_release_file),
     )
 
 
 def _build_job_dependencies(
-    timeseries_repo: TimeSeriesRepository,
-    video_repo: VideoRepository,
-    release_repo: ReleaseRepository,
+    timeseries_repo: TimeSeriesReader,
+    video_repo: VideoMetadataReader,
+    release_repo: ReleaseStore,
     settings: AppSettings,
     target_platforms: set[str] | None = None,
 ) -> VerticalPublishJobContext:
@@ -72,12 +77,20 @@ def _build_job_dependencies(
     db_publishers_file = settings.db_release_file.replace("db_release", "db_publishers")
     if not settings.is_production_env:
         db_publishers_file += ".test"
-    state_reader = PublisherStateRepository(db_publishers_file)
+    db_timeseries_file = settings.db_timeseries_file
+    if not settings.is_production_env:
+        db_timeseries_file += ".test"
+    state_reader = open_publisher_state_repository(settings, db_publishers_file)
     publishers = build_publishers(state_reader, target_platforms=target_platforms)
     publish_vertical_use_case = PublishVerticalUseCase()
     vertical_video_pipeline = VerticalVideoPipelineAdapter(settings)
     video_publish_executor = VideoPublishExecutorAdapter()
-    fetch_videos_use_case = FetchTopVideosUseCase(timeseries_repo, video_repo)
+    fetch_videos_use_case = FetchTopVideosUseCase(
+        timeseries_repo,
+        video_repo,
+        open_daily_snapshot_store(settings, db_timeseries_file),
+        open_timeseries_rollup_store(settings, db_timeseries_file),
+    )
 
     return VerticalPublishJobContext(
         timeseries_repo=timeseries_repo,
@@ -115,13 +128,7 @@ async def main_async(*, target_publishers: tuple[str, ...] | None = None) -> Non
 
 
 async def _run_vertical_publish_job(settings: AppSettings, *, target_platforms: set[str] | None = None) -> None:
-    metrics_db_path = (
-        settings.db_timeseries_file if settings.is_production_env else f"{settings.db_timeseries_file}.test"
-    )
-    metrics_repo = OperationalMetricsRepository(
-        metrics_db_path,
-        retention_days=settings.operational_metrics_retention_days,
-    )
+    metrics_repo = open_operational_metrics_repository(settings)
 
     try:
         day = datetime.datetime.now(UTC).date()
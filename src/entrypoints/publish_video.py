@@ -10,10 +10,14 @@ from src.adapters.youtube_weekly_uploader import YouTubeWeeklyUploaderAdapter
 from src.application.fetch_top_videos_use_case import FetchTopVideosUseCase
 from src.application.publish_video_use_case import WeeklyHorizontalPublishRequest, WeeklyHorizontalPublishUseCase
 from src.config.settings import AppSettings, get_app_settings
-from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
-from src.infrastructure.storage.release_repository import ReleaseRepository
-from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
-from src.infrastructure.storage.video_repository import VideoRepository
+from src.infrastructure.storage.storage_backend import (
+    open_daily_snapshot_store,
+    open_operational_metrics_repository,
+    open_release_repository,
+    open_timeseries_repository,
+    open_timeseries_rollup_store,
+    open_video_repository,
+)
 from src.shared.execution_lock import FileExecutionLock
 from src.shared.logging import get_logger, setup_logging
 
@@ -24,7 +28,7 @@ def _resolve_storage_paths(settings: AppSettings) -> tuple[str, str, str, str]:
     db_video_file = settings.db_video_file
     db_release_file = settings.db_release_file
     db_timeseries_file = settings.db_timeseries_file
-    metrics_db_path = settings.db_timeseries_file
+    metrics_db_path = settings.db_metrics_file
 
     if not settings.is_production_env:
         db_video_file += ".test"
@@ -45,17 +49,16 @@ async def main_async() -> None:
 
 async def _run_weekly_publish_job(settings: AppSettings) -> None:
     db_video_file, db_release_file, db_timeseries_file, metrics_db_path = _resolve_storage_paths(settings)
-    metrics_repo = OperationalMetricsRepository(
-        metrics_db_path,
-        retention_days=settings.operational_metrics_retention_days,
-    )
+    metrics_repo = open_operational_metrics_repository(settings, metrics_db_path)
 
     try:
         day = datetime.datetime.now(UTC).date()
-        release_repo = ReleaseRepository(db_release_file)
+        release_repo = open_release_repository(settings, db_release_file)
         fetch_videos_use_case = FetchTopVideosUseCase(
-            TimeSeriesRepository(db_timeseries_file),
-            VideoRepository(Path(db_video_file)),
+            open_timeseries_repository(settings, db_timeseries_file),
+            open_video_repository(settings, db_video_file),
+            open_daily_snapshot_store(settings, db_timeseries_file),
+            open_timeseries_rollup_store(settings, db_timeseries_file),
         )
         use_case = WeeklyHorizontalPublishUseCase(
             release_store=release_repo,
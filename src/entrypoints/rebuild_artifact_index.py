@@ -0,0 +1,43 @@
+"""Rebuild the index of rendered video artifacts from the videos folder.
+
+Renderers keep the index up to date and lookups rescan changed directories,
+so this is only needed after moving files around by hand or when the index
+file was lost or corrupted.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from src.config.settings import get_app_settings
+from src.infrastructure.video.artifact_registry import VideoArtifactRegistry
+from src.shared.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--folder", help="Generated videos folder (default: video_generated_folder setting)")
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+    args = _build_parser().parse_args()
+
+    registry = VideoArtifactRegistry(args.folder or settings.video_generated_folder)
+    count = registry.rebuild()
+    latest = registry.latest_artifact()
+
+    logger.info(
+        "rebuild_artifact_index.summary",
+        index=str(registry.index_path),
+        artifacts=count,
+        latest_artifact=latest.path if latest else None,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,12 @@ from pathlib import Path
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from src.config.settings import AppSettings, get_app_settings
+from src.domain.models import TaskMethod
+from src.entrypoints.compact_timeseries import main_async as compact_timeseries_main_async
 from src.entrypoints.fetch_data import main_async as fetch_data_main_async
 from src.entrypoints.publish_vertical import main_async as publish_vertical_main_async
 from src.entrypoints.publish_video import main_async as publish_weekly_main_async
-from src.shared.logging import get_logger, setup_logging
+from src.shared.logging import get_logger, run_log_context, setup_logging
 
 logger = get_logger(__name__)
 
@@ -28,6 +30,12 @@ class ScheduledJob:
     minute: int
     runner: JobRunner
     day_of_week: int | None = None
+    task_method: TaskMethod | None = None
+    """Admin task the job runs, so its run logs sit with the admin-triggered ones."""
+
+    @property
+    def run_log_task(self) -> str:
+        return self.task_method.value if self.task_method else self.name
 
 
 def _resolve_scheduler_timezone(settings: AppSettings) -> tzinfo:
@@ -65,12 +73,14 @@ def _build_jobs(settings: AppSettings) -> list[ScheduledJob]:
             hour=settings.scheduler_fetch_hour,
             minute=settings.scheduler_fetch_minute,
             runner=fetch_data_main_async,
+            task_method=TaskMethod.FETCH,
         ),
         ScheduledJob(
             name="vertical_publish",
             hour=settings.scheduler_vertical_publish_hour,
             minute=settings.scheduler_vertical_publish_minute,
             runner=publish_vertical_main_async,
+            task_method=TaskMethod.DAILY,
         ),
         ScheduledJob(
             name="weekly_publish",
@@ -78,6 +88,14 @@ def _build_jobs(settings: AppSettings) -> list[ScheduledJob]:
             minute=settings.scheduler_weekly_publish_minute,
             runner=publish_weekly_main_async,
             day_of_week=settings.scheduler_weekly_publish_day_of_week,
+            task_method=TaskMethod.WEEKLY,
+        ),
+        ScheduledJob(
+            name="compact_timeseries",
+            hour=settings.scheduler_compaction_hour,
+            minute=settings.scheduler_compaction_minute,
+            runner=compact_timeseries_main_async,
+            day_of_week=settings.scheduler_compaction_day_of_week,
         ),
     ]
 
@@ -120,6 +138,45 @@ def heartbeat_is_fresh(heartbeat_file: Path, stale_seconds: int, now: datetime |
     return (now.astimezone(UTC) - updated_at.astimezone(UTC)).total_seconds() <= stale_seconds
 
 
+async def _run_job(
+    job: ScheduledJob,
+    now: datetime,
+    heartbeat_file: Path,
+    *,
+    last_successful_job_name: str | None,
+) -> str | None:
+    """Run one due job inside its own run log context; returns the last successful job name."""
+    with run_log_context(job.run_log_task, trigger="scheduler"):
+        logger.info("scheduler.job_started", job=job.name, scheduled_date=str(now.date()))
+        await _write_heartbeat(
+            heartbeat_file,
+            status="running",
+            last_job_name=job.name,
+            last_successful_job_name=last_successful_job_name,
+        )
+        try:
+            await job.runner()
+            last_successful_job_name = job.name
+            logger.info("scheduler.job_finished", job=job.name)
+            await _write_heartbeat(
+                heartbeat_file,
+                status="idle",
+                last_job_name=job.name,
+                last_successful_job_name=last_successful_job_name,
+            )
+        except Exception as exc:
+            logger.exception("scheduler.job_failed", job=job.name, error=str(exc))
+            await _write_heartbeat(
+                heartbeat_file,
+                status="idle",
+                last_job_name=job.name,
+                last_successful_job_name=last_successful_job_name,
+                error=f"{job.name} failed: {exc!s}",
+            )
+            # Do NOT raise: allow other jobs in cycle to continue
+    return last_successful_job_name
+
+
 async def main_async() -> None:
     settings = get_app_settings()
     heartbeat_file = Path(settings.scheduler_heartbeat_file)
@@ -150,33 +207,9 @@ async def main_async() -> None:
                 continue
 
             last_run_keys[job.name] = run_key
-            logger.info("scheduler.job_started", job=job.name, scheduled_date=str(now.date()))
-            await _write_heartbeat(
-                heartbeat_file,
-                status="running",
-                last_job_name=job.name,
-                last_successful_job_name=last_successful_job_name,
+            last_successful_job_name = await _run_job(
+                job, now, heartbeat_file, last_successful_job_name=last_successful_job_name
             )
-            try:
-                await job.runner()
-                last_successful_job_name = job.name
-                logger.info("scheduler.job_finished", job=job.name)
-                await _write_heartbeat(
-                    heartbeat_file,
-                    status="idle",
-                    last_job_name=job.name,
-                    last_successful_job_name=last_successful_job_name,
-                )
-            except Exception as exc:
-                logger.exception("scheduler.job_failed", job=job.name, error=str(exc))
-                await _write_heartbeat(
-                    heartbeat_file,
-                    status="idle",
-                    last_job_name=job.name,
-                    last_successful_job_name=last_successful_job_name,
-                    error=f"{job.name} failed: {exc!s}",
-                )
-                # Do NOT raise: allow other jobs in cycle to continue
 
         await asyncio.sleep(settings.scheduler_poll_interval_seconds)
 
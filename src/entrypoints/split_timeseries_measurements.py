@@ -0,0 +1,187 @@
+"""One-shot migration: move admin measurements out of the shared timeseries CSV.
+
+"Operational metrics" rows go to ``db_metrics_file`` and "Task run state"
+rows to ``db_task_runs_file`` (merged with rows already there, in time
+order); video rows stay in the timeseries CSV. Task run error messages are
+moved from the ``error_message`` tag to the ``error_ref`` field. Run it while
+the API server is stopped: open TinyFlux handles in other processes would
+keep pointing at the old files.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.config.settings import get_app_settings
+from src.infrastructure.storage.operational_metrics_repository import OPERATIONAL_METRICS_MEASUREMENT
+from src.infrastructure.storage.task_run_state_repository import TASK_RUN_STATE_MEASUREMENT, TaskErrorMessageLog
+from src.infrastructure.storage.timeseries_files import (
+    TimedRecord,
+    backup_file,
+    csv_write_lock,
+    iter_complete_records,
+    merge_with_existing,
+    write_records_atomically,
+)
+from src.infrastructure.storage.timeseries_index import deserialize_row, parse_csv_record, row_time, serialize_point
+from src.infrastructure.storage.timeseries_repository import VIDEO_MEASUREMENT
+from src.infrastructure.storage.timeseries_segments import TimeSeriesSegment
+from src.shared.execution_lock import FileExecutionLock
+from src.shared.logging import get_logger, setup_logging
+from src.shared.utils import resolve_project_path
+
+logger = get_logger(__name__)
+
+_MIN_ROW_COLUMNS = 2
+
+
+@dataclass
+class MeasurementSplitSummary:
+    apply_changes: bool
+    source_csv: Path
+    metrics_rows: int = 0
+    task_run_rows: int = 0
+    error_messages_moved: int = 0
+    kept_rows: int = 0
+    backup_path: Path | None = None
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
+
+
+def split_timeseries_measurements(
+    source_csv: Path,
+    metrics_csv: Path,
+    task_runs_csv: Path,
+    *,
+    apply_changes: bool,
+) -> MeasurementSplitSummary:
+    summary = MeasurementSplitSummary(apply_changes=apply_changes, source_csv=source_csv)
+
+    if not source_csv.exists():
+        summary.errors.append(f"Source timeseries not found: {source_csv}")
+        return summary
+    paths = [source_csv, metrics_csv, task_runs_csv]
+    if len({path.resolve() for path in paths}) != len(paths):
+        summary.errors.append("Metrics and task run files must differ from the source timeseries file")
+        return summary
+
+    with ExitStack() as locks:
+        for path in paths:
+            locks.enter_context(csv_write_lock(path))
+
+        kept_records, metrics_records, task_run_records = _partition_records(source_csv, summary)
+        if not apply_changes or not (metrics_records or task_run_records):
+            return summary
+
+        summary.backup_path = backup_file(source_csv)
+        error_log = TaskErrorMessageLog(task_runs_csv)
+        task_run_records = [
+            (point_time, _move_error_message_to_field(record, error_log, summary))
+            for point_time, record in task_run_records
+        ]
+        write_records_atomically(metrics_csv, merge_with_existing(metrics_csv, metrics_records))
+        write_records_atomically(task_runs_csv, merge_with_existing(task_runs_csv, task_run_records))
+        write_records_atomically(source_csv, kept_records)
+        TimeSeriesSegment(source_csv, VIDEO_MEASUREMENT).discard_sidecars()
+    return summary
+
+
+def _partition_records(
+    source_csv: Path,
+    summary: MeasurementSplitSummary,
+) -> tuple[list[bytes], list[TimedRecord], list[TimedRecord]]:
+    kept_records: list[bytes] = []
+    moved: dict[str, list[TimedRecord]] = {OPERATIONAL_METRICS_MEASUREMENT: [], TASK_RUN_STATE_MEASUREMENT: []}
+    for record in iter_complete_records(source_csv):
+        row = parse_csv_record(record)
+        destination = moved.get(row[1]) if len(row) >= _MIN_ROW_COLUMNS else None
+        point_time = row_time(row)
+        if destination is None or point_time is None:
+            if destination is not None:
+                summary.warnings.append(f"Kept {row[1]} row with unreadable time in source CSV: {row[:1]}")
+            kept_records.append(record)
+            continue
+        destination.append((point_time, record))
+
+    summary.kept_rows = len(kept_records)
+    summary.metrics_rows = len(moved[OPERATIONAL_METRICS_MEASUREMENT])
+    summary.task_run_rows = len(moved[TASK_RUN_STATE_MEASUREMENT])
+    return kept_records, moved[OPERATIONAL_METRICS_MEASUREMENT], moved[TASK_RUN_STATE_MEASUREMENT]
+
+
+def _move_error_message_to_field(
+    record: bytes,
+    error_log: TaskErrorMessageLog,
+    summary: MeasurementSplitSummary,
+) -> bytes:
+    point = deserialize_row(parse_csv_record(record))
+    if "error_message" not in point.tags:
+        return record
+    message = point.tags.pop("error_message")
+    point.fields["error_ref"] = error_log.append(message) if message else 0
+    if message:
+        summary.error_messages_moved += 1
+    return serialize_point(point)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Move metrics and task run rows out of the shared timeseries CSV")
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Apply changes. Without this flag the command runs in dry-run mode.",
+    )
+    parser.add_argument("--source", type=str, default=None, help="Shared timeseries CSV path")
+    parser.add_argument("--metrics-db", type=str, default=None, help="Destination operational metrics CSV path")
+    parser.add_argument("--task-runs-db", type=str, default=None, help="Destination task run state CSV path")
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    source_csv = resolve_project_path(args.source or settings.db_timeseries_file)
+    metrics_csv = resolve_project_path(args.metrics_db or settings.db_metrics_file)
+    task_runs_csv = resolve_project_path(args.task_runs_db or settings.db_task_runs_file)
+
+    with FileExecutionLock(Path(settings.scheduler_lock_file), "split_timeseries_measurements") as execution_lock:
+        if not execution_lock.acquired:
+            raise SystemExit(1)
+        summary = split_timeseries_measurements(source_csv, metrics_csv, task_runs_csv, apply_changes=args.apply)
+
+    logger.info(
+        "timeseries_measurement_split.summary",
+        apply_changes=summary.apply_changes,
+        source_csv=str(summary.source_csv),
+        backup_path=str(summary.backup_path) if summary.backup_path else None,
+        metrics_rows=summary.metrics_rows,
+        task_run_rows=summary.task_run_rows,
+        error_messages_moved=summary.error_messages_moved,
+        kept_rows=summary.kept_rows,
+        warning_count=len(summary.warnings),
+        error_count=len(summary.errors),
+    )
+
+    for warning in summary.warnings[:20]:
+        logger.warning("timeseries_measurement_split.warning", warning=warning)
+
+    for error in summary.errors[:20]:
+        logger.error("timeseries_measurement_split.error", error=error)
+
+    if summary.has_errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
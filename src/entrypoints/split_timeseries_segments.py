@@ -0,0 +1,172 @@
+"""One-shot migration: split video points of the timeseries CSV into time segments.
+
+Video rows of the base CSV are moved to ``<csv>.segments/<key>.csv`` files
+(merged with, and sorted alongside, rows already written there); rows of
+other measurements stay in the base CSV. Run it while the API server is
+stopped: the scheduler lock and the CSV write lock are held, but open
+TinyFlux handles in other processes would keep pointing at the old file.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.config.settings import TimeSeriesSegmentPeriod, get_app_settings
+from src.infrastructure.storage.timeseries_files import (
+    TimedRecord,
+    backup_file,
+    csv_write_lock,
+    iter_complete_records,
+    merge_with_existing,
+    write_records_atomically,
+)
+from src.infrastructure.storage.timeseries_index import parse_csv_record, row_time
+from src.infrastructure.storage.timeseries_repository import VIDEO_MEASUREMENT
+from src.infrastructure.storage.timeseries_segments import (
+    TimeSeriesSegment,
+    TimeSeriesSegmentLayout,
+    segment_key,
+)
+from src.shared.execution_lock import FileExecutionLock
+from src.shared.logging import get_logger, setup_logging
+from src.shared.utils import resolve_project_path
+
+logger = get_logger(__name__)
+
+_MIN_ROW_COLUMNS = 2
+
+
+@dataclass
+class SplitSummary:
+    apply_changes: bool
+    source_csv: Path
+    period: TimeSeriesSegmentPeriod
+    video_rows: int = 0
+    kept_rows: int = 0
+    segment_rows: dict[str, int] = field(default_factory=dict)
+    backup_path: Path | None = None
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
+
+
+def split_timeseries_segments(
+    source_csv: Path,
+    period: TimeSeriesSegmentPeriod,
+    *,
+    apply_changes: bool,
+) -> SplitSummary:
+    summary = SplitSummary(apply_changes=apply_changes, source_csv=source_csv, period=period)
+
+    if period == TimeSeriesSegmentPeriod.NONE:
+        summary.errors.append("Segment period 'none' disables partitioning. Nothing to split.")
+        return summary
+    if not source_csv.exists():
+        summary.errors.append(f"Source timeseries not found: {source_csv}")
+        return summary
+
+    with csv_write_lock(source_csv):
+        kept_records, records_by_key = _partition_records(source_csv, period, summary)
+        if not apply_changes or not records_by_key:
+            return summary
+
+        summary.backup_path = backup_file(source_csv)
+        layout = TimeSeriesSegmentLayout(source_csv, VIDEO_MEASUREMENT, period)
+        for key, records in records_by_key.items():
+            segment = layout.segment(key)
+            write_records_atomically(segment.path, merge_with_existing(segment.path, records))
+            segment.discard_sidecars()
+        write_records_atomically(source_csv, kept_records)
+        TimeSeriesSegment(source_csv, VIDEO_MEASUREMENT).discard_sidecars()
+    return summary
+
+
+def _partition_records(
+    source_csv: Path,
+    period: TimeSeriesSegmentPeriod,
+    summary: SplitSummary,
+) -> tuple[list[bytes], dict[str, list[TimedRecord]]]:
+    kept_records: list[bytes] = []
+    records_by_key: dict[str, list[TimedRecord]] = {}
+    for record in iter_complete_records(source_csv):
+        row = parse_csv_record(record)
+        if len(row) < _MIN_ROW_COLUMNS or row[1] != VIDEO_MEASUREMENT:
+            kept_records.append(record)
+            continue
+        point_time = row_time(row)
+        if point_time is None:
+            summary.warnings.append(f"Kept video row with unreadable time in base CSV: {row[:1]}")
+            kept_records.append(record)
+            continue
+        key = segment_key(point_time, period)
+        records_by_key.setdefault(key, []).append((point_time, record))
+
+    summary.kept_rows = len(kept_records)
+    summary.video_rows = sum(len(records) for records in records_by_key.values())
+    summary.segment_rows = {key: len(records) for key, records in sorted(records_by_key.items())}
+    return kept_records, records_by_key
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Split the timeseries CSV into time-partitioned segment files")
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Apply changes. Without this flag the command runs in dry-run mode.",
+    )
+    parser.add_argument("--source", type=str, default=None, help="Source timeseries CSV path")
+    parser.add_argument(
+        "--period",
+        type=TimeSeriesSegmentPeriod,
+        choices=[period for period in TimeSeriesSegmentPeriod if period != TimeSeriesSegmentPeriod.NONE],
+        default=None,
+        help="Segment period (default: TOP_MUSIC_TIMESERIES_SEGMENT_PERIOD)",
+    )
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    source_csv = resolve_project_path(args.source or settings.db_timeseries_file)
+    period = args.period or settings.timeseries_segment_period
+
+    with FileExecutionLock(Path(settings.scheduler_lock_file), "split_timeseries_segments") as execution_lock:
+        if not execution_lock.acquired:
+            raise SystemExit(1)
+        summary = split_timeseries_segments(source_csv, period, apply_changes=args.apply)
+
+    logger.info(
+        "timeseries_split.summary",
+        apply_changes=summary.apply_changes,
+        source_csv=str(summary.source_csv),
+        period=summary.period.value,
+        backup_path=str(summary.backup_path) if summary.backup_path else None,
+        video_rows=summary.video_rows,
+        kept_rows=summary.kept_rows,
+        segment_rows=summary.segment_rows,
+        warning_count=len(summary.warnings),
+        error_count=len(summary.errors),
+    )
+
+    for warning in summary.warnings[:20]:
+        logger.warning("timeseries_split.warning", warning=warning)
+
+    for error in summary.errors[:20]:
+        logger.error("timeseries_split.error", error=error)
+
+    if summary.has_errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Run the storage-service daemon that owns the shared stores.
+
+Opens the task run, operational metrics, publisher state and release stores
+of the configured backend, at the paths the web server uses, and serves them
+on ``TOP_MUSIC_STORAGE_SERVICE_SOCKET`` (or ``--socket``) until interrupted.
+Processes configured with the same socket then reach these stores through
+the daemon instead of opening the files themselves.
+"""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import threading
+from typing import TYPE_CHECKING, Any
+
+from src.config.settings import get_app_settings
+from src.infrastructure.storage.sqlite_database import close_shared_databases
+from src.infrastructure.storage.storage_backend import (
+    open_operational_metrics_repository,
+    open_publisher_state_repository,
+    open_release_repository,
+    open_task_run_state_repository,
+)
+from src.infrastructure.storage.storage_service import (
+    METRICS_STORE,
+    PUBLISHER_STATE_STORE,
+    RELEASES_STORE,
+    TASK_RUNS_STORE,
+    StorageService,
+)
+from src.shared.logging import get_logger, setup_logging
+from src.shared.utils import resolve_project_path
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    from src.config.settings import AppSettings
+
+logger = get_logger(__name__)
+
+
+def open_service_stores(settings: AppSettings) -> dict[str, Any]:
+    """Open the repositories served by the daemon, keyed by store name."""
+    suffix = "" if settings.is_production_env else ".test"
+    return {
+        TASK_RUNS_STORE: open_task_run_state_repository(
+            settings, resolve_project_path(settings.db_task_runs_file + suffix), via_service=False
+        ),
+        METRICS_STORE: open_operational_metrics_repository(
+            settings, resolve_project_path(settings.db_metrics_file + suffix), via_service=False
+        ),
+        PUBLISHER_STATE_STORE: open_publisher_state_repository(
+            settings,
+            resolve_project_path(settings.db_release_file.replace("db_release", "db_publishers")),
+            via_service=False,
+        ),
+        RELEASES_STORE: open_release_repository(
+            settings, resolve_project_path(settings.db_release_file), via_service=False
+        ),
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", help="Unix socket to listen on (default: TOP_MUSIC_STORAGE_SERVICE_SOCKET)")
+    return parser
+
+
+def main() -> None:
+    settings = get_app_settings()
+    setup_logging(settings.log_file_path)
+    args = _build_parser().parse_args()
+
+    socket_path = args.socket or settings.storage_service_socket
+    if not socket_path:
+        logger.error("storage_service.socket_not_configured")
+        raise SystemExit(1)
+
+    service = StorageService(resolve_project_path(socket_path), open_service_stores(settings))
+
+    def _stop(signum: int, _frame: FrameType | None) -> None:
+        logger.info("storage_service.stopping", signal=signum)
+        # shutdown() blocks until serve_forever() returns, so it cannot run on the serving thread.
+        threading.Thread(target=service.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    try:
+        service.serve_forever()
+    finally:
+        # The SQLite stores share one connection, which their close() leaves open.
+        close_shared_databases()
+
+
+if __name__ == "__main__":
+    main()
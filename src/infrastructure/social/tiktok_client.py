@@ -13,7 +13,7 @@ from pydantic import BaseModel
 
 from src.config.settings import AppSettings, get_app_settings
 from src.domain.models import TikTokAuth
-from src.infrastructure.storage.auth_repository import AuthenticationRepository
+from src.infrastructure.storage.storage_backend import open_auth_repository
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -79,17 +79,17 @@ class TikTokClient:
         self._tiktok_redirect_uri: str = resolved_settings.tiktok_redirect_uri or ""
         self._tiktok_app_id: str = resolved_settings.tiktok_app_id or ""
         self._tiktok_user_openid: str = resolved_settings.tiktok_user_openid or ""
-        self._db_auth_file: str = resolved_settings.db_auth_file
+        self._settings: AppSettings = resolved_settings
 
     async def _get_user_refresh_token(self, user_openid: str) -> str:
-        repo = AuthenticationRepository(pathlib.Path(self._db_auth_file))
+        repo = open_auth_repository(self._settings)
         tiktok_auth = repo.get_tiktok_auth(user_openid)
         if tiktok_auth is None:
             return ""
         return tiktok_auth.refresh_token or ""
 
     async def _get_user_token_bearer_credentials(self, user_openid: str) -> str:
-        repo = AuthenticationRepository(pathlib.Path(self._db_auth_file))
+        repo = open_auth_repository(self._settings)
         tiktok_auth = repo.get_tiktok_auth(user_openid)
         if tiktok_auth is None:
             return ""
@@ -176,7 +176,7 @@ class TikTokClient:
             response_dict = await response.json()
 
         logger.debug("response_dict:", response_dict=response_dict)
-        repo = AuthenticationRepository(pathlib.Path(self._db_auth_file))
+        repo = open_auth_repository(self._settings)
         tiktok_auth = repo.add_or_update_tiktok_auth(
             tiktok_auth=TikTokAuth(
                 token=response_dict.get("access_token"),
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from src.config.settings import AppSettings, get_app_settings
-from src.infrastructure.storage.auth_repository import AuthenticationRepository
+from src.infrastructure.storage.storage_backend import open_auth_repository
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -21,7 +21,7 @@ class TikTokUploaderClient:
 
     def __init__(self, settings: AppSettings | None = None) -> None:
         resolved_settings = settings if settings is not None else get_app_settings()
-        self._db_auth_file = resolved_settings.db_auth_file
+        self._settings: AppSettings = resolved_settings
         self._tiktok_user_openid = resolved_settings.tiktok_user_openid or "default"
         self._tiktok_cookies_file = resolved_settings.tiktok_cookies_file
         self._tiktok_browser = resolved_settings.tiktok_browser
@@ -68,7 +68,7 @@ class TikTokUploaderClient:
                 return None
             return str(cookie_file)
 
-        repo = AuthenticationRepository(Path(self._db_auth_file))
+        repo = open_auth_repository(self._settings)
         auth = repo.get_tiktok_auth(self._tiktok_user_openid)
         if auth and auth.token:
             # During migration we allow existing auth token field to hold cookie payload.
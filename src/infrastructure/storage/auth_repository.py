@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, cast
 
 from tinydb import Query, TinyDB
 
 from src.domain.models import TikTokAuth, YtAuth
+from src.infrastructure.storage.tinydb_storage import BufferedJSONStorage
 from src.shared.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 logger = get_logger(__name__)
@@ -26,10 +29,17 @@ class AuthenticationRepository:
     _TABLE_TIKTOK = "tiktok_auth"
     _TABLE_YT = "yt_auth"
 
-    def __init__(self, db_path: Path) -> None:
-        """Initialize repository with TinyDB backend."""
+    def __init__(self, db_path: Path, *, write_back: bool = False) -> None:
+        """Initialize repository with TinyDB backend; ``write_back`` holds writes until ``flush()``/``close()``."""
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = TinyDB(str(db_path))
+        self._db = TinyDB(str(db_path), storage=BufferedJSONStorage, write_back=write_back)
+        self._storage = cast("BufferedJSONStorage", self._db.storage)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in memory and write the file once on exit."""
+        with self._storage.buffered():
+            yield
 
     # ========================================================================
     # TikTok Authentication
@@ -83,6 +93,10 @@ class AuthenticationRepository:
         table.upsert(yt_auth.model_dump(), Query().client_id == client_id)
         return yt_auth
 
+    def flush(self) -> None:
+        """Write changes held back in write-back mode."""
+        self._storage.flush()
+
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection, flushing pending writes."""
         self._db.close()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import fcntl
 from contextlib import contextmanager
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import IO, TYPE_CHECKING
 
@@ -13,18 +13,23 @@ if TYPE_CHECKING:
 
 from tinyflux import Point, TimeQuery, TinyFlux
 
+from src.infrastructure.storage.timeseries_files import TinyFluxHandle
+
+OPERATIONAL_METRICS_MEASUREMENT = "Operational metrics"
+
 
 class OperationalMetricsRepository:
     """Persist and aggregate operational metric events in TinyFlux."""
 
-    _MEASUREMENT = "Operational metrics"
+    _MEASUREMENT = OPERATIONAL_METRICS_MEASUREMENT
     _SUPPORTED_STAGES = frozenset({"fetch", "processing", "upload"})
 
     def __init__(self, db_path: str, *, retention_days: int | None = None) -> None:
         db_file = Path(db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
-        self._db = TinyFlux(db_path)
+        self._handle = TinyFluxHandle(db_file)
         self._retention_days = retention_days
+        self._pruned_on: date | None = None
         self._lock_path = db_file.with_suffix(f"{db_file.suffix}.lock")
 
     def record_metric_event(
@@ -82,12 +87,21 @@ class OperationalMetricsRepository:
         return counts
 
     def close(self) -> None:
-        self._db.close()
+        self._handle.close()
+
+    @property
+    def _db(self) -> TinyFlux:
+        # Reopened when compact-timeseries has replaced the CSV since the last access.
+        return self._handle.get()
 
     def _prune_old_events(self) -> None:
         if self._retention_days is None or self._retention_days <= 0:
             return
         cutoff = datetime.now(UTC)
+        # Day-granular retention: prune once per day; compact-timeseries handles the offline cleanup.
+        if self._pruned_on == cutoff.date():
+            return
+        self._pruned_on = cutoff.date()
         cutoff = cutoff.replace(microsecond=0)
         cutoff_ts = cutoff.timestamp() - (self._retention_days * 24 * 3600)
         cutoff_dt = datetime.fromtimestamp(cutoff_ts, tz=UTC)
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 from tinydb import Query, TinyDB
 
 from src.domain.ports import PublisherStateReader, PublisherStateWriter
+from src.infrastructure.storage.tinydb_storage import BufferedJSONStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class PublisherStateRepository(PublisherStateReader, PublisherStateWriter):
@@ -15,10 +21,17 @@ class PublisherStateRepository(PublisherStateReader, PublisherStateWriter):
     _TABLE = "publisher_state"
     _DEFAULT_ENABLED = True
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, *, write_back: bool = False) -> None:
         db_file = Path(db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
-        self._db = TinyDB(db_path)
+        self._db = TinyDB(db_path, storage=BufferedJSONStorage, write_back=write_back)
+        self._storage = cast("BufferedJSONStorage", self._db.storage)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in memory and write the file once on exit."""
+        with self._storage.buffered():
+            yield
 
     def is_enabled(self, platform: str) -> bool:
         table = self._db.table(self._TABLE)
@@ -36,5 +49,8 @@ class PublisherStateRepository(PublisherStateReader, PublisherStateWriter):
         records = table.all()
         return {r["platform"]: r["enabled"] for r in records}
 
+    def flush(self) -> None:
+        self._storage.flush()
+
     def close(self) -> None:
         self._db.close()
@@ -2,15 +2,94 @@
 
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
 from tinydb import Query, TinyDB
 
 from src.domain.models import Release
+from src.infrastructure.storage.tinydb_storage import BufferedJSONStorage
 from src.shared.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
 logger = get_logger(__name__)
 
+type FileStamp = tuple[int, int, int]
+# (published_at, doc_id) of the latest release; undated releases rank below every dated one.
+type LatestPointer = tuple[float, int]
+
+
+def _published_at(document: Mapping[str, Any]) -> float | None:
+    value = document.get("published_at")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _keep_latest[K](latest: dict[K, LatestPointer], key: K, pointer: LatestPointer) -> None:
+    current = latest.get(key)
+    if current is None or pointer[0] >= current[0]:
+        latest[key] = pointer
+
+
+class _ReleaseIndex:
+    """
+    Lookup tables over the release table.
+
+    ``dates`` holds the (platform, release_kind, UTC date) of every dated
+    release and ``platform_dates`` the same without the kind; ``latest``
+    points at the latest release per (platform, release_kind) and
+    ``latest_any_kind`` per platform. Appends update them in place.
+    """
+
+    def __init__(self) -> None:
+        self.dates: set[tuple[str | None, str | None, date]] = set()
+        self.platform_dates: set[tuple[str | None, date]] = set()
+        self.latest: dict[tuple[str | None, str | None], LatestPointer] = {}
+        self.latest_any_kind: dict[str | None, LatestPointer] = {}
+
+    def add(self, doc_id: int, document: Mapping[str, Any]) -> None:
+        """Index a release appended as ``doc_id``; must be called in insertion order."""
+        platform: str | None = document.get("platform")
+        release_kind: str | None = document.get("release_kind")
+        published_at = _published_at(document)
+        if published_at is not None:
+            published_date = datetime.fromtimestamp(published_at, tz=UTC).date()
+            self.dates.add((platform, release_kind, published_date))
+            self.platform_dates.add((platform, published_date))
+        # Among equal timestamps (or no timestamp at all) the later insert wins.
+        pointer = (published_at if published_at is not None else float("-inf"), doc_id)
+        _keep_latest(self.latest, (platform, release_kind), pointer)
+        _keep_latest(self.latest_any_kind, platform, pointer)
+
+    def copy(self) -> _ReleaseIndex:
+        """Return an independent copy, for changing an index other repositories may be reading."""
+        clone = _ReleaseIndex()
+        clone.dates = set(self.dates)
+        clone.platform_dates = set(self.platform_dates)
+        clone.latest = dict(self.latest)
+        clone.latest_any_kind = dict(self.latest_any_kind)
+        return clone
+
+
+@dataclass
+class _SharedReleaseIndex:
+    stamp: FileStamp | None
+    index: _ReleaseIndex
+
+
+_shared_release_indexes: dict[Path, _SharedReleaseIndex] = {}
+_shared_release_indexes_lock = threading.Lock()
+
 
 class ReleaseRepository:
     """
@@ -19,13 +98,42 @@ class ReleaseRepository:
     Storage: TinyDB (JSON)
     Table: "release"
     Responsibility: Record when a video was published on which platform.
+
+    ``is_release_at_date`` and ``get_latest_release`` run on every dashboard
+    request and publish job, so they are answered from an in-memory index
+    (see ``_ReleaseIndex``) instead of scanning the table. It is shared by
+    every repository of the process opened on the same file and version,
+    extended on appends (a repository copies it before its first change),
+    rebuilt after updates and deletes, and rebuilt whenever the file was
+    changed by someone else, so the web server, which opens a repository
+    per request, scans the table once per database change.
     """
 
     _TABLE = "release"
 
-    def __init__(self, db_path: str) -> None:
-        """Initialize repository with TinyDB backend."""
-        self._db = TinyDB(db_path)
+    def __init__(self, db_path: str, *, write_back: bool = False) -> None:
+        """Initialize repository with TinyDB backend; ``write_back`` holds writes until ``flush()``/``close()``."""
+        self._path = Path(db_path)
+        self._index_key = self._path.resolve()
+        self._db = TinyDB(db_path, storage=BufferedJSONStorage, write_back=write_back)
+        self._storage = cast("BufferedJSONStorage", self._db.storage)
+        self._table = self._db.table(self._TABLE)
+        self._release_index = _ReleaseIndex()
+        self._owns_index = False
+        self._stamp: FileStamp | None = None
+        self._load_index(self._file_stamp())
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in memory and write the file once on exit."""
+        try:
+            with self._storage.buffered():
+                yield
+        except BaseException:
+            # Writes discarded by the storage may already be in the index.
+            self._rebuild_index()
+            raise
+        self._after_write()
 
     def get_release(self, platform: str, client_id: str, release_kind: str | None = None) -> Release | None:
         """
@@ -53,32 +161,15 @@ class ReleaseRepository:
 
     def get_latest_release(self, platform: str, release_kind: str | None = None) -> Release | None:
         """Return the most recent release for a platform, optionally scoped by release kind."""
-        table = self._db.table(self._TABLE)
-        results = table.search(Query().platform == platform)
-        if not results:
+        index = self._index()
+        if release_kind is None:
+            pointer = index.latest_any_kind.get(platform)
+        else:
+            pointer = index.latest.get((platform, release_kind))
+        if pointer is None:
             return None
-        if release_kind is not None:
-            results = [result for result in results if result.get("release_kind") == release_kind]
-            if not results:
-                return None
-
-        latest: dict | None = None
-        latest_ts = float("-inf")
-        for result in results:
-            ts = result.get("published_at")
-            if ts is None:
-                continue
-            try:
-                ts_float = float(ts)
-            except (TypeError, ValueError):
-                continue
-            if ts_float >= latest_ts:
-                latest = result
-                latest_ts = ts_float
-
-        if latest is None:
-            return Release.model_validate(results[-1])
-        return Release.model_validate(latest)
+        document = self._table.get(doc_id=pointer[1])
+        return Release.model_validate(document) if document is not None else None
 
     def update_release(self, release: Release) -> Release:
         """
@@ -100,6 +191,7 @@ class ReleaseRepository:
         )
         if matching_docs:
             table.update(release.model_dump(), doc_ids=[matching_docs[-1].doc_id])
+            self._rebuild_index()
         return release
 
     def add_or_update_release(self, release: Release) -> Release:
@@ -116,8 +208,11 @@ class ReleaseRepository:
         Returns:
             Persisted Release.
         """
-        table = self._db.table(self._TABLE)
-        table.insert(release.model_dump())
+        document = release.model_dump()
+        index = self._owned_index()
+        doc_id = self._table.insert(document)
+        index.add(doc_id, document)
+        self._after_write()
         return release
 
     def is_release_at_date(self, platform: str, release_date: date, release_kind: str | None = None) -> bool:
@@ -132,24 +227,11 @@ class ReleaseRepository:
         Returns:
             True if a release exists for this platform on this date, False otherwise.
         """
-        table = self._db.table(self._TABLE)
-        results = table.search(Query().platform == platform)
-
-        if not results:
-            return False
-
-        # Check if any release timestamp falls on the given date
-        for result in results:
-            release = Release.model_validate(result)
-            if release_kind is not None and release.release_kind not in {None, release_kind}:
-                continue
-            if release.published_at is None:
-                continue
-            published_date = datetime.fromtimestamp(release.published_at, tz=UTC).date()
-            if published_date == release_date:
-                return True
-
-        return False
+        index = self._index()
+        if release_kind is None:
+            return (platform, release_date) in index.platform_dates
+        # Releases recorded before kinds existed count for every kind.
+        return (platform, release_kind, release_date) in index.dates or (platform, None, release_date) in index.dates
 
     def clear_releases_for_platform(self, platform: str) -> int:
         """
@@ -161,12 +243,19 @@ class ReleaseRepository:
         Returns:
             Number of records deleted.
         """
-        table = self._db.table(self._TABLE)
-        return len(table.remove(Query().platform == platform))
+        removed = self._table.remove(Query().platform == platform)
+        self._rebuild_index()
+        return len(removed)
+
+    def flush(self) -> None:
+        """Write changes held back in write-back mode."""
+        self._storage.flush()
+        self._after_write()
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection, flushing pending writes."""
         self._db.close()
+        self._after_write()
 
     def _get_matching_release_documents(self, platform: str, client_id: str, release_kind: str | None) -> list:
         """Return stored release documents matching platform, client and exact kind."""
@@ -176,3 +265,58 @@ class ReleaseRepository:
         if release_kind is None:
             return [result for result in results if result.get("release_kind") is None]
         return [result for result in results if result.get("release_kind") == release_kind]
+
+    def _index(self) -> _ReleaseIndex:
+        """Return the release index, rebuilt if the file changed since it was last seen."""
+        stamp = self._file_stamp()
+        if stamp != self._stamp:
+            self._load_index(stamp)
+        return self._release_index
+
+    def _owned_index(self) -> _ReleaseIndex:
+        """Return the release index for changing it, first copying it if it is shared."""
+        index = self._index()
+        if not self._owns_index:
+            self._release_index = index.copy()
+            self._owns_index = True
+        return self._release_index
+
+    def _after_write(self) -> None:
+        """Refresh the file stamp and share the updated index once the writes are on disk."""
+        self._stamp = self._file_stamp()
+        if self._owns_index and not self._storage.has_pending_writes:
+            self._share_index()
+
+    def _load_index(self, stamp: FileStamp | None) -> None:
+        """Adopt the shared index of database version ``stamp``, building it from the table if there is none."""
+        self._stamp = stamp
+        if not self._storage.has_pending_writes:
+            with _shared_release_indexes_lock:
+                shared = _shared_release_indexes.get(self._index_key)
+            if shared is not None and shared.stamp == stamp:
+                self._release_index = shared.index
+                self._owns_index = False
+                return
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Build the index from the table; it stays private while the table holds writes not on disk yet."""
+        self._stamp = self._file_stamp()
+        self._release_index = _ReleaseIndex()
+        for document in self._table.all():
+            self._release_index.add(document.doc_id, document)
+        self._owns_index = True
+        self._after_write()
+
+    def _share_index(self) -> None:
+        """Make this repository's index the process-wide index of its database version; it is read-only from now."""
+        with _shared_release_indexes_lock:
+            _shared_release_indexes[self._index_key] = _SharedReleaseIndex(stamp=self._stamp, index=self._release_index)
+        self._owns_index = False
+
+    def _file_stamp(self) -> FileStamp | None:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
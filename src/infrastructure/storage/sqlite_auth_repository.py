@@ -0,0 +1,98 @@
+"""Authentication token storage repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from src.domain.models import TikTokAuth, YtAuth
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, open_database
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+
+class SqliteAuthenticationRepository:
+    """
+    Manages OAuth2 authentication tokens for third-party integrations in SQLite.
+
+    Platforms: TikTok, YouTube
+    Tables: ``tiktok_auth`` and ``yt_auth``, keyed by client_id, holding the
+    credentials JSON.
+    """
+
+    _TABLE_TIKTOK = "tiktok_auth"
+    _TABLE_YT = "yt_auth"
+
+    def __init__(self, db: SqliteDatabase | str | Path) -> None:
+        """Initialize repository on a shared SQLite database, or on a connection of its own to the file ``db``."""
+        self._db, self._owns_db = open_database(db)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in one transaction."""
+        with self._db.transaction():
+            yield
+
+    # ========================================================================
+    # TikTok Authentication
+    # ========================================================================
+
+    def get_tiktok_auth(self, client_id: str) -> TikTokAuth | None:
+        """Retrieve TikTok auth by client_id."""
+        data = self._get(self._TABLE_TIKTOK, client_id)
+        return TikTokAuth.model_validate_json(data) if data is not None else None
+
+    def update_tiktok_auth(self, tiktok_auth: TikTokAuth) -> TikTokAuth:
+        """Update TikTok auth for existing client."""
+        self._update(self._TABLE_TIKTOK, tiktok_auth.client_id, tiktok_auth)
+        return tiktok_auth
+
+    def add_or_update_tiktok_auth(self, tiktok_auth: TikTokAuth) -> TikTokAuth:
+        """Insert or update TikTok auth (upsert)."""
+        self._upsert(self._TABLE_TIKTOK, tiktok_auth.client_id, tiktok_auth)
+        return tiktok_auth
+
+    # ========================================================================
+    # YouTube Authentication
+    # ========================================================================
+
+    def get_yt_auth(self, client_id: str) -> YtAuth | None:
+        """Retrieve YouTube auth by client_id."""
+        data = self._get(self._TABLE_YT, client_id)
+        return YtAuth.model_validate_json(data) if data is not None else None
+
+    def update_yt_auth(self, yt_auth: YtAuth) -> YtAuth:
+        """Update YouTube auth for existing client."""
+        self._update(self._TABLE_YT, yt_auth.client_id, yt_auth)
+        return yt_auth
+
+    def add_or_update_yt_auth(self, yt_auth: YtAuth) -> YtAuth:
+        """Insert or update YouTube auth (upsert)."""
+        self._upsert(self._TABLE_YT, yt_auth.client_id, yt_auth)
+        return yt_auth
+
+    def close(self) -> None:
+        """Close the database connection, unless it is shared."""
+        if self._owns_db:
+            self._db.close()
+
+    def _get(self, table: str, client_id: str) -> str | None:
+        row = self._db.fetch_one(f"SELECT data FROM {table} WHERE client_id = ?", (client_id,))  # noqa: S608
+        return row["data"] if row is not None else None
+
+    def _update(self, table: str, client_id: str | None, auth: BaseModel) -> None:
+        self._db.execute(
+            f"UPDATE {table} SET data = ? WHERE client_id = ?",  # noqa: S608 - table names are class constants
+            (auth.model_dump_json(), client_id or ""),
+        )
+
+    def _upsert(self, table: str, client_id: str | None, auth: BaseModel) -> None:
+        self._db.execute(
+            f"INSERT INTO {table} (client_id, data) VALUES (?, ?) "  # noqa: S608 - table names are class constants
+            "ON CONFLICT (client_id) DO UPDATE SET data = excluded.data",
+            (client_id or "", auth.model_dump_json()),
+        )
@@ -0,0 +1,233 @@
+"""Shared SQLite connection handling and schema for the sqlite storage backend."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_BUSY_TIMEOUT_MS = 5_000
+_FETCH_BATCH_SIZE = 1_000
+
+TABLES: tuple[str, ...] = (
+    "video",
+    "video_point",
+    "release",
+    "tiktok_auth",
+    "yt_auth",
+    "publisher_state",
+    "task_run",
+    "operational_metric",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS video (
+    video_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    channel_name TEXT NOT NULL DEFAULT '',
+    views INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    description TEXT NOT NULL DEFAULT '',
+    duration_seconds REAL NOT NULL DEFAULT 0
+);
+
+-- Text search over video, kept in sync by SqliteVideoRepository; rowid = video.rowid.
+CREATE VIRTUAL TABLE IF NOT EXISTS video_search USING fts5 (
+    video_id UNINDEXED,
+    title,
+    channel_name,
+    hashtags,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS video_point (
+    time_us INTEGER NOT NULL,
+    video_id TEXT NOT NULL,
+    views INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    views_growth INTEGER,
+    score INTEGER,
+    score_status TEXT
+);
+CREATE INDEX IF NOT EXISTS video_point_time ON video_point (time_us);
+CREATE INDEX IF NOT EXISTS video_point_video_time ON video_point (video_id, time_us);
+
+CREATE TABLE IF NOT EXISTS release (
+    id INTEGER PRIMARY KEY,
+    platform TEXT,
+    client_id TEXT,
+    release_kind TEXT,
+    published_at REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS release_platform_client ON release (platform, client_id);
+CREATE INDEX IF NOT EXISTS release_platform_published ON release (platform, published_at);
+CREATE INDEX IF NOT EXISTS release_platform_kind_published ON release (platform, release_kind, published_at);
+
+CREATE TABLE IF NOT EXISTS tiktok_auth (
+    client_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS yt_auth (
+    client_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS publisher_state (
+    platform TEXT PRIMARY KEY,
+    enabled INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS task_run (
+    id INTEGER PRIMARY KEY,
+    time_us INTEGER NOT NULL,
+    task_method TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS task_run_method_time ON task_run (task_method, time_us);
+CREATE INDEX IF NOT EXISTS task_run_method_status_time ON task_run (task_method, status, time_us);
+
+CREATE TABLE IF NOT EXISTS operational_metric (
+    time_us INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS operational_metric_time ON operational_metric (time_us);
+"""
+
+
+def to_time_us(value: datetime) -> int:
+    """Encode an aware datetime as integer microseconds since the Unix epoch (UTC)."""
+    return (value.astimezone(UTC) - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_time_us(value: int) -> datetime:
+    """Inverse of ``to_time_us``."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _regexp(pattern: str, value: str | None) -> bool:
+    return value is not None and re.search(pattern, value, flags=re.IGNORECASE) is not None
+
+
+class SqliteDatabase:
+    """
+    One SQLite connection in WAL mode, shared by the threads of a repository.
+
+    WAL lets readers in other processes (the web server) proceed while the
+    scheduler writes; ``synchronous=NORMAL`` only fsyncs at checkpoints, which
+    in WAL mode still never corrupts the database on power loss. Statements are
+    serialized on a lock because sqlite3 connections are not thread-safe.
+    The schema is created on open, so every repository can be pointed at a
+    fresh file.
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.path = Path(db_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # Autocommit mode: transactions are opened explicitly by ``transaction()``.
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.create_function("REGEXP", 2, _regexp, deterministic=True)
+        self._connection.executescript(SCHEMA)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in one write transaction, rolled back if it raises."""
+        with self._lock:
+            if self._connection.in_transaction:
+                yield self._connection
+                return
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> int:
+        """Run a single write statement in its own transaction and return the affected row count."""
+        with self.transaction() as connection:
+            return connection.execute(sql, parameters).rowcount
+
+    def fetch_all(self, sql: str, parameters: Sequence[Any] = ()) -> list[sqlite3.Row]:
+        """Run a query and return every row."""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def fetch_one(self, sql: str, parameters: Sequence[Any] = ()) -> sqlite3.Row | None:
+        """Run a query and return its first row, if any."""
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+
+    def iter_rows(self, sql: str, parameters: Sequence[Any] = ()) -> Iterator[sqlite3.Row]:
+        """Yield the rows of a query in batches, without holding the lock between batches."""
+        with self._lock:
+            cursor = self._connection.execute(sql, parameters)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    def row_counts(self) -> dict[str, int]:
+        """Return the number of rows of every backend table."""
+        return {
+            table: self.fetch_all(f"SELECT COUNT(*) AS rows FROM {table}")[0]["rows"]  # noqa: S608 - constant names
+            for table in TABLES
+        }
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._connection.close()
+
+
+_shared_databases: dict[Path, SqliteDatabase] = {}
+_shared_databases_lock = threading.Lock()
+
+
+def shared_database(db_path: str | Path) -> SqliteDatabase:
+    """Return the process-wide connection to ``db_path``, opening it (and creating the schema) on first use."""
+    path = Path(db_path).resolve()
+    with _shared_databases_lock:
+        database = _shared_databases.get(path)
+        if database is None:
+            database = _shared_databases[path] = SqliteDatabase(path)
+        return database
+
+
+def close_shared_databases() -> None:
+    """Close every process-wide connection, e.g. when the web server shuts down."""
+    with _shared_databases_lock:
+        databases = list(_shared_databases.values())
+        _shared_databases.clear()
+    for database in databases:
+        database.close()
+
+
+def open_database(source: SqliteDatabase | str | Path) -> tuple[SqliteDatabase, bool]:
+    """Return the database a repository runs on and whether the repository owns it, i.e. must close it."""
+    if isinstance(source, SqliteDatabase):
+        return source, False
+    return SqliteDatabase(source), True
@@ -0,0 +1,78 @@
+"""Operational metrics repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, open_database, to_time_us
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class SqliteOperationalMetricsRepository:
+    """
+    Persist and aggregate operational metric events in SQLite.
+
+    Table: ``operational_metric``, indexed on ``time_us``; counts are summed
+    by ``GROUP BY stage, outcome`` over the window instead of in Python.
+    """
+
+    _SUPPORTED_STAGES = frozenset({"fetch", "processing", "upload"})
+
+    def __init__(self, db: SqliteDatabase | str | Path, *, retention_days: int | None = None) -> None:
+        self._db, self._owns_db = open_database(db)
+        self._retention_days = retention_days
+        self._pruned_on: date | None = None
+
+    def record_metric_event(
+        self,
+        *,
+        stage: str,
+        is_error: bool,
+        event_time: datetime | None = None,
+    ) -> None:
+        if stage not in self._SUPPORTED_STAGES:
+            msg = f"Unsupported metrics stage: {stage}"
+            raise ValueError(msg)
+
+        with self._db.transaction() as connection:
+            connection.execute(
+                "INSERT INTO operational_metric (time_us, stage, outcome, count) VALUES (?, ?, ?, 1)",
+                (to_time_us(event_time or datetime.now(UTC)), stage, "error" if is_error else "success"),
+            )
+            self._prune_old_events()
+
+    def get_metric_counts(self, *, start_time: datetime, end_time: datetime) -> dict[str, dict[str, int]]:
+        rows = self._db.fetch_all(
+            "SELECT stage, outcome, SUM(count) AS total FROM operational_metric "
+            "WHERE time_us > ? AND time_us <= ? GROUP BY stage, outcome",
+            (to_time_us(start_time), to_time_us(end_time)),
+        )
+
+        counts = {
+            "fetch": {"count": 0, "errors": 0},
+            "processing": {"count": 0, "errors": 0},
+            "upload": {"count": 0, "errors": 0},
+        }
+        for row in rows:
+            if row["stage"] not in counts:
+                continue
+            counts[row["stage"]]["errors" if row["outcome"] == "error" else "count"] += int(row["total"])
+        return counts
+
+    def close(self) -> None:
+        if self._owns_db:
+            self._db.close()
+
+    def _prune_old_events(self) -> None:
+        if self._retention_days is None or self._retention_days <= 0:
+            return
+        now = datetime.now(UTC)
+        # Day-granular retention, like the TinyFlux backend: prune at most once per day.
+        if self._pruned_on == now.date():
+            return
+        self._pruned_on = now.date()
+        cutoff = now.replace(microsecond=0) - timedelta(days=self._retention_days)
+        self._db.execute("DELETE FROM operational_metric WHERE time_us < ?", (to_time_us(cutoff),))
@@ -0,0 +1,41 @@
+"""Publisher enable/disable state repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.domain.ports import PublisherStateReader, PublisherStateWriter
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, open_database
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class SqlitePublisherStateRepository(PublisherStateReader, PublisherStateWriter):
+    """Persist publisher enabled state per platform in SQLite."""
+
+    _DEFAULT_ENABLED = True
+
+    def __init__(self, db: SqliteDatabase | str | Path) -> None:
+        self._db, self._owns_db = open_database(db)
+
+    def is_enabled(self, platform: str) -> bool:
+        row = self._db.fetch_one("SELECT enabled FROM publisher_state WHERE platform = ?", (platform,))
+        if row is None:
+            return self._DEFAULT_ENABLED
+        return bool(row["enabled"])
+
+    def set_enabled(self, platform: str, enabled: bool) -> None:
+        self._db.execute(
+            "INSERT INTO publisher_state (platform, enabled) VALUES (?, ?) "
+            "ON CONFLICT (platform) DO UPDATE SET enabled = excluded.enabled",
+            (platform, enabled),
+        )
+
+    def get_all(self) -> dict[str, bool]:
+        rows = self._db.fetch_all("SELECT platform, enabled FROM publisher_state ORDER BY rowid")
+        return {row["platform"]: bool(row["enabled"]) for row in rows}
+
+    def close(self) -> None:
+        if self._owns_db:
+            self._db.close()
@@ -0,0 +1,116 @@
+"""Release tracking repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+from src.domain.models import Release
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, open_database
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class SqliteReleaseRepository:
+    """
+    Tracks published releases across platforms in SQLite.
+
+    Table: ``release``, one row per publish (full history, like the TinyDB
+    ReleaseRepository). Rows keep the Release JSON in ``data`` next to indexed
+    ``platform``/``client_id``/``published_at`` columns; row ids give the
+    insertion order the "last inserted wins" lookups rely on.
+    """
+
+    def __init__(self, db: SqliteDatabase | str | Path) -> None:
+        """Initialize repository on a shared SQLite database, or on a connection of its own to the file ``db``."""
+        self._db, self._owns_db = open_database(db)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in one transaction."""
+        with self._db.transaction():
+            yield
+
+    def get_release(self, platform: str, client_id: str, release_kind: str | None = None) -> Release | None:
+        """Retrieve the most recently inserted release for a platform+client_id, optionally of one kind."""
+        sql = "SELECT data FROM release WHERE platform = ? AND client_id = ?"
+        parameters: list[object] = [platform, client_id]
+        if release_kind is not None:
+            sql += " AND release_kind = ?"
+            parameters.append(release_kind)
+        row = self._db.fetch_one(f"{sql} ORDER BY id DESC LIMIT 1", parameters)
+        return Release.model_validate_json(row["data"]) if row is not None else None
+
+    def get_latest_release(self, platform: str, release_kind: str | None = None) -> Release | None:
+        """Return the release with the newest published_at for a platform, optionally scoped by kind."""
+        sql = "SELECT data FROM release WHERE platform = ?"
+        parameters: list[object] = [platform]
+        if release_kind is not None:
+            sql += " AND release_kind = ?"
+            parameters.append(release_kind)
+        # Both lookups walk the (platform[, release_kind], published_at) index backwards, whose
+        # implicit rowid suffix makes the later insert win among equal timestamps, as in the TinyDB backend.
+        row = self._db.fetch_one(
+            f"{sql} AND published_at IS NOT NULL ORDER BY published_at DESC, id DESC LIMIT 1", parameters
+        )
+        if row is None:
+            # Only undated rows, if any: the last inserted one.
+            row = self._db.fetch_one(f"{sql} ORDER BY id DESC LIMIT 1", parameters)
+        return Release.model_validate_json(row["data"]) if row is not None else None
+
+    def update_release(self, release: Release) -> Release:
+        """Overwrite the most recent release row of the same platform, client and exact kind, if any."""
+        with self._db.transaction() as connection:
+            row = connection.execute(
+                "SELECT id FROM release WHERE platform = ? AND client_id = ? AND release_kind IS ? "
+                "ORDER BY id DESC LIMIT 1",
+                (release.platform or "", release.client_id or "", release.release_kind),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE release SET platform = ?, client_id = ?, release_kind = ?, published_at = ?, data = ? "
+                    "WHERE id = ?",
+                    (*self._values(release), row["id"]),
+                )
+        return release
+
+    def add_or_update_release(self, release: Release) -> Release:
+        """Append a new release record, preserving full publish history."""
+        self._db.execute(
+            "INSERT INTO release (platform, client_id, release_kind, published_at, data) VALUES (?, ?, ?, ?, ?)",
+            self._values(release),
+        )
+        return release
+
+    def is_release_at_date(self, platform: str, release_date: date, release_kind: str | None = None) -> bool:
+        """Check if a release (of the kind, or unscoped) was published on the platform on the given UTC date."""
+        day_start = datetime.combine(release_date, time.min, tzinfo=UTC).timestamp()
+        day_end = (datetime.combine(release_date, time.min, tzinfo=UTC) + timedelta(days=1)).timestamp()
+        sql = "SELECT 1 FROM release WHERE platform = ? AND published_at >= ? AND published_at < ?"
+        parameters: list[object] = [platform, day_start, day_end]
+        if release_kind is not None:
+            sql += " AND (release_kind IS NULL OR release_kind = ?)"
+            parameters.append(release_kind)
+        return self._db.fetch_one(f"{sql} LIMIT 1", parameters) is not None
+
+    def clear_releases_for_platform(self, platform: str) -> int:
+        """Delete all releases for a platform (use with caution) and return the number deleted."""
+        return self._db.execute("DELETE FROM release WHERE platform = ?", (platform,))
+
+    def close(self) -> None:
+        """Close the database connection, unless it is shared."""
+        if self._owns_db:
+            self._db.close()
+
+    @staticmethod
+    def _values(release: Release) -> tuple[object, ...]:
+        return (
+            release.platform,
+            release.client_id,
+            release.release_kind,
+            release.published_at,
+            release.model_dump_json(),
+        )
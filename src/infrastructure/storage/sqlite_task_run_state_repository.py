@@ -0,0 +1,109 @@
+"""Task run state repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from src.domain.models import TaskMethod, TaskRunSnapshot, TaskRunState, TaskRunStatus
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, from_time_us, open_database, to_time_us
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+_TASK_METHODS = frozenset(method.value for method in TaskMethod)
+_TASK_STATUSES = frozenset(status.value for status in TaskRunStatus)
+
+
+class SqliteTaskRunStateRepository:
+    """
+    Persist and query admin task execution events in SQLite.
+
+    Table: ``task_run``, indexed on ``(task_method, time_us)`` and
+    ``(task_method, status, time_us)`` so the latest-event lookups read a
+    single index entry. Error messages are stored as plain text columns.
+    """
+
+    def __init__(self, db: SqliteDatabase | str | Path) -> None:
+        self._db, self._owns_db = open_database(db)
+
+    def record_task_event(
+        self,
+        *,
+        task_method: TaskMethod,
+        status: TaskRunStatus,
+        error_message: str | None = None,
+        event_time: datetime | None = None,
+    ) -> None:
+        self._db.execute(
+            "INSERT INTO task_run (time_us, task_method, status, error_message) VALUES (?, ?, ?, ?)",
+            (to_time_us(event_time or datetime.now(UTC)), task_method.value, status.value, error_message or None),
+        )
+
+    def get_latest_task_event(
+        self,
+        *,
+        task_method: TaskMethod,
+        status: TaskRunStatus | None = None,
+    ) -> TaskRunState | None:
+        sql = "SELECT time_us, task_method, status, error_message FROM task_run WHERE task_method = ?"
+        parameters: list[object] = [task_method.value]
+        if status is not None:
+            sql += " AND status = ?"
+            parameters.append(status.value)
+        row = self._db.fetch_one(f"{sql} ORDER BY time_us DESC, id DESC LIMIT 1", parameters)
+        return self._map_row(row) if row is not None else None
+
+    def get_task_events_since(
+        self,
+        *,
+        task_method: TaskMethod,
+        since: datetime,
+    ) -> list[TaskRunState]:
+        rows = self._db.fetch_all(
+            "SELECT time_us, task_method, status, error_message FROM task_run "
+            "WHERE task_method = ? AND time_us > ? ORDER BY time_us, id",
+            (task_method.value, to_time_us(since)),
+        )
+        return [self._map_row(row) for row in rows]
+
+    def snapshot(self, *, since: datetime) -> TaskRunSnapshot:
+        # One statement, so the latest events and the window come from the same database version.
+        rows = self._db.fetch_all(
+            "SELECT time_us, task_method, status, error_message FROM ("
+            "SELECT id, time_us, task_method, status, error_message, ROW_NUMBER() OVER ("
+            "PARTITION BY task_method, status ORDER BY time_us DESC, id DESC) AS recency FROM task_run"
+            ") WHERE recency = 1 OR time_us > ? ORDER BY time_us, id",
+            (to_time_us(since),),
+        )
+        # Rows of a task method or status this version does not know are skipped, not fatal.
+        known = [row for row in rows if row["task_method"] in _TASK_METHODS and row["status"] in _TASK_STATUSES]
+        if len(known) < len(rows):
+            logger.warning(
+                "task_run_state.unknown_events_skipped",
+                count=len(rows) - len(known),
+                task_methods=sorted({row["task_method"] for row in rows} - _TASK_METHODS),
+            )
+        return TaskRunSnapshot.from_events((self._map_row(row) for row in known), since=since.astimezone(UTC))
+
+    def data_version(self) -> str:
+        # Events are only ever appended, so the last rowid changes with every one of them.
+        row = self._db.fetch_one("SELECT MAX(id) AS last_id FROM task_run")
+        return str(row["last_id"] if row is not None else None)
+
+    def close(self) -> None:
+        if self._owns_db:
+            self._db.close()
+
+    @staticmethod
+    def _map_row(row: sqlite3.Row) -> TaskRunState:
+        return TaskRunState(
+            task_method=TaskMethod(row["task_method"]),
+            status=TaskRunStatus(row["status"]),
+            event_at=from_time_us(row["time_us"]),
+            error_message=row["error_message"],
+        )
@@ -0,0 +1,150 @@
+"""Time-series data repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.domain.models import VideoPoint, VideoPointRecord, VideoScoreStatus
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, from_time_us, open_database, to_time_us
+from src.infrastructure.storage.timeseries_repository import VIDEO_POINT_FIELDS
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Collection, Iterator, Sequence
+    from datetime import datetime
+    from pathlib import Path
+
+_COLUMNS = ("time_us", "video_id", "views", "likes", "views_growth", "score", "score_status")
+_SELECT_RANGE = (
+    f"SELECT {', '.join(_COLUMNS)} FROM video_point "  # noqa: S608 - constant column list
+    "WHERE time_us > ? AND time_us < ? ORDER BY time_us, rowid"
+)
+
+
+class SqliteTimeSeriesRepository:
+    """
+    Manages video time-series data (views, likes tracked over time) in SQLite.
+
+    Table: ``video_point``, indexed on ``time_us`` for range queries and on
+    ``(video_id, time_us)`` for point updates. Same read semantics as the
+    TinyFlux TimeSeriesRepository: ranges are exclusive at both ends, and
+    unset ``views_growth``/``score`` read back as None.
+    """
+
+    def __init__(self, db: SqliteDatabase | str | Path) -> None:
+        """Initialize repository on a shared SQLite database, or on a connection of its own to the file ``db``."""
+        self._db, self._owns_db = open_database(db)
+
+    def add_video_point(self, video_point: VideoPoint) -> None:
+        """Insert a new video data point into time-series."""
+        self.add_video_points([video_point])
+
+    def add_video_points(self, video_points: Sequence[VideoPoint]) -> None:
+        """Insert video data points in a single transaction."""
+        rows = [
+            (
+                to_time_us(video_point.time),
+                video_point.video_id,
+                video_point.views,
+                video_point.likes,
+                video_point.views_growth,
+                video_point.score,
+                video_point.score_status.value if video_point.score_status else None,
+            )
+            for video_point in video_points
+        ]
+        with self._db.transaction() as connection:
+            connection.executemany(
+                f"INSERT INTO video_point ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",  # noqa: S608
+                rows,
+            )
+
+    def update_video_point(self, video_point: VideoPoint) -> None:
+        """Update an existing video data point."""
+        self.update_video_points([video_point])
+
+    def update_video_points(self, video_points: Sequence[VideoPoint]) -> None:
+        """Update the score columns of existing points, matched on (video_id, time), in one transaction."""
+        rows = [
+            (
+                video_point.views_growth,
+                video_point.score,
+                video_point.score_status.value if video_point.score_status else None,
+                video_point.video_id,
+                to_time_us(video_point.time),
+            )
+            for video_point in video_points
+        ]
+        with self._db.transaction() as connection:
+            connection.executemany(
+                "UPDATE video_point SET views_growth = ?, score = ?, score_status = ? "
+                "WHERE video_id = ? AND time_us = ?",
+                rows,
+            )
+
+    def get_last_timestamp(self) -> datetime | None:
+        """Get the most recent timestamp in the time-series, answered from the time index."""
+        row = self._db.fetch_one("SELECT MAX(time_us) AS time_us FROM video_point")
+        if row is None or row["time_us"] is None:
+            return None
+        return from_time_us(row["time_us"])
+
+    def get_video_points_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPoint]:
+        """Retrieve points within ``(start_time, end_time)``, mapped to VideoPoint models."""
+        return list(self.iter_video_points(start_time, end_time))
+
+    def get_video_records_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPointRecord]:
+        """Retrieve points within ``(start_time, end_time)`` as lightweight records."""
+        return [self._map_record(row) for row in self._iter_range(start_time, end_time)]
+
+    def iter_video_points(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[VideoPoint]:
+        """
+        Yield VideoPoints within ``(start_time, end_time)`` while the rows are fetched.
+
+        Args:
+            start_time: Start of time range (exclusive).
+            end_time: End of time range (exclusive).
+            fields: Optional projection among ``VIDEO_POINT_FIELDS``; ``time`` and
+                ``video_id`` are always set, other attributes keep model defaults.
+
+        Raises:
+            ValueError: If ``fields`` names an unknown attribute.
+        """
+        projection = tuple(VIDEO_POINT_FIELDS if fields is None else fields)
+        if unknown := set(projection) - set(VIDEO_POINT_FIELDS):
+            msg = f"Unknown video point fields: {sorted(unknown)}"
+            raise ValueError(msg)
+        for row in self._iter_range(start_time, end_time):
+            record = self._map_record(row)
+            yield VideoPoint(
+                time=record.time,
+                video_id=record.video_id,
+                **{field_name: getattr(record, field_name) for field_name in projection},
+            )
+
+    def close(self) -> None:
+        """Close the database connection, unless it is shared."""
+        if self._owns_db:
+            self._db.close()
+
+    def _iter_range(self, start_time: datetime, end_time: datetime) -> Iterator[sqlite3.Row]:
+        return self._db.iter_rows(_SELECT_RANGE, (to_time_us(start_time), to_time_us(end_time)))
+
+    @staticmethod
+    def _map_record(row: sqlite3.Row) -> VideoPointRecord:
+        raw_status = row["score_status"]
+        return VideoPointRecord(
+            time=from_time_us(row["time_us"]),
+            video_id=row["video_id"],
+            views=row["views"],
+            likes=row["likes"],
+            views_growth=row["views_growth"] or None,
+            score=row["score"] or None,
+            score_status=VideoScoreStatus(raw_status) if raw_status else None,
+        )
@@ -0,0 +1,139 @@
+"""Video metadata repository (SQLite backend)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, open_database
+from src.infrastructure.storage.video_repository import VideoRecord
+from src.infrastructure.storage.video_text_index import FIELD_WEIGHTS, extract_hashtags, tokenize
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from src.domain.models import CanonicalVideo
+
+_COLUMNS = ("video_id", "title", "channel_name", "views", "likes", "description", "duration_seconds")
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM video"  # noqa: S608 - constant column list
+_UPSERT = (
+    f"INSERT INTO video ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))}) "  # noqa: S608
+    "ON CONFLICT (video_id) DO UPDATE SET " + ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+)
+_INSERT_SEARCH = "INSERT INTO video_search (rowid, video_id, title, channel_name, hashtags) VALUES (?, ?, ?, ?, ?)"
+# bm25 weight per video_search column (video_id is not indexed), same field weights as the TinyDB index.
+_SEARCH_RANK = "bm25(video_search, 0.0, {title}, {channel_name}, {hashtags})".format(**FIELD_WEIGHTS)
+# SQLite caps bound parameters per statement (32766 since 3.32); stay well below.
+_MAX_IN_PARAMETERS = 500
+
+
+class SqliteVideoRepository:
+    """
+    Video metadata repository using SQLite.
+
+    Same contract as the TinyDB VideoRepository; video_id is the primary key,
+    so get/upsert/delete are index lookups and ``all()`` keeps insertion order.
+    Text search uses the FTS5 table ``video_search``, written in the same
+    transaction as ``video`` and ranked with bm25.
+    """
+
+    def __init__(self, db: SqliteDatabase | str | Path) -> None:
+        """Initialize repository on a shared SQLite database, or on a connection of its own to the file ``db``."""
+        self._db, self._owns_db = open_database(db)
+
+    def upsert(self, video: CanonicalVideo) -> None:
+        """Insert or update a video record."""
+        with self._db.transaction() as connection:
+            self._upsert(connection, video)
+
+    def upsert_many(self, videos: Iterable[CanonicalVideo]) -> int:
+        """Insert or update several video records in a single transaction."""
+        count = 0
+        with self._db.transaction() as connection:
+            for video in videos:
+                self._upsert(connection, video)
+                count += 1
+        return count
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in one transaction."""
+        with self._db.transaction():
+            yield
+
+    def get(self, video_id: str) -> CanonicalVideo | None:
+        """Retrieve a video by ID."""
+        row = self._db.fetch_one(f"{_SELECT} WHERE video_id = ?", (video_id,))
+        return self._to_canonical(row) if row is not None else None
+
+    def get_many(self, video_ids: Iterable[str]) -> dict[str, CanonicalVideo]:
+        """Retrieve several videos by ID, one primary-key IN query per batch."""
+        unique_ids = list(dict.fromkeys(video_ids))
+        videos: dict[str, CanonicalVideo] = {}
+        for offset in range(0, len(unique_ids), _MAX_IN_PARAMETERS):
+            batch = unique_ids[offset : offset + _MAX_IN_PARAMETERS]
+            placeholders = ", ".join("?" * len(batch))
+            for row in self._db.fetch_all(f"{_SELECT} WHERE video_id IN ({placeholders})", batch):
+                videos[row["video_id"]] = self._to_canonical(row)
+        return videos
+
+    def search(self, pattern: str) -> list[CanonicalVideo]:
+        """Search videos by video_id pattern (case-insensitive regex)."""
+        rows = self._db.fetch_all(f"{_SELECT} WHERE video_id REGEXP ? ORDER BY rowid", (pattern,))
+        return [self._to_canonical(row) for row in rows]
+
+    def search_text(self, query: str, *, limit: int = 20) -> list[CanonicalVideo]:
+        """Search videos by title, channel name and hashtags; every query token matches a word or word prefix."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit <= 0:
+            return []
+        # Quoted prefix queries: the tokens are plain words, so FTS5 operators cannot be injected.
+        match = " ".join(f'"{token}"*' for token in tokens)
+        rows = self._db.fetch_all(
+            f"SELECT video_id FROM video_search WHERE video_search MATCH ? ORDER BY {_SEARCH_RANK}, video_id LIMIT ?",  # noqa: S608
+            (match, limit),
+        )
+        ranked = [row["video_id"] for row in rows]
+        videos = self.get_many(ranked)
+        return [videos[video_id] for video_id in ranked if video_id in videos]
+
+    def delete(self, video_id: str) -> int:
+        """Delete a video by ID and return the number of records deleted (0 or 1)."""
+        with self._db.transaction() as connection:
+            connection.execute(
+                "DELETE FROM video_search WHERE rowid = (SELECT rowid FROM video WHERE video_id = ?)", (video_id,)
+            )
+            return connection.execute("DELETE FROM video WHERE video_id = ?", (video_id,)).rowcount
+
+    def all(self) -> list[CanonicalVideo]:
+        """Retrieve all videos in insertion order."""
+        return [self._to_canonical(row) for row in self._db.fetch_all(f"{_SELECT} ORDER BY rowid")]
+
+    def clear(self) -> None:
+        """Delete all videos from table (use with caution)."""
+        with self._db.transaction() as connection:
+            connection.execute("DELETE FROM video_search")
+            connection.execute("DELETE FROM video")
+
+    def close(self) -> None:
+        """Close the database connection, unless it is shared."""
+        if self._owns_db:
+            self._db.close()
+
+    def _upsert(self, connection: sqlite3.Connection, video: CanonicalVideo) -> None:
+        connection.execute(_UPSERT, self._values(video))
+        (rowid,) = connection.execute("SELECT rowid FROM video WHERE video_id = ?", (video.video_id,)).fetchone()
+        connection.execute("DELETE FROM video_search WHERE rowid = ?", (rowid,))
+        hashtags = " ".join(extract_hashtags(video.title, video.description))
+        connection.execute(_INSERT_SEARCH, (rowid, video.video_id, video.title, video.channel_name, hashtags))
+
+    @staticmethod
+    def _values(video: CanonicalVideo) -> tuple[object, ...]:
+        record = VideoRecord.from_canonical(video)
+        return tuple(getattr(record, column) for column in _COLUMNS)
+
+    @staticmethod
+    def _to_canonical(row: sqlite3.Row) -> CanonicalVideo:
+        return VideoRecord.model_validate(dict(row)).to_canonical()
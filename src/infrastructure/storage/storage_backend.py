@@ -0,0 +1,188 @@
+"""Repository factories resolving the configured storage backend."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.config.settings import StorageBackend
+from src.infrastructure.storage.auth_repository import AuthenticationRepository
+from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
+from src.infrastructure.storage.publisher_state_repository import PublisherStateRepository
+from src.infrastructure.storage.release_repository import ReleaseRepository
+from src.infrastructure.storage.sqlite_auth_repository import SqliteAuthenticationRepository
+from src.infrastructure.storage.sqlite_database import shared_database
+from src.infrastructure.storage.sqlite_operational_metrics_repository import SqliteOperationalMetricsRepository
+from src.infrastructure.storage.sqlite_publisher_state_repository import SqlitePublisherStateRepository
+from src.infrastructure.storage.sqlite_release_repository import SqliteReleaseRepository
+from src.infrastructure.storage.sqlite_task_run_state_repository import SqliteTaskRunStateRepository
+from src.infrastructure.storage.sqlite_timeseries_repository import SqliteTimeSeriesRepository
+from src.infrastructure.storage.sqlite_video_repository import SqliteVideoRepository
+from src.infrastructure.storage.storage_service import (
+    RemoteOperationalMetricsRepository,
+    RemotePublisherStateRepository,
+    RemoteReleaseRepository,
+    RemoteTaskRunStateRepository,
+    StorageServiceClient,
+)
+from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
+from src.infrastructure.storage.timeseries_export import TimeSeriesExport
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+from src.infrastructure.storage.timeseries_rollup_store import TimeSeriesRollupStore
+from src.infrastructure.storage.timeseries_snapshot_store import DailySnapshotStore
+from src.infrastructure.storage.video_repository import VideoRepository
+from src.shared.utils import resolve_project_path
+
+if TYPE_CHECKING:
+    from src.config.settings import AppSettings
+    from src.infrastructure.storage.sqlite_database import SqliteDatabase
+
+
+def is_sqlite_backend(settings: AppSettings) -> bool:
+    """Return True when repositories should use the SQLite database instead of the TinyDB/TinyFlux files."""
+    return settings.storage_backend == StorageBackend.SQLITE
+
+
+def sqlite_database_path(settings: AppSettings) -> Path:
+    """Return the SQLite database file, resolved against the project root and suffixed ``.test`` outside production."""
+    return resolve_project_path(_env_file(settings, settings.db_sqlite_file))
+
+
+def operational_metrics_file(settings: AppSettings) -> str:
+    """Return the TinyFlux operational metrics file, suffixed ``.test`` outside production."""
+    return _env_file(settings, settings.db_metrics_file)
+
+
+def task_runs_file(settings: AppSettings) -> str:
+    """Return the TinyFlux admin task run file, suffixed ``.test`` outside production."""
+    return _env_file(settings, settings.db_task_runs_file)
+
+
+def open_sqlite_database(settings: AppSettings) -> SqliteDatabase:
+    """Return the process-wide connection to the SQLite database, shared by every repository of the process."""
+    return shared_database(sqlite_database_path(settings))
+
+
+def open_auth_repository(settings: AppSettings) -> AuthenticationRepository | SqliteAuthenticationRepository:
+    """Open the credential store of the configured backend."""
+    if is_sqlite_backend(settings):
+        return SqliteAuthenticationRepository(open_sqlite_database(settings))
+    return AuthenticationRepository(Path(settings.db_auth_file))
+
+
+def open_video_repository(
+    settings: AppSettings, db_video_file: str | Path | None = None
+) -> VideoRepository | SqliteVideoRepository:
+    """Open the video metadata store of the configured backend; ``db_video_file`` overrides the TinyDB file."""
+    if is_sqlite_backend(settings):
+        return SqliteVideoRepository(open_sqlite_database(settings))
+    return VideoRepository(Path(db_video_file or settings.db_video_file))
+
+
+def open_timeseries_repository(
+    settings: AppSettings, db_timeseries_file: str | Path | None = None
+) -> TimeSeriesRepository | SqliteTimeSeriesRepository:
+    """Open the timeseries store of the configured backend; ``db_timeseries_file`` overrides the TinyFlux file."""
+    if is_sqlite_backend(settings):
+        return SqliteTimeSeriesRepository(open_sqlite_database(settings))
+    return TimeSeriesRepository(
+        str(db_timeseries_file or settings.db_timeseries_file),
+        segment_period=settings.timeseries_segment_period,
+    )
+
+
+def open_daily_snapshot_store(
+    settings: AppSettings, db_timeseries_file: str | Path | None = None
+) -> DailySnapshotStore | None:
+    """Open the columnar daily snapshots beside the TinyFlux file; None on SQLite, which ranks from indexed queries."""
+    if is_sqlite_backend(settings):
+        return None
+    return DailySnapshotStore.for_timeseries_file(db_timeseries_file or settings.db_timeseries_file)
+
+
+def open_timeseries_rollup_store(
+    settings: AppSettings, db_timeseries_file: str | Path | None = None
+) -> TimeSeriesRollupStore | None:
+    """Open the daily/weekly rollups beside the TinyFlux file; None on SQLite, which ranks from indexed queries."""
+    if is_sqlite_backend(settings):
+        return None
+    return TimeSeriesRollupStore.for_timeseries_file(db_timeseries_file or settings.db_timeseries_file)
+
+
+def open_timeseries_export(
+    settings: AppSettings, db_timeseries_file: str | Path | None = None
+) -> TimeSeriesExport | None:
+    """Open the memory-mapped timeseries export beside the TinyFlux file; None on SQLite, which serves range queries."""
+    if is_sqlite_backend(settings):
+        return None
+    return TimeSeriesExport.for_timeseries_file(db_timeseries_file or settings.db_timeseries_file)
+
+
+def open_release_repository(
+    settings: AppSettings, db_release_file: str | Path | None = None, *, via_service: bool = True
+) -> ReleaseRepository | SqliteReleaseRepository | RemoteReleaseRepository:
+    """Open the release store: the storage-service daemon's if one runs, else the configured backend's."""
+    if via_service and (client := storage_service_client(settings)) is not None:
+        return RemoteReleaseRepository(client)
+    if is_sqlite_backend(settings):
+        return SqliteReleaseRepository(open_sqlite_database(settings))
+    return ReleaseRepository(str(db_release_file or settings.db_release_file))
+
+
+def open_publisher_state_repository(
+    settings: AppSettings, db_publishers_file: str | Path | None = None, *, via_service: bool = True
+) -> PublisherStateRepository | SqlitePublisherStateRepository | RemotePublisherStateRepository:
+    """Open the publisher on/off store: the storage-service daemon's if one runs, else the configured backend's."""
+    if via_service and (client := storage_service_client(settings)) is not None:
+        return RemotePublisherStateRepository(client)
+    if is_sqlite_backend(settings):
+        return SqlitePublisherStateRepository(open_sqlite_database(settings))
+    return PublisherStateRepository(
+        str(db_publishers_file or settings.db_release_file.replace("db_release", "db_publishers"))
+    )
+
+
+def open_operational_metrics_repository(
+    settings: AppSettings, db_metrics_file: str | Path | None = None, *, via_service: bool = True
+) -> OperationalMetricsRepository | SqliteOperationalMetricsRepository | RemoteOperationalMetricsRepository:
+    """Open the operational metrics store: the storage-service daemon's if one runs, else the configured backend's."""
+    if via_service and (client := storage_service_client(settings)) is not None:
+        return RemoteOperationalMetricsRepository(client)
+    if is_sqlite_backend(settings):
+        return SqliteOperationalMetricsRepository(
+            open_sqlite_database(settings),
+            retention_days=settings.operational_metrics_retention_days,
+        )
+    return OperationalMetricsRepository(
+        str(db_metrics_file or operational_metrics_file(settings)),
+        retention_days=settings.operational_metrics_retention_days,
+    )
+
+
+def open_task_run_state_repository(
+    settings: AppSettings, db_task_runs_file: str | Path | None = None, *, via_service: bool = True
+) -> TaskRunStateRepository | SqliteTaskRunStateRepository | RemoteTaskRunStateRepository:
+    """Open the admin task run store: the storage-service daemon's if one runs, else the configured backend's."""
+    if via_service and (client := storage_service_client(settings)) is not None:
+        return RemoteTaskRunStateRepository(client)
+    if is_sqlite_backend(settings):
+        return SqliteTaskRunStateRepository(open_sqlite_database(settings))
+    return TaskRunStateRepository(str(db_task_runs_file or task_runs_file(settings)))
+
+
+@lru_cache(maxsize=4)
+def _storage_service_client(socket_path: str) -> StorageServiceClient:
+    # One connection per process, shared by the adapters of every request and job.
+    return StorageServiceClient(socket_path)
+
+
+def storage_service_client(settings: AppSettings) -> StorageServiceClient | None:
+    """Return the client of the storage-service daemon, or None when the stores are opened directly."""
+    if not settings.storage_service_socket:
+        return None
+    return _storage_service_client(settings.storage_service_socket)
+
+
+def _env_file(settings: AppSettings, db_file: str) -> str:
+    return db_file if settings.is_production_env else f"{db_file}.test"
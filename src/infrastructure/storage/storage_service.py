@@ -0,0 +1,577 @@
+"""Single-writer storage service: a local daemon that owns the shared stores, and its client adapters.
+
+The scheduler jobs, the admin background tasks of the web process and the
+publish entrypoints all write the task run, operational metrics, publisher
+state and release stores. With ``storage_service_socket`` configured, they
+send those calls over a Unix socket to one ``StorageService`` process
+instead, which keeps the repositories open, so writers no longer contend on
+file locks or re-read files, and reads are served from the daemon's warm
+repositories (decoded-file cache, release index).
+
+Protocol: one JSON object per line in each direction. A request is
+``{"store": ..., "method": ..., "args": {...}}``; the reply is
+``{"result": ...}`` or ``{"error": ...}``. Every call of the ports below
+is listed in ``_READS``/``_WRITES`` with explicit argument and result
+codecs, so nothing else of the repositories is reachable remotely.
+
+Writes go through one writer thread that drains every queued write into
+a batch and applies each store's share of it inside the repository's
+``buffered()`` block when it has one (one file write or one SQLite
+transaction per batch). Calls fail individually: an error in one write is
+reported to its caller and does not discard the rest of the batch.
+
+On shutdown, the writes already accepted are applied, every later call is
+answered with an error and the open client connections are closed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import queue
+import socket
+import socketserver
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from src.domain.models import Release, TaskMethod, TaskRunSnapshot, TaskRunState, TaskRunStatus
+from src.shared import json_codec
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterator, Mapping
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+TASK_RUNS_STORE = "task_runs"
+METRICS_STORE = "metrics"
+PUBLISHER_STATE_STORE = "publisher_state"
+RELEASES_STORE = "releases"
+
+# Upper bound on the writes applied under one buffered() block.
+MAX_WRITE_BATCH = 256
+
+_SHUTTING_DOWN = "storage service is shutting down"
+
+
+class StorageServiceError(RuntimeError):
+    """The storage service could not be reached or rejected a call."""
+
+
+def _encode_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _decode_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _decode_release(value: Mapping[str, Any] | None) -> Release | None:
+    return Release.model_validate(value) if value is not None else None
+
+
+def _encode_release(release: Release | None) -> dict[str, Any] | None:
+    return release.model_dump(mode="json") if release is not None else None
+
+
+def _encode_task_run(state: TaskRunState | None) -> dict[str, Any] | None:
+    return state.model_dump(mode="json") if state is not None else None
+
+
+type _Handler = Callable[[Any, dict[str, Any]], Any]
+
+# (store, method) → handler(repository, args) returning a JSON-serializable result.
+_READS: dict[tuple[str, str], _Handler] = {
+    (TASK_RUNS_STORE, "get_latest_task_event"): lambda repo, args: _encode_task_run(
+        repo.get_latest_task_event(
+            task_method=TaskMethod(args["task_method"]),
+            status=TaskRunStatus(args["status"]) if args.get("status") else None,
+        )
+    ),
+    (TASK_RUNS_STORE, "get_task_events_since"): lambda repo, args: [
+        _encode_task_run(state)
+        for state in repo.get_task_events_since(
+            task_method=TaskMethod(args["task_method"]), since=_decode_datetime(args["since"])
+        )
+    ],
+    (TASK_RUNS_STORE, "snapshot"): lambda repo, args: repo.snapshot(since=_decode_datetime(args["since"])).model_dump(
+        mode="json"
+    ),
+    (TASK_RUNS_STORE, "data_version"): lambda repo, _args: repo.data_version(),
+    (METRICS_STORE, "get_metric_counts"): lambda repo, args: repo.get_metric_counts(
+        start_time=_decode_datetime(args["start_time"]), end_time=_decode_datetime(args["end_time"])
+    ),
+    (PUBLISHER_STATE_STORE, "is_enabled"): lambda repo, args: repo.is_enabled(args["platform"]),
+    (PUBLISHER_STATE_STORE, "get_all"): lambda repo, _args: repo.get_all(),
+    (RELEASES_STORE, "get_release"): lambda repo, args: _encode_release(
+        repo.get_release(args["platform"], args["client_id"], args.get("release_kind"))
+    ),
+    (RELEASES_STORE, "get_latest_release"): lambda repo, args: _encode_release(
+        repo.get_latest_release(args["platform"], args.get("release_kind"))
+    ),
+    (RELEASES_STORE, "is_release_at_date"): lambda repo, args: repo.is_release_at_date(
+        args["platform"], date.fromisoformat(args["release_date"]), args.get("release_kind")
+    ),
+}
+
+_WRITES: dict[tuple[str, str], _Handler] = {
+    (TASK_RUNS_STORE, "record_task_event"): lambda repo, args: repo.record_task_event(
+        task_method=TaskMethod(args["task_method"]),
+        status=TaskRunStatus(args["status"]),
+        error_message=args.get("error_message"),
+        event_time=_decode_datetime(args.get("event_time")),
+    ),
+    (METRICS_STORE, "record_metric_event"): lambda repo, args: repo.record_metric_event(
+        stage=args["stage"], is_error=args["is_error"], event_time=_decode_datetime(args.get("event_time"))
+    ),
+    (PUBLISHER_STATE_STORE, "set_enabled"): lambda repo, args: repo.set_enabled(args["platform"], args["enabled"]),
+    (RELEASES_STORE, "add_or_update_release"): lambda repo, args: _encode_release(
+        repo.add_or_update_release(Release.model_validate(args["release"]))
+    ),
+    (RELEASES_STORE, "update_release"): lambda repo, args: _encode_release(
+        repo.update_release(Release.model_validate(args["release"]))
+    ),
+}
+
+
+@dataclass
+class _PendingWrite:
+    store: str
+    handler: _Handler
+    args: dict[str, Any]
+    result: Future[Any]
+
+
+class StorageService:
+    """
+    Serves the given repositories over a Unix socket.
+
+    ``stores`` maps the store names (``TASK_RUNS_STORE``, ...) to open
+    repositories of either backend; stores left out reject their calls.
+    """
+
+    def __init__(self, socket_path: Path, stores: Mapping[str, Any], *, max_batch: int = MAX_WRITE_BATCH) -> None:
+        """Prepare the service; nothing is bound until ``serve_forever()`` or ``start()``."""
+        self.socket_path = socket_path
+        self._stores = dict(stores)
+        self._max_batch = max_batch
+        # Repositories are not thread-safe: reads and write batches take turns.
+        self._stores_lock = threading.Lock()
+        # Set under _accept_lock once the writer has been told to stop: no write may be queued after that.
+        self._stopping = False
+        self._accept_lock = threading.Lock()
+        self._writes: queue.Queue[_PendingWrite | None] = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="storage-service-writer", daemon=True)
+        self._server: _Server | None = None
+        self._server_thread: threading.Thread | None = None
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve until ``shutdown()`` is called from another thread."""
+        server = self._bind()
+        logger.info("storage_service.listening", socket=str(self.socket_path), stores=sorted(self._stores))
+        try:
+            server.serve_forever()
+        finally:
+            self._close()
+
+    def start(self) -> None:
+        """Serve from a background thread."""
+        server = self._bind()
+        self._server_thread = threading.Thread(target=server.serve_forever, name="storage-service", daemon=True)
+        self._server_thread.start()
+
+    def shutdown(self) -> None:
+        """Stop serving, apply the writes already queued and close the repositories."""
+        if self._server is not None:
+            self._server.shutdown()
+        if self._server_thread is not None:
+            self._server_thread.join()
+            self._close()
+
+    def handle(self, request: Mapping[str, Any]) -> dict[str, Any]:
+        """Execute one decoded request and return the reply object."""
+        store, method = request.get("store"), request.get("method")
+        if not isinstance(store, str) or not isinstance(method, str) or store not in self._stores:
+            return {"error": f"unknown store or method: {store}.{method}"}
+        args = request.get("args") or {}
+        if not isinstance(args, dict):
+            return {"error": "malformed request"}
+        key = (store, method)
+        if (handler := _READS.get(key)) is not None:
+            return self._read(store, method, handler, args)
+        if (handler := _WRITES.get(key)) is not None:
+            return self._write(store, handler, args)
+        return {"error": f"unknown method: {store}.{method}"}
+
+    def _read(self, store: str, method: str, handler: _Handler, args: dict[str, Any]) -> dict[str, Any]:
+        try:
+            with self._stores_lock:
+                if self._stopping:
+                    return {"error": _SHUTTING_DOWN}
+                return {"result": handler(self._stores[store], args)}
+        except Exception as exc:
+            logger.exception("storage_service.read_failed", store=store, method=method)
+            return {"error": f"{type(exc).__name__}: {exc}"}
+
+    def _write(self, store: str, handler: _Handler, args: dict[str, Any]) -> dict[str, Any]:
+        pending = _PendingWrite(store=store, handler=handler, args=args, result=Future())
+        with self._accept_lock:
+            if self._stopping:
+                return {"error": _SHUTTING_DOWN}
+            self._writes.put(pending)
+        try:
+            return {"result": pending.result.result()}
+        except Exception as exc:  # noqa: BLE001 - already logged by the writer thread
+            return {"error": f"{type(exc).__name__}: {exc}"}
+
+    def _bind(self) -> _Server:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.is_socket():
+            # Left behind by a daemon that did not shut down cleanly.
+            self.socket_path.unlink()
+        server = _Server(str(self.socket_path), _RequestHandler, service=self)
+        self.socket_path.chmod(0o660)
+        self._server = server
+        self._writer.start()
+        return server
+
+    def _close(self) -> None:
+        with self._accept_lock:
+            self._stopping = True
+            self._writes.put(None)
+        self._writer.join()
+        if self._server is not None:
+            self._server.server_close()
+            self._server.close_connections()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+        with self._stores_lock:
+            for repository in self._stores.values():
+                close = getattr(repository, "close", None)
+                if close is not None:
+                    close()
+
+    def _write_loop(self) -> None:
+        while True:
+            first = self._writes.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self._max_batch:
+                try:
+                    pending = self._writes.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+            self._apply(batch)
+            if stop:
+                return
+
+    def _apply(self, batch: list[_PendingWrite]) -> None:
+        by_store: dict[str, list[_PendingWrite]] = {}
+        for pending in batch:
+            by_store.setdefault(pending.store, []).append(pending)
+        with self._stores_lock:
+            for store, writes in by_store.items():
+                repository = self._stores[store]
+                outcomes: list[tuple[_PendingWrite, Any, BaseException | None]] = []
+                try:
+                    with _write_batch(repository):
+                        for pending in writes:
+                            try:
+                                outcomes.append((pending, pending.handler(repository, pending.args), None))
+                            except Exception as exc:  # reported to the caller of this write only
+                                logger.exception("storage_service.write_failed", store=store)
+                                outcomes.append((pending, None, exc))
+                except Exception as exc:
+                    # The batch itself failed to reach the disk: none of its writes succeeded.
+                    logger.exception("storage_service.batch_failed", store=store, writes=len(writes))
+                    outcomes = [(pending, None, exc) for pending in writes]
+                for pending, result, error in outcomes:
+                    if error is not None:
+                        pending.result.set_exception(error)
+                    else:
+                        pending.result.set_result(result)
+            logger.debug("storage_service.batch_applied", writes=len(batch), stores=len(by_store))
+
+
+@contextlib.contextmanager
+def _write_batch(repository: Any) -> Iterator[None]:
+    buffered = getattr(repository, "buffered", None)
+    if buffered is None:
+        yield
+        return
+    with buffered():
+        yield
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: str, handler: type[socketserver.BaseRequestHandler], *, service: StorageService
+    ) -> None:
+        self.service = service
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(address, handler)
+
+    def track_connection(self, connection: socket.socket, *, is_open: bool) -> None:
+        with self._connections_lock:
+            if is_open:
+                self._connections.add(connection)
+            else:
+                self._connections.discard(connection)
+
+    def close_connections(self) -> None:
+        """End the connections still open, so their clients see the service go away."""
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            with contextlib.suppress(OSError):
+                connection.shutdown(socket.SHUT_RDWR)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.track_connection(self.connection, is_open=True)
+
+    def finish(self) -> None:
+        self.server.track_connection(self.connection, is_open=False)
+        with contextlib.suppress(OSError):
+            super().finish()
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
+                request = None
+            reply = self.server.service.handle(request) if isinstance(request, dict) else {"error": "malformed request"}
+            self.wfile.write(json_codec.dumps(reply) + b"\n")
+            self.wfile.flush()
+
+
+class StorageServiceClient:
+    """
+    Connection to a ``StorageService``, shared by every adapter of a process.
+
+    Calls are serialized over one persistent connection. A read that fails
+    because the connection dropped is retried once on a new connection; a
+    write is not, since the service may already have applied it.
+    """
+
+    def __init__(self, socket_path: str | os.PathLike[str], *, timeout: float = 30.0) -> None:
+        """Create a client; the connection is opened on the first call."""
+        self.socket_path = str(socket_path)
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._reader: Any = None
+
+    def call(self, store: str, method: str, **args: Any) -> Any:
+        """Run ``store.method(**args)`` in the service and return its decoded JSON result."""
+        payload = json_codec.dumps({"store": store, "method": method, "args": args}) + b"\n"
+        attempts = 2 if (store, method) in _READS else 1
+        with self._lock:
+            reply = self._exchange_with_retries(payload, attempts)
+        if "error" in reply:
+            msg = f"{store}.{method} failed in the storage service: {reply['error']}"
+            raise StorageServiceError(msg)
+        return reply.get("result")
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._disconnect()
+
+    def _exchange_with_retries(self, payload: bytes, attempts: int) -> dict[str, Any]:
+        for attempt in range(1, attempts + 1):
+            try:
+                return self._exchange(payload)
+            except OSError as exc:
+                self._disconnect()
+                if attempt == attempts:
+                    msg = f"Storage service at {self.socket_path} unavailable: {exc}"
+                    raise StorageServiceError(msg) from exc
+        msg = f"Storage service at {self.socket_path} was not called: no attempt allowed"
+        raise StorageServiceError(msg)
+
+    def _exchange(self, payload: bytes) -> dict[str, Any]:
+        if self._socket is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self._timeout)
+            try:
+                connection.connect(self.socket_path)
+            except OSError:
+                connection.close()
+                raise
+            self._socket = connection
+            self._reader = connection.makefile("rb")
+        self._socket.sendall(payload)
+        line = self._reader.readline()
+        if not line:
+            msg = "connection closed by the storage service"
+            raise ConnectionResetError(msg)
+        return json_codec.loads(line)
+
+    def _disconnect(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class RemoteTaskRunStateRepository:
+    """TaskRunStateReader/Writer served by the storage service."""
+
+    def __init__(self, client: StorageServiceClient) -> None:
+        self._client = client
+
+    def record_task_event(
+        self,
+        *,
+        task_method: TaskMethod,
+        status: TaskRunStatus,
+        error_message: str | None = None,
+        event_time: datetime | None = None,
+    ) -> None:
+        self._client.call(
+            TASK_RUNS_STORE,
+            "record_task_event",
+            task_method=task_method.value,
+            status=status.value,
+            error_message=error_message,
+            event_time=_encode_datetime(event_time),
+        )
+
+    def get_latest_task_event(
+        self,
+        *,
+        task_method: TaskMethod,
+        status: TaskRunStatus | None = None,
+    ) -> TaskRunState | None:
+        result = self._client.call(
+            TASK_RUNS_STORE,
+            "get_latest_task_event",
+            task_method=task_method.value,
+            status=status.value if status is not None else None,
+        )
+        return TaskRunState.model_validate(result) if result is not None else None
+
+    def get_task_events_since(self, *, task_method: TaskMethod, since: datetime) -> list[TaskRunState]:
+        result = self._client.call(
+            TASK_RUNS_STORE, "get_task_events_since", task_method=task_method.value, since=_encode_datetime(since)
+        )
+        return [TaskRunState.model_validate(state) for state in result]
+
+    def snapshot(self, *, since: datetime) -> TaskRunSnapshot:
+        return TaskRunSnapshot.model_validate(
+            self._client.call(TASK_RUNS_STORE, "snapshot", since=_encode_datetime(since))
+        )
+
+    def data_version(self) -> str:
+        return str(self._client.call(TASK_RUNS_STORE, "data_version"))
+
+    def close(self) -> None:
+        """Nothing to release: the connection is shared by the process."""
+
+
+class RemoteOperationalMetricsRepository:
+    """OperationalMetricsReader/Writer served by the storage service."""
+
+    def __init__(self, client: StorageServiceClient) -> None:
+        self._client = client
+
+    def record_metric_event(self, *, stage: str, is_error: bool, event_time: datetime | None = None) -> None:
+        self._client.call(
+            METRICS_STORE,
+            "record_metric_event",
+            stage=stage,
+            is_error=is_error,
+            event_time=_encode_datetime(event_time),
+        )
+
+    def get_metric_counts(self, *, start_time: datetime, end_time: datetime) -> dict[str, dict[str, int]]:
+        return self._client.call(
+            METRICS_STORE,
+            "get_metric_counts",
+            start_time=_encode_datetime(start_time),
+            end_time=_encode_datetime(end_time),
+        )
+
+    def close(self) -> None:
+        """Nothing to release: the connection is shared by the process."""
+
+
+class RemotePublisherStateRepository:
+    """PublisherStateReader/Writer served by the storage service."""
+
+    def __init__(self, client: StorageServiceClient) -> None:
+        self._client = client
+
+    def is_enabled(self, platform: str) -> bool:
+        return self._client.call(PUBLISHER_STATE_STORE, "is_enabled", platform=platform)
+
+    def set_enabled(self, platform: str, enabled: bool) -> None:
+        self._client.call(PUBLISHER_STATE_STORE, "set_enabled", platform=platform, enabled=enabled)
+
+    def get_all(self) -> dict[str, bool]:
+        return self._client.call(PUBLISHER_STATE_STORE, "get_all")
+
+    def close(self) -> None:
+        """Nothing to release: the connection is shared by the process."""
+
+
+class RemoteReleaseRepository:
+    """ReleaseStore served by the storage service."""
+
+    def __init__(self, client: StorageServiceClient) -> None:
+        self._client = client
+
+    def get_release(self, platform: str, client_id: str, release_kind: str | None = None) -> Release | None:
+        return _decode_release(
+            self._client.call(
+                RELEASES_STORE, "get_release", platform=platform, client_id=client_id, release_kind=release_kind
+            )
+        )
+
+    def get_latest_release(self, platform: str, release_kind: str | None = None) -> Release | None:
+        return _decode_release(
+            self._client.call(RELEASES_STORE, "get_latest_release", platform=platform, release_kind=release_kind)
+        )
+
+    def is_release_at_date(self, platform: str, release_date: date, release_kind: str | None = None) -> bool:
+        return self._client.call(
+            RELEASES_STORE,
+            "is_release_at_date",
+            platform=platform,
+            release_date=release_date.isoformat(),
+            release_kind=release_kind,
+        )
+
+    def add_or_update_release(self, release: Release) -> Release:
+        self._client.call(RELEASES_STORE, "add_or_update_release", release=_encode_release(release))
+        return release
+
+    def update_release(self, release: Release) -> Release:
+        self._client.call(RELEASES_STORE, "update_release", release=_encode_release(release))
+        return release
+
+    def close(self) -> None:
+        """Nothing to release: the connection is shared by the process."""
@@ -3,29 +3,106 @@
 from __future__ import annotations
 
 import fcntl
+import json
+import os
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, BinaryIO, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Collection, Iterator
 
-from tinyflux import Point, TagQuery, TimeQuery, TinyFlux
+from tinyflux import MeasurementQuery, Point, TagQuery, TimeQuery, TinyFlux
 
-from src.domain.models import TaskMethod, TaskRunState, TaskRunStatus
+from src.domain.models import TaskMethod, TaskRunSnapshot, TaskRunState, TaskRunStatus
+from src.infrastructure.storage.timeseries_files import TinyFluxHandle, write_records_atomically
+from src.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+TASK_RUN_STATE_MEASUREMENT = "Task run state"
+_TASK_METHODS = frozenset(method.value for method in TaskMethod)
+_TASK_STATUSES = frozenset(status.value for status in TaskRunStatus)
+
+
+class TaskErrorMessageLog:
+    """
+    Append-only JSON-lines log of task error messages.
+
+    Storage: ``<csv>.errors.jsonl``
+
+    TinyFlux fields are numeric, so points reference their message through the
+    ``error_ref`` field: the 1-based byte offset of its line (0 means none).
+    This keeps free-form text out of the TinyFlux tag index. ``compact`` drops
+    the messages no point references any more, when compact-timeseries
+    rewrites the CSV.
+    """
+
+    def __init__(self, csv_path: Path) -> None:
+        self.path = csv_path.with_name(f"{csv_path.name}.errors.jsonl")
+
+    def append(self, message: str) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as handle:
+            offset = handle.seek(0, os.SEEK_END)
+            handle.write(json.dumps({"message": message}).encode("utf-8") + b"\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        return offset + 1
+
+    def read(self, error_ref: int) -> str | None:
+        if error_ref <= 0:
+            return None
+        try:
+            with self.path.open("rb") as handle:
+                return self._read_message(handle, error_ref)
+        except OSError:
+            return None
+
+    def compact(self, error_refs: Collection[int]) -> dict[int, int]:
+        """Rewrite the log with only the messages of ``error_refs``; return their old to new refs.
+
+        Call it with the CSV lock held, then store the new refs in the points.
+        """
+        if not self.path.exists():
+            return {}
+        kept: list[bytes] = []
+        remapped: dict[int, int] = {}
+        offset = 0
+        with self.path.open("rb") as handle:
+            for error_ref in sorted(ref for ref in set(error_refs) if ref > 0):
+                message = self._read_message(handle, error_ref)
+                if message is None:
+                    continue
+                line = json.dumps({"message": message}).encode("utf-8") + b"\n"
+                remapped[error_ref] = offset + 1
+                kept.append(line)
+                offset += len(line)
+        write_records_atomically(self.path, kept)
+        return remapped
+
+    @staticmethod
+    def _read_message(handle: BinaryIO, error_ref: int) -> str | None:
+        try:
+            handle.seek(error_ref - 1)
+            return str(json.loads(handle.readline())["message"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
 
 
 class TaskRunStateRepository:
     """Persist and query admin task execution events in TinyFlux."""
 
-    _MEASUREMENT = "Task run state"
+    _MEASUREMENT = TASK_RUN_STATE_MEASUREMENT
 
     def __init__(self, db_path: str) -> None:
         db_file = Path(db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
-        self._db = TinyFlux(db_path)
+        self._path = db_file
+        self._handle = TinyFluxHandle(db_file)
         self._lock_path = db_file.with_suffix(f"{db_file.suffix}.lock")
+        self._error_log = TaskErrorMessageLog(db_file)
 
     def record_task_event(
         self,
@@ -37,6 +114,7 @@ class TaskRunStateRepository:
     ) -> None:
         point_time = (event_time or datetime.now(UTC)).astimezone(UTC)
         with self._acquire_lock():
+            error_ref = self._error_log.append(error_message) if error_message else 0
             self._db.insert(
                 Point(
                     measurement=self._MEASUREMENT,
@@ -44,9 +122,8 @@ class TaskRunStateRepository:
                     tags={
                         "task_method": task_method.value,
                         "status": status.value,
-                        "error_message": error_message or "",
                     },
-                    fields={"count": 1},
+                    fields={"count": 1, "error_ref": error_ref},
                 )
             )
 
@@ -68,12 +145,7 @@ class TaskRunStateRepository:
             return None
 
         latest = max(filtered, key=lambda point: cast("datetime", point.time))
-        return TaskRunState(
-            task_method=TaskMethod(latest.tags.get("task_method") or task_method.value),
-            status=TaskRunStatus(latest.tags.get("status") or TaskRunStatus.QUEUED.value),
-            event_at=cast("datetime", latest.time).astimezone(UTC),
-            error_message=(latest.tags.get("error_message") or None),
-        )
+        return self._map_point(latest, task_method)
 
     def get_task_events_since(
         self,
@@ -87,17 +159,81 @@ class TaskRunStateRepository:
 
         filtered = [point for point in points if point.measurement == self._MEASUREMENT and point.time is not None]
         return [
-            TaskRunState(
-                task_method=TaskMethod(point.tags.get("task_method") or task_method.value),
-                status=TaskRunStatus(point.tags.get("status") or TaskRunStatus.QUEUED.value),
-                event_at=cast("datetime", point.time).astimezone(UTC),
-                error_message=(point.tags.get("error_message") or None),
-            )
-            for point in sorted(filtered, key=lambda p: cast("datetime", p.time))
+            self._map_point(point, task_method) for point in sorted(filtered, key=lambda p: cast("datetime", p.time))
         ]
 
+    def snapshot(self, *, since: datetime) -> TaskRunSnapshot:
+        """
+        Read the task measurement once and summarize it.
+
+        Error messages are only looked up for the points the snapshot keeps:
+        the latest of every (method, status) and those after ``since``.
+        Points of a task method or status this version does not know (a
+        removed task, a newer deployment) are skipped and logged.
+        """
+        since = since.astimezone(UTC)
+        with self._acquire_lock():
+            points = self._db.search(MeasurementQuery() == self._MEASUREMENT)
+
+        unknown = [point for point in points if not self._is_known(point)]
+        if unknown:
+            logger.warning(
+                "task_run_state.unknown_events_skipped",
+                count=len(unknown),
+                task_methods=sorted({str(point.tags.get("task_method")) for point in unknown}),
+            )
+        # Sorting is stable, so among equal times the point recorded last wins.
+        points = sorted(
+            (point for point in points if point.time is not None and self._is_known(point)),
+            key=lambda p: cast("datetime", p.time),
+        )
+        latest: dict[tuple[str | None, str | None], Point] = {}
+        for point in points:
+            latest[(point.tags.get("task_method"), point.tags.get("status"))] = point
+        kept = {id(point) for point in latest.values()}
+        return TaskRunSnapshot.from_events(
+            (
+                self._map_point(point, TaskMethod(point.tags["task_method"]))
+                for point in points
+                if id(point) in kept or cast("datetime", point.time) > since
+            ),
+            since=since,
+        )
+
+    def data_version(self) -> str:
+        """Marker that changes with every recorded event, read from the file's stat instead of its points."""
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return "missing"
+        return f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"
+
     def close(self) -> None:
-        self._db.close()
+        self._handle.close()
+
+    @property
+    def _db(self) -> TinyFlux:
+        # Reopened when compact-timeseries has replaced the CSV since the last access.
+        return self._handle.get()
+
+    @staticmethod
+    def _is_known(point: Point) -> bool:
+        status = point.tags.get("status")
+        return point.tags.get("task_method") in _TASK_METHODS and (not status or status in _TASK_STATUSES)
+
+    def _map_point(self, point: Point, task_method: TaskMethod) -> TaskRunState:
+        return TaskRunState(
+            task_method=TaskMethod(point.tags.get("task_method") or task_method.value),
+            status=TaskRunStatus(point.tags.get("status") or TaskRunStatus.QUEUED.value),
+            event_at=cast("datetime", point.time).astimezone(UTC),
+            error_message=self._error_message(point),
+        )
+
+    def _error_message(self, point: Point) -> str | None:
+        # Rows written before split-timeseries-measurements still carry the message as a tag.
+        if legacy_message := point.tags.get("error_message"):
+            return legacy_message
+        return self._error_log.read(int(point.fields.get("error_ref") or 0))
 
     @contextmanager
     def _acquire_lock(self) -> Iterator[IO[str]]:
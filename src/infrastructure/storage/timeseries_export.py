@@ -0,0 +1,146 @@
+"""Whole-timeseries columnar export and its read-only, memory-mapped reader."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.infrastructure.storage.timeseries_snapshot_store import map_columns_file, write_columns_file
+from src.infrastructure.storage.video_point_columns import VideoPointColumns
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Sequence
+
+    from src.domain.models import VideoPoint, VideoPointRecord
+    from src.domain.ports import TimeSeriesStreamReader
+
+logger = get_logger(__name__)
+
+type FileStamp = tuple[int, int, int]
+
+_ALL_TIME = (datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC))
+
+
+def export_path_for(db_timeseries_file: str | os.PathLike[str]) -> Path:
+    """Return the export file that lives next to a TinyFlux timeseries CSV."""
+    return Path(f"{db_timeseries_file}.export.cols")
+
+
+class TimeSeriesExport:
+    """
+    Writes every video point of the timeseries into one columnar file.
+
+    Storage: ``<timeseries csv>.export.cols`` (same layout as the daily
+    snapshots), rows sorted by time. Every write replaces the file with an
+    atomic rename, so readers never see a partial export.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize export writer for ``path``."""
+        self.path = path
+
+    @classmethod
+    def for_timeseries_file(cls, db_timeseries_file: str | os.PathLike[str]) -> TimeSeriesExport:
+        """Build the export that lives next to a TinyFlux timeseries CSV."""
+        return cls(export_path_for(db_timeseries_file))
+
+    def exists(self) -> bool:
+        """Check whether an export has been written."""
+        return self.path.is_file()
+
+    def get_last_timestamp(self) -> datetime | None:
+        """Return the newest point time in the export, or None when it is missing or empty."""
+        if not self.exists():
+            return None
+        columns = map_columns_file(self.path)
+        if not len(columns):
+            return None
+        return columns.to_records([len(columns) - 1])[0].time
+
+    def rebuild(self, points: Iterable[VideoPoint]) -> None:
+        """Replace the export with ``points``."""
+        self._write(VideoPointColumns.from_video_points(points))
+
+    def rebuild_from(self, reader: TimeSeriesStreamReader) -> None:
+        """Replace the export with every video point of ``reader``, streamed row by row."""
+        self.rebuild(reader.iter_video_points(*_ALL_TIME))
+
+    def append(self, points: Sequence[VideoPoint]) -> None:
+        """Add ``points`` to the current export without decoding existing rows."""
+        existing = map_columns_file(self.path) if self.exists() else None
+        added = VideoPointColumns.from_video_points(points)
+        self._write(VideoPointColumns.concat([existing, added]) if existing is not None else added)
+
+    def _write(self, columns: VideoPointColumns) -> None:
+        ordered = columns.take(np.argsort(columns.times, kind="stable"))
+        # Only the columns the CSV stores: appended batches must read back like a rebuild from the CSV.
+        ordered = replace(ordered, score_previous=np.zeros_like(ordered.score_previous))
+        write_columns_file(self.path, ordered)
+        logger.debug("timeseries_export.written", path=str(self.path), rows=len(ordered))
+
+
+class TimeSeriesSnapshotReader:
+    """
+    Read-only ``TimeSeriesReader`` over the memory-mapped export.
+
+    One instance is meant to be shared by all requests of a process; the
+    mapped columns are reloaded when the file identity (inode, mtime, size)
+    changes, i.e. after the fetch job swaps in a new export. Pages are
+    shared through the OS page cache across worker processes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize reader for an export file (which may not exist yet)."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._stamp: FileStamp | None = None
+        self._columns: VideoPointColumns | None = None
+
+    def is_available(self) -> bool:
+        """Check whether an export can be served."""
+        return self._current() is not None
+
+    def get_last_timestamp(self) -> datetime | None:
+        """Return the newest point time in the export."""
+        columns = self._current()
+        if columns is None or not len(columns):
+            return None
+        return columns.to_records([len(columns) - 1])[0].time
+
+    def get_video_points_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPoint]:
+        """Return points with ``start_time < time < end_time`` in time order."""
+        columns = self._current()
+        if columns is None:
+            return []
+        return columns.to_video_points(columns.rows_between(start_time, end_time))
+
+    def get_video_records_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPointRecord]:
+        """Return lightweight records with ``start_time < time < end_time`` in time order."""
+        columns = self._current()
+        if columns is None:
+            return []
+        return columns.to_records(columns.rows_between(start_time, end_time))
+
+    def _current(self) -> VideoPointColumns | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if stamp != self._stamp:
+                try:
+                    self._columns = map_columns_file(self.path)
+                except (OSError, ValueError):
+                    logger.exception("timeseries_export.read_failed", path=str(self.path))
+                    return self._columns
+                self._stamp = stamp
+                logger.debug("timeseries_export.loaded", path=str(self.path), rows=len(self._columns))
+            return self._columns
@@ -0,0 +1,129 @@
+"""File-level helpers for TinyFlux CSV files rewritten by maintenance commands."""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager, suppress
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tinyflux import TinyFlux
+
+from src.infrastructure.storage.timeseries_index import iter_csv_records, parse_csv_record, row_time
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+type TimedRecord = tuple[datetime, bytes]
+
+_MIN_TIME = datetime.min.replace(tzinfo=UTC)
+
+
+def iter_complete_records(path: Path) -> Iterator[bytes]:
+    """Yield raw CSV records of a file, terminating a trailing partial line."""
+    with path.open("rb") as handle:
+        for _, raw_record in iter_csv_records(handle):
+            yield raw_record if raw_record.endswith(b"\n") else raw_record + b"\n"
+
+
+def merge_with_existing(path: Path, records: Iterable[TimedRecord]) -> list[bytes]:
+    """Return ``records`` merged with the rows already in ``path``, sorted by time.
+
+    TinyFlux files are read back assuming append (time) order, e.g. by the
+    watermark tail scan, so moved rows must not simply be appended.
+    """
+    merged = list(records)
+    if path.exists():
+        merged.extend(
+            (row_time(parse_csv_record(record)) or _MIN_TIME, record) for record in iter_complete_records(path)
+        )
+    merged.sort(key=lambda timed_record: timed_record[0])
+    return [record for _, record in merged]
+
+
+def write_records_atomically(path: Path, records: Iterable[bytes]) -> None:
+    """Replace ``path`` with ``records`` via tempfile + fsync + rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(temp_fd, "wb") as handle:
+            handle.writelines(records)
+            handle.flush()
+            os.fsync(handle.fileno())
+        Path(temp_path).replace(path)
+    except OSError:
+        with suppress(OSError):
+            Path(temp_path).unlink()
+        raise
+
+
+def backup_file(path: Path) -> Path:
+    """Copy ``path`` to a timestamped ``.bak`` file next to it."""
+    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    backup_path = path.with_name(f"{path.name}.{timestamp}.bak")
+    shutil.copy2(path, backup_path)
+    return backup_path
+
+
+@contextmanager
+def csv_write_lock(path: Path) -> Iterator[None]:
+    """Hold the ``<csv>.lock`` flock the TinyFlux repositories take around writes."""
+    lock_path = path.with_suffix(f"{path.suffix}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class TinyFluxHandle:
+    """
+    TinyFlux database that follows its CSV across atomic rewrites.
+
+    Maintenance commands replace a CSV by renaming a new file over it (see
+    ``write_records_atomically``); a TinyFlux instance opened earlier would keep
+    reading and appending to the unlinked old file. ``get`` reopens the
+    database when the path no longer points at the file it opened, so writers
+    calling it under ``csv_write_lock`` always append to the live file.
+    """
+
+    def __init__(self, path: Path, **options: Any) -> None:
+        """Initialize a lazily opened handle for ``path`` with TinyFlux ``options``."""
+        self.path = path
+        self._options = options
+        self._db: TinyFlux | None = None
+        self._inode: int | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the database has been opened."""
+        return self._db is not None
+
+    def get(self) -> TinyFlux:
+        """Return the database on the current file, creating the file on first use."""
+        if self._db is not None and self._inode == self._current_inode():
+            return self._db
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = TinyFlux(str(self.path), **self._options)
+        self._inode = self._current_inode()
+        return self._db
+
+    def close(self) -> None:
+        """Close the database if it was opened."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            self._inode = None
+
+    def _current_inode(self) -> int | None:
+        try:
+            return self.path.stat().st_ino
+        except FileNotFoundError:
+            return None
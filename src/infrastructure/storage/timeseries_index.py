@@ -0,0 +1,407 @@
+"""Persistent sidecar indexes for the TinyFlux timeseries CSV."""
+
+from __future__ import annotations
+
+import csv
+import io
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from tinyflux import Point
+
+from src.shared.atomic_storage import AtomicFileStorage
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+_QUOTE = ord('"')
+_MIN_ROW_COLUMNS = 2
+_NONE_VALUE = "_none"  # TinyFlux's serialized None
+_TAG_PREFIXES = ("_tag_", "t_")
+_FIELD_PREFIXES = ("_field_", "f_")
+
+
+def iter_csv_records(handle: BinaryIO, start: int = 0) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, raw_record)`` pairs from a CSV file opened in binary mode.
+
+    Quoted fields may span several physical lines, so lines are joined until the
+    quote count of the record is balanced.
+    """
+    handle.seek(start)
+    offset = start
+    pending = b""
+    pending_offset = start
+    for line in handle:
+        if not pending:
+            pending_offset = offset
+        pending += line
+        offset += len(line)
+        if pending.count(_QUOTE) % 2 == 0:
+            yield pending_offset, pending
+            pending = b""
+    if pending:
+        yield pending_offset, pending
+
+
+def iter_csv_lines_reversed(handle: BinaryIO, end: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield physical lines of a binary CSV file from ``end`` backwards.
+
+    Only the tail of the file is read until the caller stops iterating. Lines
+    that are fragments of quoted multi-line fields are yielded as-is, so
+    callers must validate what they parse.
+    """
+    position = end
+    remainder = b""
+    while position > 0:
+        read_size = min(chunk_size, position)
+        position -= read_size
+        handle.seek(position)
+        lines = (handle.read(read_size) + remainder).split(b"\n")
+        remainder = lines[0]
+        for line in reversed(lines[1:]):
+            if line.strip():
+                yield line + b"\n"
+    if remainder.strip():
+        yield remainder + b"\n"
+
+
+def read_csv_record(handle: BinaryIO, offset: int) -> bytes:
+    """Read the single CSV record starting at ``offset``."""
+    return next(iter_csv_records(handle, offset), (offset, b""))[1]
+
+
+def parse_csv_record(raw_record: bytes) -> list[str]:
+    """Split one raw CSV record into its string columns."""
+    return next(csv.reader([raw_record.decode("utf-8")]), [])
+
+
+def row_tag(row: list[str], tag_name: str) -> str | None:
+    """Return a tag value from a serialized TinyFlux row without building a Point."""
+    keys = (f"_tag_{tag_name}", f"t_{tag_name}")
+    for position in range(2, len(row) - 1, 2):
+        if row[position] in keys:
+            value = row[position + 1]
+            return None if value == _NONE_VALUE else value
+    return None
+
+
+def row_field(row: list[str], field_name: str) -> int | float | None:
+    """Return a numeric field from a serialized TinyFlux row, decoded like TinyFlux does."""
+    keys = (f"_field_{field_name}", f"f_{field_name}")
+    for position in range(2, len(row) - 1, 2):
+        if row[position] in keys:
+            return _decode_field(row[position + 1])
+    return None
+
+
+def row_items(row: list[str]) -> tuple[dict[str, str | None], dict[str, int | float | None]]:
+    """Return all ``(tags, fields)`` of a serialized row in one pass, decoded like ``row_tag``/``row_field``."""
+    tags: dict[str, str | None] = {}
+    fields: dict[str, int | float | None] = {}
+    for position in range(2, len(row) - 1, 2):
+        key, value = row[position], row[position + 1]
+        if (tag_name := _strip_prefix(key, _TAG_PREFIXES)) is not None:
+            tags[tag_name] = None if value == _NONE_VALUE else value
+        elif (field_name := _strip_prefix(key, _FIELD_PREFIXES)) is not None:
+            fields[field_name] = _decode_field(value)
+    return tags, fields
+
+
+def _strip_prefix(key: str, prefixes: tuple[str, ...]) -> str | None:
+    for prefix in prefixes:
+        if key.startswith(prefix):
+            return key[len(prefix) :]
+    return None
+
+
+def _decode_field(raw_value: str) -> int | float | None:
+    if raw_value.lstrip("-").isdigit():
+        return int(raw_value)
+    try:
+        return float(raw_value)
+    except ValueError:
+        return None
+
+
+def row_time(row: list[str]) -> datetime | None:
+    """Return the UTC timestamp of a serialized TinyFlux row, or None if malformed."""
+    try:
+        return datetime.fromisoformat(row[0]).replace(tzinfo=UTC)
+    except (IndexError, ValueError):
+        return None
+
+
+def deserialize_row(row: list[str]) -> Point:
+    """Convert a serialized TinyFlux CSV row back into a Point."""
+    return Point()._deserialize_from_list(row)  # noqa: SLF001 - TinyFlux has no public row decoder
+
+
+def serialize_point(point: Point) -> bytes:
+    """Encode a Point as one CSV record, exactly as TinyFlux appends it."""
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer).writerow(point._serialize_to_list())  # noqa: SLF001 - TinyFlux has no public row encoder
+    return buffer.getvalue().encode("utf-8")
+
+
+class TimeSeriesVideoIndex:
+    """
+    Sidecar index mapping video ids to the byte offsets of their CSV rows.
+
+    Storage: JSON next to the CSV (``<csv>.idx.json``)
+    Stamp: CSV size, mtime and a short tail fingerprint
+
+    When the CSV only grew since the stamp was taken, the appended bytes are
+    scanned incrementally; any other change triggers a full rebuild.
+    """
+
+    _VERSION = 1
+    _TAIL_BYTES = 64
+
+    def __init__(self, csv_path: Path, measurement: str) -> None:
+        """Initialize index for a TinyFlux CSV file and measurement."""
+        self._csv_path = csv_path
+        self._measurement = measurement
+        self._storage = AtomicFileStorage(f"{csv_path}.idx.json")
+        self._offsets: dict[str, list[int]] = {}
+        self._size = 0
+        self._mtime_ns = 0
+        self._tail = b""
+        self._loaded = False
+
+    @property
+    def path(self) -> Path:
+        """Location of the persisted index file."""
+        return self._storage.file_path
+
+    def offsets_for(self, video_id: str) -> list[int]:
+        """Return row offsets for a video, refreshing the index first when stale."""
+        self.refresh()
+        return list(self._offsets.get(video_id, []))
+
+    def read_rows(self, video_id: str) -> list[list[str]]:
+        """
+        Read the raw CSV rows of one video by seeking to its indexed offsets.
+
+        Falls back to a full rebuild when an offset no longer points at a row
+        for the requested video (e.g. the CSV was rewritten in place).
+        """
+        rows = self._read_rows_at(video_id, self.offsets_for(video_id))
+        if rows is None:
+            logger.info("timeseries_index.offsets_mismatch", video_id=video_id)
+            self.rebuild()
+            rows = self._read_rows_at(video_id, self._offsets.get(video_id, [])) or []
+        return rows
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the CSV on disk."""
+        if not self._loaded:
+            self._load()
+
+        try:
+            stat = self._csv_path.stat()
+        except FileNotFoundError:
+            if self._offsets or self._size:
+                self._reset()
+                self._persist()
+            return
+
+        if stat.st_size == self._size and stat.st_mtime_ns == self._mtime_ns:
+            return
+
+        if stat.st_size >= self._size and self._tail_matches():
+            self._scan_from(self._size)
+        else:
+            self._reset()
+            self._scan_from(0)
+        self._persist()
+
+    def rebuild(self) -> None:
+        """Discard the current index and rescan the whole CSV."""
+        self._loaded = True
+        self._reset()
+        if self._csv_path.exists():
+            self._scan_from(0)
+        self._persist()
+
+    def _load(self) -> None:
+        self._loaded = True
+        data = self._storage.read_json()
+        if data.get("version") != self._VERSION:
+            return
+        self._offsets = {video_id: list(offsets) for video_id, offsets in data.get("offsets", {}).items()}
+        self._size = int(data.get("size", 0))
+        self._mtime_ns = int(data.get("mtime_ns", 0))
+        self._tail = bytes.fromhex(data.get("tail", ""))
+
+    def _reset(self) -> None:
+        self._offsets = {}
+        self._size = 0
+        self._mtime_ns = 0
+        self._tail = b""
+
+    def _tail_matches(self) -> bool:
+        if not self._tail:
+            return self._size == 0
+        with self._csv_path.open("rb") as handle:
+            handle.seek(self._size - len(self._tail))
+            return handle.read(len(self._tail)) == self._tail
+
+    def _scan_from(self, start: int) -> None:
+        end = start
+        with self._csv_path.open("rb") as handle:
+            for offset, raw_record in iter_csv_records(handle, start):
+                if not raw_record.endswith(b"\n"):
+                    # Partially flushed row; pick it up on the next refresh.
+                    break
+                end = offset + len(raw_record)
+                row = parse_csv_record(raw_record)
+                if not self._is_measurement_row(row):
+                    continue
+                if video_id := row_tag(row, "video_id"):
+                    self._offsets.setdefault(video_id, []).append(offset)
+        self._stamp(end)
+
+    def _stamp(self, end: int) -> None:
+        stat = self._csv_path.stat()
+        self._size = min(end, stat.st_size)
+        self._mtime_ns = stat.st_mtime_ns if self._size == stat.st_size else 0
+        with self._csv_path.open("rb") as handle:
+            tail_start = max(0, self._size - self._TAIL_BYTES)
+            handle.seek(tail_start)
+            self._tail = handle.read(self._size - tail_start)
+
+    def _is_measurement_row(self, row: list[str]) -> bool:
+        return len(row) >= _MIN_ROW_COLUMNS and row[1] == self._measurement
+
+    def _persist(self) -> None:
+        payload: dict[str, Any] = {
+            "version": self._VERSION,
+            "size": self._size,
+            "mtime_ns": self._mtime_ns,
+            "tail": self._tail.hex(),
+            "offsets": self._offsets,
+        }
+        self._storage.write_json(payload)
+
+    def _read_rows_at(self, video_id: str, offsets: list[int]) -> list[list[str]] | None:
+        rows: list[list[str]] = []
+        if not offsets:
+            return rows
+        with self._csv_path.open("rb") as handle:
+            for offset in offsets:
+                row = parse_csv_record(read_csv_record(handle, offset))
+                if not self._is_measurement_row(row) or row_tag(row, "video_id") != video_id:
+                    return None
+                rows.append(row)
+        return rows
+
+
+class TimeSeriesWatermark:
+    """
+    Persisted high-water mark of the newest point for one measurement.
+
+    Storage: JSON next to the CSV (``<csv>.watermark.json``)
+    Stamp: CSV inode, size and mtime at the time the watermark was recorded
+
+    Only writers persist the mark (``advance``, ``refresh``); ``get`` never
+    touches the disk beyond reading. When the CSV only grew since the stamp,
+    the appended rows are scanned forward from it. Without a usable stamp the
+    CSV is read backwards from the end until the first row of the measurement
+    is found; TinyFlux data is appended in time order, so that row holds the
+    latest timestamp.
+    """
+
+    def __init__(self, csv_path: Path, measurement: str) -> None:
+        """Initialize watermark for a TinyFlux CSV file and measurement."""
+        self._csv_path = csv_path
+        self._measurement = measurement
+        self._storage = AtomicFileStorage(f"{csv_path}.watermark.json")
+
+    @property
+    def path(self) -> Path:
+        """Location of the persisted watermark file."""
+        return self._storage.file_path
+
+    def get(self) -> datetime | None:
+        """Return the newest timestamp of the measurement, catching up with appended rows."""
+        try:
+            stat = self._csv_path.stat()
+        except FileNotFoundError:
+            return None
+        return self._latest(stat)
+
+    def advance(self, point_time: datetime) -> None:
+        """Record that a point at ``point_time`` has just been written."""
+        stat = self._csv_path.stat()
+        latest = self._latest(stat)
+        point_time = point_time.astimezone(UTC)
+        self._persist(point_time if latest is None or point_time > latest else latest, stat)
+
+    def refresh(self) -> None:
+        """Re-stamp the mark after the CSV was rewritten without new points."""
+        try:
+            stat = self._csv_path.stat()
+        except FileNotFoundError:
+            return
+        self._persist(self._latest(stat), stat)
+
+    def _latest(self, stat: os.stat_result) -> datetime | None:
+        data = self._storage.read_json()
+        recorded_size = data.get("size")
+        recorded_time = self._parse_time(data.get("last_time"))
+        if data.get("inode") != stat.st_ino or not isinstance(recorded_size, int):
+            return self._scan_backwards(stat.st_size)
+        if recorded_size == stat.st_size and data.get("mtime_ns") == stat.st_mtime_ns:
+            return recorded_time
+        if 0 < recorded_size < stat.st_size:
+            # Only appended to since the stamp (same file, grown): scan the new rows.
+            return self._max_time_from(recorded_size, recorded_time)
+        return self._scan_backwards(stat.st_size)
+
+    def _max_time_from(self, start: int, latest: datetime | None) -> datetime | None:
+        with self._csv_path.open("rb") as handle:
+            for _, raw_record in iter_csv_records(handle, start):
+                row = parse_csv_record(raw_record)
+                if not self._is_measurement_row(row):
+                    continue
+                point_time = row_time(row)
+                if point_time is not None and (latest is None or point_time > latest):
+                    latest = point_time
+        return latest
+
+    def _scan_backwards(self, end: int) -> datetime | None:
+        with self._csv_path.open("rb") as handle:
+            for line in iter_csv_lines_reversed(handle, end):
+                if line.count(_QUOTE) % 2:
+                    continue
+                row = parse_csv_record(line)
+                if self._is_measurement_row(row) and (point_time := row_time(row)) is not None:
+                    return point_time
+        return None
+
+    def _is_measurement_row(self, row: list[str]) -> bool:
+        return len(row) >= _MIN_ROW_COLUMNS and row[1] == self._measurement
+
+    def _persist(self, latest: datetime | None, stat: os.stat_result) -> None:
+        self._storage.write_json(
+            {
+                "inode": stat.st_ino,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "last_time": latest.isoformat() if latest else None,
+            }
+        )
+
+    @staticmethod
+    def _parse_time(raw_value: object) -> datetime | None:
+        if not isinstance(raw_value, str):
+            return None
+        try:
+            return datetime.fromisoformat(raw_value).astimezone(UTC)
+        except ValueError:
+            return None
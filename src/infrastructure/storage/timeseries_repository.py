@@ -3,14 +3,41 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tinyflux import Point, TagQuery, TimeQuery, TinyFlux
+from tinyflux import Point, TimeQuery
 
-from src.domain.models import VideoPoint, VideoScoreStatus
+from src.config.settings import TimeSeriesSegmentPeriod
+from src.domain.models import VideoPoint, VideoPointRecord, VideoScoreStatus
+from src.infrastructure.storage.timeseries_index import (
+    deserialize_row,
+    iter_csv_records,
+    parse_csv_record,
+    row_field,
+    row_items,
+    row_tag,
+    row_time,
+)
+from src.infrastructure.storage.timeseries_segments import (
+    PointChange,
+    PointKey,
+    TimeSeriesSegment,
+    TimeSeriesSegmentLayout,
+)
 from src.shared.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator, Sequence
+
+    from tinyflux import TinyFlux
+
 logger = get_logger(__name__)
 
+VIDEO_MEASUREMENT = "Video visualizations"
+VIDEO_POINT_FIELDS: tuple[str, ...] = ("views", "likes", "views_growth", "score", "score_status")
+_MIN_ROW_COLUMNS = 2
+
 
 class TimeSeriesRepository:
     """
@@ -20,14 +47,27 @@ class TimeSeriesRepository:
     Measurement: "Video visualizations"
     tags: video_id, score_status
     fields: views, likes, views_growth, score
+    Segments: with a segment period, points go to ``<csv>.segments/<key>.csv``
+    (see TimeSeriesSegmentLayout) and range queries only open the segments
+    overlapping the window; the base CSV keeps serving history not split yet
+    Index: video_id → row offsets in ``<csv>.idx.json`` (see TimeSeriesVideoIndex)
+    Watermark: newest video timestamp in ``<csv>.watermark.json`` (see TimeSeriesWatermark)
     """
 
-    _MEASUREMENT = "Video visualizations"
-    _MIN_TIME = datetime(1970, 1, 1, tzinfo=UTC)
+    _MEASUREMENT = VIDEO_MEASUREMENT
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        segment_period: TimeSeriesSegmentPeriod = TimeSeriesSegmentPeriod.NONE,
+    ) -> None:
         """Initialize repository with TinyFlux backend."""
-        self._db = TinyFlux(db_path)
+        self._base = TimeSeriesSegment(Path(db_path), self._MEASUREMENT)
+        self._base.db  # noqa: B018 - the base CSV is created with the repository
+        self._layout = TimeSeriesSegmentLayout(
+            Path(db_path), self._MEASUREMENT, TimeSeriesSegmentPeriod(segment_period)
+        )
 
     def add_video_point(self, video_point: VideoPoint) -> None:
         """
@@ -36,22 +76,35 @@ class TimeSeriesRepository:
         Args:
             video_point: VideoPoint with video_id, views, likes, score, timestamp.
         """
-        self._db.insert(
-            Point(
-                measurement=self._MEASUREMENT,
-                time=video_point.time,
-                tags={
-                    "video_id": video_point.video_id,
-                    "score_status": video_point.score_status.value if video_point.score_status else "UNKNOWN",
-                },
-                fields={
-                    "views": video_point.views,
-                    "likes": video_point.likes,
-                    "views_growth": video_point.views_growth or 0,
-                    "score": video_point.score or 0,
-                },
+        self.add_video_points([video_point])
+
+    def add_video_points(self, video_points: Sequence[VideoPoint]) -> None:
+        """
+        Insert video data points with one buffered write (and one fsync) per segment.
+
+        Args:
+            video_points: VideoPoints with video_id, views, likes, score, timestamp.
+        """
+        points_by_segment: dict[TimeSeriesSegment, list[Point]] = {}
+        for video_point in video_points:
+            points_by_segment.setdefault(self._write_segment(video_point.time), []).append(
+                Point(
+                    measurement=self._MEASUREMENT,
+                    time=video_point.time,
+                    tags={
+                        "video_id": video_point.video_id,
+                        "score_status": self._score_status_tag(video_point),
+                    },
+                    fields={
+                        "views": video_point.views,
+                        "likes": video_point.likes,
+                        "views_growth": video_point.views_growth or 0,
+                        "score": video_point.score or 0,
+                    },
+                )
             )
-        )
+        for segment, points in points_by_segment.items():
+            segment.insert_many(points)
 
     def update_video_point(self, video_point: VideoPoint) -> None:
         """
@@ -60,17 +113,36 @@ class TimeSeriesRepository:
         Args:
             video_point: Updated VideoPoint with matching video_id and timestamp.
         """
-        query = (TagQuery().video_id == video_point.video_id) & (TimeQuery() == video_point.time.astimezone(UTC))
-        self._db.update(
-            query,
-            tags={
-                "score_status": video_point.score_status.value if video_point.score_status else "UNKNOWN",
-            },
-            fields={
-                "views_growth": video_point.views_growth or 0,
-                "score": video_point.score or 0,
-            },
-        )
+        self.update_video_points([video_point])
+
+    def update_video_points(self, video_points: Sequence[VideoPoint]) -> None:
+        """
+        Update existing video data points, rewriting each affected segment once.
+
+        Segments holding the points' timestamps are tried first; the base CSV
+        is only scanned for points older than its newest video row, i.e.
+        points written before the history was split.
+
+        Args:
+            video_points: Updated VideoPoints with matching video_id and timestamp.
+        """
+        pending: dict[PointKey, PointChange] = {
+            (video_point.video_id, video_point.time.astimezone(UTC)): (
+                {"score_status": self._score_status_tag(video_point)},
+                {"views_growth": video_point.views_growth or 0, "score": video_point.score or 0},
+            )
+            for video_point in video_points
+        }
+        for segment in self._layout.segments():
+            if not pending:
+                return
+            in_window = {key: change for key, change in pending.items() if segment.contains(key[1])}
+            for key in segment.update_many(in_window):
+                del pending[key]
+
+        base_latest = self._base.watermark.get()
+        if pending and base_latest is not None:
+            self._base.update_many({key: change for key, change in pending.items() if key[1] <= base_latest})
 
     def get_all_points_by_video(self, video_id: str) -> list[Point]:
         """
@@ -80,31 +152,42 @@ class TimeSeriesRepository:
             video_id: YouTube video ID.
 
         Returns:
-            List of Point objects from TinyFlux (raw).
+            List of Point objects from TinyFlux (raw), sorted by time.
         """
-        query = TagQuery().video_id == video_id
-        return [point for point in self._db.search(query) if self._is_video_measurement(point)]
+        points = [
+            deserialize_row(row)
+            for segment in [self._base, *self._layout.segments()]
+            for row in segment.video_index.read_rows(video_id)
+        ]
+        points.sort(key=lambda point: (point.time is None, point.time))
+        return points
 
     def get_last_timestamp(self) -> datetime | None:
         """
         Get the most recent timestamp in the entire time-series database.
 
+        Served from the persisted watermarks of the newest segments, so the
+        cost does not grow with the history size.
+
         Returns:
             datetime of the last recorded point, or None if empty.
         """
-        points = self._db.search(TimeQuery() >= self._MIN_TIME, sorted=True)
-        if not points:
-            return None
-        for point in reversed(points):
-            if point.time is None or not self._is_video_measurement(point):
-                continue
-            return point.time.astimezone(UTC)
-        return None
+        latest = self._base.watermark.get()
+        newest_first = sorted(self._layout.segments(), key=lambda segment: segment.window or (), reverse=True)
+        for segment in newest_first:
+            if latest is not None and segment.window is not None and segment.window[1] <= latest:
+                break
+            segment_latest = segment.watermark.get()
+            if segment_latest is not None and (latest is None or segment_latest > latest):
+                latest = segment_latest
+        return latest
 
     def get_points_by_date_range(self, start_time: datetime, end_time: datetime) -> list[Point]:
         """
         Retrieve all points within a time range.
 
+        Only segments overlapping the window are opened.
+
         Args:
             start_time: Start of time range (exclusive).
             end_time: End of time range (exclusive).
@@ -115,7 +198,27 @@ class TimeSeriesRepository:
         start_utc = start_time.astimezone(UTC)
         end_utc = end_time.astimezone(UTC)
         query = (TimeQuery() > start_utc) & (TimeQuery() < end_utc)
-        return [point for point in self._db.search(query) if self._is_video_measurement(point)]
+        return [
+            point
+            for segment in self._read_segments(start_utc, end_utc)
+            for point in segment.db.search(query)
+            if self._is_video_measurement(point)
+        ]
+
+    def _write_segment(self, point_time: datetime) -> TimeSeriesSegment:
+        """Return the segment new points at ``point_time`` are appended to."""
+        if self._layout.period == TimeSeriesSegmentPeriod.NONE:
+            return self._base
+        return self._layout.segment_for(point_time)
+
+    def _read_segments(self, start_utc: datetime, end_utc: datetime) -> list[TimeSeriesSegment]:
+        """Return segments that may hold points in ``(start_utc, end_utc)``, oldest first."""
+        segments = self._layout.overlapping(start_utc, end_utc)
+        # The base CSV has no window; skip it once its newest video point predates the range.
+        base_latest = self._base.watermark.get()
+        if base_latest is not None and base_latest > start_utc:
+            segments.insert(0, self._base)
+        return segments
 
     def _is_video_measurement(self, point: Point) -> bool:
         """Check whether a TinyFlux point belongs to video timeseries."""
@@ -125,6 +228,114 @@ class TimeSeriesRepository:
         """Retrieve points within a time range, mapped to VideoPoint models."""
         return [self._map_point(p) for p in self.get_points_by_date_range(start_time, end_time)]
 
+    def get_video_records_by_date_range(self, start_time: datetime, end_time: datetime) -> list[VideoPointRecord]:
+        """
+        Retrieve video rows within ``(start_time, end_time)`` as lightweight records.
+
+        Rows are decoded straight from the CSV into slotted records, skipping
+        TinyFlux Points and pydantic validation; callers convert only the rows
+        they return with ``VideoPointRecord.to_video_point``.
+        """
+        return [self._map_record(row, point_time) for row, point_time in self._iter_rows(start_time, end_time)]
+
+    def iter_points_by_date_range(self, start_time: datetime, end_time: datetime) -> Iterator[Point]:
+        """
+        Yield raw points within ``(start_time, end_time)`` while the segment files are read.
+
+        Unlike ``get_points_by_date_range`` no result list is built, so memory
+        stays flat whatever the window size. Points come in file (append) order.
+        """
+        for row, _point_time in self._iter_rows(start_time, end_time):
+            yield deserialize_row(row)
+
+    def iter_video_points(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> Iterator[VideoPoint]:
+        """
+        Yield VideoPoints within ``(start_time, end_time)`` while the segment files are read.
+
+        Args:
+            start_time: Start of time range (exclusive).
+            end_time: End of time range (exclusive).
+            fields: Optional projection among ``VIDEO_POINT_FIELDS``; ``time`` and
+                ``video_id`` are always set, other attributes keep model defaults.
+
+        Raises:
+            ValueError: If ``fields`` names an unknown attribute.
+        """
+        projection = tuple(VIDEO_POINT_FIELDS if fields is None else fields)
+        if unknown := set(projection) - set(VIDEO_POINT_FIELDS):
+            msg = f"Unknown video point fields: {sorted(unknown)}"
+            raise ValueError(msg)
+        for row, point_time in self._iter_rows(start_time, end_time):
+            yield self._map_row(row, point_time, projection)
+
+    def _iter_rows(self, start_time: datetime, end_time: datetime) -> Iterator[tuple[list[str], datetime]]:
+        """Yield ``(row, UTC time)`` of video rows in ``(start_time, end_time)``, segment by segment."""
+        start_utc = start_time.astimezone(UTC)
+        end_utc = end_time.astimezone(UTC)
+        for segment in self._read_segments(start_utc, end_utc):
+            if not segment.path.exists():
+                continue
+            with segment.path.open("rb") as handle:
+                for _, raw_record in iter_csv_records(handle):
+                    if not raw_record.endswith(b"\n"):
+                        # Trailing record still being appended by a concurrent writer.
+                        continue
+                    row = parse_csv_record(raw_record)
+                    if len(row) < _MIN_ROW_COLUMNS or row[1] != self._MEASUREMENT:
+                        continue
+                    point_time = row_time(row)
+                    if point_time is not None and start_utc < point_time < end_utc:
+                        yield row, point_time
+
+    @staticmethod
+    def _map_record(row: list[str], point_time: datetime) -> VideoPointRecord:
+        """Build a VideoPointRecord from a CSV row, decoding its columns in one pass."""
+        tags, fields = row_items(row)
+        views_growth = fields.get("views_growth")
+        score = fields.get("score")
+        return VideoPointRecord(
+            time=point_time,
+            video_id=tags.get("video_id") or "",
+            views=int(fields.get("views") or 0),
+            likes=int(fields.get("likes") or 0),
+            views_growth=int(views_growth) if views_growth else None,
+            score=int(score) if score else None,
+            score_status=TimeSeriesRepository._parse_score_status(tags.get("score_status")),
+        )
+
+    @staticmethod
+    def _map_row(row: list[str], point_time: datetime, fields: Sequence[str]) -> VideoPoint:
+        """Build a VideoPoint straight from a CSV row, decoding only the projected fields."""
+        values: dict[str, object] = {"time": point_time, "video_id": row_tag(row, "video_id") or ""}
+        for field_name in fields:
+            if field_name == "score_status":
+                values[field_name] = TimeSeriesRepository._parse_score_status(row_tag(row, "score_status"))
+                continue
+            raw_value = row_field(row, field_name)
+            if field_name in {"views", "likes"}:
+                values[field_name] = int(raw_value or 0)
+            else:
+                values[field_name] = int(raw_value) if raw_value else None
+        return VideoPoint.model_validate(values)
+
+    @staticmethod
+    def _parse_score_status(raw_status: str | None) -> VideoScoreStatus | None:
+        """Inverse of ``_score_status_tag``: the UNKNOWN placeholder reads back as None."""
+        if not raw_status or raw_status == "UNKNOWN":
+            return None
+        return VideoScoreStatus(raw_status)
+
+    @staticmethod
+    def _score_status_tag(video_point: VideoPoint) -> str:
+        """Return the stored score_status tag, with UNKNOWN for unscored points."""
+        return video_point.score_status.value if video_point.score_status else "UNKNOWN"
+
     @staticmethod
     def _map_point(point: Point) -> VideoPoint:
         """Convert a raw TinyFlux Point to a VideoPoint model."""
@@ -164,6 +375,11 @@ class TimeSeriesRepository:
             return None
         return int(raw_value)
 
+    @property
+    def _db(self) -> TinyFlux:
+        return self._base.db
+
     def close(self) -> None:
         """Close database connection."""
-        self._db.close()
+        self._base.close()
+        self._layout.close()
@@ -0,0 +1,85 @@
+"""Materialized per-video daily/weekly rollups of the video timeseries."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from src.domain.models import VideoRollup
+from src.domain.services.rollup_service import week_key
+from src.shared.atomic_storage import AtomicFileStorage
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+    from datetime import date
+
+logger = get_logger(__name__)
+
+
+class TimeSeriesRollupStore:
+    """
+    Stores one small JSON table of per-video closes per day and per ISO week.
+
+    Storage: ``<timeseries csv>.rollups/daily/YYYY-MM-DD.json`` and
+    ``<timeseries csv>.rollups/weekly/YYYY-Www.json``
+
+    Tables are derived data: they are rewritten atomically on every
+    materialization and can be rebuilt from the timeseries at any time.
+    """
+
+    _SUFFIX = ".json"
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize store rooted at ``directory`` (created lazily on first write)."""
+        self._directory = directory
+
+    @classmethod
+    def for_timeseries_file(cls, db_timeseries_file: str | os.PathLike[str]) -> TimeSeriesRollupStore:
+        """Build the store that lives next to a TinyFlux timeseries CSV."""
+        return cls(Path(f"{db_timeseries_file}.rollups"))
+
+    def daily_path(self, day: date) -> Path:
+        """Return the daily table path for a day."""
+        return self._directory / "daily" / f"{day.isoformat()}{self._SUFFIX}"
+
+    def weekly_path(self, day: date) -> Path:
+        """Return the weekly table path for the ISO week containing ``day``."""
+        return self._directory / "weekly" / f"{week_key(day)}{self._SUFFIX}"
+
+    def write_daily(self, day: date, rollups: Sequence[VideoRollup]) -> None:
+        """Replace the daily closes of ``day``."""
+        self._write(self.daily_path(day), rollups)
+
+    def read_daily(self, day: date) -> list[VideoRollup] | None:
+        """Return the daily closes of ``day``, or None when they were never materialized."""
+        return self._read(self.daily_path(day))
+
+    def write_weekly(self, day: date, rollups: Sequence[VideoRollup]) -> None:
+        """Replace the weekly closes of the ISO week containing ``day``."""
+        self._write(self.weekly_path(day), rollups)
+
+    def read_weekly(self, day: date) -> list[VideoRollup] | None:
+        """Return the weekly closes of the ISO week containing ``day``, or None when missing."""
+        return self._read(self.weekly_path(day))
+
+    @staticmethod
+    def _write(path: Path, rollups: Sequence[VideoRollup]) -> None:
+        AtomicFileStorage(str(path)).write_json(
+            {"rollups": [rollup.model_dump(mode="json") for rollup in rollups]},
+        )
+        logger.debug("timeseries_rollup.written", path=str(path), rows=len(rollups))
+
+    @staticmethod
+    def _read(path: Path) -> list[VideoRollup] | None:
+        if not path.is_file():
+            return None
+        data = AtomicFileStorage(str(path)).read_json()
+        try:
+            return [VideoRollup.model_validate(item) for item in data.get("rollups", [])]
+        except ValidationError:
+            logger.exception("timeseries_rollup.read_failed", path=str(path))
+            return None
@@ -0,0 +1,265 @@
+"""Time-partitioned segment files for the TinyFlux timeseries CSV."""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from src.config.settings import TimeSeriesSegmentPeriod
+from src.infrastructure.storage.timeseries_files import (
+    TinyFluxHandle,
+    csv_write_lock,
+    iter_complete_records,
+    write_records_atomically,
+)
+from src.infrastructure.storage.timeseries_index import (
+    TimeSeriesVideoIndex,
+    TimeSeriesWatermark,
+    deserialize_row,
+    parse_csv_record,
+    row_tag,
+    row_time,
+    serialize_point,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from tinyflux import Point, TinyFlux
+
+_MONTHS_PER_YEAR = 12
+_MIN_ROW_COLUMNS = 2
+_DAY_KEY = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_WEEK_KEY = re.compile(r"^(\d{4})-W(\d{2})$")
+_MONTH_KEY = re.compile(r"^(\d{4})-(\d{2})$")
+_YEAR_KEY = re.compile(r"^\d{4}$")
+
+type SegmentWindow = tuple[datetime, datetime]
+type PointKey = tuple[str, datetime]
+type PointChange = tuple[dict[str, str | None], dict[str, int | float | None]]
+
+
+def segment_key(moment: datetime, period: TimeSeriesSegmentPeriod) -> str:
+    """Return the segment key holding ``moment`` for a partitioning period.
+
+    Keys are ``YYYY-MM-DD`` (day), ``YYYY-Www`` (ISO week), ``YYYY-MM`` (month)
+    or ``YYYY`` (year), computed on the UTC timestamp.
+    """
+    moment_utc = moment.astimezone(UTC)
+    match period:
+        case TimeSeriesSegmentPeriod.DAY:
+            return moment_utc.date().isoformat()
+        case TimeSeriesSegmentPeriod.WEEK:
+            iso_year, iso_week, _ = moment_utc.isocalendar()
+            return f"{iso_year:04d}-W{iso_week:02d}"
+        case TimeSeriesSegmentPeriod.MONTH:
+            return f"{moment_utc.year:04d}-{moment_utc.month:02d}"
+        case TimeSeriesSegmentPeriod.YEAR:
+            return f"{moment_utc.year:04d}"
+    msg = f"Unsupported segment period: {period}"
+    raise ValueError(msg)
+
+
+def segment_window(key: str) -> SegmentWindow | None:
+    """Return the ``[start, end)`` UTC window covered by a segment key, or None if unknown."""
+    try:
+        window = _parse_window(key)
+    except ValueError:
+        return None
+    if window is None:
+        return None
+    start, end = window
+    return _midnight(start), _midnight(end)
+
+
+def _parse_window(key: str) -> tuple[date, date] | None:
+    if _DAY_KEY.match(key):
+        start = date.fromisoformat(key)
+        end = start + timedelta(days=1)
+    elif week_match := _WEEK_KEY.match(key):
+        start = date.fromisocalendar(int(week_match[1]), int(week_match[2]), 1)
+        end = start + timedelta(weeks=1)
+    elif month_match := _MONTH_KEY.match(key):
+        year, month = int(month_match[1]), int(month_match[2])
+        start = date(year, month, 1)
+        end = date(year + month // _MONTHS_PER_YEAR, month % _MONTHS_PER_YEAR + 1, 1)
+    elif _YEAR_KEY.match(key):
+        start = date(int(key), 1, 1)
+        end = date(int(key) + 1, 1, 1)
+    else:
+        return None
+    return start, end
+
+
+def _midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=UTC)
+
+
+class TimeSeriesSegment:
+    """
+    One TinyFlux CSV file with its video offset index and watermark.
+
+    ``window`` is the ``[start, end)`` time range the segment may hold; it is
+    None for the unpartitioned base CSV, which can hold any timestamp.
+    The TinyFlux handle is opened lazily so pruned segments are never read.
+    Writes hold the ``<csv>.lock`` compaction takes, so rows are never
+    appended to a file that is being rewritten.
+    """
+
+    def __init__(self, csv_path: Path, measurement: str, window: SegmentWindow | None = None) -> None:
+        """Initialize segment for a CSV file, measurement and optional time window."""
+        self.path = csv_path
+        self.window = window
+        self._measurement = measurement
+        self.video_index = TimeSeriesVideoIndex(csv_path, measurement)
+        self.watermark = TimeSeriesWatermark(csv_path, measurement)
+        # TinyFlux's in-memory index would parse the whole CSV on every open;
+        # per-video lookups go through the persistent offset index instead.
+        self._handle = TinyFluxHandle(csv_path, auto_index=False)
+
+    @property
+    def db(self) -> TinyFlux:
+        """TinyFlux handle for the segment, creating the file on first use."""
+        return self._handle.get()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the TinyFlux handle has been opened."""
+        return self._handle.is_open
+
+    def overlaps(self, start_time: datetime, end_time: datetime) -> bool:
+        """Check whether the segment window intersects the open interval ``(start, end)``."""
+        if self.window is None:
+            return True
+        window_start, window_end = self.window
+        return window_start < end_time and start_time < window_end
+
+    def contains(self, moment: datetime) -> bool:
+        """Check whether ``moment`` falls inside the segment window."""
+        if self.window is None:
+            return True
+        window_start, window_end = self.window
+        return window_start <= moment < window_end
+
+    def insert_many(self, points: Sequence[Point]) -> None:
+        """Append points in one buffered write and bring the index and watermark up to date."""
+        if not points:
+            return
+        with csv_write_lock(self.path):
+            # A single batch means a single write + fsync for all rows.
+            self.db.insert_multiple(points, batch_size=len(points))
+            self.video_index.refresh()
+            if point_times := [point.time for point in points if point.time is not None]:
+                self.watermark.advance(max(point_times))
+
+    def update_many(self, changes: Mapping[PointKey, PointChange]) -> set[PointKey]:
+        """
+        Merge tag/field changes into the rows keyed by ``(video_id, UTC time)``.
+
+        The CSV is rewritten in one pass to a temporary file that replaces it
+        (see ``write_records_atomically``), so a crash leaves either the old or
+        the new file; TinyFlux handles reopen on the new file (``TinyFluxHandle``).
+
+        Returns:
+            Keys whose rows were found and updated.
+        """
+        if not changes:
+            return set()
+        with csv_write_lock(self.path):
+            return self._update_locked(changes)
+
+    def _update_locked(self, changes: Mapping[PointKey, PointChange]) -> set[PointKey]:
+        if not self.path.exists():
+            return set()
+
+        updated: set[PointKey] = set()
+        records: list[bytes] = []
+        for raw_record in iter_complete_records(self.path):
+            row = parse_csv_record(raw_record)
+            key = self._point_key(row)
+            if key is not None and (change := changes.get(key)) is not None:
+                point = deserialize_row(row)
+                point.tags.update(change[0])
+                point.fields.update(change[1])
+                records.append(serialize_point(point))
+                updated.add(key)
+            else:
+                records.append(raw_record)
+        if updated:
+            write_records_atomically(self.path, records)
+            # Rewritten rows may have changed length, so offsets after the first change may have shifted.
+            self.video_index.rebuild()
+            self.watermark.refresh()
+        return updated
+
+    def discard_sidecars(self) -> None:
+        """Delete the persisted index and watermark after the CSV was rewritten externally."""
+        self.video_index.path.unlink(missing_ok=True)
+        self.watermark.path.unlink(missing_ok=True)
+
+    def _point_key(self, row: list[str]) -> PointKey | None:
+        if len(row) < _MIN_ROW_COLUMNS or row[1] != self._measurement:
+            return None
+        video_id = row_tag(row, "video_id")
+        point_time = row_time(row)
+        if video_id is None or point_time is None:
+            return None
+        return video_id, point_time
+
+    def close(self) -> None:
+        """Close the TinyFlux handle if it was opened."""
+        self._handle.close()
+
+
+class TimeSeriesSegmentLayout:
+    """
+    Directory of time-partitioned segment files next to the base CSV.
+
+    Storage: ``<csv>.segments/<key>.csv`` (see ``segment_key``)
+
+    Segments of different periods may coexist (e.g. after changing the
+    configured period); each file is bounded by the window parsed from its
+    own key, so reads stay correct and new writes use the configured period.
+    """
+
+    _SUFFIX = ".csv"
+
+    def __init__(self, base_csv: Path, measurement: str, period: TimeSeriesSegmentPeriod) -> None:
+        """Initialize layout for the base CSV path, measurement and write period."""
+        self.directory = base_csv.with_name(f"{base_csv.name}.segments")
+        self.period = period
+        self._measurement = measurement
+        self._segments: dict[str, TimeSeriesSegment] = {}
+
+    def segment_for(self, moment: datetime) -> TimeSeriesSegment:
+        """Return the segment new points at ``moment`` are written to."""
+        return self.segment(segment_key(moment, self.period))
+
+    def segments(self) -> list[TimeSeriesSegment]:
+        """Return all segments on disk (plus ones opened in-process), ordered by window."""
+        keys = set(self._segments)
+        if self.directory.is_dir():
+            keys.update(path.stem for path in self.directory.glob(f"*{self._SUFFIX}"))
+        windows = {key: window for key in keys if (window := segment_window(key)) is not None}
+        return [self.segment(key) for key in sorted(windows, key=windows.__getitem__)]
+
+    def overlapping(self, start_time: datetime, end_time: datetime) -> list[TimeSeriesSegment]:
+        """Return segments whose window intersects ``(start_time, end_time)``, ordered by window."""
+        return [segment for segment in self.segments() if segment.overlaps(start_time, end_time)]
+
+    def close(self) -> None:
+        """Close every opened segment."""
+        for segment in self._segments.values():
+            segment.close()
+
+    def segment(self, key: str) -> TimeSeriesSegment:
+        """Return the segment stored under ``key`` (the file may not exist yet)."""
+        if key not in self._segments:
+            self._segments[key] = TimeSeriesSegment(
+                self.directory / f"{key}{self._SUFFIX}",
+                self._measurement,
+                segment_window(key),
+            )
+        return self._segments[key]
@@ -0,0 +1,191 @@
+"""Columnar daily snapshots of video timeseries points (memory-mapped NumPy arrays)."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.infrastructure.storage.video_point_columns import (
+    VideoPointColumns,
+    score_and_rank_video_columns,
+    top_ranked_records,
+)
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
+    from src.domain.models import VideoPoint, VideoPointRecord
+
+logger = get_logger(__name__)
+
+
+_MAGIC = b"TVGCOLS1"
+_ALIGNMENT = 64
+_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("video_codes", "<i4"),
+    ("times", "<i8"),
+    ("views", "<i8"),
+    ("likes", "<i8"),
+    ("views_growth", "<i8"),
+    ("score", "<i8"),
+    ("score_previous", "<i8"),
+    ("score_status", "|i1"),
+)
+
+
+def write_columns_file(path: Path, columns: VideoPointColumns) -> None:
+    """
+    Write ``columns`` to ``path`` atomically (tempfile + fsync + rename).
+
+    Layout: 8-byte magic, uint64 header length, JSON header (row count,
+    video_id dictionary, column offsets), then one 64-byte aligned
+    little-endian array per column so readers can memory-map each column.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    offsets: dict[str, int] = {}
+    blobs: list[bytes] = []
+    position = 0
+    for name, dtype in _COLUMNS:
+        blob = np.ascontiguousarray(getattr(columns, name), dtype=dtype).tobytes()
+        offsets[name] = position
+        padding = -len(blob) % _ALIGNMENT
+        blobs.append(blob + b"\0" * padding)
+        position += len(blob) + padding
+
+    header = json.dumps(
+        {"rows": len(columns), "video_ids": list(columns.video_ids), "columns": offsets},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    prefix_length = len(_MAGIC) + 8 + len(header)
+    header += b" " * (-prefix_length % _ALIGNMENT)
+
+    temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(temp_fd, "wb") as handle:
+            handle.write(_MAGIC)
+            handle.write(struct.pack("<Q", len(header)))
+            handle.write(header)
+            for blob in blobs:
+                handle.write(blob)
+            handle.flush()
+            os.fsync(handle.fileno())
+        Path(temp_path).replace(path)
+    except OSError:
+        with suppress(OSError):
+            Path(temp_path).unlink()
+        raise
+
+
+def map_columns_file(path: Path) -> VideoPointColumns:
+    """
+    Memory-map a file written by ``write_columns_file``.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a columnar snapshot.
+    """
+    with path.open("rb") as handle:
+        if handle.read(len(_MAGIC)) != _MAGIC:
+            msg = f"Not a columnar snapshot: {path}"
+            raise ValueError(msg)
+        (header_length,) = struct.unpack("<Q", handle.read(8))
+        header = json.loads(handle.read(header_length))
+    data_offset = len(_MAGIC) + 8 + header_length
+
+    rows = int(header["rows"])
+    arrays = {
+        name: _map_column(path, dtype, data_offset + int(header["columns"][name]), rows) for name, dtype in _COLUMNS
+    }
+    return VideoPointColumns(video_ids=tuple(header["video_ids"]), **arrays)
+
+
+def _map_column(path: Path, dtype: str, offset: int, rows: int) -> Any:
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+
+
+class DailySnapshotStore:
+    """
+    Stores one columnar snapshot file per fetch day.
+
+    Storage: ``<timeseries csv>.snapshots/YYYY-MM-DD.cols``
+    Layout: see ``write_columns_file``.
+
+    ``rank_day`` ranks a whole day on the memory-mapped arrays and only
+    decodes the top-N rows into domain records.
+    """
+
+    _SUFFIX = ".cols"
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize store rooted at ``directory`` (created lazily on first write)."""
+        self._directory = directory
+
+    @classmethod
+    def for_timeseries_file(cls, db_timeseries_file: str | os.PathLike[str]) -> DailySnapshotStore:
+        """Build the store that lives next to a TinyFlux timeseries CSV."""
+        return cls(Path(f"{db_timeseries_file}.snapshots"))
+
+    def snapshot_path(self, day: date) -> Path:
+        """Return the snapshot file path for a fetch day."""
+        return self._directory / f"{day.isoformat()}{self._SUFFIX}"
+
+    def write_day(self, day: date, points: Sequence[VideoPoint]) -> None:
+        """
+        Append points to the snapshot of ``day``.
+
+        The file is rewritten atomically (tempfile + rename); existing rows of
+        the same day are kept so repeated fetches match the CSV contents.
+        """
+        existing = self.read_day(day)
+        combined = [*(existing.to_video_points() if existing else []), *points]
+        columns = VideoPointColumns.from_video_points(combined)
+        write_columns_file(self.snapshot_path(day), columns)
+        logger.debug("timeseries_snapshot.written", day=day.isoformat(), rows=len(columns))
+
+    def rank_day(
+        self,
+        day: date,
+        baseline_day: date,
+        *,
+        baseline: Sequence[VideoPointRecord] | None,
+        limit: int,
+    ) -> list[VideoPointRecord] | None:
+        """
+        Rank the points of ``day`` by growth and return the top ``limit`` records.
+
+        The baseline is ``baseline`` when given (e.g. materialized closes), else
+        the snapshot of ``baseline_day``. Returns None when the snapshot of
+        ``day`` is missing or empty, or the baseline snapshot is missing, so
+        callers can fall back to the timeseries for identical results.
+        """
+        current = self.read_day(day)
+        if current is None or not len(current):
+            return None
+        previous = (
+            VideoPointColumns.from_video_points(baseline) if baseline is not None else self.read_day(baseline_day)
+        )
+        if previous is None:
+            return None
+        return top_ranked_records(score_and_rank_video_columns(current, previous), limit)
+
+    def read_day(self, day: date) -> VideoPointColumns | None:
+        """Memory-map the snapshot for ``day``, or return None when it does not exist."""
+        path = self.snapshot_path(day)
+        if not path.is_file():
+            return None
+        try:
+            return map_columns_file(path)
+        except (OSError, ValueError):
+            logger.exception("timeseries_snapshot.read_failed", path=str(path))
+            return None
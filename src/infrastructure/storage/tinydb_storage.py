@@ -0,0 +1,158 @@
+"""TinyDB storage with atomic writes, a shared read cache and optional write buffering."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tinydb.storages import Storage
+
+from src.shared import json_codec
+from src.shared.atomic_storage import AtomicFileStorage
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+type FileStamp = tuple[int, int, int]
+
+
+def _file_stamp(stat: os.stat_result) -> FileStamp:
+    # Writers replace the file by rename, so a new version always has a new inode.
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _copy_tables(data: dict[str, Any]) -> dict[str, Any]:
+    """Copy the levels TinyDB mutates in place: the tables mapping, each table and each document."""
+    return {name: {doc_id: dict(doc) for doc_id, doc in table.items()} for name, table in data.items()}
+
+
+class _DecodedFileCache:
+    """
+    Process-wide cache of decoded TinyDB files, keyed by path.
+
+    An entry is reused while the file's (inode, mtime, size) stamp is
+    unchanged, so repositories opened per web request skip re-parsing files
+    that nobody wrote, yet still see replacements made by other processes.
+    Callers get a copy, because TinyDB updates the data it reads in place.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[FileStamp, dict[str, Any]]] = {}
+
+    def load(self, path: Path) -> dict[str, Any] | None:
+        """Return a private copy of the file contents, or None for an empty file."""
+        stat = path.stat()
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == _file_stamp(stat):
+            return _copy_tables(entry[1])
+        # Stat before reading: if the file is replaced in between, the stale
+        # stamp only causes one extra reload on the next read.
+        content = path.read_bytes()
+        if not content.strip():
+            return None
+        data = json_codec.loads(content)
+        self.store(path, stat, data)
+        return _copy_tables(data)
+
+    def store(self, path: Path, stat: os.stat_result, data: dict[str, Any]) -> None:
+        """Record ``data`` as the contents of the file version described by ``stat``; takes ownership."""
+        with self._lock:
+            self._entries[path] = (_file_stamp(stat), data)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+_decoded_files = _DecodedFileCache()
+
+
+class BufferedJSONStorage(Storage):
+    """
+    JSON storage for TinyDB repositories.
+
+    Files are compact JSON written through ``src.shared.json_codec`` (orjson
+    when installed). Every write replaces the file through tempfile + rename,
+    so readers never see a half-written file; reads go through a process-wide
+    decoded cache validated against the file's stat, so unchanged files are
+    not parsed again and atomic replacements by other processes are seen.
+
+    Inside ``buffered()`` writes only update an in-memory copy, and leaving
+    the outermost block writes the file once. If the block raises, buffered
+    writes are discarded.
+
+    With ``write_back=True`` (passed through ``TinyDB(..., write_back=True)``)
+    every write is held in memory until ``flush()`` or ``close()``; meant for
+    jobs that own the file for their whole run. Pending writes are then kept
+    even if a ``buffered()`` block raises.
+    """
+
+    def __init__(self, path: str, *, write_back: bool = False, **_kwargs: object) -> None:
+        """Initialize storage for a JSON file, creating it if absent."""
+        self._path = Path(path).resolve()
+        self._file = AtomicFileStorage(str(self._path))
+        if not self._path.exists():
+            # touch() on an existing file would bump its mtime and invalidate every cached decode.
+            self._path.touch(exist_ok=True)
+        self._write_back = write_back
+        self._depth = 0
+        self._cache: dict[str, Any] | None = None
+        self._dirty = False
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Whether writes may be held in memory (inside ``buffered()`` or not yet flushed in write-back mode)."""
+        return bool(self._depth) or self._dirty
+
+    def read(self) -> dict[str, Any] | None:
+        """Return the database contents, or None for an empty file."""
+        if self._cache is not None:
+            return self._cache
+        data = _decoded_files.load(self._path)
+        if self._depth:
+            self._cache = data if data is not None else {}
+        return data
+
+    def write(self, data: dict[str, Any]) -> None:
+        """Replace the file atomically, or only the in-memory copy while buffered or in write-back mode."""
+        if self._depth or self._write_back:
+            self._cache = data
+            self._dirty = True
+            return
+        self._write_file(data)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Coalesce all writes made inside the block into a single file write."""
+        self._depth += 1
+        try:
+            yield
+            if self._depth == 1 and not self._write_back:
+                self.flush()
+        finally:
+            self._depth -= 1
+            if not self._depth and not (self._write_back and self._dirty):
+                self._cache = None
+                self._dirty = False
+
+    def flush(self) -> None:
+        """Write pending changes to the file, if any."""
+        if self._dirty and self._cache is not None:
+            self._write_file(self._cache)
+        self._cache = None
+        self._dirty = False
+
+    def close(self) -> None:
+        """Flush pending changes; the file itself is not kept open."""
+        self.flush()
+
+    def _write_file(self, data: dict[str, Any]) -> None:
+        stat = self._file.write_json(data, indent=None)
+        # Ownership of ``data`` moves to the shared cache: TinyDB reads again before its next change.
+        _decoded_files.store(self._path, stat, data)
@@ -0,0 +1,253 @@
+"""Column-oriented batches of video points (NumPy) for the snapshot and export files."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.domain.exceptions import ScoringError
+from src.domain.models import VideoPointRecord, VideoScoreStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import numpy.typing as npt
+
+    from src.domain.models import VideoPoint
+
+SCORE_STATUS_CODES: tuple[VideoScoreStatus, ...] = tuple(VideoScoreStatus)
+NO_SCORE_STATUS_CODE = -1
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class VideoPointColumns:
+    """
+    Column-oriented batch of video points, one NumPy array per attribute.
+
+    ``video_codes`` index into the ``video_ids`` dictionary. Nullable integer
+    columns use 0 for "missing" (the same convention as the TinyFlux rows) and
+    ``score_status`` holds an index into ``SCORE_STATUS_CODES`` or
+    ``NO_SCORE_STATUS_CODE``. ``times`` are UTC epoch microseconds.
+    """
+
+    video_ids: tuple[str, ...]
+    video_codes: npt.NDArray[np.int32]
+    times: npt.NDArray[np.int64]
+    views: npt.NDArray[np.int64]
+    likes: npt.NDArray[np.int64]
+    views_growth: npt.NDArray[np.int64]
+    score: npt.NDArray[np.int64]
+    score_previous: npt.NDArray[np.int64]
+    score_status: npt.NDArray[np.int8]
+
+    def __len__(self) -> int:
+        return len(self.video_codes)
+
+    @classmethod
+    def from_video_points(cls, points: Iterable[VideoPoint | VideoPointRecord]) -> VideoPointColumns:
+        """Encode VideoPoint models or records into columns with a dictionary-encoded video_id.
+
+        ``points`` is consumed in a single pass, so it may be a stream: only
+        plain integers are kept per row, never the models themselves.
+        """
+        codes_by_id: dict[str, int] = {}
+        video_codes, score_status = array("i"), array("b")
+        times, views, likes, views_growth, score, score_previous = (array("q") for _ in range(6))
+        for point in points:
+            video_codes.append(codes_by_id.setdefault(point.video_id, len(codes_by_id)))
+            times.append((point.time - _EPOCH) // _MICROSECOND)
+            views.append(point.views)
+            likes.append(point.likes)
+            views_growth.append(point.views_growth or 0)
+            score.append(point.score or 0)
+            score_previous.append(point.score_previous or 0)
+            score_status.append(
+                SCORE_STATUS_CODES.index(point.score_status) if point.score_status else NO_SCORE_STATUS_CODE
+            )
+        return cls(
+            video_ids=tuple(codes_by_id),
+            video_codes=np.array(video_codes, dtype=np.int32),
+            times=np.array(times, dtype=np.int64),
+            views=np.array(views, dtype=np.int64),
+            likes=np.array(likes, dtype=np.int64),
+            views_growth=np.array(views_growth, dtype=np.int64),
+            score=np.array(score, dtype=np.int64),
+            score_previous=np.array(score_previous, dtype=np.int64),
+            score_status=np.array(score_status, dtype=np.int8),
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence[VideoPointColumns]) -> VideoPointColumns:
+        """Concatenate batches row-wise, merging their video_id dictionaries."""
+        codes_by_id: dict[str, int] = {}
+        video_codes: list[npt.NDArray[np.int32]] = [np.empty(0, dtype=np.int32)]
+        for part in parts:
+            remap = np.asarray(
+                [codes_by_id.setdefault(video_id, len(codes_by_id)) for video_id in part.video_ids],
+                dtype=np.int32,
+            )
+            video_codes.append(remap[part.video_codes] if len(part) else np.empty(0, dtype=np.int32))
+
+        def column(name: str, dtype: type[np.generic]) -> npt.NDArray[Any]:
+            return np.concatenate([np.empty(0, dtype=dtype), *(getattr(part, name) for part in parts)])
+
+        return cls(
+            video_ids=tuple(codes_by_id),
+            video_codes=np.concatenate(video_codes),
+            times=column("times", np.int64),
+            views=column("views", np.int64),
+            likes=column("likes", np.int64),
+            views_growth=column("views_growth", np.int64),
+            score=column("score", np.int64),
+            score_previous=column("score_previous", np.int64),
+            score_status=column("score_status", np.int8),
+        )
+
+    def take(self, rows: npt.NDArray[np.intp]) -> VideoPointColumns:
+        """Return the given rows, in the given order, as a new batch."""
+        return VideoPointColumns(
+            video_ids=self.video_ids,
+            video_codes=self.video_codes[rows],
+            times=self.times[rows],
+            views=self.views[rows],
+            likes=self.likes[rows],
+            views_growth=self.views_growth[rows],
+            score=self.score[rows],
+            score_previous=self.score_previous[rows],
+            score_status=self.score_status[rows],
+        )
+
+    def rows_between(self, start_time: datetime, end_time: datetime) -> range:
+        """Rows with ``start_time < time < end_time``; ``times`` must be sorted ascending."""
+        start = (start_time.astimezone(UTC) - _EPOCH) // _MICROSECOND
+        end = (end_time.astimezone(UTC) - _EPOCH) // _MICROSECOND
+        first = int(np.searchsorted(self.times, start, side="right"))
+        last = int(np.searchsorted(self.times, end, side="left"))
+        return range(first, max(first, last))
+
+    def video_id_array(self) -> npt.NDArray[np.str_]:
+        """Decode the video_id column into a string array."""
+        dictionary = np.asarray(self.video_ids, dtype=np.str_)
+        if not len(dictionary):
+            return np.empty(len(self), dtype=np.str_)
+        return dictionary[self.video_codes]
+
+    def to_video_points(self, rows: Sequence[int] | None = None) -> list[VideoPoint]:
+        """Materialize VideoPoint models, optionally only for the given row positions."""
+        return [record.to_video_point() for record in self.to_records(rows)]
+
+    def to_records(self, rows: Sequence[int] | None = None) -> list[VideoPointRecord]:
+        """Decode rows into VideoPointRecords, optionally only the given row positions."""
+        batch = self if rows is None else self.take(np.asarray(rows, dtype=np.intp))
+        # Whole-column tolist() calls are far cheaper than per-cell NumPy scalar access.
+        columns = zip(
+            batch.times.tolist(),
+            batch.video_codes.tolist(),
+            batch.views.tolist(),
+            batch.likes.tolist(),
+            batch.views_growth.tolist(),
+            batch.score.tolist(),
+            batch.score_previous.tolist(),
+            batch.score_status.tolist(),
+            strict=True,
+        )
+        return [
+            VideoPointRecord(
+                time=_EPOCH + time_us * _MICROSECOND,
+                video_id=self.video_ids[video_code],
+                views=views,
+                likes=likes,
+                views_growth=views_growth or None,
+                score=score or None,
+                score_previous=score_previous or None,
+                score_status=SCORE_STATUS_CODES[status_code] if status_code != NO_SCORE_STATUS_CODE else None,
+            )
+            for time_us, video_code, views, likes, views_growth, score, score_previous, status_code in columns
+        ]
+
+
+def score_and_rank_video_columns(
+    current: VideoPointColumns,
+    previous: VideoPointColumns,
+) -> VideoPointColumns:
+    """Columnar counterpart of ``score_and_rank_video_records`` for whole-day snapshots.
+
+    Applies the same ranking rule without building per-row records: the
+    returned columns are the current rows reordered by rank, with
+    views_growth, score, score_previous and score_status filled in.
+    """
+    if not len(current):
+        raise ScoringError("current video list is empty")
+
+    previous_rows = _last_rows_by_video_id(previous, current.video_id_array())
+    matched = previous_rows >= 0
+    safe_rows = np.where(matched, previous_rows, 0)
+
+    if len(previous):
+        previous_views = previous.views[safe_rows]
+        previous_scores = np.where(matched, previous.score[safe_rows], 0)
+    else:
+        previous_views = np.zeros(len(current), dtype=np.int64)
+        previous_scores = np.zeros(len(current), dtype=np.int64)
+
+    fallback_growth = np.where(current.views_growth != 0, current.views_growth, current.views)
+    views_growth = np.where(matched, np.abs(current.views - previous_views), fallback_growth)
+
+    # Stable descending sort keeps insertion order for ties, like sorted(..., reverse=True).
+    order = np.argsort(-views_growth, kind="stable")
+    ranks = np.arange(1, len(current) + 1, dtype=np.int64)
+    score_previous = previous_scores[order]
+    # calculate_score_status, vectorized (0 is "no previous score").
+    score_status = np.select(
+        [score_previous == 0, ranks == score_previous, ranks > score_previous],
+        [
+            SCORE_STATUS_CODES.index(VideoScoreStatus.NEW),
+            SCORE_STATUS_CODES.index(VideoScoreStatus.EQUAL),
+            SCORE_STATUS_CODES.index(VideoScoreStatus.DOWN),
+        ],
+        default=SCORE_STATUS_CODES.index(VideoScoreStatus.UP),
+    ).astype(np.int8)
+
+    return VideoPointColumns(
+        video_ids=current.video_ids,
+        video_codes=current.video_codes[order],
+        times=current.times[order],
+        views=current.views[order],
+        likes=current.likes[order],
+        views_growth=views_growth[order],
+        score=ranks,
+        score_previous=score_previous,
+        score_status=score_status,
+    )
+
+
+def top_ranked_records(ranked: VideoPointColumns, limit: int) -> list[VideoPointRecord]:
+    """Decode the first ``limit`` rows returned by ``score_and_rank_video_columns``.
+
+    Ranked rows always have a growth, so a 0 decodes to a real zero rather
+    than the columns' "missing", like the record and point rankers return it.
+    """
+    return [
+        replace(record, views_growth=record.views_growth or 0)
+        for record in ranked.to_records(range(min(limit, len(ranked))))
+    ]
+
+
+def _last_rows_by_video_id(columns: VideoPointColumns, video_ids: npt.NDArray[np.str_]) -> npt.NDArray[np.int64]:
+    """Row of the last occurrence of each video_id in ``columns``, or -1 when absent."""
+    if not len(columns):
+        return np.full(len(video_ids), -1, dtype=np.int64)
+
+    known_ids = columns.video_id_array()
+    # np.unique keeps the first occurrence, so search the reversed column for "last wins".
+    unique_ids, first_reversed = np.unique(known_ids[::-1], return_index=True)
+    last_rows = len(known_ids) - 1 - first_reversed
+    positions = np.minimum(np.searchsorted(unique_ids, video_ids), len(unique_ids) - 1)
+    found = unique_ids[positions] == video_ids
+    return np.where(found, last_rows[positions], -1).astype(np.int64)
@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 from pydantic import BaseModel
 from tinydb import Query, TinyDB
 
 from src.domain.models import CanonicalVideo
+from src.infrastructure.storage.tinydb_storage import BufferedJSONStorage
+from src.infrastructure.storage.video_text_index import VideoTextIndex, VideoTextIndexStore
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterable, Iterator
+
+    from tinydb.table import Document
+
+type FileStamp = tuple[int, int, int]
 
 
 class VideoRecord(BaseModel):
@@ -55,25 +65,58 @@ class VideoRecord(BaseModel):
         )
 
 
+@dataclass
+class _SharedDocIds:
+    stamp: FileStamp | None
+    doc_ids: dict[str, int]
+
+
+_shared_doc_ids: dict[Path, _SharedDocIds] = {}
+_shared_doc_ids_lock = threading.Lock()
+
+
 class VideoRepository:
     """
     Video metadata repository using TinyDB.
 
     Responsibility: Persist and retrieve video metadata (title, channel, views, etc).
     Does NOT handle time-series data (views over time) — use TimeSeriesRepository for that.
+
+    Index: an in-memory video_id → doc_id map, so get/upsert/delete address
+    documents by ``doc_ids`` instead of scanning the table with a query. It is
+    shared by every repository of the process opened on the same file and
+    version, kept up to date on writes (a repository copies it before its
+    first change), and rebuilt whenever the file was changed by someone
+    else (e.g. the scheduler process), so the web server, which opens a
+    repository per request, scans the table once per database change.
+
+    Text search: an inverted index over title, channel name and hashtags
+    (see ``VideoTextIndex``), persisted as ``<db>.search.json``. Writes keep
+    it in sync and save it once their changes are on disk; it is rebuilt
+    from the table when the sidecar does not match the database file.
     """
 
     _TABLE = "video"
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, *, write_back: bool = False) -> None:
         """
         Initialize repository.
 
         Args:
             db_path: Path to TinyDB file (e.g., /path/to/db.json).
+            write_back: Hold every write in memory until ``flush()`` or ``close()``.
         """
-        self._db = TinyDB(str(db_path))
+        self._path = Path(db_path)
+        self._index_key = self._path.resolve()
+        self._db = TinyDB(str(db_path), storage=BufferedJSONStorage, write_back=write_back)
+        self._storage = cast("BufferedJSONStorage", self._db.storage)
         self._table = self._db.table(self._TABLE)
+        self._doc_ids: dict[str, int] = {}
+        self._owns_doc_ids = False
+        self._stamp: FileStamp | None = None
+        self._search_store = VideoTextIndexStore(self._path)
+        self._unsaved_search_index: VideoTextIndex | None = None
+        self._load_index(self._file_stamp())
 
     def upsert(self, video: CanonicalVideo) -> None:
         """
@@ -83,7 +126,47 @@ class VideoRepository:
             video: Domain entity to persist.
         """
         record = VideoRecord.from_canonical(video).model_dump()
-        self._table.upsert(record, Query().video_id == video.video_id)
+        search_index = self._search_index()
+        doc_id = self._index().get(video.video_id)
+        if doc_id is None or not self._table.update(record, doc_ids=[doc_id]):
+            index = self._owned_index()
+            index[video.video_id] = self._table.insert(record)
+        search_index.add(
+            video.video_id, title=video.title, channel_name=video.channel_name, description=video.description
+        )
+        self._after_write(search_index)
+
+    def upsert_many(self, videos: Iterable[CanonicalVideo]) -> int:
+        """
+        Insert or update several video records with a single file write.
+
+        Args:
+            videos: Domain entities to persist.
+
+        Returns:
+            Number of videos written.
+        """
+        count = 0
+        with self.buffered():
+            for video in videos:
+                self.upsert(video)
+                count += 1
+        return count
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Apply every write made inside the block in memory and write the file once on exit."""
+        try:
+            with self._storage.buffered():
+                yield
+        except BaseException:
+            if not self._storage.has_pending_writes:
+                # The writes were discarded; the shared search index already reflects them.
+                self._search_store.forget()
+                self._unsaved_search_index = None
+                self._load_index(self._file_stamp())
+            raise
+        self._after_write()
 
     def get(self, video_id: str) -> CanonicalVideo | None:
         """
@@ -95,10 +178,29 @@ class VideoRepository:
         Returns:
             CanonicalVideo if found, None otherwise.
         """
-        results = self._table.search(Query().video_id == video_id)
-        if not results:
+        doc_id = self._index().get(video_id)
+        document = self._table.get(doc_id=doc_id) if doc_id is not None else None
+        if document is None:
             return None
-        return VideoRecord.model_validate(results[0]).to_canonical()
+        return VideoRecord.model_validate(document).to_canonical()
+
+    def get_many(self, video_ids: Iterable[str]) -> dict[str, CanonicalVideo]:
+        """
+        Retrieve several videos by ID with a single read of the table.
+
+        Args:
+            video_ids: YouTube video IDs.
+
+        Returns:
+            Mapping of video_id to CanonicalVideo for the IDs found.
+        """
+        index = self._index()
+        doc_ids = [doc_id for video_id in dict.fromkeys(video_ids) if (doc_id := index.get(video_id)) is not None]
+        if not doc_ids:
+            return {}
+        documents = cast("list[Document]", self._table.get(doc_ids=doc_ids) or [])
+        videos = (VideoRecord.model_validate(document).to_canonical() for document in documents)
+        return {video.video_id: video for video in videos}
 
     def search(self, pattern: str) -> list[CanonicalVideo]:
         """
@@ -113,6 +215,24 @@ class VideoRepository:
         results = self._table.search(Query().video_id.matches(pattern, flags=re.IGNORECASE))
         return [VideoRecord.model_validate(r).to_canonical() for r in results]
 
+    def search_text(self, query: str, *, limit: int = 20) -> list[CanonicalVideo]:
+        """
+        Search videos by title, channel name and hashtags.
+
+        Every query token must match a whole word or a word prefix
+        ("beat" finds "Beatles"); matching is case- and accent-insensitive.
+
+        Args:
+            query: Free text typed by the user.
+            limit: Maximum number of results.
+
+        Returns:
+            Matching videos, best ranked first (title over channel over hashtag matches).
+        """
+        ranked = self._search_index().search(query, limit=limit)
+        videos = self.get_many(video_id for video_id, _ in ranked)
+        return [videos[video_id] for video_id, _ in ranked if video_id in videos]
+
     def delete(self, video_id: str) -> int:
         """
         Delete a video by ID.
@@ -123,7 +243,14 @@ class VideoRepository:
         Returns:
             Number of records deleted (0 or 1).
         """
-        return len(self._table.remove(Query().video_id == video_id))
+        if video_id not in self._index():
+            return 0
+        doc_id = self._owned_index().pop(video_id)
+        search_index = self._search_index()
+        removed = self._table.remove(doc_ids=[doc_id])
+        search_index.remove(video_id)
+        self._after_write(search_index)
+        return len(removed)
 
     def all(self) -> list[CanonicalVideo]:
         """
@@ -136,8 +263,87 @@ class VideoRepository:
 
     def clear(self) -> None:
         """Delete all videos from table (use with caution)."""
+        search_index = self._search_index()
         self._table.truncate()
+        self._doc_ids = {}
+        self._owns_doc_ids = True
+        search_index.clear()
+        self._after_write(search_index)
+
+    def flush(self) -> None:
+        """Write changes held back in write-back mode."""
+        self._storage.flush()
+        self._after_write()
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection, flushing pending writes."""
         self._db.close()
+        self._after_write()
+
+    def _index(self) -> dict[str, int]:
+        """Return the video_id → doc_id map, rebuilt if the file changed since it was last seen."""
+        stamp = self._file_stamp()
+        if stamp != self._stamp:
+            self._load_index(stamp)
+        return self._doc_ids
+
+    def _owned_index(self) -> dict[str, int]:
+        """Return the video_id → doc_id map for changing it, first copying it if it is shared."""
+        index = self._index()
+        if not self._owns_doc_ids:
+            self._doc_ids = dict(index)
+            self._owns_doc_ids = True
+        return self._doc_ids
+
+    def _search_index(self) -> VideoTextIndex:
+        """Return the text index of the current database contents, loading or rebuilding it if needed."""
+        stamp = self._file_stamp()
+        search_index = self._search_store.get(stamp)
+        if search_index is None:
+            search_index = VideoTextIndex.from_documents(self._table.all())
+            if self._storage.has_pending_writes:
+                self._search_store.share(search_index, stamp)
+            else:
+                self._search_store.save(search_index, stamp)
+        return search_index
+
+    def _after_write(self, search_index: VideoTextIndex | None = None) -> None:
+        """Refresh the file stamp and persist the updated text index once the writes are on disk."""
+        self._stamp = self._file_stamp()
+        if self._owns_doc_ids and not self._storage.has_pending_writes:
+            self._share_index()
+        if search_index is not None:
+            self._unsaved_search_index = search_index
+        if self._unsaved_search_index is not None and not self._storage.has_pending_writes:
+            self._search_store.save(self._unsaved_search_index, self._stamp)
+            self._unsaved_search_index = None
+
+    def _load_index(self, stamp: FileStamp | None) -> None:
+        """Adopt the shared index of database version ``stamp``, building it from the table if there is none."""
+        self._stamp = stamp
+        if self._storage.has_pending_writes:
+            # The table holds writes that are not on disk yet: the index is private until they are.
+            self._doc_ids = {document["video_id"]: document.doc_id for document in self._table.all()}
+            self._owns_doc_ids = True
+            return
+        with _shared_doc_ids_lock:
+            shared = _shared_doc_ids.get(self._index_key)
+        if shared is not None and shared.stamp == stamp:
+            self._doc_ids = shared.doc_ids
+            self._owns_doc_ids = False
+            return
+        self._doc_ids = {document["video_id"]: document.doc_id for document in self._table.all()}
+        self._share_index()
+
+    def _share_index(self) -> None:
+        """Make this repository's index the process-wide index of its database version; it is read-only from now."""
+        with _shared_doc_ids_lock:
+            _shared_doc_ids[self._index_key] = _SharedDocIds(stamp=self._stamp, doc_ids=self._doc_ids)
+        self._owns_doc_ids = False
+
+    def _file_stamp(self) -> FileStamp | None:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
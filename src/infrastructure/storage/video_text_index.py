@@ -0,0 +1,263 @@
+"""Inverted text index over video titles, channel names and hashtags."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.shared.atomic_storage import AtomicFileStorage, JournalOp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+type FileStamp = tuple[int, int, int]
+
+INDEX_VERSION = 1
+# Per-field weight of a term; a term found in several fields keeps the highest one.
+FIELD_WEIGHTS: dict[str, float] = {"title": 3.0, "channel_name": 2.0, "hashtags": 1.0}
+# A query token that only prefixes a term scores this fraction of an exact match.
+PREFIX_MATCH_FACTOR = 0.5
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_HASHTAG_PATTERN = re.compile(r"#(\w+)")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase, accent-free word tokens ("Canción #1" → ["cancion", "1"])."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return _TOKEN_PATTERN.findall(folded)
+
+
+def extract_hashtags(*texts: str) -> list[str]:
+    """Return the hashtags of the given texts, without the leading ``#``, in order of appearance."""
+    return [tag for text in texts for tag in _HASHTAG_PATTERN.findall(text)]
+
+
+def document_terms(*, title: str, channel_name: str, description: str) -> dict[str, float]:
+    """Return the weighted terms a video is indexed under."""
+    fields = {
+        "title": title,
+        "channel_name": channel_name,
+        "hashtags": " ".join(extract_hashtags(title, description)),
+    }
+    terms: dict[str, float] = {}
+    for field_name, text in fields.items():
+        weight = FIELD_WEIGHTS[field_name]
+        for term in tokenize(text):
+            terms[term] = max(terms.get(term, 0.0), weight)
+    return terms
+
+
+class VideoTextIndex:
+    """
+    In-memory inverted index: term → {video_id: weight}.
+
+    A query matches the videos containing every query token, either as a
+    whole term or as a term prefix (so "beat" finds "beatles"). A video's
+    score is the sum, over the query tokens, of its best matching term
+    weight; results are ranked by score, ties by video_id. Prefix lookups
+    bisect a sorted term list, rebuilt lazily after writes.
+    """
+
+    def __init__(self) -> None:
+        self._documents: dict[str, dict[str, float]] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._sorted_terms: list[str] | None = None
+        # Videos changed since the index was loaded or saved; None until it has been, or after clear().
+        self._unsaved: set[str] | None = None
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Mapping[str, Any]]) -> VideoTextIndex:
+        """Build an index from stored video documents (``VideoRecord`` dumps)."""
+        index = cls()
+        for document in documents:
+            index.add(
+                document["video_id"],
+                title=document.get("title") or "",
+                channel_name=document.get("channel_name") or "",
+                description=document.get("description") or "",
+            )
+        return index
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, video_id: str, *, title: str, channel_name: str, description: str) -> None:
+        """Index a video, replacing any previous terms it had."""
+        self.remove(video_id)
+        self._add_terms(video_id, document_terms(title=title, channel_name=channel_name, description=description))
+        if self._unsaved is not None:
+            self._unsaved.add(video_id)
+
+    def remove(self, video_id: str) -> None:
+        """Drop a video from the index, if present."""
+        terms = self._documents.pop(video_id, None)
+        if not terms:
+            return
+        if self._unsaved is not None:
+            self._unsaved.add(video_id)
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(video_id, None)
+            if not posting:
+                del self._postings[term]
+                self._sorted_terms = None
+
+    def clear(self) -> None:
+        """Drop every video."""
+        self._documents.clear()
+        self._postings.clear()
+        self._sorted_terms = None
+        self._unsaved = None
+
+    def search(self, query: str, *, limit: int) -> list[tuple[str, float]]:
+        """Return up to ``limit`` (video_id, score) pairs matching every query token, best first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit <= 0:
+            return []
+        scores = self._match(tokens[0])
+        for token in tokens[1:]:
+            if not scores:
+                return []
+            matches = self._match(token)
+            scores = {video_id: score + matches[video_id] for video_id, score in scores.items() if video_id in matches}
+        return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def take_changes(self) -> dict[str, dict[str, float] | None] | None:
+        """
+        Return the weighted terms of every video changed since the last call, load or save.
+
+        Removed videos map to None. Returns None when the index was never
+        persisted or was cleared, i.e. only a full ``to_dict`` can save it.
+        """
+        unsaved, self._unsaved = self._unsaved, set()
+        if unsaved is None:
+            return None
+        return {video_id: self._documents.get(video_id) for video_id in unsaved}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form: the weighted terms of every video (postings are derived on load)."""
+        return {"documents": self._documents}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> VideoTextIndex:
+        """Inverse of ``to_dict``."""
+        index = cls()
+        for video_id, terms in data.get("documents", {}).items():
+            index._add_terms(video_id, {term: float(weight) for term, weight in terms.items()})
+        index._unsaved = set()
+        return index
+
+    def _add_terms(self, video_id: str, terms: dict[str, float]) -> None:
+        self._documents[video_id] = terms
+        for term, weight in terms.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                self._postings[term] = posting = {}
+                self._sorted_terms = None
+            posting[video_id] = weight
+
+    def _match(self, token: str) -> dict[str, float]:
+        """Best score per video for one query token, over the exact term and every longer term it prefixes."""
+        matches = dict(self._postings.get(token, {}))
+        terms = self._terms()
+        position = bisect_left(terms, token)
+        for term in itertools.islice(terms, position, None):
+            if not term.startswith(token):
+                break
+            if term == token:
+                continue
+            for video_id, weight in self._postings[term].items():
+                score = weight * PREFIX_MATCH_FACTOR
+                if score > matches.get(video_id, 0.0):
+                    matches[video_id] = score
+        return matches
+
+    def _terms(self) -> list[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        return self._sorted_terms
+
+
+@dataclass
+class _SharedIndex:
+    stamp: FileStamp | None
+    index: VideoTextIndex
+
+
+_shared_indexes: dict[Path, _SharedIndex] = {}
+_shared_indexes_lock = threading.Lock()
+
+
+class VideoTextIndexStore:
+    """
+    Persists a VideoTextIndex next to the video database as ``<db>.search.json``.
+
+    The sidecar records the database file stamp it was built for, so a
+    stale sidecar (the database was written without updating it) is
+    detected and rebuilt. It is a journaled AtomicFileStorage: saving an
+    index that was loaded or saved before only appends the videos changed
+    since, conditioned on the sidecar still holding the stamp the changes
+    were made against; a record whose condition fails is dropped, leaving
+    a stale sidecar that is rebuilt on the next load. Loaded indexes are shared by every repository of
+    the process opened on the same file, so the web server, which opens a
+    repository per request, parses the sidecar once per database change.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path.resolve()
+        self._storage = AtomicFileStorage(f"{self._db_path}.search.json", journal=True)
+
+    def get(self, stamp: FileStamp | None) -> VideoTextIndex | None:
+        """Return the shared index if it was built for ``stamp``, else the persisted one if it matches."""
+        with _shared_indexes_lock:
+            shared = _shared_indexes.get(self._db_path)
+        if shared is not None and shared.stamp == stamp:
+            return shared.index
+        data = self._storage.read_json()
+        if data.get("version") != INDEX_VERSION or data.get("stamp") != (list(stamp) if stamp else None):
+            return None
+        index = VideoTextIndex.from_dict(data)
+        self.share(index, stamp)
+        return index
+
+    def save(self, index: VideoTextIndex, stamp: FileStamp | None) -> None:
+        """Persist ``index`` as the index of the database version ``stamp`` and share it."""
+        with _shared_indexes_lock:
+            shared = _shared_indexes.get(self._db_path)
+        changes = index.take_changes()
+        if changes is None or shared is None or shared.index is not index:
+            self._storage.write_json(
+                {"version": INDEX_VERSION, "stamp": list(stamp) if stamp else None, **index.to_dict()},
+                indent=None,
+            )
+        else:
+            ops = [
+                JournalOp(("documents", video_id), terms, delete=terms is None) for video_id, terms in changes.items()
+            ]
+            ops.append(JournalOp(("stamp",), list(stamp) if stamp else None))
+            self._storage.append_ops(
+                ops,
+                expect={"version": INDEX_VERSION, "stamp": list(shared.stamp) if shared.stamp else None},
+            )
+        self.share(index, stamp)
+
+    def forget(self) -> None:
+        """Drop the shared index, e.g. after discarding writes it already reflects."""
+        with _shared_indexes_lock:
+            _shared_indexes.pop(self._db_path, None)
+
+    def share(self, index: VideoTextIndex, stamp: FileStamp | None) -> None:
+        """Make ``index`` the process-wide index of database version ``stamp``, without persisting it."""
+        with _shared_indexes_lock:
+            _shared_indexes[self._db_path] = _SharedIndex(stamp=stamp, index=index)
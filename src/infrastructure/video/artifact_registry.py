@@ -0,0 +1,292 @@
+"""Registry of rendered video artifacts, so the latest one is found without walking the videos folder."""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.domain.models import VideoArtifact, VideoArtifactKind
+from src.shared.atomic_storage import AtomicFileStorage
+from src.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+type FileStamp = tuple[int, int, int]
+type RegistryState = dict[str, Any]
+
+INDEX_VERSION = 1
+
+logger = get_logger(__name__)
+
+_ROOT = "."
+_RENDER_PATTERN = re.compile(r"(?P<name>.+?)(?P<vertical>_vertical)?_format\.mp4")
+_DATE_FOLDER_PATTERN = re.compile(r"\d{8}")
+
+
+def artifact_kind(file_name: str) -> VideoArtifactKind | None:
+    """Classify a rendered file by name ("abc_vertical_format.mp4" → VERTICAL); None for any other file."""
+    match = _RENDER_PATTERN.fullmatch(file_name)
+    if match is None:
+        return None
+    # Joined videos are named after their UTC day: YYYYMMDD[_vertical]_format.mp4.
+    compilation = _DATE_FOLDER_PATTERN.fullmatch(match["name"]) is not None
+    if match["vertical"]:
+        return VideoArtifactKind.VERTICAL_COMPILATION if compilation else VideoArtifactKind.VERTICAL
+    return VideoArtifactKind.HORIZONTAL_COMPILATION if compilation else VideoArtifactKind.HORIZONTAL
+
+
+def _file_stamp(stat: os.stat_result) -> FileStamp:
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _empty_state() -> RegistryState:
+    return {"version": INDEX_VERSION, "dirs": {}, "artifacts": {}, "latest": None}
+
+
+def _load_state(data: Mapping[str, Any]) -> RegistryState:
+    if data.get("version") != INDEX_VERSION:
+        return _empty_state()
+    return {
+        "version": INDEX_VERSION,
+        "dirs": dict(data.get("dirs") or {}),
+        "artifacts": dict(data.get("artifacts") or {}),
+        "latest": data.get("latest"),
+    }
+
+
+def _parent(relative: str) -> str:
+    return relative.rpartition("/")[0] or _ROOT
+
+
+def _is_within(relative: str, directory: str) -> bool:
+    return directory in (_ROOT, relative) or relative.startswith(f"{directory}/")
+
+
+def _latest(artifacts: Mapping[str, Mapping[str, Any]]) -> str | None:
+    """Newest artifact of the newest dated (YYYYMMDD) top-level folder holding any, else the newest anywhere."""
+    dated_folders = {
+        folder
+        for relative in artifacts
+        if (folder := relative.partition("/")[0]) != relative and _DATE_FOLDER_PATTERN.fullmatch(folder)
+    }
+    pool = artifacts
+    if dated_folders:
+        newest_folder = max(dated_folders)
+        pool = {relative: record for relative, record in artifacts.items() if _is_within(relative, newest_folder)}
+    return max(pool, key=lambda relative: (pool[relative]["mtime"], relative), default=None)
+
+
+def _watched_dirs(dirs: Mapping[str, int]) -> list[str]:
+    """The root and the newest dated (YYYYMMDD) folder with its subfolders; every directory without dated folders."""
+    dated_folders = [relative for relative in dirs if _DATE_FOLDER_PATTERN.fullmatch(relative)]
+    if not dated_folders:
+        return list(dirs)
+    newest_folder = max(dated_folders)
+    return [relative for relative in dirs if relative == _ROOT or _is_within(relative, newest_folder)]
+
+
+_shared_states: dict[Path, tuple[FileStamp, RegistryState]] = {}
+_shared_states_lock = threading.Lock()
+
+
+class VideoArtifactRegistry:
+    """
+    Index of the rendered mp4 files under the generated videos folder.
+
+    Stored as ``<folder>.artifacts.json`` beside the folder: inside it, every
+    index write would change the folder's mtime. The index records the
+    mtime of each directory of the tree. Renders go to the folder of the
+    current UTC day, so a lookup only stats the root and the newest dated
+    folder (with its subfolders); when one of them changed, every indexed
+    directory is checked and only those whose entries changed are rescanned.
+    Older folders are thus re-checked when a new day's folder appears.
+    Finishing a file does not touch its directory, so renderers
+    ``record()`` each output once written (with its duration, which a scan
+    cannot know); ``rebuild()`` rescans the whole tree. The latest artifact
+    is recomputed on every change, making ``latest_artifact()`` O(1) while
+    nothing changed. Parsed indexes are shared by the registries of the
+    process, as the web server opens one per request.
+    """
+
+    def __init__(self, folder: str | os.PathLike[str]) -> None:
+        self._folder = Path(folder)
+        resolved = self._folder.resolve()
+        self._storage = AtomicFileStorage(str(resolved.with_name(f"{resolved.name}.artifacts.json")))
+
+    @property
+    def index_path(self) -> Path:
+        return self._storage.file_path
+
+    def latest_artifact(self) -> VideoArtifact | None:
+        """Return the most recently rendered artifact, preferring the newest dated output folder."""
+        state = self._current_state()
+        latest = state["latest"]
+        return self._artifact(latest, state["artifacts"][latest]) if latest else None
+
+    def artifacts(self) -> list[VideoArtifact]:
+        """Return every indexed artifact, oldest first."""
+        state = self._current_state()
+        return sorted(
+            (self._artifact(relative, record) for relative, record in state["artifacts"].items()),
+            key=lambda artifact: (artifact.mtime, artifact.path),
+        )
+
+    def record(self, path: str | os.PathLike[str], *, duration: float | None = None) -> VideoArtifact | None:
+        """
+        Register a file the renderer has finished writing.
+
+        Returns None, without touching the index, for files outside the
+        folder or not named like a render.
+        """
+        try:
+            relative = Path(path).resolve().relative_to(self._folder.resolve()).as_posix()
+        except ValueError:
+            return None
+        if artifact_kind(Path(relative).name) is None:
+            return None
+        with self._locked_state() as state:
+            self._refresh(state)
+            # Re-stat even if the refresh just scanned it: the directory scan may have caught the file mid-write.
+            self._scan_file(state, relative, duration=duration)
+            state["latest"] = _latest(state["artifacts"])
+            record = state["artifacts"].get(relative)
+        return self._artifact(relative, record) if record else None
+
+    def rebuild(self) -> int:
+        """Rescan the whole folder, keeping known durations of unchanged files; returns the artifact count."""
+        previous = _load_state(self._storage.read_json())
+        state = _empty_state()
+        if self._folder.is_dir():
+            self._scan_dir(state, _ROOT, previous=previous["artifacts"])
+        state["latest"] = _latest(state["artifacts"])
+        # A full replace, so an unreadable index is recovered too.
+        self._storage.write_json(state, indent=None)
+        return len(state["artifacts"])
+
+    def _current_state(self) -> RegistryState:
+        state = self._read()
+        if not self._is_stale(state):
+            return state
+        try:
+            with self._locked_state() as state:
+                self._refresh(state)
+        except (OSError, ValueError):
+            logger.exception("artifact_registry.refresh_failed", index=str(self.index_path))
+        return state
+
+    def _read(self) -> RegistryState:
+        try:
+            stamp = _file_stamp(self.index_path.stat())
+        except FileNotFoundError:
+            return _empty_state()
+        with _shared_states_lock:
+            shared = _shared_states.get(self.index_path)
+        if shared is not None and shared[0] == stamp:
+            return shared[1]
+        state = _load_state(self._storage.read_json())
+        with _shared_states_lock:
+            _shared_states[self.index_path] = (stamp, state)
+        return state
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[RegistryState]:
+        with self._storage.locked_read_write() as data:
+            state = _load_state(data)
+            yield state
+            data.clear()
+            data.update(state)
+
+    def _is_stale(self, state: RegistryState) -> bool:
+        if _ROOT not in state["dirs"]:
+            return self._folder.is_dir()
+        for relative in _watched_dirs(state["dirs"]):
+            try:
+                if (self._folder / relative).stat().st_mtime_ns != state["dirs"][relative]:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def _refresh(self, state: RegistryState) -> None:
+        """Rescan the directories whose entries changed since they were indexed."""
+        if _ROOT not in state["dirs"]:
+            if self._folder.is_dir():
+                self._scan_dir(state, _ROOT)
+        else:
+            for relative, mtime_ns in list(state["dirs"].items()):
+                if relative not in state["dirs"]:
+                    continue  # Dropped along with its parent.
+                try:
+                    current = (self._folder / relative).stat().st_mtime_ns
+                except FileNotFoundError:
+                    self._forget(state, relative)
+                    continue
+                if current != mtime_ns:
+                    self._scan_dir(state, relative)
+        state["latest"] = _latest(state["artifacts"])
+
+    def _scan_dir(
+        self, state: RegistryState, relative: str, *, previous: Mapping[str, Mapping[str, Any]] | None = None
+    ) -> None:
+        directory = self._folder / relative
+        try:
+            # Stat before listing: an entry added in between only causes one extra rescan.
+            state["dirs"][relative] = directory.stat().st_mtime_ns
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            self._forget(state, relative)
+            return
+        files: set[str] = set()
+        subdirs: set[str] = set()
+        for entry in entries:
+            child = entry.name if relative == _ROOT else f"{relative}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.add(child)
+                if child not in state["dirs"]:
+                    self._scan_dir(state, child, previous=previous)
+            elif artifact_kind(entry.name) is not None and entry.is_file():
+                files.add(child)
+                self._scan_file(state, child, stat=entry.stat(), previous=previous)
+        for gone in [path for path in state["artifacts"] if _parent(path) == relative and path not in files]:
+            del state["artifacts"][gone]
+        for gone in [path for path in state["dirs"] if path != relative and _parent(path) == relative]:
+            if gone not in subdirs:
+                self._forget(state, gone)
+
+    def _scan_file(
+        self,
+        state: RegistryState,
+        relative: str,
+        *,
+        stat: os.stat_result | None = None,
+        duration: float | None = None,
+        previous: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
+        try:
+            stat = stat or (self._folder / relative).stat()
+        except FileNotFoundError:
+            state["artifacts"].pop(relative, None)
+            return
+        known = (previous if previous is not None else state["artifacts"]).get(relative)
+        if duration is None and known and (known["size"], known["mtime"]) == (stat.st_size, stat.st_mtime):
+            duration = known.get("duration")
+        state["artifacts"][relative] = {
+            "kind": artifact_kind(Path(relative).name),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "duration": duration,
+        }
+
+    @staticmethod
+    def _forget(state: RegistryState, directory: str) -> None:
+        for key in ("dirs", "artifacts"):
+            for relative in [relative for relative in state[key] if _is_within(relative, directory)]:
+                del state[key][relative]
+
+    def _artifact(self, relative: str, record: Mapping[str, Any]) -> VideoArtifact:
+        return VideoArtifact(path=str(self._folder / relative), **record)
@@ -65,6 +65,8 @@ class VideoAssetManager:
         self._thumbnail_font_file = thumbnail_font_file
         self._video_yt_resources_folder = video_yt_resources_folder
 
+        self._video_generated_base_folder = video_generated_base_folder
+
         # Create dated output folder (e.g., generated/20260305/)
         path = pathlib.Path(f"{video_generated_base_folder}/{datetime.datetime.now(datetime.UTC).strftime('%Y%m%d')}/")
         path.mkdir(parents=True, exist_ok=True)
@@ -105,6 +107,11 @@ class VideoAssetManager:
         """Folder containing downloaded YouTube video files."""
         return self._video_yt_resources_folder
 
+    @property
+    def video_generated_base_folder(self) -> str:
+        """Base folder holding the dated output folders."""
+        return self._video_generated_base_folder
+
     @property
     def video_generated_folder(self) -> str:
         """Folder for generated output videos (dated: YYYYMMDD)."""
@@ -16,6 +16,7 @@ from src.config.settings import get_app_settings
 from src.domain.models import Video
 from src.shared.logging import get_logger
 
+from .artifact_registry import VideoArtifactRegistry
 from .asset_manager import VideoAssetManager
 from .moviepy_compat import (
     CompositeVideoClip,
@@ -44,7 +45,7 @@ class VideoCompositor:
     - post_process_video(): horizontal (1920x1080) format composition
     - post_process_vertical_video(): vertical (1080x1920) format composition
     - join_processed_videos(): joining multiple clips with cross-fade transitions
-    - _render_clip(): FFmpeg rendering with h264 codec
+    - _render_clip(): FFmpeg rendering with h264 codec, recording each output in the artifact registry
 
     Dependencies:
         - VideoAssetManager: provides paths (start_screen, end_screen, video_generated_folder)
@@ -67,6 +68,7 @@ class VideoCompositor:
         self._end_screen_file = asset_manager.end_screen_file
         self._video_yt_resources_folder = asset_manager.video_yt_resources_folder
         self._video_generated_folder = asset_manager.video_generated_folder
+        self._artifact_registry = VideoArtifactRegistry(asset_manager.video_generated_base_folder)
 
     def _source_video_file(self, video: Video) -> pathlib.Path:
         video_id = video.video_id.strip()
@@ -222,6 +224,7 @@ class VideoCompositor:
         """Render CompositeVideoClip to MP4 file using FFmpeg.
 
         Skips rendering if output file already exists (idempotency check).
+        The output is recorded in the VideoArtifactRegistry either way.
 
         Args:
             video: CompositeVideoClip to render.
@@ -233,6 +236,7 @@ class VideoCompositor:
         logger.debug("start render clip", video_id=video_id)
         path = pathlib.Path(f"{self._video_generated_folder}/{video_id}_format.mp4")
         if await asyncio.to_thread(path.exists):
+            await self._record_artifact(path, duration=None)
             return str(path)
         if not (threads := get_app_settings().threads_workers):
             threads = 1
@@ -248,4 +252,13 @@ class VideoCompositor:
             preset="ultrafast",
         )
 
+        raw_duration: Any = getattr(video, "duration", None)
+        await self._record_artifact(path, duration=float(raw_duration) if raw_duration else None)
         return str(path)
+
+    async def _record_artifact(self, path: pathlib.Path, *, duration: float | None) -> None:
+        # The registry only speeds up admin lookups: failing to update it must not fail the render.
+        try:
+            await asyncio.to_thread(self._artifact_registry.record, path, duration=duration)
+        except (OSError, ValueError):
+            logger.exception("artifact_registry.record_failed", path=str(path))
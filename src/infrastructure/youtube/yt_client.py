@@ -2,7 +2,6 @@
 
 import asyncio
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any
 
 from googleapiclient.errors import HttpError
@@ -10,7 +9,7 @@ from googleapiclient.http import MediaFileUpload
 
 from src.config.settings import AppSettings, get_app_settings
 from src.domain.models import YtAuth
-from src.infrastructure.storage.auth_repository import AuthenticationRepository
+from src.infrastructure.storage.storage_backend import open_auth_repository
 from src.infrastructure.youtube.auth_manager import MemoryCache, YouTubeAuthManager
 from src.infrastructure.youtube.schemas import (
     YTRoot,
@@ -34,7 +33,7 @@ class YTClient:
         self._yt_search_language_code: str = resolved_settings.yt_search_language_code or ""
         self._yt_search_category_code: str = resolved_settings.yt_search_category_code or ""
         self._yt_auth_user_id: str = resolved_settings.yt_auth_user_id or ""
-        self._db_auth_file: str = resolved_settings.db_auth_file
+        self._settings: AppSettings = resolved_settings
         tags_raw = resolved_settings.yt_tags or ""
         self._yt_tags: list[str] = [str(tag) for tag in tags_raw.split(",") if tag]
         self._memory_cache = MemoryCache()
@@ -49,7 +48,7 @@ class YTClient:
         )
 
     def get_authenticated_service(self) -> Any:
-        auth_repo = AuthenticationRepository(Path(self._db_auth_file))
+        auth_repo = open_auth_repository(self._settings)
         yt_auth = auth_repo.get_yt_auth(self._yt_auth_user_id)
         if yt_auth is None:
             raise ValueError("Missing YouTube auth credentials")
@@ -3,39 +3,122 @@
 Provides safe concurrent access to JSON files with:
 - Exclusive file locks (fcntl on Unix)
 - Atomic writes (tempfile + POSIX rename)
+- Optional journaled mode: small changes are appended as records and
+  folded back into the file by a periodic compaction
 - Graceful error handling and logging
 """
 
 from __future__ import annotations
 
+import copy
 import fcntl
-import json
 import os
 import tempfile
 from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 
+from src.shared import json_codec
 from src.shared.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
 logger = get_logger(__name__)
 
+type FileStamp = tuple[int, int, int]
+
+# A journal is compacted once it outgrows both this size and the snapshot itself.
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+
+def _file_stamp(stat: os.stat_result) -> FileStamp:
+    # The snapshot is only ever replaced by rename, so a new version always has a new inode.
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@dataclass(frozen=True)
+class JournalOp:
+    """One journaled change: set ``value`` at the key ``path`` (creating missing dicts), or delete it."""
+
+    path: tuple[str, ...]
+    value: Any = None
+    delete: bool = False
+
+    def __post_init__(self) -> None:
+        """Reject the empty path; whole-file replacements go through ``write_json``."""
+        if not self.path:
+            msg = "JournalOp path must not be empty"
+            raise ValueError(msg)
+
+    def apply(self, data: dict[str, Any]) -> None:
+        """Apply the change to ``data`` in place."""
+        *parents, key = self.path
+        target = data
+        for name in parents:
+            child = target.get(name)
+            if not isinstance(child, dict):
+                if self.delete:
+                    return
+                child = target[name] = {}
+            target = child
+        if self.delete:
+            target.pop(key, None)
+        else:
+            target[key] = self.value
+
+    def to_record(self) -> dict[str, Any]:
+        """Compact JSON form: ``{"p": path, "v": value}``, without ``v`` for a delete."""
+        if self.delete:
+            return {"p": list(self.path)}
+        return {"p": list(self.path), "v": self.value}
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> JournalOp:
+        """Inverse of ``to_record``."""
+        path = tuple(record["p"])
+        if "v" in record:
+            return cls(path, record["v"])
+        return cls(path, delete=True)
+
+
+def _matches(data: Mapping[str, Any], expect: Mapping[str, Any] | None) -> bool:
+    return not expect or all(data.get(key) == value for key, value in expect.items())
+
 
 class AtomicFileStorage:
     """Atomic JSON file storage with file-level locking.
 
     Uses fcntl locks (Unix) to serialize writes and tempfile + rename
     pattern to ensure atomic write operations without corruption.
+
+    Journaled mode (``journal=True``) makes small updates cost O(change)
+    instead of O(file): ``append_ops`` and ``locked_read_write`` append one
+    compact JSON line to ``<file>.journal`` instead of rewriting the file,
+    and readers replay the journal on top of the file (the snapshot). The
+    journal's first line names the snapshot version it applies to, so a
+    journal left behind by a crash during compaction or ``write_json`` is
+    ignored rather than replayed twice; a torn last record (crash during an
+    append that was never acknowledged) is skipped. Once the journal
+    outgrows both ``compact_bytes`` and the snapshot, it is folded into a
+    new snapshot. The journal file is never replaced, so its fcntl lock
+    serializes every reader and writer of the pair. All processes using a
+    file must agree on the mode.
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, *, journal: bool = False, compact_bytes: int = DEFAULT_COMPACT_BYTES) -> None:
         """Initialize storage for a JSON file.
 
         Args:
             file_path: Path to JSON file. Will be created if absent.
+            journal: Append changes to ``<file>.journal`` instead of rewriting the file.
+            compact_bytes: Journal size below which it is never compacted.
         """
         self.file_path = Path(file_path)
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.file_path.with_name(f"{self.file_path.name}.journal") if journal else None
+        self._compact_bytes = compact_bytes
 
     def read_json(self) -> dict[str, Any]:
         """Read JSON file with exclusive lock.
@@ -43,24 +126,32 @@ class AtomicFileStorage:
         Returns:
             Parsed JSON dict, or empty dict if file absent or empty.
         """
+        if self.journal_path is not None:
+            try:
+                with self._locked_journal(self.journal_path, fcntl.LOCK_SH) as journal:
+                    return self._read_state(journal)
+            except (json_codec.JSONDecodeError, OSError):
+                logger.exception("Failed to read JSON from %s", self.file_path)
+                return {}
+
         if not self.file_path.exists():
             return {}
 
         try:
-            with self.file_path.open(encoding="utf-8") as f:
+            with self.file_path.open("rb") as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)  # Shared lock for read
                 try:
                     content = f.read()
                     if not content:
                         return {}
-                    return json.loads(content)
+                    return json_codec.loads(content)
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)  # Release lock
-        except (json.JSONDecodeError, OSError):
+        except (json_codec.JSONDecodeError, OSError):
             logger.exception("Failed to read JSON from %s", self.file_path)
             return {}
 
-    def write_json(self, data: dict[str, Any]) -> None:
+    def write_json(self, data: dict[str, Any], *, indent: int | None = 2) -> os.stat_result:
         """Write JSON file atomically with exclusive lock.
 
         Uses tempfile + POSIX rename pattern for atomicity:
@@ -71,38 +162,58 @@ class AtomicFileStorage:
 
         Args:
             data: Dict to serialize as JSON.
+            indent: JSON indentation; None writes compact JSON.
+
+        Returns:
+            Stat of the written file. It is taken before the rename, so it
+            identifies this exact version even if another writer replaces
+            the file right after.
         """
         try:
-            # Write to temp file in same directory (ensures same filesystem)
-            temp_fd, temp_path = tempfile.mkstemp(
-                dir=self.file_path.parent,
-                prefix=f".{self.file_path.name}.",
-                suffix=".tmp",
-            )
-            try:
-                with os.fdopen(temp_fd, "w", encoding="utf-8") as temp_f:
-                    json.dump(data, temp_f, indent=2, ensure_ascii=False)
-                    temp_f.flush()
-                    os.fsync(temp_f.fileno())  # Ensure written to disk
-
-                # Acquire exclusive lock on target file before rename
-                with self.file_path.open("a", encoding="utf-8") as target_f:
-                    fcntl.flock(target_f.fileno(), fcntl.LOCK_EX)  # Exclusive lock
-                    try:
-                        # Atomic rename: temp → target
-                        Path(temp_path).rename(self.file_path)
-                        logger.debug("Atomically wrote %s", self.file_path)
-                    finally:
-                        fcntl.flock(target_f.fileno(), fcntl.LOCK_UN)  # Release lock
-            except OSError:
-                # Clean up temp file on error
-                with suppress(OSError):
-                    Path(temp_path).unlink()
-                raise
+            if self.journal_path is None:
+                return self._replace_file(data, indent)
+            with self._locked_journal(self.journal_path, fcntl.LOCK_EX) as journal:
+                written = self._replace_file(data, indent)
+                self._reset_journal(journal, _file_stamp(written))
+                return written
         except OSError:
             logger.exception("Failed to write JSON to %s", self.file_path)
             raise
 
+    def append_ops(self, ops: Sequence[JournalOp], *, expect: Mapping[str, Any] | None = None) -> None:
+        """Apply ``ops`` atomically, as one journal record in journaled mode.
+
+        Args:
+            ops: Changes, applied in order.
+            expect: Top-level keys and the values they must hold for the
+                changes to apply. Checked when the record is replayed, so a
+                writer can append without reading the file; if another
+                writer changed those keys first, the record is dropped.
+        """
+        if self.journal_path is None:
+            with self.locked_read_write() as data:
+                if _matches(data, expect):
+                    for op in ops:
+                        op.apply(data)
+            return
+
+        record: dict[str, Any] = {"ops": [op.to_record() for op in ops]}
+        if expect:
+            record["if"] = dict(expect)
+        try:
+            with self._locked_journal(self.journal_path, fcntl.LOCK_EX) as journal:
+                self._append_record(journal, record)
+        except OSError:
+            logger.exception("Failed to append journal record for %s", self.file_path)
+            raise
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot now (no-op outside journaled mode)."""
+        if self.journal_path is None:
+            return
+        with self._locked_journal(self.journal_path, fcntl.LOCK_EX) as journal:
+            self._compact(journal)
+
     @contextmanager
     def locked_read_write(self):  # noqa: ANN201
         """Context manager for atomic read-modify-write operations.
@@ -117,28 +228,163 @@ class AtomicFileStorage:
 
         Yields:
             Mutable dict that will be written back on successful exit.
+            In journaled mode only the top-level keys that changed are
+            appended to the journal.
         """
+        if self.journal_path is not None:
+            with self._journaled_read_write(self.journal_path) as data:
+                yield data
+            return
+
         if not self.file_path.exists():
             # Create file with lock if it doesn't exist
             self.file_path.touch()
 
         try:
-            with self.file_path.open("r+", encoding="utf-8") as f:
+            with self.file_path.open("r+b") as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)  # Exclusive lock
                 try:
                     content = f.read()
-                    data: dict[str, Any] = json.loads(content) if content else {}
+                    data: dict[str, Any] = json_codec.loads(content) if content else {}
                     yield data
 
                     # Write back modified data
                     f.seek(0)
                     f.truncate()
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.write(json_codec.dumps(data, indent=2))
                     f.flush()
                     os.fsync(f.fileno())
                     logger.debug("Wrote back locked data to %s", self.file_path)
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)  # Release lock
-        except (json.JSONDecodeError, OSError):
+        except (json_codec.JSONDecodeError, OSError):
+            logger.exception("Failed to perform locked read-write on %s", self.file_path)
+            raise
+
+    @contextmanager
+    def _journaled_read_write(self, journal_path: Path) -> Iterator[dict[str, Any]]:
+        try:
+            with self._locked_journal(journal_path, fcntl.LOCK_EX) as journal:
+                data = self._read_state(journal)
+                original = copy.deepcopy(data)
+                yield data
+                ops = [
+                    JournalOp((key,), value)
+                    for key, value in data.items()
+                    if key not in original or original[key] != value
+                ]
+                ops.extend(JournalOp((key,), delete=True) for key in original if key not in data)
+                if ops:
+                    self._append_record(journal, {"ops": [op.to_record() for op in ops]})
+        except (json_codec.JSONDecodeError, OSError):
             logger.exception("Failed to perform locked read-write on %s", self.file_path)
             raise
+
+    def _replace_file(self, data: dict[str, Any], indent: int | None) -> os.stat_result:
+        # Write to temp file in same directory (ensures same filesystem)
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=self.file_path.parent,
+            prefix=f".{self.file_path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(temp_fd, "wb") as temp_f:
+                temp_f.write(json_codec.dumps(data, indent=indent))
+                temp_f.flush()
+                os.fsync(temp_f.fileno())  # Ensure written to disk
+                written = os.fstat(temp_f.fileno())
+
+            # Acquire exclusive lock on target file before rename
+            with self.file_path.open("a", encoding="utf-8") as target_f:
+                fcntl.flock(target_f.fileno(), fcntl.LOCK_EX)  # Exclusive lock
+                try:
+                    # Atomic rename: temp → target
+                    Path(temp_path).rename(self.file_path)
+                    logger.debug("Atomically wrote %s", self.file_path)
+                finally:
+                    fcntl.flock(target_f.fileno(), fcntl.LOCK_UN)  # Release lock
+        except OSError:
+            # Clean up temp file on error
+            with suppress(OSError):
+                Path(temp_path).unlink()
+            raise
+        return written
+
+    @staticmethod
+    @contextmanager
+    def _locked_journal(journal_path: Path, operation: int) -> Iterator[IO[bytes]]:
+        # Append mode: writes always land at the end, whatever the read position.
+        with journal_path.open("a+b") as journal:
+            fcntl.flock(journal.fileno(), operation)
+            try:
+                yield journal
+            finally:
+                fcntl.flock(journal.fileno(), fcntl.LOCK_UN)
+
+    def _read_state(self, journal: IO[bytes]) -> dict[str, Any]:
+        """Return the snapshot with the journal replayed on top; the caller holds the journal lock."""
+        try:
+            with self.file_path.open("rb") as f:
+                stamp: FileStamp | None = _file_stamp(os.fstat(f.fileno()))
+                content = f.read()
+        except FileNotFoundError:
+            stamp, content = None, b""
+        data: dict[str, Any] = json_codec.loads(content) if content.strip() else {}
+
+        journal.seek(0)
+        header, *records = journal.read().split(b"\n")
+        if header + b"\n" != self._journal_header(stamp):
+            # Empty, or written for an older snapshot that already includes it.
+            return data
+        for line in records:
+            if not line:
+                continue
+            try:
+                record = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
+                logger.warning("Skipping torn journal record in %s", self.journal_path)
+                continue
+            if _matches(data, record.get("if")):
+                for op in record["ops"]:
+                    JournalOp.from_record(op).apply(data)
+        return data
+
+    def _append_record(self, journal: IO[bytes], record: dict[str, Any]) -> None:
+        """Append one record, compacting afterwards if the journal grew too large; the caller holds the lock."""
+        stamp = self._snapshot_stamp()
+        journal.seek(0)
+        if journal.readline() != self._journal_header(stamp):
+            self._reset_journal(journal, stamp)
+        else:
+            size = journal.seek(0, os.SEEK_END)
+            journal.seek(size - 1)
+            if journal.read(1) != b"\n":
+                # Terminate a torn record so it stays a single skipped line.
+                journal.write(b"\n")
+        journal.write(json_codec.dumps(record) + b"\n")
+        journal.flush()
+        os.fsync(journal.fileno())
+        if os.fstat(journal.fileno()).st_size > max(self._compact_bytes, stamp[2] if stamp else 0):
+            self._compact(journal)
+
+    def _compact(self, journal: IO[bytes]) -> None:
+        data = self._read_state(journal)
+        written = self._replace_file(data, indent=None)
+        self._reset_journal(journal, _file_stamp(written))
+        logger.debug("Compacted journal of %s", self.file_path)
+
+    def _reset_journal(self, journal: IO[bytes], stamp: FileStamp | None) -> None:
+        journal.truncate(0)
+        journal.write(self._journal_header(stamp))
+        journal.flush()
+        os.fsync(journal.fileno())
+
+    def _snapshot_stamp(self) -> FileStamp | None:
+        try:
+            return _file_stamp(self.file_path.stat())
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _journal_header(stamp: FileStamp | None) -> bytes:
+        return json_codec.dumps({"base": list(stamp) if stamp else None}) + b"\n"
@@ -0,0 +1,42 @@
+"""JSON encoding for the file-backed stores.
+
+Uses orjson when the optional ``fast-json`` extra is installed and the
+standard library otherwise. Both produce UTF-8 output that the other can
+read, so a deployment can add or drop the extra without migrating files.
+Compact output (no indentation, no spaces after separators) is the default.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+from typing import Any
+
+# orjson.JSONDecodeError subclasses it, so callers only need to catch this one.
+JSONDecodeError = json.JSONDecodeError
+
+
+def is_orjson_available() -> bool:
+    """Return whether the optional orjson dependency is installed."""
+    return importlib.util.find_spec("orjson") is not None
+
+
+orjson = importlib.import_module("orjson") if is_orjson_available() else None
+
+
+def dumps(data: Any, *, indent: int | None = None) -> bytes:
+    """Encode ``data`` as UTF-8 JSON; any truthy ``indent`` means two-space indentation."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(content: bytes | str) -> Any:
+    """Decode UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
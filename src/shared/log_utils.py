@@ -3,23 +3,150 @@
 from __future__ import annotations
 
 import datetime
+import json
+import os
+from dataclasses import dataclass
 from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Bytes read per backward step when looking for the last lines of a log.
+TAIL_BLOCK_SIZE = 16 * 1024
+# Most bytes one read_from() call returns, however far behind the cursor is.
+MAX_READ_BYTES = 256 * 1024
+# Keys of a run log record shown apart from, or implied by, the rest of the line.
+_RUN_RECORD_HEADER_KEYS = ("timestamp", "level", "event", "logger", "run_id", "run_task", "run_trigger")
+
+
+@dataclass(frozen=True)
+class LogCursor:
+    """Position right after the last line a client has seen: the log file's inode and a byte offset in it."""
+
+    inode: int
+    offset: int
+
+    def __str__(self) -> str:
+        return f"{self.inode}-{self.offset}"
+
+    @classmethod
+    def parse(cls, token: str | None) -> LogCursor | None:
+        """Inverse of ``str()``; None for a missing or malformed token."""
+        inode, separator, offset = (token or "").partition("-")
+        if not separator or not inode.isdigit() or not offset.isdigit():
+            return None
+        return cls(inode=int(inode), offset=int(offset))
+
+
+class LogTailer:
+    """
+    Reads a TimedRotatingFileHandler log by byte offset instead of whole-file reads.
+
+    ``tail()`` seeks back from the end until it holds the requested number
+    of lines, and ``read_from()`` reads only what was appended after a
+    cursor, at most ``max_read_bytes`` per call, so both cost the same on
+    a 5 KB and a 500 MB log. Only complete lines are returned: a line
+    being written is left for the next read. When the log rolls over
+    (the file at the path has another inode), the rest of the renamed
+    file, found among the ``<name>.*`` backups by inode, is read before
+    the new file. ``render_line`` turns each raw line into the displayed
+    text, e.g. ``format_run_log_record`` for run log segments.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        *,
+        max_read_bytes: int = MAX_READ_BYTES,
+        render_line: Callable[[str], str] | None = None,
+    ) -> None:
+        self._log_path = log_path
+        self._max_read_bytes = max_read_bytes
+        self._render_line = render_line
+
+    def tail(
+        self, max_lines: int, since_timestamp: float | None = None
+    ) -> tuple[list[dict[str, str]], LogCursor | None]:
+        """Return the last ``max_lines`` lines, optionally only those since a timestamp, and the cursor after them."""
+        try:
+            with self._log_path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                start, data = _read_last_lines(handle, stat.st_size, max_lines)
+        except OSError:
+            return [], None
+        complete = data[: data.rfind(b"\n") + 1]
+        lines = self._decode_lines(complete)[-max_lines:] if max_lines > 0 else []
+        return _classify_since(lines, since_timestamp), LogCursor(inode=stat.st_ino, offset=start + len(complete))
+
+    def read_from(self, cursor: LogCursor) -> tuple[list[dict[str, str]], LogCursor]:
+        """Return the complete lines appended after ``cursor`` and the cursor after them."""
+        chunks: list[bytes] = []
+        budget = self._max_read_bytes
+        try:
+            with self._log_path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                if stat.st_ino != cursor.inode:
+                    rotated = self._find_rotated(cursor.inode)
+                    if rotated is not None:
+                        with rotated.open("rb") as rotated_handle:
+                            data, at_eof = _read_lines_at(rotated_handle, cursor.offset, budget, closed=True)
+                        chunks.append(data)
+                        budget -= len(data)
+                        if not at_eof:
+                            return self._classify_chunks(chunks), LogCursor(cursor.inode, cursor.offset + len(data))
+                    cursor = LogCursor(inode=stat.st_ino, offset=0)
+                elif cursor.offset > stat.st_size:
+                    # Truncated in place: start over.
+                    cursor = LogCursor(inode=stat.st_ino, offset=0)
+                data, _at_eof = _read_lines_at(handle, cursor.offset, budget)
+        except OSError:
+            return self._classify_chunks(chunks), cursor
+        chunks.append(data)
+        return self._classify_chunks(chunks), LogCursor(cursor.inode, cursor.offset + len(data))
+
+    def _decode_lines(self, data: bytes) -> list[str]:
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        return [self._render_line(line) for line in lines if line.strip()] if self._render_line else lines
+
+    def _classify_chunks(self, chunks: list[bytes]) -> list[dict[str, str]]:
+        return [classify_log_line(line) for chunk in chunks for line in self._decode_lines(chunk) if line.strip()]
+
+    def _find_rotated(self, inode: int) -> Path | None:
+        for candidate in self._log_path.parent.glob(f"{self._log_path.name}.*"):
+            try:
+                if candidate.stat().st_ino == inode:
+                    return candidate
+            except OSError:
+                continue
+        return None
 
 
 def read_log_lines_since(log_path: Path, since_timestamp: float | None, max_lines: int) -> list[dict[str, str]]:
     """Read last N lines from log file, optionally filtering by timestamp."""
+    lines, _cursor = LogTailer(log_path).tail(max_lines, since_timestamp)
+    return lines
+
+
+def latest_run_log(runs_folder: Path, task: str) -> Path | None:
+    """Return the segment of the task's latest run; run ids sort by start time."""
     try:
-        all_lines = log_path.read_text(encoding="utf-8").splitlines()
+        return max((runs_folder / task).glob("*.jsonl"), key=lambda path: path.name, default=None)
     except OSError:
-        return []
+        return None
 
-    recent = all_lines[-max_lines:] if len(all_lines) > max_lines else all_lines
-
-    if since_timestamp is None:
-        return [classify_log_line(line) for line in recent if line.strip()]
 
-    cutoff_str = datetime.datetime.fromtimestamp(since_timestamp, tz=datetime.UTC).strftime("%Y-%m-%d %H:%M:%S")
-    return [classify_log_line(line) for line in recent if line.strip() and line[:19] >= cutoff_str]
+def format_run_log_record(line: str) -> str:
+    """Render a run log JSON record like the main log ("2026-05-16 10:00:00 [info] event key=value")."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return line
+    if not isinstance(record, dict):
+        return line
+    fields = " ".join(f"{key}={value}" for key, value in record.items() if key not in _RUN_RECORD_HEADER_KEYS)
+    header = f"{record.get('timestamp', '')} [{record.get('level', 'info')}] {record.get('event', '')}"
+    return f"{header} {fields}".rstrip()
 
 
 def classify_log_line(line: str) -> dict[str, str]:
@@ -31,3 +158,43 @@ def classify_log_line(line: str) -> dict[str, str]:
     elif "warning" in lower or "warn" in lower:
         level = "warning"
     return {"text": line, "level": level}
+
+
+def _read_last_lines(handle: BinaryIO, size: int, max_lines: int) -> tuple[int, bytes]:
+    """Read backwards from ``size`` until more than ``max_lines`` newlines are held; returns (start offset, bytes)."""
+    start = size
+    data = b""
+    while start > 0 and data.count(b"\n") <= max_lines:
+        step = min(TAIL_BLOCK_SIZE, start)
+        start -= step
+        handle.seek(start)
+        data = handle.read(step) + data
+    return start, data
+
+
+def _read_lines_at(handle: BinaryIO, offset: int, limit: int, *, closed: bool = False) -> tuple[bytes, bool]:
+    """
+    Read up to ``limit`` bytes from ``offset``, cut after the last newline.
+
+    A ``closed`` file no longer grows, so its unterminated last line is
+    returned too. A line longer than ``limit`` is returned in pieces rather
+    than never. Returns the bytes and whether they reach the end of file.
+    """
+    handle.seek(offset)
+    data = handle.read(limit + 1)
+    at_eof = len(data) <= limit
+    data = data[:limit]
+    if at_eof and closed:
+        return data, True
+    complete = data[: data.rfind(b"\n") + 1]
+    if not complete and len(data) == limit:
+        return data, False
+    return complete, at_eof and len(complete) == len(data)
+
+
+def _classify_since(lines: list[str], since_timestamp: float | None) -> list[dict[str, str]]:
+    if since_timestamp is None:
+        return [classify_log_line(line) for line in lines if line.strip()]
+
+    cutoff_str = datetime.datetime.fromtimestamp(since_timestamp, tz=datetime.UTC).strftime("%Y-%m-%d %H:%M:%S")
+    return [classify_log_line(line) for line in lines if line.strip() and line[:19] >= cutoff_str]
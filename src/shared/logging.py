@@ -2,7 +2,10 @@
 
 import logging
 import sys
-from collections.abc import MutableMapping
+import uuid
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from logging import handlers
 from pathlib import Path
 from typing import Protocol, Self
@@ -68,6 +71,7 @@ def event_dict_to_message(
 
 
 processors: list[Processor] = [
+    structlog.contextvars.merge_contextvars,
     structlog.stdlib.filter_by_level,
     structlog.stdlib.add_logger_name,
     structlog.stdlib.add_log_level,
@@ -83,10 +87,79 @@ file_processors: list[Processor] = [
     structlog.dev.ConsoleRenderer(colors=False),
 ]
 
+run_log_processors: list[Processor] = [
+    structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+    structlog.processors.JSONRenderer(),
+]
+
+# Segments kept per task under the run logs folder; older ones are pruned when a run starts.
+RUN_LOGS_KEPT = 30
 
 _configured_handlers: list[logging.Handler] = []
 
 
+def run_logs_folder(log_file_path: Path | str) -> Path:
+    """Folder of the per-run JSON-lines segments, beside the main log file."""
+    return Path(log_file_path).parent / "runs"
+
+
+class RunLogHandler(logging.Handler):
+    """
+    Copies the records logged inside ``run_log_context()`` to the run's own segment.
+
+    The segment is ``<folder>/<task>/<run id>.jsonl``, one JSON record per
+    line. The run is read from the structlog context when the record is
+    emitted, so overlapping runs (asyncio tasks, or threads started with
+    ``asyncio.to_thread``) each get only their own lines.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.folder = folder
+
+    def emit(self, record: logging.LogRecord) -> None:
+        context = structlog.contextvars.get_contextvars()
+        run_id, task = context.get("run_id"), context.get("run_task")
+        if not run_id or not task:
+            return
+        try:
+            line = self.format(record)
+            with (self.folder / str(task) / f"{run_id}.jsonl").open("a", encoding="utf-8") as segment:
+                segment.write(line + "\n")
+        except Exception:  # noqa: BLE001 - logging must never raise into the job
+            self.handleError(record)
+
+
+def new_run_id() -> str:
+    """Return a unique run id that sorts by start time ("20261017T041500Z-1a2b3c4d")."""
+    return f"{datetime.now(UTC):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+
+
+@contextmanager
+def run_log_context(task: str, *, trigger: str) -> Iterator[str]:
+    """
+    Bind a new run id, the task and what triggered it into the structlog context.
+
+    While bound, every log line of the run is also written to the run's
+    JSON-lines segment (when logging was set up). The segment is created
+    up front, so readers see the run as the task's latest even before it logs.
+    Yields the run id.
+    """
+    run_id = new_run_id()
+    run_handler = next((handler for handler in _configured_handlers if isinstance(handler, RunLogHandler)), None)
+    if run_handler is not None:
+        task_folder = run_handler.folder / task
+        try:
+            task_folder.mkdir(parents=True, exist_ok=True)
+            (task_folder / f"{run_id}.jsonl").touch()
+            for stale in sorted(task_folder.glob("*.jsonl"))[:-RUN_LOGS_KEPT]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            logging.getLogger(__name__).exception("run_log.segment_unavailable")
+    with structlog.contextvars.bound_contextvars(run_id=run_id, run_task=task, run_trigger=trigger):
+        yield run_id
+
+
 def _reset_configured_handlers() -> None:
     for handler in tuple(_configured_handlers):
         logging.root.removeHandler(handler)
@@ -119,8 +192,21 @@ def _build_file_handler(log_file_path: Path) -> logging.Handler:
     return handler_file
 
 
+def _build_run_log_handler(folder: Path) -> logging.Handler:
+    folder.mkdir(parents=True, exist_ok=True)
+    handler_runs = RunLogHandler(folder)
+    handler_runs.setFormatter(
+        ProcessorFormatter(
+            processors=run_log_processors,
+            foreign_pre_chain=[*pre_chain, structlog.contextvars.merge_contextvars],
+        )
+    )
+    return handler_runs
+
+
 def setup_logging(log_file_path: Path | str) -> None:
     """Explicitly initialize root logging handlers and structlog."""
+
     structlog.configure(
         processors=processors,
         context_class=dict,
@@ -133,13 +219,15 @@ def setup_logging(log_file_path: Path | str) -> None:
 
     stream_handler = _build_stream_handler()
     file_handler = _build_file_handler(Path(log_file_path))
+    run_log_handler = _build_run_log_handler(run_logs_folder(log_file_path))
 
     logging.root.setLevel(logging.DEBUG)
     logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.DEBUG)
     logging.getLogger("PIL").setLevel(logging.INFO)
     logging.root.addHandler(stream_handler)
     logging.root.addHandler(file_handler)
-    _configured_handlers.extend([stream_handler, file_handler])
+    logging.root.addHandler(run_log_handler)
+    _configured_handlers.extend([stream_handler, file_handler, run_log_handler])
 
 
 def get_logger(*args: object, **initial_values: object) -> StructuredLogger:
@@ -1,6 +1,6 @@
 """Dependency factories for the FastAPI web layer."""
 
-from pathlib import Path
+from functools import lru_cache
 from typing import Annotated, cast
 
 from fastapi import Depends, Request
@@ -17,6 +17,7 @@ from src.application.verify_published_videos_use_case import VerifyPublishedVide
 from src.config.settings import AppSettings, get_app_settings
 from src.domain.models import YtAuth
 from src.domain.ports import AuthCredentialStore as AuthenticationRepositoryPort
+from src.domain.ports import DailySnapshotReader as DailySnapshotReaderPort
 from src.domain.ports import IntegrationChecker, OAuthProvider
 from src.domain.ports import OperationalMetricsReader as OperationalMetricsRepositoryPort
 from src.domain.ports import PublisherStateReader as PublisherStatePort
@@ -25,20 +26,27 @@ from src.domain.ports import ReleaseDateValidator as ReleaseRepositoryPort
 from src.domain.ports import TaskRunStateReader as TaskRunStateRepositoryPort
 from src.domain.ports import TaskRunStateWriter as TaskRunStateWriterPort
 from src.domain.ports import TimeSeriesReader as TimeSeriesRepositoryPort
+from src.domain.ports import TimeSeriesRollupReader as TimeSeriesRollupReaderPort
+from src.domain.ports import VideoArtifactIndex as VideoArtifactIndexPort
 from src.domain.ports import VideoMetadataReader as VideoRepositoryPort
-from src.infrastructure.storage.auth_repository import AuthenticationRepository as TinyDbAuthenticationRepository
-from src.infrastructure.storage.operational_metrics_repository import (
-    OperationalMetricsRepository as TinyFluxOperationalMetricsRepository,
+from src.domain.ports import VideoSearcher as VideoSearcherPort
+from src.infrastructure.storage.sqlite_task_run_state_repository import SqliteTaskRunStateRepository
+from src.infrastructure.storage.storage_backend import (
+    is_sqlite_backend,
+    open_auth_repository,
+    open_daily_snapshot_store,
+    open_operational_metrics_repository,
+    open_publisher_state_repository,
+    open_release_repository,
+    open_task_run_state_repository,
+    open_timeseries_repository,
+    open_timeseries_rollup_store,
+    open_video_repository,
 )
-from src.infrastructure.storage.publisher_state_repository import (
-    PublisherStateRepository as TinyDbPublisherStateRepository,
-)
-from src.infrastructure.storage.release_repository import ReleaseRepository as TinyDbReleaseRepository
-from src.infrastructure.storage.task_run_state_repository import (
-    TaskRunStateRepository as TinyFluxTaskRunStateRepository,
-)
-from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository as TinyDbTimeSeriesRepository
-from src.infrastructure.storage.video_repository import VideoRepository as TinyDbVideoRepository
+from src.infrastructure.storage.storage_service import RemoteTaskRunStateRepository
+from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
+from src.infrastructure.storage.timeseries_export import TimeSeriesSnapshotReader, export_path_for
+from src.infrastructure.video.artifact_registry import VideoArtifactRegistry
 from src.infrastructure.youtube.yt_client import YTClient
 from src.infrastructure.youtube.yt_fake_client import YTClientFake
 
@@ -62,43 +70,61 @@ def get_yt_provider(
 
 
 def get_auth_repo(settings: Annotated[AppSettings, Depends(get_settings)]) -> AuthenticationRepositoryPort:
-    return TinyDbAuthenticationRepository(Path(settings.db_auth_file))
+    return open_auth_repository(settings)
 
 
 def get_release_repo(settings: Annotated[AppSettings, Depends(get_settings)]) -> ReleaseRepositoryPort:
-    return TinyDbReleaseRepository(settings.db_release_file)
+    return open_release_repository(settings)
 
 
 def get_publisher_state_repo(
     settings: Annotated[AppSettings, Depends(get_settings)],
 ) -> PublisherStatePort:
-    db_path = settings.db_release_file.replace("db_release", "db_publishers")
-    return TinyDbPublisherStateRepository(db_path)
+    return open_publisher_state_repository(settings)
+
+
+@lru_cache(maxsize=8)
+def _get_timeseries_snapshot_reader(db_timeseries_file: str) -> TimeSeriesSnapshotReader:
+    # Shared by every request of the process; it remaps itself when the export is swapped.
+    return TimeSeriesSnapshotReader(export_path_for(db_timeseries_file))
 
 
 def get_timeseries_repo(settings: Annotated[AppSettings, Depends(get_settings)]) -> TimeSeriesRepositoryPort:
-    return TinyDbTimeSeriesRepository(settings.db_timeseries_file)
+    if not is_sqlite_backend(settings):
+        # The memory-mapped export only exists for the files backend; SQLite serves indexed range queries itself.
+        snapshot_reader = _get_timeseries_snapshot_reader(settings.db_timeseries_file)
+        if snapshot_reader.is_available():
+            return snapshot_reader
+    return open_timeseries_repository(settings)
+
+
+def get_daily_snapshot_reader(
+    settings: Annotated[AppSettings, Depends(get_settings)],
+) -> DailySnapshotReaderPort | None:
+    return open_daily_snapshot_store(settings)
+
+
+def get_timeseries_rollup_reader(
+    settings: Annotated[AppSettings, Depends(get_settings)],
+) -> TimeSeriesRollupReaderPort | None:
+    return open_timeseries_rollup_store(settings)
 
 
 def get_video_repo(settings: Annotated[AppSettings, Depends(get_settings)]) -> VideoRepositoryPort:
-    return TinyDbVideoRepository(Path(settings.db_video_file))
+    return open_video_repository(settings)
 
 
 def get_operational_metrics_repo(
     settings: Annotated[AppSettings, Depends(get_settings)],
 ) -> OperationalMetricsRepositoryPort:
-    db_path = settings.db_timeseries_file if settings.is_production_env else f"{settings.db_timeseries_file}.test"
-    return TinyFluxOperationalMetricsRepository(
-        db_path,
-        retention_days=settings.operational_metrics_retention_days,
-    )
+    return open_operational_metrics_repository(settings)
 
 
 def get_task_run_state_repo(
     settings: Annotated[AppSettings, Depends(get_settings)],
-) -> TaskRunStateRepositoryPort:
-    db_path = settings.db_timeseries_file if settings.is_production_env else f"{settings.db_timeseries_file}.test"
-    return TinyFluxTaskRunStateRepository(db_path)
+) -> TaskRunStateRepository | SqliteTaskRunStateRepository | RemoteTaskRunStateRepository:
+    # Concrete stores, so callers holding one beyond a request (log streams) can close it.
+    return open_task_run_state_repository(settings)
 
 
 def get_authorize_use_case(
@@ -114,8 +140,10 @@ def get_authorize_use_case(
 def get_fetch_top_videos_use_case(
     timeseries_repo: Annotated[TimeSeriesRepositoryPort, Depends(get_timeseries_repo)],
     video_repo: Annotated[VideoRepositoryPort, Depends(get_video_repo)],
+    snapshot_reader: Annotated[DailySnapshotReaderPort | None, Depends(get_daily_snapshot_reader)],
+    rollup_reader: Annotated[TimeSeriesRollupReaderPort | None, Depends(get_timeseries_rollup_reader)],
 ) -> FetchTopVideosUseCase:
-    return FetchTopVideosUseCase(timeseries_repo, video_repo)
+    return FetchTopVideosUseCase(timeseries_repo, video_repo, snapshot_reader, rollup_reader)
 
 
 def get_top_videos_dashboard_use_case(
@@ -147,15 +175,19 @@ def get_check_platform_connection_use_case(
     return CheckPlatformConnectionUseCase(checkers=checkers)
 
 
+def get_video_artifact_index(settings: Annotated[AppSettings, Depends(get_settings)]) -> VideoArtifactIndexPort:
+    return VideoArtifactRegistry(settings.video_generated_folder)
+
+
 def get_admin_task_status_use_case(
     task_run_state_repo: Annotated[TaskRunStateRepositoryPort, Depends(get_task_run_state_repo)],
     release_repo: Annotated[ReleaseRepositoryPort, Depends(get_release_repo)],
-    settings: Annotated[AppSettings, Depends(get_settings)],
+    artifact_index: Annotated[VideoArtifactIndexPort, Depends(get_video_artifact_index)],
 ) -> GetAdminTaskStatusUseCase:
     return GetAdminTaskStatusUseCase(
         task_run_state_repo,
         release_store=release_repo,
-        video_generated_folder=settings.video_generated_folder,
+        artifact_index=artifact_index,
     )
 
 
@@ -191,6 +223,7 @@ ReleaseReadPortDep = Annotated[ReleaseRepositoryPort, Depends(get_release_repo)]
 YouTubeProviderDep = Annotated[OAuthProvider[YtAuth], Depends(get_yt_provider)]
 TimeSeriesRepositoryDep = Annotated[TimeSeriesRepositoryPort, Depends(get_timeseries_repo)]
 VideoRepositoryDep = Annotated[VideoRepositoryPort, Depends(get_video_repo)]
+VideoSearcherDep = Annotated[VideoSearcherPort, Depends(get_video_repo)]
 GetAdminTaskStatusUseCaseDep = Annotated[GetAdminTaskStatusUseCase, Depends(get_admin_task_status_use_case)]
 TriggerAdminTaskUseCaseDep = Annotated[TriggerAdminTaskUseCase, Depends(get_trigger_admin_task_use_case)]
 GetOperationalMetricsUseCaseDep = Annotated[
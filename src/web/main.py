@@ -1,8 +1,12 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
 from src.config.settings import AppSettings, get_app_settings
+from src.infrastructure.storage.sqlite_database import close_shared_databases
 from src.web.routes.admin import router as admin_router
 from src.web.routes.auth import router as auth_router
 from src.web.routes.ops import router as ops_router
@@ -10,9 +14,16 @@ from src.web.routes.pages import router as pages_router
 from src.web.state import WEB_DIR
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Request-scoped SQLite repositories share one connection per process (see storage_backend).
+    close_shared_databases()
+
+
 def create_app(settings: AppSettings | None = None) -> FastAPI:
     resolved_settings = settings if settings is not None else get_app_settings()
-    app = FastAPI()
+    app = FastAPI(lifespan=_lifespan)
     app.state.settings = resolved_settings
     app.mount("/static", StaticFiles(directory=str(WEB_DIR / "static")), name="static")
 
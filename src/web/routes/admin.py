@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import hmac
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, cast
 from urllib.parse import parse_qs
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Request
 from fastapi.responses import HTMLResponse
-from starlette.responses import RedirectResponse, Response
+from starlette.responses import RedirectResponse, Response, StreamingResponse
 from starlette.status import HTTP_303_SEE_OTHER
 
 from src.application.check_platform_connection_use_case import CheckPlatformConnectionRequest
+from src.application.get_admin_task_status_use_case import is_task_complete
 from src.application.get_setup_page_use_case import GetSetupPageRequest
 from src.application.trigger_admin_task_use_case import TriggerAdminTaskRequest
 from src.domain.models import IntegrationCheckResult, IntegrationPlatform
+from src.shared.log_utils import LogCursor, LogTailer, format_run_log_record, latest_run_log
+from src.shared.logging import run_log_context, run_logs_folder
 from src.web.dependencies import (
     CheckPlatformConnectionUseCaseDep,
     GetAdminTaskStatusUseCaseDep,
@@ -28,6 +33,7 @@ from src.web.dependencies import (
     VerifyPublishedVideosUseCaseDep,
     get_settings,
     get_setup_page_use_case,
+    get_task_run_state_repo,
 )
 from src.web.routes import ops as ops_routes
 from src.web.state import get_app_version, logger, templates
@@ -42,6 +48,8 @@ from src.web.viewmodels import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from src.config.settings import AppSettings
 else:
     AppSettings = Any
@@ -50,6 +58,11 @@ router = APIRouter(prefix="/admin")
 
 _SESSION_KEY = "admin_authenticated"
 
+_LOG_METHODS = {"fetch", "daily", "weekly"}
+_LOG_TAIL_LINES = 80
+_LOG_STREAM_INTERVAL_SECONDS = 1.0
+_LOG_STREAM_KEEPALIVE_SECONDS = 15.0
+
 
 def _is_admin(request: Request) -> bool:
     return bool(request.session.get(_SESSION_KEY))
@@ -248,15 +261,32 @@ async def admin_health_status(
 async def admin_tasks_status(
     request: Request,
     task_status_use_case: GetAdminTaskStatusUseCaseDep,
+    since: Annotated[float | None, Query(ge=0)] = None,
+    oldest: Annotated[float | None, Query(ge=0)] = None,
 ) -> Response:
-    """HTMX partial — returns the #tasks-grid fragment with task status cards."""
+    """
+    HTMX partial — returns the #tasks-grid fragment with task status cards.
+
+    Pollers send ``since`` and ``oldest``, the newest and oldest timeline
+    events they show, and get the timeline changes after ``since`` as
+    out-of-band fragments instead of the whole timeline, until ``oldest``
+    leaves the 7-day window. The response carries an ETag over the use
+    case's cheap ``data_version()``, checked before the status is built,
+    so a poll that sends it back in If-None-Match gets 304 while nothing
+    changed.
+    """
     if not _is_admin(request):
         return HTMLResponse(status_code=403, content="")
 
     # Build view model from repos
     from src.web.viewmodels import build_admin_tasks_view_model, format_timeline_timestamp
 
-    tasks_vm = build_admin_tasks_view_model(task_status_use_case.execute())
+    etag = _task_status_etag(task_status_use_case.data_version(), since, oldest)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    tasks_vm = build_admin_tasks_view_model(task_status_use_case.execute(), since=since, oldest=oldest)
 
     return templates.TemplateResponse(
         request=request,
@@ -266,9 +296,23 @@ async def admin_tasks_status(
             "tasks": tasks_vm,
             "format_timeline_timestamp": format_timeline_timestamp,
         },
+        headers=headers,
     )
 
 
+def _task_status_etag(data_version: str, since: float | None, oldest: float | None) -> str:
+    # Relative labels ("5m ago", running durations) and the 7-day window age with the clock: refresh once a minute.
+    minute = int(time.time() // 60)
+    return f'"{data_version}-{minute}-{since if since is not None else "full"}-{oldest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/metrics/status", response_class=HTMLResponse)
 async def admin_metrics_status(
     request: Request,
@@ -357,12 +401,16 @@ async def trigger_admin_task(
 
     # Dispatch background task
     async def _run_with_task_tracking(task_method: str, task_fn: Any) -> None:
-        try:
-            await task_fn()
-            trigger_use_case.mark_completed(task_method=task_method)
-        except Exception as exc:
-            trigger_use_case.mark_failed(task_method=task_method, error_message=str(exc))
-            raise
+        with run_log_context(task_method, trigger="admin"):
+            logger.info("admin_task_run.started", task_method=task_method)
+            try:
+                await task_fn()
+                trigger_use_case.mark_completed(task_method=task_method)
+            except Exception as exc:
+                logger.exception("admin_task_run.failed", task_method=task_method)
+                trigger_use_case.mark_failed(task_method=task_method, error_message=str(exc))
+                raise
+            logger.info("admin_task_run.finished", task_method=task_method)
 
     try:
         normalized_publisher = _normalize_task_publisher(method, publisher)
@@ -413,27 +461,32 @@ async def admin_task_logs(
     task_status_use_case: GetAdminTaskStatusUseCaseDep,
     settings: Annotated[AppSettings, Depends(get_settings)],
 ) -> Response:
-    """HTMX partial — returns live log lines for a running task."""
+    """
+    HTMX partial — returns the last log lines of a task's latest run.
+
+    Lines come from the run's own log segment; runs that predate segments
+    fall back to the shared log since the task was queued. While the task
+    runs, the panel then follows the log over
+    ``/admin/tasks/logs/{method}/stream`` from the cursor rendered with it.
+    """
     if not _is_admin(request):
         return HTMLResponse(status_code=403, content="")
 
-    valid_methods = {"fetch", "daily", "weekly"}
-    if method not in valid_methods:
+    if method not in _LOG_METHODS:
         return HTMLResponse(status_code=404, content="")
 
-    log_path = Path(settings.log_file_path)
-    if not log_path.is_file():  # noqa: ASYNC240
+    tailer, is_run_log = await asyncio.to_thread(_task_log_tailer, settings, method)
+    if tailer is None:
         return templates.TemplateResponse(
             request=request,
             name="admin/_task_logs.html",
-            context={"request": request, "method": method, "lines": [], "task_complete": True},
+            context={"request": request, "method": method, "lines": [], "task_complete": True, "cursor": None},
         )
 
-    task_started_at = task_status_use_case.get_task_started_at(method)
-    latest_status = task_status_use_case.execute().latest_status_by_method.get(method)
-    task_complete = latest_status not in ("queued", None)
+    task_started_at = None if is_run_log else task_status_use_case.get_task_started_at(method)
+    task_complete = task_status_use_case.is_task_complete(method)
 
-    lines = _read_log_lines(log_path, task_started_at)
+    lines, cursor = await asyncio.to_thread(tailer.tail, _LOG_TAIL_LINES, since_timestamp=task_started_at)
 
     return templates.TemplateResponse(
         request=request,
@@ -443,15 +496,97 @@ async def admin_task_logs(
             "method": method,
             "lines": lines,
             "task_complete": task_complete,
+            "cursor": str(cursor) if cursor else None,
         },
     )
 
 
-def _read_log_lines(log_path: Path, since_timestamp: float | None) -> list[dict[str, str]]:
-    """Delegate to shared log utils."""
-    from src.shared.log_utils import read_log_lines_since
+@router.get("/tasks/logs/{method}/stream")
+async def admin_task_logs_stream(
+    request: Request,
+    method: str,
+    settings: Annotated[AppSettings, Depends(get_settings)],
+    cursor: Annotated[str | None, Query()] = None,
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    Server-sent events — the log lines appended after a cursor, as they are written.
+
+    ``lines`` events carry rendered log lines and, as their id, the cursor
+    after them, so a reconnecting EventSource resumes from Last-Event-ID.
+    A ``complete`` event ends the stream once the task is no longer running.
+    Without a cursor the stream starts at the end of the log. The stream
+    outlives its request, so it takes no request-scoped dependencies: it
+    opens the task run store it polls for completion itself.
+    """
+    if not _is_admin(request):
+        return HTMLResponse(status_code=403, content="")
+
+    if method not in _LOG_METHODS:
+        return HTMLResponse(status_code=404, content="")
+
+    tailer, _is_run_log = await asyncio.to_thread(_task_log_tailer, settings, method)
+    if tailer is None:
+        tailer = LogTailer(Path(settings.log_file_path))
+    start = LogCursor.parse(last_event_id) or LogCursor.parse(cursor)
+    return StreamingResponse(
+        _stream_task_logs(request, tailer, start, settings=settings, method=method),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_task_logs(
+    request: Request,
+    tailer: LogTailer,
+    cursor: LogCursor | None,
+    *,
+    settings: AppSettings,
+    method: str,
+) -> AsyncIterator[str]:
+    task_run_state_reader = await asyncio.to_thread(get_task_run_state_repo, settings)
+    try:
+        if cursor is None:
+            _lines, cursor = await asyncio.to_thread(tailer.tail, 0)
+        if cursor is None:
+            # No log file yet: no inode is 0, so the file is read from its start once it exists.
+            cursor = LogCursor(inode=0, offset=0)
+        idle_since = time.monotonic()
+        while not await request.is_disconnected():
+            lines, cursor = await asyncio.to_thread(tailer.read_from, cursor)
+            if lines:
+                rendered = templates.get_template("admin/_task_log_lines.html").render(lines=lines)
+                yield _sse_event("lines", rendered, event_id=str(cursor))
+                idle_since = time.monotonic()
+                continue
+            # Lines are logged before the task records its final status, so nothing is left to read once it has.
+            if await asyncio.to_thread(is_task_complete, task_run_state_reader, method):
+                yield _sse_event("complete", "")
+                return
+            if time.monotonic() - idle_since >= _LOG_STREAM_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                idle_since = time.monotonic()
+            await asyncio.sleep(_LOG_STREAM_INTERVAL_SECONDS)
+    finally:
+        # The store lives as long as the stream, not the request: release its file handle on disconnect too.
+        await asyncio.to_thread(task_run_state_reader.close)
+
+
+def _task_log_tailer(settings: AppSettings, method: str) -> tuple[LogTailer | None, bool]:
+    """Tailer over the segment of the method's latest run, else over the shared log; flags a run segment."""
+    run_log = latest_run_log(run_logs_folder(settings.log_file_path), method)
+    if run_log is not None:
+        return LogTailer(run_log, render_line=format_run_log_record), True
+    log_path = Path(settings.log_file_path)
+    return (LogTailer(log_path) if log_path.is_file() else None), False
+
 
-    return read_log_lines_since(log_path, since_timestamp, max_lines=80)
+def _sse_event(event: str, data: str, *, event_id: str | None = None) -> str:
+    fields = [f"event: {event}"]
+    if event_id is not None:
+        fields.append(f"id: {event_id}")
+    fields.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(fields) + "\n\n"
 
 
 @router.get("/connectors/status", response_class=HTMLResponse)
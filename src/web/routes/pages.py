@@ -1,16 +1,17 @@
 """SSR page routes."""
 
 from datetime import UTC, date, datetime
+from typing import Annotated
 
 import flag
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
 from src.application.get_top_videos_dashboard_use_case import GetTopVideosDashboardRequest
 from src.domain.models import TimeseriesRange
-from src.web.dependencies import AppSettingsDep, GetTopVideosDashboardUseCaseDep
-from src.web.state import logger, request_had_any_credentials, templates
+from src.web.dependencies import AppSettingsDep, GetTopVideosDashboardUseCaseDep, VideoSearcherDep
+from src.web.state import VideoSearchResult, logger, request_had_any_credentials, templates
 from src.web.viewmodels import build_index_page_view_model
 
 router = APIRouter()
@@ -84,3 +85,18 @@ async def index(
         name="index.html",
         context={"request": request, "vm": view_model},
     )
+
+
+@router.get("/videos/search")
+def search_videos(
+    searcher: VideoSearcherDep,
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> list[VideoSearchResult]:
+    """Tracked videos matching every word (or word prefix) of ``q`` in title, channel or hashtags, best first."""
+    return [
+        VideoSearchResult(
+            video_id=video.video_id, title=video.title, channel_name=video.channel_name, views=video.views
+        )
+        for video in searcher.search_text(q, limit=limit)
+    ]
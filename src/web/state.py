@@ -38,5 +38,12 @@ class HealthCheck(BaseModel):
     checks: dict[str, dict[str, str]]
 
 
+class VideoSearchResult(BaseModel):
+    video_id: str
+    title: str
+    channel_name: str
+    views: int
+
+
 async def request_had_any_credentials(request: Request) -> bool:
     return bool(request.session.get("yt_credentials") or request.session.get("tiktok_credentials"))
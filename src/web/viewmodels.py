@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import TYPE_CHECKING, Any
@@ -395,6 +396,20 @@ class AdminTaskViewModel:
     is_running: bool = False
 
 
+@dataclass(frozen=True)
+class AdminTimelineDeltaViewModel:
+    """Timeline changes after the newest event a polling client already shows."""
+
+    appended: dict[str, list[dict]] = field(default_factory=dict)
+    """New events per task method, to append to its timeline card."""
+
+    refreshed: dict[str, list[dict]] = field(default_factory=dict)
+    """Events the client shows whose labels changed (open runs), to replace in place."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    """New event total per task method with appended events."""
+
+
 @dataclass(frozen=True)
 class AdminTasksPanelViewModel:
     """Presentation model for the admin tasks panel."""
@@ -404,6 +419,15 @@ class AdminTasksPanelViewModel:
     timeline_data: dict[str, list[dict]] = field(default_factory=dict)
     """Timeline data for each task method over the last 7 days."""
 
+    timeline_cursor: float | None = None
+    """Timestamp of the newest timeline event; pollers send it back as ``since``."""
+
+    timeline_oldest: float | None = None
+    """Timestamp of the oldest timeline event the client shows; pollers send it back as ``oldest``."""
+
+    timeline_delta: AdminTimelineDeltaViewModel | None = None
+    """Set instead of ``timeline_data`` when only the changes after the client's cursor are rendered."""
+
 
 def build_time_label(timestamp: float | None) -> str:
     """
@@ -496,8 +520,26 @@ def _summarize_error_message(error_message: str, *, max_chars: int = 90) -> str:
     return f"{normalized[: max_chars - 1].rstrip()}…"
 
 
-def _enrich_timeline_events(events: list[dict[str, Any]], *, now_timestamp: float) -> list[dict[str, Any]]:
-    """Decorate raw timeline events with UI-ready metadata."""
+def _has_terminal_before_next_queue(events: list[dict[str, Any]], index: int) -> bool:
+    """Whether the run queued at ``events[index]`` has finished."""
+    for future_event in events[index + 1 :]:
+        future_status = str(future_event.get("status") or "").lower()
+        if future_status == "queued":
+            return False
+        if future_status in {"success", "failed"}:
+            return True
+    return False
+
+
+def _enrich_timeline_events(
+    events: list[dict[str, Any]], *, now_timestamp: float, start: int = 0
+) -> list[dict[str, Any]]:
+    """
+    Decorate raw timeline events with UI-ready metadata.
+
+    Only ``events[start:]`` are returned; earlier events are still scanned so
+    run numbers and durations match a full rendering.
+    """
     from datetime import UTC, datetime
 
     enriched: list[dict[str, Any]] = []
@@ -511,7 +553,6 @@ def _enrich_timeline_events(events: list[dict[str, Any]], *, now_timestamp: floa
 
         timestamp = float(timestamp_value)
         status = str(event.get("status") or "").lower()
-        error_message = str(event.get("error_message") or "") or None
 
         if status == "queued":
             run_index += 1
@@ -520,29 +561,26 @@ def _enrich_timeline_events(events: list[dict[str, Any]], *, now_timestamp: floa
             # Fallback for terminal events without a visible queued marker in range.
             run_index = 1
 
-        run_label = f"Run {run_index:02d}"
-        duration_label: str | None = None
+        run_started_at = queued_started_at
         if status in {"success", "failed"} and queued_started_at is not None and timestamp >= queued_started_at:
-            duration_label = f"Duration {_format_duration(timestamp - queued_started_at)}"
             queued_started_at = None
-        elif status == "queued":
-            has_terminal_before_next_queue = False
-            for future_event in events[index + 1 :]:
-                future_status = str(future_event.get("status") or "").lower()
-                if future_status == "queued":
-                    break
-                if future_status in {"success", "failed"}:
-                    has_terminal_before_next_queue = True
-                    break
-
-            if not has_terminal_before_next_queue:
-                duration_label = f"Running for {_format_duration(now_timestamp - timestamp)}"
+        if index < start:
+            continue
+
+        error_message = str(event.get("error_message") or "") or None
+        run_label = f"Run {run_index:02d}"
+        duration_label: str | None = None
+        if status in {"success", "failed"} and run_started_at is not None and timestamp >= run_started_at:
+            duration_label = f"Duration {_format_duration(timestamp - run_started_at)}"
+        elif status == "queued" and not _has_terminal_before_next_queue(events, index):
+            duration_label = f"Running for {_format_duration(now_timestamp - timestamp)}"
 
         timestamp_full = datetime.fromtimestamp(timestamp, tz=UTC).isoformat(timespec="seconds")
         error_summary = _summarize_error_message(error_message) if error_message else None
 
         enriched.append(
             {
+                "event_id": f"{round(timestamp * 1_000_000)}-{status or 'unknown'}",
                 "status": status,
                 "status_label": status.upper() if status else "UNKNOWN",
                 "timestamp": timestamp,
@@ -570,14 +608,78 @@ def _build_timeline_view_data(raw_timeline_data: dict[str, list[dict[str, Any]]]
     }
 
 
+def _timeline_timestamps(raw_timeline_data: dict[str, list[dict[str, Any]]]) -> list[float]:
+    return [
+        float(event["timestamp"])
+        for events in raw_timeline_data.values()
+        for event in events
+        if isinstance(event.get("timestamp"), int | float)
+    ]
+
+
+def _timeline_cursor(raw_timeline_data: dict[str, list[dict[str, Any]]]) -> float | None:
+    """Timestamp of the newest timeline event, if any."""
+    return max(_timeline_timestamps(raw_timeline_data), default=None)
+
+
+def _build_timeline_delta(
+    raw_timeline_data: dict[str, list[dict[str, Any]]], *, since: float, oldest: float | None = None
+) -> AdminTimelineDeltaViewModel | None:
+    """
+    Timeline changes for a client whose events span ``oldest`` to ``since``.
+
+    Returns None when the client cannot apply a delta and needs the full
+    timeline: a method has new events but no timeline card yet, or the
+    client's oldest event has left the window (deltas only append, so the
+    whole window is swapped in to drop the aged-out events).
+    """
+    from datetime import UTC, datetime
+
+    if oldest is not None and min(_timeline_timestamps(raw_timeline_data), default=None) != oldest:
+        return None
+    now_timestamp = datetime.now(UTC).timestamp()
+    appended: dict[str, list[dict[str, Any]]] = {}
+    refreshed: dict[str, list[dict[str, Any]]] = {}
+    counts: dict[str, int] = {}
+    for task_method, events in raw_timeline_data.items():
+        timestamps = [float(event.get("timestamp") or 0.0) for event in events]
+        split = bisect_right(timestamps, since)
+        if split == 0 and events:
+            return None
+        # The client's last run may still be open: its queued event shows a running duration to refresh.
+        start = split
+        for index in range(split - 1, -1, -1):
+            status = str(events[index].get("status") or "").lower()
+            if status in {"success", "failed"}:
+                break
+            if status == "queued":
+                start = index
+                break
+        if start == len(events):
+            continue
+        enriched = _enrich_timeline_events(events, now_timestamp=now_timestamp, start=start)
+        refreshed[task_method] = enriched[: split - start]
+        if split < len(events):
+            appended[task_method] = enriched[split - start :]
+            counts[task_method] = len(events)
+    return AdminTimelineDeltaViewModel(appended=appended, refreshed=refreshed, counts=counts)
+
+
 def build_admin_tasks_view_model(
     task_status: TaskStatusResult,
+    *,
+    since: float | None = None,
+    oldest: float | None = None,
 ) -> AdminTasksPanelViewModel:
     """
     Build admin tasks panel from persisted task execution status.
 
     Args:
         task_status: Result from GetAdminTaskStatusUseCase
+        since: Timestamp of the newest timeline event the client already
+            shows; when set, only the timeline changes after it are built
+        oldest: Timestamp of the oldest timeline event the client shows;
+            once it ages out of the window, the whole timeline is rebuilt
 
     Returns:
         AdminTasksPanelViewModel with task statuses
@@ -703,10 +805,19 @@ def build_admin_tasks_view_model(
         )
         tasks.append(task_vm)
 
+    timeline_delta = (
+        _build_timeline_delta(task_status.timeline_data, since=since, oldest=oldest) if since is not None else None
+    )
     return AdminTasksPanelViewModel(
         tasks=tuple(tasks),
         any_running=any(t.is_running for t in tasks),
-        timeline_data=_build_timeline_view_data(task_status.timeline_data),
+        timeline_data=_build_timeline_view_data(task_status.timeline_data) if timeline_delta is None else {},
+        timeline_cursor=_timeline_cursor(task_status.timeline_data),
+        # A delta leaves the client's timeline in place, so its oldest event stays the same.
+        timeline_oldest=oldest
+        if timeline_delta is not None
+        else min(_timeline_timestamps(task_status.timeline_data), default=None),
+        timeline_delta=timeline_delta,
     )
 
 
@@ -8,10 +8,13 @@ import pytest
 
 from src.domain.models import TikTokAuth, YtAuth
 from src.infrastructure.storage.auth_repository import AuthenticationRepository
+from src.infrastructure.storage.sqlite_auth_repository import SqliteAuthenticationRepository
 
 
-@pytest.fixture
-def repo(tmp_path: Path) -> AuthenticationRepository:
+@pytest.fixture(params=["files", "sqlite"])
+def repo(request: pytest.FixtureRequest, tmp_path: Path) -> AuthenticationRepository:
+    if request.param == "sqlite":
+        return SqliteAuthenticationRepository(tmp_path / "test_auth.sqlite3")
     return AuthenticationRepository(db_path=tmp_path / "test_auth.json")
 
 
@@ -9,10 +9,13 @@ import pytest
 
 from src.domain.models import Release
 from src.infrastructure.storage.release_repository import ReleaseRepository
+from src.infrastructure.storage.sqlite_release_repository import SqliteReleaseRepository
 
 
-@pytest.fixture
-def repo(tmp_path: Path) -> ReleaseRepository:
+@pytest.fixture(params=["files", "sqlite"])
+def repo(request: pytest.FixtureRequest, tmp_path: Path) -> ReleaseRepository:
+    if request.param == "sqlite":
+        return SqliteReleaseRepository(str(tmp_path / "test.sqlite3"))
     return ReleaseRepository(db_path=str(tmp_path / "test.db"))
 
 
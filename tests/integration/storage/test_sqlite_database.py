@@ -0,0 +1,83 @@
+"""Integration tests for the SQLite backend connection and schema."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import VideoPoint, VideoScoreStatus
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, from_time_us, to_time_us
+from src.infrastructure.storage.sqlite_timeseries_repository import SqliteTimeSeriesRepository
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> SqliteDatabase:
+    return SqliteDatabase(tmp_path / "nested" / "db.sqlite3")
+
+
+def test_opens_in_wal_mode_with_schema(database: SqliteDatabase) -> None:
+    journal_mode = database.fetch_one("PRAGMA journal_mode")
+    assert journal_mode is not None
+    assert journal_mode[0] == "wal"
+    assert set(database.row_counts().values()) == {0}
+
+
+def test_time_us_round_trips_aware_datetimes() -> None:
+    value = datetime(2026, 3, 30, 12, 30, 15, 123456, tzinfo=UTC)
+
+    assert from_time_us(to_time_us(value)) == value
+    assert to_time_us(value.astimezone(timezone(timedelta(hours=2)))) == to_time_us(value)
+
+
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        ("SELECT * FROM video_point WHERE time_us > 0 AND time_us < 10", "video_point_time"),
+        ("SELECT * FROM video_point WHERE video_id = 'v1' AND time_us = 1", "video_point_video_time"),
+        ("SELECT * FROM task_run WHERE task_method = 'FETCH' ORDER BY time_us DESC", "task_run_method_time"),
+        ("SELECT * FROM operational_metric WHERE time_us > 0 AND time_us <= 10", "operational_metric_time"),
+        (
+            (
+                "SELECT * FROM release WHERE platform = 'YOUTUBE' AND release_kind = 'daily' "
+                "AND published_at IS NOT NULL ORDER BY published_at DESC, id DESC LIMIT 1"
+            ),
+            "release_platform_kind_published",
+        ),
+    ],
+)
+def test_hot_queries_use_indexes(database: SqliteDatabase, query: str, index: str) -> None:
+    plan = " ".join(row["detail"] for row in database.fetch_all(f"EXPLAIN QUERY PLAN {query}"))
+
+    assert index in plan
+
+
+def test_transaction_rolls_back_on_error(database: SqliteDatabase) -> None:
+    def insert_then_fail() -> None:
+        with database.transaction() as connection:
+            connection.execute("INSERT INTO publisher_state (platform, enabled) VALUES ('tiktok', 0)")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        insert_then_fail()
+
+    assert database.row_counts()["publisher_state"] == 0
+
+
+def test_second_connection_sees_committed_writes(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "db.sqlite3")
+    writer = SqliteTimeSeriesRepository(db_path)
+    reader = SqliteTimeSeriesRepository(db_path)
+    point_time = datetime(2026, 3, 30, 12, tzinfo=UTC)
+
+    writer.add_video_point(VideoPoint(time=point_time, video_id="v1", views=10, likes=1))
+    writer.update_video_points(
+        [VideoPoint(time=point_time, video_id="v1", views=10, likes=1, score=4, score_status=VideoScoreStatus.UP)]
+    )
+
+    [point] = reader.get_video_points_by_date_range(point_time - timedelta(hours=1), point_time + timedelta(hours=1))
+    assert (point.score, point.score_status) == (4, VideoScoreStatus.UP)
+    assert reader.get_last_timestamp() == point_time
+    writer.close()
+    reader.close()
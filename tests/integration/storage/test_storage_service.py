@@ -0,0 +1,233 @@
+"""Integration tests for the storage-service daemon and its client adapters."""
+
+from __future__ import annotations
+
+import socket
+import time
+from concurrent.futures import Future
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.models import Release, ReleaseKind, TaskMethod, TaskRunStatus
+from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
+from src.infrastructure.storage.publisher_state_repository import PublisherStateRepository
+from src.infrastructure.storage.release_repository import ReleaseRepository
+from src.infrastructure.storage.storage_service import (
+    _WRITES,
+    METRICS_STORE,
+    PUBLISHER_STATE_STORE,
+    RELEASES_STORE,
+    TASK_RUNS_STORE,
+    RemoteOperationalMetricsRepository,
+    RemotePublisherStateRepository,
+    RemoteReleaseRepository,
+    RemoteTaskRunStateRepository,
+    StorageService,
+    StorageServiceClient,
+    StorageServiceError,
+    _PendingWrite,
+)
+from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
+from src.shared.atomic_storage import AtomicFileStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_NOW = datetime(2026, 3, 31, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> Iterator[StorageService]:
+    service = StorageService(
+        tmp_path / "storage.sock",
+        {
+            TASK_RUNS_STORE: TaskRunStateRepository(str(tmp_path / "task_runs.csv")),
+            METRICS_STORE: OperationalMetricsRepository(str(tmp_path / "metrics.csv")),
+            PUBLISHER_STATE_STORE: PublisherStateRepository(str(tmp_path / "publishers.json")),
+            RELEASES_STORE: ReleaseRepository(str(tmp_path / "release.json")),
+        },
+    )
+    service.start()
+    yield service
+    service.shutdown()
+
+
+@pytest.fixture
+def client(service: StorageService) -> Iterator[StorageServiceClient]:
+    client = StorageServiceClient(service.socket_path)
+    yield client
+    client.close()
+
+
+def test_task_runs_round_trip(client: StorageServiceClient) -> None:
+    repo = RemoteTaskRunStateRepository(client)
+
+    repo.record_task_event(task_method=TaskMethod.FETCH, status=TaskRunStatus.QUEUED, event_time=_NOW)
+    version = repo.data_version()
+    repo.record_task_event(
+        task_method=TaskMethod.FETCH, status=TaskRunStatus.FAILED, error_message="boom", event_time=_NOW
+    )
+
+    latest = repo.get_latest_task_event(task_method=TaskMethod.FETCH, status=TaskRunStatus.FAILED)
+    assert latest is not None
+    assert (latest.status, latest.error_message, latest.event_at) == (TaskRunStatus.FAILED, "boom", _NOW)
+    events = repo.get_task_events_since(task_method=TaskMethod.FETCH, since=_NOW - timedelta(hours=1))
+    assert [event.status for event in events] == [TaskRunStatus.QUEUED, TaskRunStatus.FAILED]
+    snapshot = repo.snapshot(since=_NOW - timedelta(hours=1))
+    assert snapshot.last_error(TaskMethod.FETCH) == latest
+    assert snapshot.events_since == {TaskMethod.FETCH: events}
+    assert repo.data_version() != version
+
+
+def test_metrics_and_publisher_state_round_trip(client: StorageServiceClient) -> None:
+    metrics = RemoteOperationalMetricsRepository(client)
+    publishers = RemotePublisherStateRepository(client)
+
+    metrics.record_metric_event(stage="upload", is_error=True, event_time=_NOW)
+    publishers.set_enabled("tiktok", False)
+
+    counts = metrics.get_metric_counts(start_time=_NOW - timedelta(hours=1), end_time=_NOW)
+    assert counts["upload"] == {"count": 0, "errors": 1}
+    assert publishers.is_enabled("tiktok") is False
+    assert publishers.is_enabled("youtube") is True
+    assert publishers.get_all() == {"tiktok": False}
+
+
+def test_releases_round_trip_and_reach_the_file(client: StorageServiceClient, tmp_path: Path) -> None:
+    repo = RemoteReleaseRepository(client)
+    kind = ReleaseKind.DAILY_VERTICAL.value
+    release = Release(
+        platform="YOUTUBE", client_id="creator", release_kind=kind, release_id="r1", published_at=_NOW.timestamp()
+    )
+
+    assert repo.add_or_update_release(release) == release
+
+    assert repo.is_release_at_date("YOUTUBE", date(2026, 3, 31), kind)
+    assert repo.get_latest_release("YOUTUBE", kind) == release
+    assert repo.get_release("YOUTUBE", "creator", kind) == release
+    assert ReleaseRepository(str(tmp_path / "release.json")).get_latest_release("YOUTUBE") == release
+
+
+def test_queued_writes_are_applied_in_one_batch(tmp_path: Path) -> None:
+    service = StorageService(
+        tmp_path / "storage.sock", {PUBLISHER_STATE_STORE: PublisherStateRepository(str(tmp_path / "p.json"))}
+    )
+    # Queue the writes before the writer thread starts, as concurrent callers would while it is busy.
+    pending = [
+        _PendingWrite(
+            store=PUBLISHER_STATE_STORE,
+            handler=_WRITES[(PUBLISHER_STATE_STORE, "set_enabled")],
+            args={"platform": platform, "enabled": False},
+            result=Future(),
+        )
+        for platform in ("tiktok", "instagram", "youtube")
+    ]
+    for write in pending:
+        service._writes.put(write)
+
+    with patch.object(AtomicFileStorage, "write_json", autospec=True, side_effect=AtomicFileStorage.write_json) as spy:
+        service.start()
+        try:
+            for write in pending:
+                write.result.result(timeout=5)
+        finally:
+            service.shutdown()
+
+    assert spy.call_count == 1
+    assert PublisherStateRepository(str(tmp_path / "p.json")).get_all() == {
+        "tiktok": False,
+        "instagram": False,
+        "youtube": False,
+    }
+
+
+def test_unknown_calls_and_failed_writes_raise(client: StorageServiceClient) -> None:
+    with pytest.raises(StorageServiceError, match="unknown method"):
+        client.call(RELEASES_STORE, "clear_releases_for_platform", platform="YOUTUBE")
+    with pytest.raises(StorageServiceError, match="ValueError"):
+        client.call(TASK_RUNS_STORE, "record_task_event", task_method="nope", status="queued")
+
+    # The connection stays usable after an error.
+    assert RemotePublisherStateRepository(client).get_all() == {}
+
+
+def test_malformed_requests_are_rejected(service: StorageService) -> None:
+    reply = service.handle({"store": [RELEASES_STORE], "method": "add_or_update_release"})
+
+    assert reply == {"error": "unknown store or method: ['releases'].add_or_update_release"}
+    assert service.handle({"store": PUBLISHER_STATE_STORE, "method": "get_all", "args": [1, 2]}) == {
+        "error": "malformed request"
+    }
+
+
+def test_non_object_lines_are_answered_and_keep_the_connection(service: StorageService) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(5)
+        connection.connect(str(service.socket_path))
+        reader = connection.makefile("rb")
+        replies = []
+        for line in (b"[1, 2]", b'"x"', b'{"store": "publisher_state", "method": "get_all", "args": "x"}', b"{"):
+            connection.sendall(line + b"\n")
+            replies.append(reader.readline())
+        connection.sendall(b'{"store": "publisher_state", "method": "get_all"}\n')
+        replies.append(reader.readline())
+        reader.close()
+
+    assert replies == [b'{"error":"malformed request"}\n'] * 4 + [b'{"result":{}}\n']
+
+
+def test_shutdown_rejects_calls_and_closes_open_connections(tmp_path: Path) -> None:
+    service = StorageService(
+        tmp_path / "storage.sock", {PUBLISHER_STATE_STORE: PublisherStateRepository(str(tmp_path / "p.json"))}
+    )
+    service.start()
+    client = StorageServiceClient(service.socket_path, timeout=5)
+    repo = RemotePublisherStateRepository(client)
+    repo.set_enabled("tiktok", False)
+
+    service.shutdown()
+    started = time.monotonic()
+    try:
+        with pytest.raises(StorageServiceError, match="unavailable"):
+            repo.set_enabled("youtube", False)
+    finally:
+        client.close()
+
+    assert time.monotonic() - started < 1
+    assert service.handle({"store": PUBLISHER_STATE_STORE, "method": "get_all"}) == {
+        "error": "storage service is shutting down"
+    }
+    assert service.handle({"store": PUBLISHER_STATE_STORE, "method": "set_enabled", "args": {}}) == {
+        "error": "storage service is shutting down"
+    }
+
+
+def test_client_reports_unreachable_service(tmp_path: Path) -> None:
+    client = StorageServiceClient(tmp_path / "missing.sock")
+
+    with pytest.raises(StorageServiceError, match="unavailable"):
+        RemotePublisherStateRepository(client).get_all()
+
+
+def test_reads_reconnect_after_the_service_restarts(tmp_path: Path) -> None:
+    def start() -> StorageService:
+        service = StorageService(
+            tmp_path / "storage.sock", {PUBLISHER_STATE_STORE: PublisherStateRepository(str(tmp_path / "p.json"))}
+        )
+        service.start()
+        return service
+
+    first = start()
+    client = StorageServiceClient(first.socket_path)
+    RemotePublisherStateRepository(client).set_enabled("tiktok", False)
+    first.shutdown()
+    second = start()
+    try:
+        assert RemotePublisherStateRepository(client).get_all() == {"tiktok": False}
+    finally:
+        client.close()
+        second.shutdown()
@@ -0,0 +1,187 @@
+"""Integration tests for TimeSeriesExport and TimeSeriesSnapshotReader."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from src.adapters.youtube_source import YouTubeSource
+from src.application.fetch_data_use_case import FetchDataUseCase
+from src.domain.models import CanonicalVideo, VideoPoint, VideoScoreStatus
+from src.infrastructure.storage.timeseries_export import TimeSeriesExport, TimeSeriesSnapshotReader
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+
+BASE_TIME = datetime(2026, 3, 31, 12, 0, 0, 123456, tzinfo=UTC)
+ALL_TIME = (datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC))
+
+
+@pytest.fixture
+def export(tmp_path: Path) -> TimeSeriesExport:
+    return TimeSeriesExport.for_timeseries_file(tmp_path / "db_timeseries.csv")
+
+
+def make_point(video_id: str, hours: int, views: int = 1000, score: int | None = 1) -> VideoPoint:
+    return VideoPoint(
+        time=BASE_TIME + timedelta(hours=hours),
+        video_id=video_id,
+        views=views,
+        likes=10,
+        views_growth=200,
+        score=score,
+        score_status=VideoScoreStatus.UP if score else None,
+    )
+
+
+def make_fetch(
+    repo: TimeSeriesRepository,
+    export: TimeSeriesExport,
+    rollup_store: MagicMock,
+    views: int,
+) -> FetchDataUseCase:
+    youtube_source = create_autospec(YouTubeSource, instance=True)
+    youtube_source.fetch_trending_videos = AsyncMock(return_value=[SimpleNamespace(video_id="v1")])
+    youtube_source.fetch_video_details_batch = AsyncMock(
+        return_value=[CanonicalVideo(video_id="v1", title="Video", channel_name="Channel", views=views, likes=1)]
+    )
+    return FetchDataUseCase(
+        youtube_source=youtube_source,
+        video_repo=MagicMock(),
+        timeseries_repo=repo,
+        settings=MagicMock(yt_search_region_code="IN"),
+        force_fetch=True,
+        rollup_reader=rollup_store,
+        rollup_writer=rollup_store,
+        timeseries_export=export,
+    )
+
+
+def exported_points(export: TimeSeriesExport) -> list[VideoPoint]:
+    return TimeSeriesSnapshotReader(export.path).get_video_points_by_date_range(*ALL_TIME)
+
+
+def make_rollup_store() -> MagicMock:
+    rollup_store = MagicMock()
+    rollup_store.read_daily.return_value = None
+    rollup_store.read_weekly.return_value = None
+    return rollup_store
+
+
+@pytest.mark.asyncio
+async def test_fetch_keeps_export_complete_when_rollups_fail(export: TimeSeriesExport, tmp_path: Path) -> None:
+    repo = TimeSeriesRepository(str(tmp_path / "db_timeseries.csv"))
+    try:
+        repo.add_video_points([make_point("v0", 0)])
+        export.rebuild_from(repo)
+        failing_rollups = make_rollup_store()
+        failing_rollups.write_daily.side_effect = OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            await make_fetch(repo, export, failing_rollups, views=100).execute()
+        await make_fetch(repo, export, make_rollup_store(), views=200).execute()
+
+        everything = repo.get_video_points_by_date_range(*ALL_TIME)
+    finally:
+        repo.close()
+
+    assert [(point.video_id, point.views) for point in everything] == [("v0", 1000), ("v1", 100), ("v1", 200)]
+    assert exported_points(export) == everything
+
+
+@pytest.mark.asyncio
+async def test_fetch_rebuilds_export_that_missed_a_batch(export: TimeSeriesExport, tmp_path: Path) -> None:
+    repo = TimeSeriesRepository(str(tmp_path / "db_timeseries.csv"))
+    try:
+        export.rebuild([make_point("v0", 0)])
+        # The previous run died after writing the timeseries but before updating the export.
+        repo.add_video_points([make_point("v0", 0), make_point("v2", 1)])
+
+        await make_fetch(repo, export, make_rollup_store(), views=100).execute()
+
+        everything = repo.get_video_points_by_date_range(*ALL_TIME)
+    finally:
+        repo.close()
+
+    assert [point.video_id for point in everything] == ["v0", "v2", "v1"]
+    assert exported_points(export) == everything
+
+
+def test_export_lives_next_to_timeseries_csv(export: TimeSeriesExport, tmp_path: Path) -> None:
+    export.rebuild([make_point("v1", 0)])
+
+    assert export.path == tmp_path / "db_timeseries.csv.export.cols"
+    assert export.exists()
+
+
+def test_append_keeps_rows_sorted_by_time(export: TimeSeriesExport) -> None:
+    export.rebuild([make_point("v1", 0), make_point("v2", 10)])
+    export.append([make_point("v3", 5), make_point("v1", 20, views=2000)])
+
+    points = TimeSeriesSnapshotReader(export.path).get_video_points_by_date_range(
+        BASE_TIME - timedelta(days=1), BASE_TIME + timedelta(days=1)
+    )
+
+    assert [(point.video_id, point.views) for point in points] == [
+        ("v1", 1000),
+        ("v3", 1000),
+        ("v2", 1000),
+        ("v1", 2000),
+    ]
+
+
+def test_reader_matches_tinyflux_range_semantics(export: TimeSeriesExport, tmp_path: Path) -> None:
+    points = [make_point("v1", 0), make_point("v2", 1, score=3), make_point("v1", 2, views=1500)]
+    repo = TimeSeriesRepository(str(tmp_path / "db_timeseries.csv"))
+    try:
+        repo.add_video_points(points)
+        export.rebuild_from(repo)
+        # Bounds are exclusive on both ends, like the TinyFlux time query.
+        start, end = points[0].time, points[2].time
+        expected = repo.get_video_points_by_date_range(start, end)
+        expected_records = repo.get_video_records_by_date_range(start, end)
+        expected_last = repo.get_last_timestamp()
+    finally:
+        repo.close()
+
+    reader = TimeSeriesSnapshotReader(export.path)
+
+    assert reader.get_video_points_by_date_range(start, end) == expected
+    assert reader.get_video_records_by_date_range(start, end) == expected_records
+    assert [point.video_id for point in expected] == ["v2"]
+    assert reader.get_last_timestamp() == expected_last
+
+
+def test_export_keeps_only_the_columns_the_csv_stores(export: TimeSeriesExport, tmp_path: Path) -> None:
+    point = make_point("v1", 0).model_copy(update={"score_previous": 4})
+    repo = TimeSeriesRepository(str(tmp_path / "db_timeseries.csv"))
+    try:
+        repo.add_video_points([point])
+        stored = repo.get_video_points_by_date_range(*ALL_TIME)
+    finally:
+        repo.close()
+
+    export.append([point])
+
+    assert stored[0].score_previous is None
+    assert exported_points(export) == stored
+
+
+def test_reader_reloads_after_export_is_swapped(export: TimeSeriesExport) -> None:
+    export.rebuild([make_point("v1", 0)])
+    reader = TimeSeriesSnapshotReader(export.path)
+    assert reader.get_last_timestamp() == BASE_TIME
+
+    export.append([make_point("v2", 3)])
+
+    assert reader.get_last_timestamp() == BASE_TIME + timedelta(hours=3)
+
+
+def test_reader_without_export_is_unavailable(export: TimeSeriesExport) -> None:
+    reader = TimeSeriesSnapshotReader(export.path)
+
+    assert not reader.is_available()
+    assert reader.get_last_timestamp() is None
+    assert reader.get_video_points_by_date_range(BASE_TIME, BASE_TIME + timedelta(days=1)) == []
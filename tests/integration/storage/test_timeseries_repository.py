@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 from tinyflux import Point
+from tinyflux.storages import CSVStorage
 
+from src.config.settings import TimeSeriesSegmentPeriod
 from src.domain.models import Channel, VideoPoint, VideoScoreStatus
+from src.infrastructure.storage.sqlite_timeseries_repository import SqliteTimeSeriesRepository
 from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
 
 
@@ -18,6 +21,14 @@ def repo(tmp_path: Path) -> TimeSeriesRepository:
     return TimeSeriesRepository(db_path=str(tmp_path / "test_timeseries.csv"))
 
 
+@pytest.fixture(params=["files", "sqlite"])
+def backend_repo(request: pytest.FixtureRequest, tmp_path: Path) -> TimeSeriesRepository:
+    """Fixture: repository of either storage backend, for tests of the TimeSeriesReader/Writer contract."""
+    if request.param == "sqlite":
+        return SqliteTimeSeriesRepository(str(tmp_path / "test_timeseries.sqlite3"))
+    return TimeSeriesRepository(db_path=str(tmp_path / "test_timeseries.csv"))
+
+
 def make_point(
     video_id: str = "vid_abc",
     views: int = 1000,
@@ -82,36 +93,36 @@ class TestAddVideoPoint:
 
 
 class TestGetVideoPointsByDateRange:
-    def test_returns_points_within_range(self, repo: TimeSeriesRepository) -> None:
+    def test_returns_points_within_range(self, backend_repo: TimeSeriesRepository) -> None:
         t_inside = datetime(2026, 3, 31, 12, 0, 0, tzinfo=UTC)
         t_outside = datetime(2026, 3, 28, 12, 0, 0, tzinfo=UTC)
-        repo.add_video_point(make_point(video_id="v1", dt=t_inside))
-        repo.add_video_point(make_point(video_id="v2", dt=t_outside))
+        backend_repo.add_video_point(make_point(video_id="v1", dt=t_inside))
+        backend_repo.add_video_point(make_point(video_id="v2", dt=t_outside))
 
         start = datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)
         end = datetime(2026, 4, 1, 0, 0, 0, tzinfo=UTC)
-        results = repo.get_video_points_by_date_range(start, end)
+        results = backend_repo.get_video_points_by_date_range(start, end)
 
         ids = {r.video_id for r in results}
         assert "v1" in ids
         assert "v2" not in ids
 
-    def test_returns_empty_when_no_data_in_range(self, repo: TimeSeriesRepository) -> None:
-        repo.add_video_point(make_point(dt=datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)))
+    def test_returns_empty_when_no_data_in_range(self, backend_repo: TimeSeriesRepository) -> None:
+        backend_repo.add_video_point(make_point(dt=datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)))
 
         start = datetime(2026, 3, 29, 0, 0, 0, tzinfo=UTC)
         end = datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)
-        results = repo.get_video_points_by_date_range(start, end)
+        results = backend_repo.get_video_points_by_date_range(start, end)
 
         assert results == []
 
-    def test_returns_video_points_with_correct_fields(self, repo: TimeSeriesRepository) -> None:
+    def test_returns_video_points_with_correct_fields(self, backend_repo: TimeSeriesRepository) -> None:
         dt = datetime(2026, 3, 31, 8, 0, 0, tzinfo=UTC)
-        repo.add_video_point(make_point(video_id="vX", views=9999, likes=111, views_growth=500, score=3, dt=dt))
+        backend_repo.add_video_point(make_point(video_id="vX", views=9999, likes=111, views_growth=500, score=3, dt=dt))
 
         start = datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)
         end = datetime(2026, 4, 1, 0, 0, 0, tzinfo=UTC)
-        results = repo.get_video_points_by_date_range(start, end)
+        results = backend_repo.get_video_points_by_date_range(start, end)
 
         assert len(results) == 1
         vp = results[0]
@@ -120,7 +131,7 @@ class TestGetVideoPointsByDateRange:
         assert vp.likes == 111
         assert vp.score == 3
 
-    def test_does_not_persist_optional_video_metadata_fields(self, repo: TimeSeriesRepository) -> None:
+    def test_does_not_persist_optional_video_metadata_fields(self, backend_repo: TimeSeriesRepository) -> None:
         dt = datetime(2026, 3, 31, 8, 0, 0, tzinfo=UTC)
         point = make_point(video_id="v-meta", views=9999, likes=111, views_growth=500, score=3, dt=dt)
         point.title = "Hydrated title"
@@ -128,11 +139,11 @@ class TestGetVideoPointsByDateRange:
         point.channel = Channel(name="Hydrated channel")
         point.duration = 182
 
-        repo.add_video_point(point)
+        backend_repo.add_video_point(point)
 
         start = datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)
         end = datetime(2026, 4, 1, 0, 0, 0, tzinfo=UTC)
-        results = repo.get_video_points_by_date_range(start, end)
+        results = backend_repo.get_video_points_by_date_range(start, end)
 
         assert len(results) == 1
         vp = results[0]
@@ -186,16 +197,16 @@ class TestGetVideoPointsByDateRange:
 
 
 class TestGetLastTimestamp:
-    def test_returns_none_when_empty(self, repo: TimeSeriesRepository) -> None:
-        assert repo.get_last_timestamp() is None
+    def test_returns_none_when_empty(self, backend_repo: TimeSeriesRepository) -> None:
+        assert backend_repo.get_last_timestamp() is None
 
-    def test_returns_latest_timestamp(self, repo: TimeSeriesRepository) -> None:
+    def test_returns_latest_timestamp(self, backend_repo: TimeSeriesRepository) -> None:
         t1 = datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)
         t2 = datetime(2026, 3, 31, 0, 0, 0, tzinfo=UTC)
-        repo.add_video_point(make_point(dt=t1))
-        repo.add_video_point(make_point(dt=t2))
+        backend_repo.add_video_point(make_point(dt=t1))
+        backend_repo.add_video_point(make_point(dt=t2))
 
-        last = repo.get_last_timestamp()
+        last = backend_repo.get_last_timestamp()
         assert last is not None
         assert last.date() == t2.date()
 
@@ -216,3 +227,411 @@ class TestGetLastTimestamp:
 
         assert last is not None
         assert last == t_video
+
+
+class TestVideoIndex:
+    def test_index_file_is_persisted_next_to_csv(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(video_id="v1"))
+
+        assert (tmp_path / "test_timeseries.csv.idx.json").exists()
+        assert len(repo._base.video_index.offsets_for("v1")) == 1
+
+    def test_reopened_repository_reads_points_through_index(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(video_id="v1", views=10, dt=datetime(2026, 3, 30, tzinfo=UTC)))
+        repo.add_video_point(make_point(video_id="v2", views=20, dt=datetime(2026, 3, 30, tzinfo=UTC)))
+        repo.add_video_point(make_point(video_id="v1", views=30, dt=datetime(2026, 3, 31, tzinfo=UTC)))
+        repo.close()
+
+        reopened = TimeSeriesRepository(db_path=str(db_path))
+        results = reopened.get_all_points_by_video("v1")
+
+        assert [point.fields["views"] for point in results] == [10, 30]
+
+    def test_index_rebuilds_when_csv_is_rewritten_externally(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(video_id="v1", dt=datetime(2026, 3, 30, tzinfo=UTC)))
+        repo.add_video_point(make_point(video_id="v2", dt=datetime(2026, 3, 31, tzinfo=UTC)))
+        repo.close()
+
+        lines = db_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        db_path.write_text("".join(reversed(lines)), encoding="utf-8")
+
+        reopened = TimeSeriesRepository(db_path=str(db_path))
+        results = reopened.get_all_points_by_video("v2")
+
+        assert len(results) == 1
+        assert results[0].tags["video_id"] == "v2"
+
+    def test_index_stays_valid_after_update(self, repo: TimeSeriesRepository) -> None:
+        point = make_point(video_id="v1", score=5)
+        repo.add_video_point(make_point(video_id="v0", score=1))
+        repo.add_video_point(point)
+        repo.update_video_point(point.model_copy(update={"score": 123456789}))
+
+        results = repo.get_all_points_by_video("v1")
+
+        assert len(results) == 1
+        assert results[0].fields["score"] == 123456789
+
+    def test_index_skips_rows_with_quoted_newlines(self, repo: TimeSeriesRepository) -> None:
+        repo._db.insert(
+            Point(
+                measurement="Task run state",
+                time=datetime(2026, 3, 31, 11, 0, 0, tzinfo=UTC),
+                tags={"task_method": "fetch", "error_message": "line one\nline two"},
+                fields={"count": 1},
+            )
+        )
+        repo.add_video_point(make_point(video_id="v1"))
+
+        results = repo.get_all_points_by_video("v1")
+
+        assert len(results) == 1
+        assert results[0].tags["video_id"] == "v1"
+
+
+class TestLastTimestampWatermark:
+    def test_watermark_is_persisted_on_add(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 31, 8, 0, 0, tzinfo=UTC)))
+
+        assert (tmp_path / "test_timeseries.csv.watermark.json").exists()
+        assert repo.get_last_timestamp() == datetime(2026, 3, 31, 8, 0, 0, tzinfo=UTC)
+
+    def test_falls_back_to_tail_reader_without_watermark(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)))
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 31, 0, 0, 0, tzinfo=UTC)))
+        repo._db.insert(
+            Point(
+                measurement="Task run state",
+                time=datetime(2026, 3, 31, 12, 0, 0, tzinfo=UTC),
+                tags={"task_method": "daily", "error_message": "boom\nVideo visualizations"},
+                fields={"count": 1},
+            )
+        )
+        repo.close()
+        (tmp_path / "test_timeseries.csv.watermark.json").unlink()
+
+        reopened = TimeSeriesRepository(db_path=str(db_path))
+
+        assert reopened.get_last_timestamp() == datetime(2026, 3, 31, 0, 0, 0, tzinfo=UTC)
+
+    def test_watermark_catches_up_with_rows_appended_by_other_writers(self, repo: TimeSeriesRepository) -> None:
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)))
+        repo._db.insert(
+            Point(
+                measurement="Video visualizations",
+                time=datetime(2026, 4, 2, 0, 0, 0, tzinfo=UTC),
+                tags={"video_id": "v-external", "score_status": "NEW"},
+                fields={"views": 1, "likes": 1, "views_growth": 1, "score": 1},
+            )
+        )
+
+        assert repo.get_last_timestamp() == datetime(2026, 4, 2, 0, 0, 0, tzinfo=UTC)
+
+    def test_watermark_rescans_when_csv_shrinks(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)))
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 31, 0, 0, 0, tzinfo=UTC)))
+        repo.close()
+
+        first_line = db_path.read_text(encoding="utf-8").splitlines(keepends=True)[0]
+        db_path.write_text(first_line, encoding="utf-8")
+
+        reopened = TimeSeriesRepository(db_path=str(db_path))
+
+        assert reopened.get_last_timestamp() == datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)
+
+    def test_reading_the_watermark_never_writes_it(self, repo: TimeSeriesRepository, tmp_path: Path) -> None:
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)))
+        watermark_path = tmp_path / "test_timeseries.csv.watermark.json"
+        repo._db.insert(
+            Point(
+                measurement="Video visualizations",
+                time=datetime(2026, 4, 2, 0, 0, 0, tzinfo=UTC),
+                tags={"video_id": "v-external", "score_status": "NEW"},
+                fields={"views": 1, "likes": 1, "views_growth": 1, "score": 1},
+            )
+        )
+        persisted = watermark_path.read_bytes()
+
+        assert repo.get_last_timestamp() == datetime(2026, 4, 2, 0, 0, 0, tzinfo=UTC)
+        assert watermark_path.read_bytes() == persisted
+
+    def test_watermark_rescans_a_same_size_rewrite(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_timeseries.csv"
+        repo = TimeSeriesRepository(db_path=str(db_path))
+        repo.add_video_point(make_point(dt=datetime(2026, 3, 30, 0, 0, 0, tzinfo=UTC)))
+        repo.close()
+
+        content = db_path.read_text(encoding="utf-8")
+        rewritten = content.replace("2026-03-30T00:00:00", "2026-03-31T00:00:00")
+        assert len(rewritten) == len(content)
+        db_path.write_text(rewritten, encoding="utf-8")
+
+        reopened = TimeSeriesRepository(db_path=str(db_path))
+
+        assert reopened.get_last_timestamp() == datetime(2026, 3, 31, 0, 0, 0, tzinfo=UTC)
+
+
+class TestSegmentedStorage:
+    @pytest.fixture
+    def segmented_repo(self, tmp_path: Path) -> TimeSeriesRepository:
+        return TimeSeriesRepository(
+            db_path=str(tmp_path / "test_timeseries.csv"),
+            segment_period=TimeSeriesSegmentPeriod.MONTH,
+        )
+
+    def test_points_are_written_to_monthly_segments(self, segmented_repo: TimeSeriesRepository, tmp_path: Path) -> None:
+        segmented_repo.add_video_point(make_point(video_id="v1", dt=datetime(2026, 2, 27, 12, tzinfo=UTC)))
+        segmented_repo.add_video_point(make_point(video_id="v1", dt=datetime(2026, 3, 2, 12, tzinfo=UTC)))
+
+        segments_dir = tmp_path / "test_timeseries.csv.segments"
+        assert sorted(path.name for path in segments_dir.glob("*.csv")) == ["2026-02.csv", "2026-03.csv"]
+        assert "Video visualizations" not in (tmp_path / "test_timeseries.csv").read_text()
+
+    def test_range_query_only_opens_overlapping_segments(self, segmented_repo: TimeSeriesRepository) -> None:
+        segmented_repo.add_video_point(make_point(video_id="old", dt=datetime(2026, 1, 15, 12, tzinfo=UTC)))
+        segmented_repo.add_video_point(make_point(video_id="new", dt=datetime(2026, 3, 31, 12, tzinfo=UTC)))
+        segmented_repo.close()
+
+        reopened = TimeSeriesRepository(
+            db_path=str(segmented_repo._base.path),
+            segment_period=TimeSeriesSegmentPeriod.MONTH,
+        )
+        results = reopened.get_video_points_by_date_range(
+            datetime(2026, 3, 24, tzinfo=UTC), datetime(2026, 4, 1, tzinfo=UTC)
+        )
+
+        assert [point.video_id for point in results] == ["new"]
+        opened = [segment.path.name for segment in reopened._layout.segments() if segment.is_open]
+        assert opened == ["2026-03.csv"]
+
+    def test_range_query_spans_segment_boundaries(self, segmented_repo: TimeSeriesRepository) -> None:
+        segmented_repo.add_video_point(make_point(video_id="v1", dt=datetime(2026, 2, 28, 12, tzinfo=UTC)))
+        segmented_repo.add_video_point(make_point(video_id="v2", dt=datetime(2026, 3, 1, 12, tzinfo=UTC)))
+
+        results = segmented_repo.get_video_points_by_date_range(
+            datetime(2026, 2, 28, tzinfo=UTC), datetime(2026, 3, 2, tzinfo=UTC)
+        )
+
+        assert [point.video_id for point in results] == ["v1", "v2"]
+
+    def test_reads_history_left_in_base_csv(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test_timeseries.csv")
+        TimeSeriesRepository(db_path=db_path).add_video_point(
+            make_point(video_id="v1", views=100, dt=datetime(2026, 3, 1, 12, tzinfo=UTC))
+        )
+        segmented = TimeSeriesRepository(db_path=db_path, segment_period=TimeSeriesSegmentPeriod.MONTH)
+        segmented.add_video_point(make_point(video_id="v1", views=200, dt=datetime(2026, 3, 2, 12, tzinfo=UTC)))
+
+        points = segmented.get_all_points_by_video("v1")
+        in_range = segmented.get_video_points_by_date_range(
+            datetime(2026, 2, 28, tzinfo=UTC), datetime(2026, 3, 3, tzinfo=UTC)
+        )
+
+        assert [point.fields["views"] for point in points] == [100, 200]
+        assert [point.views for point in in_range] == [100, 200]
+        assert segmented.get_last_timestamp() == datetime(2026, 3, 2, 12, tzinfo=UTC)
+
+    def test_last_timestamp_comes_from_newest_segment(self, segmented_repo: TimeSeriesRepository) -> None:
+        segmented_repo.add_video_point(make_point(dt=datetime(2026, 1, 10, 12, tzinfo=UTC)))
+        segmented_repo.add_video_point(make_point(dt=datetime(2026, 3, 10, 12, tzinfo=UTC)))
+
+        assert segmented_repo.get_last_timestamp() == datetime(2026, 3, 10, 12, tzinfo=UTC)
+
+    def test_update_rewrites_only_the_segment_of_the_point(self, segmented_repo: TimeSeriesRepository) -> None:
+        old_point = make_point(video_id="v1", score=None, dt=datetime(2026, 1, 10, 12, tzinfo=UTC))
+        new_point = make_point(video_id="v1", score=None, dt=datetime(2026, 3, 10, 12, tzinfo=UTC))
+        segmented_repo.add_video_point(old_point)
+        segmented_repo.add_video_point(new_point)
+        january = segmented_repo._layout.segment("2026-01").path
+        january_before = january.stat().st_mtime_ns
+
+        segmented_repo.update_video_point(new_point.model_copy(update={"score": 3}))
+
+        assert january.stat().st_mtime_ns == january_before
+        assert [point.fields["score"] for point in segmented_repo.get_all_points_by_video("v1")] == [0, 3]
+
+
+class TestBatchWrites:
+    def test_add_video_points_uses_one_batch_per_segment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        repo = TimeSeriesRepository(
+            db_path=str(tmp_path / "test_timeseries.csv"),
+            segment_period=TimeSeriesSegmentPeriod.MONTH,
+        )
+        appends: list[int] = []
+        real_append = CSVStorage.append
+        monkeypatch.setattr(
+            CSVStorage,
+            "append",
+            lambda storage, items, temporary=False: (
+                appends.append(len(items)),
+                real_append(storage, items, temporary),
+            ),
+        )
+
+        repo.add_video_points(
+            [make_point(video_id=f"v{i}", dt=datetime(2026, 3, 31, 12, tzinfo=UTC)) for i in range(50)]
+            + [make_point(video_id="v-april", dt=datetime(2026, 4, 1, 12, tzinfo=UTC))]
+        )
+
+        assert appends == [50, 1]
+        assert len(repo.get_all_points_by_video("v49")) == 1
+        assert repo.get_last_timestamp() == datetime(2026, 4, 1, 12, tzinfo=UTC)
+
+    def test_update_video_points_rewrites_matching_rows_only(self, repo: TimeSeriesRepository) -> None:
+        t1 = datetime(2026, 3, 30, 12, tzinfo=UTC)
+        t2 = datetime(2026, 3, 31, 12, tzinfo=UTC)
+        repo.add_video_points([make_point(video_id="v1", dt=t1), make_point(video_id="v1", dt=t2)])
+        repo.add_video_points([make_point(video_id="v2", dt=t2)])
+
+        repo.update_video_points(
+            [
+                make_point(video_id="v1", dt=t2, score=9, views_growth=90, score_status=VideoScoreStatus.UP),
+                make_point(video_id="v2", dt=t2, score=8, views_growth=80, score_status=VideoScoreStatus.DOWN),
+            ]
+        )
+
+        v1_points = repo.get_all_points_by_video("v1")
+        v2_points = repo.get_all_points_by_video("v2")
+        assert [point.fields["score"] for point in v1_points] == [5, 9]
+        assert v1_points[1].tags["score_status"] == "UP"
+        assert v2_points[0].fields["views_growth"] == 80
+        assert v2_points[0].fields["views"] == 1000
+
+    def test_failed_update_leaves_the_csv_untouched(
+        self, repo: TimeSeriesRepository, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        point_time = datetime(2026, 3, 31, 12, tzinfo=UTC)
+        repo.add_video_points([make_point(video_id="v1", dt=point_time), make_point(video_id="v2", dt=point_time)])
+        csv_path = tmp_path / "test_timeseries.csv"
+        original = csv_path.read_bytes()
+
+        def failing_fsync(fd: int) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.infrastructure.storage.timeseries_files.os.fsync", failing_fsync)
+        with pytest.raises(OSError, match="disk full"):
+            repo.update_video_points([make_point(video_id="v1", dt=point_time, score=9)])
+
+        assert csv_path.read_bytes() == original
+        assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+
+    def test_update_video_points_reaches_rows_in_base_csv(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "test_timeseries.csv")
+        old_time = datetime(2026, 2, 1, 12, tzinfo=UTC)
+        new_time = datetime(2026, 3, 1, 12, tzinfo=UTC)
+        TimeSeriesRepository(db_path=db_path).add_video_point(make_point(video_id="v1", dt=old_time))
+        segmented = TimeSeriesRepository(db_path=db_path, segment_period=TimeSeriesSegmentPeriod.MONTH)
+        segmented.add_video_point(make_point(video_id="v1", dt=new_time))
+
+        segmented.update_video_points(
+            [make_point(video_id="v1", dt=old_time, score=7), make_point(video_id="v1", dt=new_time, score=6)]
+        )
+
+        assert [point.fields["score"] for point in segmented.get_all_points_by_video("v1")] == [7, 6]
+
+
+class TestStreamingQueries:
+    def test_iter_video_points_matches_list_query(self, tmp_path: Path) -> None:
+        repo = TimeSeriesRepository(str(tmp_path / "db_timeseries.csv"), segment_period=TimeSeriesSegmentPeriod.DAY)
+        base = datetime(2026, 3, 30, 12, tzinfo=UTC)
+        try:
+            repo.add_video_points(
+                [
+                    VideoPoint(
+                        time=base + timedelta(days=offset),
+                        video_id=f"v{offset}",
+                        views=100 * offset,
+                        likes=1,
+                        views_growth=offset or None,
+                        score=offset + 1,
+                        score_status=VideoScoreStatus.NEW,
+                    )
+                    for offset in range(4)
+                ]
+            )
+            start, end = base - timedelta(hours=1), base + timedelta(days=2, hours=1)
+
+            streamed = repo.iter_video_points(start, end)
+            expected = repo.get_video_points_by_date_range(start, end)
+
+            assert not isinstance(streamed, list)
+            assert list(streamed) == expected
+            assert [point.time for point in repo.iter_points_by_date_range(start, end)] == [
+                point.time for point in expected
+            ]
+        finally:
+            repo.close()
+
+    def test_iter_video_points_projects_fields(self, backend_repo: TimeSeriesRepository) -> None:
+        repo = backend_repo
+        point_time = datetime(2026, 3, 30, 12, tzinfo=UTC)
+        try:
+            repo.add_video_point(
+                VideoPoint(
+                    time=point_time, video_id="v1", views=500, likes=7, score=3, score_status=VideoScoreStatus.UP
+                )
+            )
+
+            [point] = repo.iter_video_points(
+                point_time - timedelta(hours=1), point_time + timedelta(hours=1), fields=("views", "score")
+            )
+
+            assert (point.video_id, point.time, point.views, point.score) == ("v1", point_time, 500, 3)
+            assert point.likes == 0
+            assert point.score_status is None
+            with pytest.raises(ValueError, match="Unknown video point fields"):
+                next(repo.iter_video_points(point_time, point_time, fields=("title",)))
+        finally:
+            repo.close()
+
+    def test_iter_skips_partially_appended_trailing_row(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "db_timeseries.csv"
+        repo = TimeSeriesRepository(str(csv_path))
+        point_time = datetime(2026, 3, 30, 12, tzinfo=UTC)
+        try:
+            repo.add_video_point(
+                VideoPoint(time=point_time, video_id="v1", views=1, likes=1, score=1, score_status=VideoScoreStatus.NEW)
+            )
+            with csv_path.open("ab") as handle:
+                handle.write(b"2026-03-30T13:00:00,Video visualizations,_tag_video_id,v2")
+
+            points = list(repo.iter_video_points(point_time - timedelta(hours=1), point_time + timedelta(hours=2)))
+
+            assert [point.video_id for point in points] == ["v1"]
+        finally:
+            repo.close()
+
+
+class TestVideoRecords:
+    def test_records_match_video_points(self, backend_repo: TimeSeriesRepository) -> None:
+        points = [make_point("v1", dt=datetime(2026, 3, 30, 10, tzinfo=UTC)), make_point("v2", views_growth=None)]
+        backend_repo.add_video_points(points)
+        start, end = datetime(2026, 3, 29, tzinfo=UTC), datetime(2026, 4, 1, tzinfo=UTC)
+
+        records = backend_repo.get_video_records_by_date_range(start, end)
+
+        assert [record.to_video_point() for record in records] == backend_repo.get_video_points_by_date_range(
+            start, end
+        )
+
+    def test_unscored_rows_read_back_without_status(self, backend_repo: TimeSeriesRepository) -> None:
+        point_time = datetime(2026, 3, 30, 12, tzinfo=UTC)
+        backend_repo.add_video_point(VideoPoint(time=point_time, video_id="v1", views=10, likes=1))
+
+        [record] = backend_repo.get_video_records_by_date_range(
+            point_time - timedelta(hours=1), point_time + timedelta(hours=1)
+        )
+
+        assert (record.video_id, record.views, record.score, record.score_status) == ("v1", 10, None, None)
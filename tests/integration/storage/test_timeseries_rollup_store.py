@@ -0,0 +1,58 @@
+"""Integration tests for TimeSeriesRollupStore."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import VideoRollup, VideoScoreStatus
+from src.infrastructure.storage.timeseries_rollup_store import TimeSeriesRollupStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TimeSeriesRollupStore:
+    return TimeSeriesRollupStore.for_timeseries_file(tmp_path / "db_timeseries.csv")
+
+
+def make_rollup(video_id: str, views: int = 1000) -> VideoRollup:
+    return VideoRollup(
+        video_id=video_id,
+        close_time=datetime(2026, 3, 31, 15, 0, 0, 123456, tzinfo=UTC),
+        views=views,
+        likes=10,
+        score=2,
+        score_status=VideoScoreStatus.UP,
+        views_growth_7d=300,
+    )
+
+
+def test_tables_live_next_to_timeseries_csv(store: TimeSeriesRollupStore, tmp_path: Path) -> None:
+    store.write_daily(date(2026, 3, 31), [make_rollup("v1")])
+    store.write_weekly(date(2026, 3, 31), [make_rollup("v1")])
+
+    assert (tmp_path / "db_timeseries.csv.rollups" / "daily" / "2026-03-31.json").is_file()
+    assert (tmp_path / "db_timeseries.csv.rollups" / "weekly" / "2026-W14.json").is_file()
+
+
+def test_round_trip_preserves_rollups(store: TimeSeriesRollupStore) -> None:
+    rollups = [make_rollup("v1", views=10), make_rollup("v2", views=20)]
+
+    store.write_daily(date(2026, 3, 31), rollups)
+
+    assert store.read_daily(date(2026, 3, 31)) == rollups
+
+
+def test_write_replaces_previous_table(store: TimeSeriesRollupStore) -> None:
+    store.write_weekly(date(2026, 3, 30), [make_rollup("v1"), make_rollup("v2")])
+    store.write_weekly(date(2026, 4, 5), [make_rollup("v3")])
+
+    assert [rollup.video_id for rollup in store.read_weekly(date(2026, 4, 1)) or []] == ["v3"]
+
+
+def test_missing_and_empty_tables_are_distinguished(store: TimeSeriesRollupStore) -> None:
+    store.write_daily(date(2026, 3, 31), [])
+
+    assert store.read_daily(date(2026, 3, 31)) == []
+    assert store.read_daily(date(2026, 3, 30)) is None
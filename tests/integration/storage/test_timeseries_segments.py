@@ -0,0 +1,71 @@
+"""Integration tests for time-partitioned timeseries segments."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import TimeSeriesSegmentPeriod
+from src.infrastructure.storage.timeseries_segments import (
+    TimeSeriesSegmentLayout,
+    segment_key,
+    segment_window,
+)
+
+
+class TestSegmentKeys:
+    @pytest.mark.parametrize(
+        ("period", "expected"),
+        [
+            (TimeSeriesSegmentPeriod.DAY, "2026-12-31"),
+            (TimeSeriesSegmentPeriod.WEEK, "2026-W53"),
+            (TimeSeriesSegmentPeriod.MONTH, "2026-12"),
+            (TimeSeriesSegmentPeriod.YEAR, "2026"),
+        ],
+    )
+    def test_key_uses_utc_time(self, period: TimeSeriesSegmentPeriod, expected: str) -> None:
+        moment = datetime.fromisoformat("2027-01-01T00:30:00+01:00")
+
+        assert segment_key(moment, period) == expected
+
+    def test_none_period_has_no_keys(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported segment period"):
+            segment_key(datetime(2026, 3, 1, tzinfo=UTC), TimeSeriesSegmentPeriod.NONE)
+
+    @pytest.mark.parametrize(
+        ("key", "start", "end"),
+        [
+            ("2026-03-31", datetime(2026, 3, 31, tzinfo=UTC), datetime(2026, 4, 1, tzinfo=UTC)),
+            ("2026-W14", datetime(2026, 3, 30, tzinfo=UTC), datetime(2026, 4, 6, tzinfo=UTC)),
+            ("2026-12", datetime(2026, 12, 1, tzinfo=UTC), datetime(2027, 1, 1, tzinfo=UTC)),
+            ("2026", datetime(2026, 1, 1, tzinfo=UTC), datetime(2027, 1, 1, tzinfo=UTC)),
+        ],
+    )
+    def test_window_round_trips_keys(self, key: str, start: datetime, end: datetime) -> None:
+        assert segment_window(key) == (start, end)
+
+    @pytest.mark.parametrize("key", ["2026-13", "notes", "2026-W99"])
+    def test_window_rejects_unknown_keys(self, key: str) -> None:
+        assert segment_window(key) is None
+
+
+class TestSegmentLayout:
+    def test_lists_segments_of_mixed_periods_in_window_order(self, tmp_path: Path) -> None:
+        layout = TimeSeriesSegmentLayout(tmp_path / "ts.csv", "Video visualizations", TimeSeriesSegmentPeriod.MONTH)
+        layout.directory.mkdir()
+        for name in ("2026-03.csv", "2026-02-10.csv", "2025.csv", "README.csv"):
+            (layout.directory / name).touch()
+
+        assert [segment.path.name for segment in layout.segments()] == ["2025.csv", "2026-02-10.csv", "2026-03.csv"]
+
+    def test_overlapping_prunes_segments_outside_the_window(self, tmp_path: Path) -> None:
+        layout = TimeSeriesSegmentLayout(tmp_path / "ts.csv", "Video visualizations", TimeSeriesSegmentPeriod.MONTH)
+        layout.directory.mkdir()
+        for name in ("2026-01.csv", "2026-02.csv", "2026-03.csv"):
+            (layout.directory / name).touch()
+
+        overlapping = layout.overlapping(datetime(2026, 2, 20, tzinfo=UTC), datetime(2026, 3, 1, tzinfo=UTC))
+
+        assert [segment.path.name for segment in overlapping] == ["2026-02.csv"]
@@ -0,0 +1,107 @@
+"""Integration tests for DailySnapshotStore."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.domain.models import VideoPoint, VideoPointRecord, VideoScoreStatus
+from src.infrastructure.storage.timeseries_snapshot_store import DailySnapshotStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> DailySnapshotStore:
+    return DailySnapshotStore.for_timeseries_file(tmp_path / "db_timeseries.csv")
+
+
+def make_point(video_id: str, views: int = 1000, score: int | None = 1) -> VideoPoint:
+    return VideoPoint(
+        time=datetime(2026, 3, 31, 15, 0, 0, 123456, tzinfo=UTC),
+        video_id=video_id,
+        views=views,
+        likes=10,
+        views_growth=200,
+        score=score,
+        score_status=VideoScoreStatus.UP,
+    )
+
+
+def test_snapshot_lives_next_to_timeseries_csv(store: DailySnapshotStore, tmp_path: Path) -> None:
+    store.write_day(date(2026, 3, 31), [make_point("v1")])
+
+    path = store.snapshot_path(date(2026, 3, 31))
+    assert path == tmp_path / "db_timeseries.csv.snapshots" / "2026-03-31.cols"
+    assert path.is_file()
+
+
+def test_round_trip_preserves_points(store: DailySnapshotStore) -> None:
+    points = [make_point("v1", views=10, score=2), make_point("v2", views=20, score=None)]
+    store.write_day(date(2026, 3, 31), points)
+
+    columns = store.read_day(date(2026, 3, 31))
+
+    assert columns is not None
+    assert columns.to_video_points() == points
+
+
+def test_columns_are_memory_mapped_and_dictionary_encoded(store: DailySnapshotStore) -> None:
+    store.write_day(date(2026, 3, 31), [make_point("v1"), make_point("v2"), make_point("v1")])
+
+    columns = store.read_day(date(2026, 3, 31))
+
+    assert columns is not None
+    assert isinstance(columns.views, np.memmap)
+    assert columns.video_ids == ("v1", "v2")
+    assert columns.video_codes.tolist() == [0, 1, 0]
+
+
+def test_write_day_appends_to_existing_snapshot(store: DailySnapshotStore) -> None:
+    store.write_day(date(2026, 3, 31), [make_point("v1")])
+    store.write_day(date(2026, 3, 31), [make_point("v2")])
+
+    columns = store.read_day(date(2026, 3, 31))
+
+    assert columns is not None
+    assert columns.video_id_array().tolist() == ["v1", "v2"]
+
+
+def test_read_day_returns_none_when_missing(store: DailySnapshotStore) -> None:
+    assert store.read_day(date(2026, 1, 1)) is None
+
+
+def test_read_day_returns_none_for_corrupt_file(store: DailySnapshotStore) -> None:
+    path = store.snapshot_path(date(2026, 3, 31))
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a snapshot")
+
+    assert store.read_day(date(2026, 3, 31)) is None
+
+
+def test_rank_day_ranks_against_baseline_snapshot(store: DailySnapshotStore) -> None:
+    store.write_day(date(2026, 3, 30), [make_point("v1", views=100), make_point("v2", views=100)])
+    store.write_day(date(2026, 3, 31), [make_point("v1", views=150), make_point("v2", views=400)])
+
+    ranked = store.rank_day(date(2026, 3, 31), date(2026, 3, 30), baseline=None, limit=1)
+
+    assert ranked is not None
+    assert [(record.video_id, record.views_growth) for record in ranked] == [("v2", 300)]
+
+
+def test_rank_day_prefers_given_baseline_records(store: DailySnapshotStore) -> None:
+    store.write_day(date(2026, 3, 31), [make_point("v1", views=150)])
+    baseline = [VideoPointRecord(time=datetime(2026, 3, 30, tzinfo=UTC), video_id="v1", views=150, likes=1)]
+
+    ranked = store.rank_day(date(2026, 3, 31), date(2026, 3, 30), baseline=baseline, limit=5)
+
+    assert ranked is not None
+    assert [(record.video_id, record.views_growth) for record in ranked] == [("v1", 0)]
+
+
+def test_rank_day_returns_none_without_snapshots(store: DailySnapshotStore) -> None:
+    store.write_day(date(2026, 3, 31), [make_point("v1")])
+
+    assert store.rank_day(date(2026, 4, 1), date(2026, 3, 31), baseline=None, limit=5) is None
+    assert store.rank_day(date(2026, 3, 31), date(2026, 3, 30), baseline=None, limit=5) is None
@@ -0,0 +1,116 @@
+"""Integration tests for BufferedJSONStorage."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from tinydb import TinyDB
+
+from src.infrastructure.storage.tinydb_storage import BufferedJSONStorage
+from src.shared import json_codec
+from src.shared.atomic_storage import AtomicFileStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_unbuffered_writes_replace_file_atomically(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    db.table("items").insert({"name": "a"})
+
+    assert json.loads((tmp_path / "db.json").read_text(encoding="utf-8")) == {"items": {"1": {"name": "a"}}}
+    assert not list(tmp_path.glob(".db.json.*.tmp"))
+
+
+def test_buffered_block_writes_file_once(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    table = db.table("items")
+
+    write_json = AtomicFileStorage.write_json
+    with patch.object(AtomicFileStorage, "write_json", autospec=True, side_effect=write_json) as write:
+        with db.storage.buffered():
+            table.insert({"name": "a"})
+            with db.storage.buffered():
+                table.insert({"name": "b"})
+            assert (tmp_path / "db.json").read_text(encoding="utf-8") == ""
+            assert [item["name"] for item in table.all()] == ["a", "b"]
+        assert write.call_count == 1
+
+    reopened = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    assert [item["name"] for item in reopened.table("items").all()] == ["a", "b"]
+
+
+def test_buffered_writes_are_discarded_when_block_raises(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    table = db.table("items")
+    table.insert({"name": "kept"})
+
+    def insert_then_fail() -> None:
+        with db.storage.buffered():
+            table.insert({"name": "lost"})
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        insert_then_fail()
+
+    assert [item["name"] for item in table.all()] == ["kept"]
+
+
+def test_writes_compact_json(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    db.table("items").insert({"name": "ñ"})
+
+    assert (tmp_path / "db.json").read_text(encoding="utf-8") == '{"items":{"1":{"name":"ñ"}}}'
+
+
+def test_unchanged_file_is_decoded_once_across_instances(tmp_path: Path) -> None:
+    TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage).table("items").insert({"name": "a"})
+
+    with patch.object(json_codec, "loads", side_effect=json_codec.loads) as loads:
+        for _ in range(3):
+            db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+            assert [item["name"] for item in db.table("items").all()] == ["a"]
+
+    assert loads.call_count == 0
+
+
+def test_cached_reads_see_replacements_by_other_writers(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    db.table("items").insert({"name": "a"})
+
+    AtomicFileStorage(str(tmp_path / "db.json")).write_json({"items": {"1": {"name": "b"}}})
+
+    assert [item["name"] for item in db.table("items").all()] == ["b"]
+
+
+def test_reads_return_private_copies(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    db.table("items").insert({"name": "a"})
+
+    data = db.storage.read()
+    assert data is not None
+    data["items"]["1"]["name"] = "mutated"
+    data["items"]["2"] = {"name": "added"}
+
+    assert db.storage.read() == {"items": {"1": {"name": "a"}}}
+
+
+def test_write_back_holds_writes_until_flush_or_close(tmp_path: Path) -> None:
+    db = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage, write_back=True)
+    table = db.table("items")
+
+    write_json = AtomicFileStorage.write_json
+    with patch.object(AtomicFileStorage, "write_json", autospec=True, side_effect=write_json) as write:
+        table.insert({"name": "a"})
+        table.insert({"name": "b"})
+        assert (tmp_path / "db.json").read_text(encoding="utf-8") == ""
+        db.storage.flush()
+        table.insert({"name": "c"})
+        db.close()
+
+    assert write.call_count == 2
+    reopened = TinyDB(str(tmp_path / "db.json"), storage=BufferedJSONStorage)
+    assert [item["name"] for item in reopened.table("items").all()] == ["a", "b", "c"]
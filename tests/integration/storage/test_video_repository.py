@@ -1,18 +1,42 @@
-"""Integration tests for VideoRepository."""
+"""Integration tests for VideoRepository, run against both storage backends."""
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
+from tinydb.table import Table
 
 from src.domain.models import CanonicalVideo
+from src.infrastructure.storage import video_text_index
+from src.infrastructure.storage.sqlite_video_repository import SqliteVideoRepository
 from src.infrastructure.storage.video_repository import VideoRepository
+from src.infrastructure.storage.video_text_index import VideoTextIndex
+from src.shared.atomic_storage import AtomicFileStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture(params=["files", "sqlite"])
+def make_repo(request: pytest.FixtureRequest, tmp_path: Path) -> Callable[[], VideoRepository]:
+    """Fixture: opens repositories of one backend on the same temporary database."""
+    if request.param == "sqlite":
+        return lambda: SqliteVideoRepository(str(tmp_path / "test.sqlite3"))
+    return lambda: VideoRepository(db_path=tmp_path / "test.db")
 
 
 @pytest.fixture
-def repo(tmp_path: Path) -> VideoRepository:
-    """Fixture: fresh VideoRepository with temporary database."""
+def repo(make_repo: Callable[[], VideoRepository]) -> VideoRepository:
+    """Fixture: fresh repository with temporary database."""
+    return make_repo()
+
+
+@pytest.fixture
+def files_repo(tmp_path: Path) -> VideoRepository:
+    """Fixture: fresh TinyDB-backed VideoRepository, for tests of the files backend internals."""
     return VideoRepository(db_path=tmp_path / "test.db")
 
 
@@ -175,3 +199,209 @@ class TestVideoRepositoryDataIntegrity:
         assert result.likes == original.likes
         assert result.description == original.description
         assert result.duration_seconds == original.duration_seconds
+
+
+class TestVideoRepositoryGetMany:
+    """Tests for batched lookups."""
+
+    def test_get_many_returns_found_videos(self, repo: VideoRepository) -> None:
+        """Known IDs are returned keyed by video_id; unknown IDs are left out."""
+        for video_id in ("v1", "v2", "v3"):
+            repo.upsert(make_video(video_id, title=f"Song {video_id}"))
+
+        result = repo.get_many(["v3", "missing", "v1", "v3"])
+
+        assert {video_id: video.title for video_id, video in result.items()} == {"v3": "Song v3", "v1": "Song v1"}
+
+    def test_get_many_without_matches_is_empty(self, repo: VideoRepository) -> None:
+        """No lookup result for unknown IDs or an empty request."""
+        assert repo.get_many([]) == {}
+        assert repo.get_many(["missing"]) == {}
+
+
+class TestVideoRepositoryIndex:
+    """Tests for the in-memory video_id → doc_id index."""
+
+    def test_lookups_and_upserts_do_not_scan_the_table(self, files_repo: VideoRepository) -> None:
+        """get/upsert/delete should address documents by doc_id, never by query."""
+        files_repo.upsert(make_video("v1", title="Original Title"))
+
+        with patch.object(Table, "search", side_effect=AssertionError("table scan")):
+            files_repo.upsert(make_video("v1", title="Updated Title"))
+            result = files_repo.get("v1")
+            deleted = files_repo.delete("v1")
+
+        assert result is not None
+        assert result.title == "Updated Title"
+        assert deleted == 1
+        assert files_repo.all() == []
+
+    def test_index_is_built_on_open(self, make_repo: Callable[[], VideoRepository]) -> None:
+        """A reopened repository should find videos written before."""
+        make_repo().upsert(make_video("v1"))
+
+        reopened = make_repo()
+
+        assert reopened.get("v1") is not None
+
+    def test_index_follows_writes_from_other_instances(self, make_repo: Callable[[], VideoRepository]) -> None:
+        """Writes by another process on the same file should be picked up."""
+        reader = make_repo()
+        writer = make_repo()
+        assert reader.get("v1") is None
+
+        writer.upsert(make_video("v1", title="From Writer"))
+        result = reader.get("v1")
+        assert result is not None
+        assert result.title == "From Writer"
+
+        writer.delete("v1")
+        assert reader.get("v1") is None
+
+        reader.upsert(make_video("v1", title="Reinserted"))
+        assert len(writer.all()) == 1
+
+    def test_index_is_shared_by_repositories_of_the_process(self, tmp_path: Path) -> None:
+        """Reopening an unchanged file should reuse the index instead of scanning the table."""
+        first = VideoRepository(db_path=tmp_path / "test.db")
+        first.upsert(make_video("v1"))
+
+        with patch.object(Table, "all", side_effect=AssertionError("table scan")):
+            second = VideoRepository(db_path=tmp_path / "test.db")
+            assert second.get("v1") is not None
+            second.upsert(make_video("v2"))
+            assert first.get("v2") is not None
+            assert VideoRepository(db_path=tmp_path / "test.db").get("v2") is not None
+
+
+class TestVideoRepositoryUpsertMany:
+    """Tests for bulk upserts."""
+
+    def test_upsert_many_writes_file_once(self, files_repo: VideoRepository, tmp_path: Path) -> None:
+        """All videos should be persisted by a single atomic write."""
+        files_repo.upsert(make_video("v1", title="Original Title"))
+
+        with patch.object(
+            AtomicFileStorage, "write_json", autospec=True, side_effect=AtomicFileStorage.write_json
+        ) as write:
+            written = files_repo.upsert_many(
+                [make_video("v1", title="Updated Title"), make_video("v2"), make_video("v3")]
+            )
+
+        assert written == 3
+        db_writes = [call for call in write.call_args_list if call.args[0].file_path.name == "test.db"]
+        assert len(db_writes) == 1
+        reopened = VideoRepository(db_path=tmp_path / "test.db")
+        assert len(reopened.all()) == 3
+        updated = reopened.get("v1")
+        assert updated is not None
+        assert updated.title == "Updated Title"
+
+
+class TestVideoRepositoryWriteBack:
+    """Tests for the opt-in write-back mode of the TinyDB backend."""
+
+    def test_writes_reach_the_file_on_close(self, tmp_path: Path) -> None:
+        """Upserts should stay in memory, readable by the repository, until close()."""
+        repo = VideoRepository(db_path=tmp_path / "test.db", write_back=True)
+        repo.upsert(make_video("v1"))
+        repo.upsert(make_video("v2"))
+
+        assert repo.get("v2") is not None
+        assert VideoRepository(db_path=tmp_path / "test.db").all() == []
+
+        repo.close()
+
+        assert [video.video_id for video in VideoRepository(db_path=tmp_path / "test.db").all()] == ["v1", "v2"]
+
+
+class TestVideoRepositorySearchText:
+    """Tests for the indexed full-text search over title, channel and hashtags."""
+
+    @staticmethod
+    def _ids(videos: list[CanonicalVideo]) -> list[str]:
+        return [video.video_id for video in videos]
+
+    def test_title_matches_rank_above_channel_matches(self, repo: VideoRepository) -> None:
+        """A word in the title should outrank the same word in the channel name."""
+        repo.upsert(CanonicalVideo(video_id="v1", title="Other", channel_name="Rosalia Official", views=1))
+        repo.upsert(CanonicalVideo(video_id="v2", title="Rosalia - Despechá", channel_name="Label", views=1))
+        repo.upsert(CanonicalVideo(video_id="v3", title="Unrelated", channel_name="Nobody", views=1))
+
+        assert self._ids(repo.search_text("rosalia")) == ["v2", "v1"]
+
+    def test_matches_prefixes_and_ignores_accents(self, repo: VideoRepository) -> None:
+        """Queries should match word prefixes, case- and accent-insensitively."""
+        repo.upsert(make_video("v1", title="Canción del Verano"))
+
+        assert self._ids(repo.search_text("CANCION")) == ["v1"]
+        assert self._ids(repo.search_text("verán")) == ["v1"]
+
+    def test_matches_hashtags_from_description(self, repo: VideoRepository) -> None:
+        """Hashtags in the description should be searchable."""
+        repo.upsert(
+            CanonicalVideo(video_id="v1", title="Song", channel_name="Artist", views=1, description="New! #reggaeton")
+        )
+
+        assert self._ids(repo.search_text("reggaeton")) == ["v1"]
+
+    def test_requires_every_query_word(self, repo: VideoRepository) -> None:
+        """Only videos matching all query words should be returned."""
+        repo.upsert(make_video("v1", title="Blue Moon"))
+        repo.upsert(make_video("v2", title="Blue Sky"))
+
+        assert self._ids(repo.search_text("blue sky")) == ["v2"]
+        assert repo.search_text("blue rain") == []
+        assert repo.search_text("  !! ") == []
+
+    def test_follows_updates_and_deletes(self, repo: VideoRepository) -> None:
+        """Updated titles should be reindexed and deleted videos dropped."""
+        repo.upsert(make_video("v1", title="Old Title"))
+        repo.upsert(make_video("v2", title="Old Title"))
+        repo.upsert(make_video("v1", title="New Title"))
+        repo.delete("v2")
+
+        assert repo.search_text("old") == []
+        assert self._ids(repo.search_text("new")) == ["v1"]
+
+    def test_respects_limit(self, repo: VideoRepository) -> None:
+        """Results should be capped at ``limit``, ties ordered by video_id."""
+        repo.upsert_many([make_video(f"v{i}", title="Same Song") for i in range(5)])
+
+        assert self._ids(repo.search_text("song", limit=2)) == ["v0", "v1"]
+
+    def test_index_is_persisted_and_reused(self, tmp_path: Path) -> None:
+        """A reopened repository should load the sidecar index instead of scanning the table."""
+        VideoRepository(db_path=tmp_path / "test.db").upsert(make_video("v1", title="Persisted"))
+        assert (tmp_path / "test.db.search.json").exists()
+
+        with patch(
+            "src.infrastructure.storage.video_text_index.VideoTextIndex.from_documents",
+            side_effect=AssertionError("index rebuilt"),
+        ):
+            assert self._ids(VideoRepository(db_path=tmp_path / "test.db").search_text("persist")) == ["v1"]
+
+    def test_stale_sidecar_is_rebuilt(self, tmp_path: Path) -> None:
+        """Writes that bypassed the index (another tool edited the file) should trigger a rebuild."""
+        VideoRepository(db_path=tmp_path / "test.db").upsert(make_video("v1", title="First"))
+        (tmp_path / "test.db.search.json").write_text('{"version": 1, "stamp": [0, 0, 0], "documents": {}}')
+
+        assert self._ids(VideoRepository(db_path=tmp_path / "test.db").search_text("first")) == ["v1"]
+
+    def test_later_saves_append_to_the_sidecar_journal(self, tmp_path: Path) -> None:
+        """Once persisted, single-video changes should be journaled instead of rewriting the sidecar."""
+        repo = VideoRepository(db_path=tmp_path / "test.db")
+        repo.upsert(make_video("v1", title="First"))
+        snapshot = (tmp_path / "test.db.search.json").read_bytes()
+
+        repo.upsert(make_video("v2", title="Second"))
+        repo.delete("v1")
+
+        assert (tmp_path / "test.db.search.json").read_bytes() == snapshot
+        with (
+            patch.dict(video_text_index._shared_indexes, clear=True),
+            patch.object(VideoTextIndex, "from_documents", side_effect=AssertionError("index rebuilt")),
+        ):
+            reopened = VideoRepository(db_path=tmp_path / "test.db")
+            assert self._ids(reopened.search_text("second")) == ["v2"]
+            assert reopened.search_text("first") == []
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, create_autospec
+from unittest.mock import AsyncMock, MagicMock, create_autospec
 
 import pytest
 
 from src.adapters.youtube_source import YouTubeSource
 from src.application.fetch_data_use_case import FetchDataUseCase
-from src.config.settings import AppSettings
+from src.config.settings import AppSettings, StorageBackend, TimeSeriesSegmentPeriod
 from src.domain.models import CanonicalVideo, VideoPoint
 from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
 from src.infrastructure.storage.video_repository import VideoRepository
@@ -37,23 +37,52 @@ def mock_settings() -> AppSettings:
     settings.db_data_file = "test_db.json"
     settings.db_video_file = "test_video_db.json"
     settings.db_timeseries_file = "test_ts.csv"
+    settings.storage_backend = StorageBackend.FILES
+    settings.timeseries_segment_period = TimeSeriesSegmentPeriod.NONE
     settings.yt_search_region_code = "IN"
     settings.scheduler_lock_file = "/tmp/test.lock"
     return settings
 
 
+@pytest.fixture
+def mock_snapshot_store() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_timeseries_export() -> MagicMock:
+    export = MagicMock()
+    export.exists.return_value = True
+    export.get_last_timestamp.return_value = None
+    return export
+
+
+@pytest.fixture(autouse=True)
+def mock_materialize_rollups(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    use_case_class = MagicMock()
+    monkeypatch.setattr("src.application.fetch_data_use_case.MaterializeRollupsUseCase", use_case_class)
+    return use_case_class
+
+
 @pytest.fixture
 def fetch_data_use_case(
     mock_youtube_source: YouTubeSource,
     mock_video_repo: VideoRepository,
     mock_timeseries_repo: TimeSeriesRepository,
     mock_settings: AppSettings,
+    mock_snapshot_store: MagicMock,
+    mock_timeseries_export: MagicMock,
 ) -> FetchDataUseCase:
+    rollup_store = MagicMock()
     return FetchDataUseCase(
         youtube_source=mock_youtube_source,
         video_repo=mock_video_repo,
         timeseries_repo=mock_timeseries_repo,
         settings=mock_settings,
+        snapshot_writer=mock_snapshot_store,
+        rollup_reader=rollup_store,
+        rollup_writer=rollup_store,
+        timeseries_export=mock_timeseries_export,
     )
 
 
@@ -65,30 +94,23 @@ class TestFetchDataUseCase:
         self,
         fetch_data_use_case: FetchDataUseCase,
         mock_youtube_source: YouTubeSource,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that execute returns video points and calls dependencies correctly."""
         points_added: list[VideoPoint] = []
 
         class _TimeseriesRepoStub:
-            def __init__(self, _path: str) -> None:
-                return
-
             def get_last_timestamp(self) -> None:
                 return None
 
             def get_video_points_by_date_range(self, _from_dt: datetime, _until_dt: datetime) -> list:
                 return []
 
-            def add_video_point(self, video_point: VideoPoint) -> None:
-                points_added.append(video_point)
+            def add_video_points(self, video_points: list[VideoPoint]) -> None:
+                points_added.extend(video_points)
 
         class _VideoRepoStub:
-            def __init__(self, _path: str) -> None:
-                return
-
-            def upsert(self, _video: CanonicalVideo) -> None:
-                return
+            def upsert_many(self, videos: list[CanonicalVideo]) -> int:
+                return len(videos)
 
         canonical = CanonicalVideo(
             video_id="test123",
@@ -103,8 +125,8 @@ class TestFetchDataUseCase:
         mock_youtube_source.fetch_trending_videos = AsyncMock(return_value=[SimpleNamespace(video_id="test123")])
         mock_youtube_source.fetch_video_details_batch = AsyncMock(return_value=[canonical])
 
-        monkeypatch.setattr("src.application.fetch_data_use_case.TimeSeriesRepository", _TimeseriesRepoStub)
-        monkeypatch.setattr("src.application.fetch_data_use_case.VideoRepository", _VideoRepoStub)
+        fetch_data_use_case.timeseries_repo = _TimeseriesRepoStub()
+        fetch_data_use_case.video_repo = _VideoRepoStub()
 
         # Execute
         result = await fetch_data_use_case.execute()
@@ -119,6 +141,87 @@ class TestFetchDataUseCase:
         assert all(point.score is not None and point.score >= 1 for point in result)
         assert all(point.views_growth is not None and point.views_growth > 0 for point in result)
 
+    @pytest.mark.asyncio
+    async def test_execute_writes_daily_snapshot_and_rollups_of_scored_points(
+        self,
+        fetch_data_use_case: FetchDataUseCase,
+        mock_youtube_source: YouTubeSource,
+        mock_snapshot_store: MagicMock,
+        mock_materialize_rollups: MagicMock,
+        mock_timeseries_export: MagicMock,
+    ) -> None:
+        class _TimeseriesRepoStub:
+            def get_last_timestamp(self) -> None:
+                return None
+
+            def add_video_points(self, video_points: list[VideoPoint]) -> None:
+                points_added.extend(video_points)
+
+        class _VideoRepoStub:
+            def upsert_many(self, videos: list[CanonicalVideo]) -> int:
+                return len(videos)
+
+        points_added: list[VideoPoint] = []
+        canonical = CanonicalVideo(video_id="snap123", title="Snap", channel_name="Channel", views=10, likes=1)
+        mock_youtube_source.fetch_trending_videos = AsyncMock(return_value=[SimpleNamespace(video_id="snap123")])
+        mock_youtube_source.fetch_video_details_batch = AsyncMock(return_value=[canonical])
+        fetch_data_use_case.timeseries_repo = _TimeseriesRepoStub()
+        fetch_data_use_case.video_repo = _VideoRepoStub()
+
+        result = await fetch_data_use_case.execute()
+
+        assert points_added == result
+        mock_snapshot_store.write_day.assert_called_once_with(result[0].time.date(), result)
+        mock_materialize_rollups.return_value.execute.assert_called_once_with(result[0].time.date())
+        mock_timeseries_export.append.assert_called_once_with(result)
+
+    @pytest.mark.asyncio
+    async def test_execute_rebuilds_export_behind_the_timeseries(
+        self,
+        fetch_data_use_case: FetchDataUseCase,
+        mock_youtube_source: YouTubeSource,
+        mock_timeseries_repo: TimeSeriesRepository,
+        mock_timeseries_export: MagicMock,
+    ) -> None:
+        """An export that does not end at the timeseries watermark missed a batch and is rebuilt."""
+        watermark = datetime.now(UTC) - timedelta(days=2)
+        canonical = CanonicalVideo(video_id="gap123", title="Gap", channel_name="Channel", views=10, likes=1)
+        mock_youtube_source.fetch_trending_videos = AsyncMock(return_value=[SimpleNamespace(video_id="gap123")])
+        mock_youtube_source.fetch_video_details_batch = AsyncMock(return_value=[canonical])
+        mock_timeseries_repo.get_last_timestamp.return_value = watermark
+        mock_timeseries_repo.get_video_points_by_date_range.return_value = []
+        mock_timeseries_export.get_last_timestamp.return_value = watermark - timedelta(days=1)
+
+        await fetch_data_use_case.execute()
+
+        mock_timeseries_export.append.assert_not_called()
+        mock_timeseries_export.rebuild_from.assert_called_once_with(mock_timeseries_repo)
+
+    @pytest.mark.asyncio
+    async def test_execute_skips_derived_stores_left_out(
+        self,
+        mock_youtube_source: YouTubeSource,
+        mock_timeseries_repo: TimeSeriesRepository,
+        mock_settings: AppSettings,
+        mock_materialize_rollups: MagicMock,
+    ) -> None:
+        """The SQLite backend has no snapshot, rollup or export files: only the timeseries is written."""
+        canonical = CanonicalVideo(video_id="sql123", title="Sql", channel_name="Channel", views=10, likes=1)
+        mock_youtube_source.fetch_trending_videos = AsyncMock(return_value=[SimpleNamespace(video_id="sql123")])
+        mock_youtube_source.fetch_video_details_batch = AsyncMock(return_value=[canonical])
+        mock_timeseries_repo.get_last_timestamp.return_value = None
+        use_case = FetchDataUseCase(
+            youtube_source=mock_youtube_source,
+            video_repo=MagicMock(),
+            timeseries_repo=mock_timeseries_repo,
+            settings=mock_settings,
+        )
+
+        result = await use_case.execute()
+
+        mock_timeseries_repo.add_video_points.assert_called_once_with(result)
+        mock_materialize_rollups.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_respects_time_window(
         self,
@@ -139,29 +242,23 @@ class TestFetchDataUseCase:
         same_day_time = datetime(2026, 6, 2, 9, 0, 0, tzinfo=UTC)
 
         class _TimeseriesRepoStub:
-            def __init__(self, _path: str) -> None:
-                return
-
             def get_last_timestamp(self) -> datetime:
                 return same_day_time
 
             def get_video_points_by_date_range(self, _from_dt: datetime, _until_dt: datetime) -> list:
                 return []
 
-            def add_video_point(self, _video_point: object) -> None:
+            def add_video_points(self, _video_points: object) -> None:
                 return
 
         class _VideoRepoStub:
-            def __init__(self, _path: str) -> None:
-                return
-
-            def upsert(self, _video: CanonicalVideo) -> None:
-                return
+            def upsert_many(self, videos: list[CanonicalVideo]) -> int:
+                return len(videos)
 
         fetch_data_use_case.youtube_source.fetch_trending_videos = AsyncMock()
 
-        monkeypatch.setattr("src.application.fetch_data_use_case.TimeSeriesRepository", _TimeseriesRepoStub)
-        monkeypatch.setattr("src.application.fetch_data_use_case.VideoRepository", _VideoRepoStub)
+        fetch_data_use_case.timeseries_repo = _TimeseriesRepoStub()
+        fetch_data_use_case.video_repo = _VideoRepoStub()
 
         # Execute
         result = await fetch_data_use_case.execute()
@@ -174,33 +271,24 @@ class TestFetchDataUseCase:
     async def test_execute_force_fetch_bypasses_time_window(
         self,
         mock_youtube_source: YouTubeSource,
-        mock_video_repo: VideoRepository,
-        mock_timeseries_repo: TimeSeriesRepository,
         mock_settings: AppSettings,
-        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         recent_time = datetime.now(UTC) - timedelta(hours=1)
         points_added: list[VideoPoint] = []
 
         class _TimeseriesRepoStub:
-            def __init__(self, _path: str) -> None:
-                return
-
             def get_last_timestamp(self) -> datetime:
                 return recent_time
 
             def get_video_points_by_date_range(self, _from_dt: datetime, _until_dt: datetime) -> list:
                 return []
 
-            def add_video_point(self, video_point: VideoPoint) -> None:
-                points_added.append(video_point)
+            def add_video_points(self, video_points: list[VideoPoint]) -> None:
+                points_added.extend(video_points)
 
         class _VideoRepoStub:
-            def __init__(self, _path: str) -> None:
-                return
-
-            def upsert(self, _video: CanonicalVideo) -> None:
-                return
+            def upsert_many(self, videos: list[CanonicalVideo]) -> int:
+                return len(videos)
 
         canonical = CanonicalVideo(
             video_id="forced123",
@@ -215,13 +303,10 @@ class TestFetchDataUseCase:
         mock_youtube_source.fetch_trending_videos = AsyncMock(return_value=[SimpleNamespace(video_id="forced123")])
         mock_youtube_source.fetch_video_details_batch = AsyncMock(return_value=[canonical])
 
-        monkeypatch.setattr("src.application.fetch_data_use_case.TimeSeriesRepository", _TimeseriesRepoStub)
-        monkeypatch.setattr("src.application.fetch_data_use_case.VideoRepository", _VideoRepoStub)
-
         use_case = FetchDataUseCase(
             youtube_source=mock_youtube_source,
-            video_repo=mock_video_repo,
-            timeseries_repo=mock_timeseries_repo,
+            video_repo=_VideoRepoStub(),
+            timeseries_repo=_TimeseriesRepoStub(),
             settings=mock_settings,
             force_fetch=True,
         )
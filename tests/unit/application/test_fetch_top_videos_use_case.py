@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, date, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -12,8 +12,17 @@ from src.application.fetch_top_videos_use_case import (
     FetchTopVideosUseCase,
 )
 from src.domain.exceptions import ScoringError
-from src.domain.models import CanonicalVideo, Channel, TimeseriesRange, VideoPoint, VideoScoreStatus
-from src.domain.ports import TimeSeriesReader, VideoMetadataReader
+from src.domain.models import (
+    CanonicalVideo,
+    Channel,
+    TimeseriesRange,
+    VideoPoint,
+    VideoPointRecord,
+    VideoRollup,
+    VideoScoreStatus,
+)
+from src.domain.ports import DailySnapshotReader, TimeSeriesReader, TimeSeriesRollupReader, VideoMetadataReader
+from src.domain.services.scoring_service import score_and_rank_video_records
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -47,6 +56,18 @@ def make_video_point(
     )
 
 
+def to_record(point: VideoPoint) -> VideoPointRecord:
+    return VideoPointRecord(
+        time=point.time,
+        video_id=point.video_id,
+        views=point.views,
+        likes=point.likes,
+        views_growth=point.views_growth,
+        score=point.score,
+        score_status=point.score_status,
+    )
+
+
 def make_canonical_video(
     video_id: str,
     title: str = "Test Song",
@@ -76,14 +97,14 @@ def make_repo(
     mock = MagicMock(spec=TimeSeriesReader)
     call_count: list[int] = [0]
 
-    def side_effect(start_time: datetime, end_time: datetime) -> list[VideoPoint]:
+    def side_effect(start_time: datetime, end_time: datetime) -> list[VideoPointRecord]:
         call_count[0] += 1
         # First call = previous period (baseline); second = current period
         if call_count[0] == 1:
-            return previous_points if previous_points is not None else []
-        return current_points
+            return [to_record(point) for point in previous_points or []]
+        return [to_record(point) for point in current_points]
 
-    mock.get_video_points_by_date_range.side_effect = side_effect
+    mock.get_video_records_by_date_range.side_effect = side_effect
     return mock
 
 
@@ -91,6 +112,46 @@ def make_video_repo(videos: list[CanonicalVideo] | None = None) -> VideoMetadata
     mock = MagicMock(spec=VideoMetadataReader)
     by_video_id = {video.video_id: video for video in videos or []}
     mock.get.side_effect = lambda video_id: by_video_id.get(video_id)
+    mock.get_many.side_effect = lambda video_ids: {
+        video_id: by_video_id[video_id] for video_id in video_ids if video_id in by_video_id
+    }
+    return mock
+
+
+def make_snapshot_reader(snapshots: dict[date, list[VideoPoint]]) -> DailySnapshotReader:
+    """Returns a mock DailySnapshotReader ranking the given day snapshots like the columnar store."""
+    mock = MagicMock(spec=DailySnapshotReader)
+
+    def rank_day(
+        day: date, baseline_day: date, *, baseline: list[VideoPointRecord] | None, limit: int
+    ) -> list[VideoPointRecord] | None:
+        if not snapshots.get(day):
+            return None
+        if baseline is None and baseline_day not in snapshots:
+            return None
+        previous = baseline if baseline is not None else [to_record(point) for point in snapshots[baseline_day]]
+        return score_and_rank_video_records([to_record(point) for point in snapshots[day]], previous)[:limit]
+
+    mock.rank_day.side_effect = rank_day
+    return mock
+
+
+def make_rollup_reader(closes: dict[date, list[VideoPoint]]) -> TimeSeriesRollupReader:
+    mock = MagicMock(spec=TimeSeriesRollupReader)
+    mock.read_daily.side_effect = lambda day: (
+        [
+            VideoRollup(
+                video_id=point.video_id,
+                close_time=point.time,
+                views=point.views,
+                likes=point.likes,
+                score=point.score,
+            )
+            for point in closes[day]
+        ]
+        if day in closes
+        else None
+    )
     return mock
 
 
@@ -196,7 +257,7 @@ class TestFetchTopVideosUseCase:
 
         await use_case.execute(FetchTopVideosRequest(timeseries_range=TimeseriesRange.WEEKLY, day=date(2026, 3, 30)))
 
-        assert repo.get_video_points_by_date_range.call_count == 2
+        assert repo.get_video_records_by_date_range.call_count == 2
 
     async def test_hydrates_video_metadata_from_repository(self) -> None:
         current = [make_video_point("v1", views=5000)]
@@ -227,17 +288,21 @@ class TestFetchTopVideosUseCase:
         assert video.channel.name == "Hydrated Channel"
         assert video.duration == 182
 
-    async def test_keeps_existing_metadata_when_repository_is_missing_video(self) -> None:
-        current = [
-            make_video_point(
-                "v1",
-                views=5000,
-                title="Existing Title",
-                description="Existing Description",
-                channel=Channel(name="Existing Channel"),
-                duration=123,
-            )
-        ]
+    async def test_hydrates_top_n_with_a_single_lookup(self) -> None:
+        current = [make_video_point(f"v{i}", views=i * 100) for i in range(10)]
+        video_repo = make_video_repo([make_canonical_video(f"v{i}", title=f"Song {i}") for i in range(10)])
+        use_case = FetchTopVideosUseCase(make_repo(current), video_repo)
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.DAILY, day=date(2026, 3, 30), limit=3)
+        )
+
+        assert [video.title for video in result.videos] == ["Song 9", "Song 8", "Song 7"]
+        video_repo.get_many.assert_called_once()
+        video_repo.get.assert_not_called()
+
+    async def test_returns_ranking_row_when_repository_is_missing_video(self) -> None:
+        current = [make_video_point("v1", views=5000)]
         repo = make_repo(current)
         use_case = FetchTopVideosUseCase(repo, make_video_repo([]))
 
@@ -247,8 +312,109 @@ class TestFetchTopVideosUseCase:
 
         assert result.video_count == 1
         video = result.videos[0]
-        assert video.title == "Existing Title"
-        assert video.description == "Existing Description"
-        assert video.channel is not None
-        assert video.channel.name == "Existing Channel"
-        assert video.duration == 123
+        assert (video.video_id, video.views, video.score) == ("v1", 5000, 1)
+        assert video.title is None
+        assert video.channel is None
+
+    async def test_only_top_n_timeseries_records_are_converted(self) -> None:
+        current = [make_video_point(f"v{i}", views=i * 100) for i in range(20)]
+        use_case = FetchTopVideosUseCase(make_repo(current), make_video_repo())
+
+        convert = VideoPointRecord.to_video_point
+
+        with patch.object(VideoPointRecord, "to_video_point", autospec=True, side_effect=convert) as to_video_point:
+            result = await use_case.execute(
+                FetchTopVideosRequest(timeseries_range=TimeseriesRange.DAILY, day=date(2026, 3, 30), limit=3)
+            )
+
+        assert [video.video_id for video in result.videos] == ["v19", "v18", "v17"]
+        assert to_video_point.call_count == 3
+
+
+class TestFetchTopVideosFromSnapshots:
+    async def test_ranks_from_snapshots_without_reading_timeseries(self) -> None:
+        previous = [make_video_point("v1", views=1000, score=1), make_video_point("v2", views=500, score=2)]
+        current = [make_video_point("v1", views=1200), make_video_point("v2", views=1500)]
+        repo = make_repo([])
+        snapshots = make_snapshot_reader({date(2026, 3, 23): previous, date(2026, 3, 30): current})
+        use_case = FetchTopVideosUseCase(repo, make_video_repo(), snapshots)
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.WEEKLY, day=date(2026, 3, 30))
+        )
+
+        assert [video.video_id for video in result.videos] == ["v2", "v1"]
+        assert result.videos[0].score_status == VideoScoreStatus.UP
+        assert result.videos[1].score_status == VideoScoreStatus.DOWN
+        repo.get_video_records_by_date_range.assert_not_called()
+
+    async def test_only_top_n_rows_are_materialized(self) -> None:
+        current = [make_video_point(f"v{i}", views=i * 100) for i in range(20)]
+        snapshots = make_snapshot_reader({date(2026, 3, 29): [], date(2026, 3, 30): current})
+        use_case = FetchTopVideosUseCase(make_repo([]), make_video_repo(), snapshots)
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.DAILY, day=date(2026, 3, 30), limit=3)
+        )
+
+        assert [video.video_id for video in result.videos] == ["v19", "v18", "v17"]
+        snapshots.rank_day.assert_called_once_with(date(2026, 3, 30), date(2026, 3, 29), baseline=None, limit=3)
+
+    async def test_falls_back_to_timeseries_when_baseline_snapshot_is_missing(self) -> None:
+        current = [make_video_point("v1", views=5000)]
+        repo = make_repo(current)
+        snapshots = make_snapshot_reader({date(2026, 3, 30): current})
+        use_case = FetchTopVideosUseCase(repo, make_video_repo(), snapshots)
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.WEEKLY, day=date(2026, 3, 30))
+        )
+
+        assert result.video_count == 1
+        assert repo.get_video_records_by_date_range.call_count == 2
+
+
+class TestFetchTopVideosFromRollups:
+    async def test_reads_previous_period_from_daily_closes(self) -> None:
+        previous = [make_video_point("v1", views=1000, score=1), make_video_point("v2", views=500, score=2)]
+        current = [make_video_point("v1", views=1200), make_video_point("v2", views=1500)]
+        repo = MagicMock(spec=TimeSeriesReader)
+        repo.get_video_records_by_date_range.return_value = [to_record(point) for point in current]
+        rollups = make_rollup_reader({date(2026, 3, 23): previous})
+        use_case = FetchTopVideosUseCase(repo, make_video_repo(), rollup_reader=rollups)
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.WEEKLY, day=date(2026, 3, 30))
+        )
+
+        assert [video.video_id for video in result.videos] == ["v2", "v1"]
+        assert result.videos[0].score_previous == 2
+        assert result.videos[0].score_status == VideoScoreStatus.UP
+        assert repo.get_video_records_by_date_range.call_count == 1  # current period only
+
+    async def test_daily_closes_replace_missing_baseline_snapshot(self) -> None:
+        previous = [make_video_point("v1", views=1000, score=2), make_video_point("v2", views=500, score=1)]
+        current = [make_video_point("v1", views=1200), make_video_point("v2", views=1500)]
+        repo = make_repo([])
+        snapshots = make_snapshot_reader({date(2026, 3, 30): current})
+        rollups = make_rollup_reader({date(2026, 3, 29): previous})
+        use_case = FetchTopVideosUseCase(repo, make_video_repo(), snapshots, rollups)
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.DAILY, day=date(2026, 3, 30))
+        )
+
+        assert [video.video_id for video in result.videos] == ["v2", "v1"]
+        assert result.videos[0].score_status == VideoScoreStatus.EQUAL
+        repo.get_video_records_by_date_range.assert_not_called()
+
+    async def test_falls_back_to_timeseries_without_materialized_closes(self) -> None:
+        repo = make_repo([make_video_point("v1", views=5000)])
+        use_case = FetchTopVideosUseCase(repo, make_video_repo(), rollup_reader=make_rollup_reader({}))
+
+        result = await use_case.execute(
+            FetchTopVideosRequest(timeseries_range=TimeseriesRange.WEEKLY, day=date(2026, 3, 30))
+        )
+
+        assert result.video_count == 1
+        assert repo.get_video_records_by_date_range.call_count == 2
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-from pathlib import Path
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.application.get_admin_task_status_use_case import GetAdminTaskStatusUseCase
-from src.domain.models import TaskMethod, TaskRunState, TaskRunStatus
+from src.domain.models import (
+    TaskMethod,
+    TaskRunSnapshot,
+    TaskRunState,
+    TaskRunStatus,
+    VideoArtifact,
+    VideoArtifactKind,
+)
+
+
+def _snapshot(*events: TaskRunState) -> TaskRunSnapshot:
+    return TaskRunSnapshot.from_events(events, since=datetime.now(UTC) - timedelta(days=7))
 
 
 class TestGetAdminTaskStatusUseCase:
@@ -17,23 +27,29 @@ class TestGetAdminTaskStatusUseCase:
 
     @pytest.fixture
     def task_run_state_reader_mock(self) -> MagicMock:
-        return MagicMock(spec=["get_latest_task_event", "get_task_events_since"])
+        return MagicMock(spec=["get_latest_task_event", "snapshot", "data_version"])
 
     @pytest.fixture
     def release_store_mock(self) -> MagicMock:
         return MagicMock(spec=["get_latest_release"])
 
+    @pytest.fixture
+    def artifact_index_mock(self) -> MagicMock:
+        index = MagicMock(spec=["latest_artifact"])
+        index.latest_artifact.return_value = None
+        return index
+
     @pytest.fixture
     def use_case(
         self,
         task_run_state_reader_mock: MagicMock,
         release_store_mock: MagicMock,
-        tmp_path: Path,
+        artifact_index_mock: MagicMock,
     ) -> GetAdminTaskStatusUseCase:
         return GetAdminTaskStatusUseCase(
             task_run_state_reader_mock,
             release_store=release_store_mock,
-            video_generated_folder=str(tmp_path),
+            artifact_index=artifact_index_mock,
         )
 
     def test_execute_with_all_success_timestamps(
@@ -44,60 +60,15 @@ class TestGetAdminTaskStatusUseCase:
     ) -> None:
         now = datetime.now(UTC)
 
-        latest_map: dict[tuple[TaskMethod, TaskRunStatus | None], TaskRunState | None] = {
-            (TaskMethod.FETCH, TaskRunStatus.SUCCESS): TaskRunState(
-                task_method=TaskMethod.FETCH,
-                status=TaskRunStatus.SUCCESS,
-                event_at=now,
-            ),
-            (TaskMethod.DAILY, TaskRunStatus.SUCCESS): TaskRunState(
-                task_method=TaskMethod.DAILY,
-                status=TaskRunStatus.SUCCESS,
-                event_at=now,
-            ),
-            (TaskMethod.WEEKLY, TaskRunStatus.SUCCESS): TaskRunState(
-                task_method=TaskMethod.WEEKLY,
-                status=TaskRunStatus.SUCCESS,
-                event_at=now,
-            ),
-            (TaskMethod.FETCH, None): TaskRunState(
-                task_method=TaskMethod.FETCH,
-                status=TaskRunStatus.SUCCESS,
-                event_at=now,
-            ),
-            (TaskMethod.DAILY, None): TaskRunState(
-                task_method=TaskMethod.DAILY,
-                status=TaskRunStatus.QUEUED,
-                event_at=now,
-            ),
-            (TaskMethod.WEEKLY, None): TaskRunState(
-                task_method=TaskMethod.WEEKLY,
-                status=TaskRunStatus.FAILED,
-                event_at=now,
-                error_message="boom",
-            ),
-            (TaskMethod.FETCH, TaskRunStatus.QUEUED): None,
-            (TaskMethod.DAILY, TaskRunStatus.QUEUED): TaskRunState(
-                task_method=TaskMethod.DAILY,
-                status=TaskRunStatus.QUEUED,
-                event_at=now,
+        task_run_state_reader_mock.snapshot.return_value = _snapshot(
+            TaskRunState(task_method=TaskMethod.FETCH, status=TaskRunStatus.SUCCESS, event_at=now),
+            TaskRunState(task_method=TaskMethod.DAILY, status=TaskRunStatus.SUCCESS, event_at=now),
+            TaskRunState(task_method=TaskMethod.DAILY, status=TaskRunStatus.QUEUED, event_at=now),
+            TaskRunState(task_method=TaskMethod.WEEKLY, status=TaskRunStatus.SUCCESS, event_at=now),
+            TaskRunState(
+                task_method=TaskMethod.WEEKLY, status=TaskRunStatus.FAILED, event_at=now, error_message="boom"
             ),
-            (TaskMethod.WEEKLY, TaskRunStatus.QUEUED): None,
-            (TaskMethod.FETCH, TaskRunStatus.FAILED): None,
-            (TaskMethod.DAILY, TaskRunStatus.FAILED): None,
-            (TaskMethod.WEEKLY, TaskRunStatus.FAILED): TaskRunState(
-                task_method=TaskMethod.WEEKLY,
-                status=TaskRunStatus.FAILED,
-                event_at=now,
-                error_message="boom",
-            ),
-        }
-
-        def _side_effect(*, task_method: TaskMethod, status: TaskRunStatus | None = None):
-            return latest_map[(task_method, status)]
-
-        task_run_state_reader_mock.get_latest_task_event.side_effect = _side_effect
-        task_run_state_reader_mock.get_task_events_since.return_value = []
+        )
         release_store_mock.get_latest_release.return_value = None
 
         result = use_case.execute()
@@ -112,6 +83,9 @@ class TestGetAdminTaskStatusUseCase:
         }
         assert result.latest_error_by_method == {"weekly": "boom"}
         assert result.daily_publish_timestamps_by_platform == {}
+        assert [event["status"] for event in result.timeline_data["weekly"]] == ["success", "failed"]
+        task_run_state_reader_mock.snapshot.assert_called_once()
+        task_run_state_reader_mock.get_latest_task_event.assert_not_called()
 
     def test_execute_with_no_events(
         self,
@@ -119,8 +93,7 @@ class TestGetAdminTaskStatusUseCase:
         task_run_state_reader_mock: MagicMock,
         release_store_mock: MagicMock,
     ) -> None:
-        task_run_state_reader_mock.get_latest_task_event.return_value = None
-        task_run_state_reader_mock.get_task_events_since.return_value = []
+        task_run_state_reader_mock.snapshot.return_value = _snapshot()
         release_store_mock.get_latest_release.return_value = None
 
         result = use_case.execute()
@@ -129,15 +102,16 @@ class TestGetAdminTaskStatusUseCase:
         assert result.daily_last_timestamp is None
         assert result.weekly_last_timestamp is None
         assert result.latest_status_by_method == {}
+        assert result.timeline_data == {"fetch": [], "daily": [], "weekly": []}
 
     def test_execute_reports_latest_video_artifact_and_platform_releases(
         self,
+        use_case: GetAdminTaskStatusUseCase,
         task_run_state_reader_mock: MagicMock,
         release_store_mock: MagicMock,
-        tmp_path: Path,
+        artifact_index_mock: MagicMock,
     ) -> None:
-        task_run_state_reader_mock.get_latest_task_event.return_value = None
-        task_run_state_reader_mock.get_task_events_since.return_value = []
+        task_run_state_reader_mock.snapshot.return_value = _snapshot()
 
         now = datetime.now(UTC).timestamp()
         release_store_mock.get_latest_release.side_effect = [
@@ -147,23 +121,18 @@ class TestGetAdminTaskStatusUseCase:
             None,
         ]
 
-        video_dir = tmp_path / "20260515"
-        video_dir.mkdir(parents=True)
-        artifact = video_dir / "20260515_vertical_format.mp4"
-        artifact.write_bytes(b"mp4")
-
-        use_case = GetAdminTaskStatusUseCase(
-            task_run_state_reader_mock,
-            release_store=release_store_mock,
-            video_generated_folder=str(tmp_path),
+        artifact_index_mock.latest_artifact.return_value = VideoArtifact(
+            path="videos/20260515/20260515_vertical_format.mp4",
+            kind=VideoArtifactKind.VERTICAL_COMPILATION,
+            size=3,
+            mtime=now,
         )
 
         result = use_case.execute()
 
         assert result.daily_publish_timestamps_by_platform.get("YOUTUBE") == now
-        assert result.latest_video_artifact_path is not None
-        assert result.latest_video_artifact_path.endswith("20260515_vertical_format.mp4")
-        assert result.latest_video_artifact_timestamp is not None
+        assert result.latest_video_artifact_path == "videos/20260515/20260515_vertical_format.mp4"
+        assert result.latest_video_artifact_timestamp == now
 
     def test_running_methods_includes_queued_without_terminal_event(
         self,
@@ -171,8 +140,6 @@ class TestGetAdminTaskStatusUseCase:
         task_run_state_reader_mock: MagicMock,
         release_store_mock: MagicMock,
     ) -> None:
-        from datetime import timedelta
-
         now = datetime.now(UTC)
 
         # fetch: QUEUED recent (no terminal after it) -> running
@@ -207,27 +174,9 @@ class TestGetAdminTaskStatusUseCase:
             error_message="older failure",
         )
 
-        def _side_effect(*, task_method: TaskMethod, status: TaskRunStatus | None = None):
-            if status is None:
-                return {
-                    TaskMethod.FETCH: fetch_queued,
-                    TaskMethod.DAILY: daily_queued,
-                    TaskMethod.WEEKLY: weekly_queued,
-                }[task_method]
-            if status == TaskRunStatus.QUEUED:
-                return {
-                    TaskMethod.FETCH: fetch_queued,
-                    TaskMethod.DAILY: daily_queued,
-                    TaskMethod.WEEKLY: weekly_queued,
-                }[task_method]
-            if status == TaskRunStatus.SUCCESS:
-                return daily_success if task_method == TaskMethod.DAILY else None
-            if status == TaskRunStatus.FAILED:
-                return weekly_failed_older if task_method == TaskMethod.WEEKLY else None
-            return None
-
-        task_run_state_reader_mock.get_latest_task_event.side_effect = _side_effect
-        task_run_state_reader_mock.get_task_events_since.return_value = []
+        task_run_state_reader_mock.snapshot.return_value = _snapshot(
+            weekly_failed_older, fetch_queued, weekly_queued, daily_queued, daily_success
+        )
         release_store_mock.get_latest_release.return_value = None
 
         result = use_case.execute()
@@ -245,8 +194,6 @@ class TestGetAdminTaskStatusUseCase:
         task_run_state_reader_mock: MagicMock,
         release_store_mock: MagicMock,
     ) -> None:
-        from datetime import timedelta
-
         now = datetime.now(UTC)
         stale_fetch_queued = TaskRunState(
             task_method=TaskMethod.FETCH,
@@ -254,27 +201,60 @@ class TestGetAdminTaskStatusUseCase:
             event_at=now - timedelta(minutes=10),
         )
 
-        def _side_effect(*, task_method: TaskMethod, status: TaskRunStatus | None = None):
-            if task_method == TaskMethod.FETCH and status is None:
-                return stale_fetch_queued
-            return None
-
-        task_run_state_reader_mock.get_latest_task_event.side_effect = _side_effect
-        task_run_state_reader_mock.get_task_events_since.return_value = []
+        task_run_state_reader_mock.snapshot.return_value = _snapshot(stale_fetch_queued)
         release_store_mock.get_latest_release.return_value = None
 
         result = use_case.execute()
 
         assert "fetch" not in result.running_methods
 
+    def test_data_version_follows_the_stores_without_reading_the_events(
+        self,
+        use_case: GetAdminTaskStatusUseCase,
+        task_run_state_reader_mock: MagicMock,
+        release_store_mock: MagicMock,
+    ) -> None:
+        task_run_state_reader_mock.data_version.return_value = "1"
+        release_store_mock.get_latest_release.return_value = None
+
+        first = use_case.data_version()
+        unchanged = use_case.data_version()
+        task_run_state_reader_mock.data_version.return_value = "2"
+        after_event = use_case.data_version()
+        release_store_mock.get_latest_release.return_value = MagicMock(published_at=1.0)
+        after_release = use_case.data_version()
+
+        assert first == unchanged
+        assert len({first, after_event, after_release}) == 3
+        task_run_state_reader_mock.snapshot.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("latest_status", "expected"),
+        [(None, False), (TaskRunStatus.QUEUED, False), (TaskRunStatus.SUCCESS, True), (TaskRunStatus.FAILED, True)],
+    )
+    def test_is_task_complete_reads_the_latest_event_only(
+        self,
+        use_case: GetAdminTaskStatusUseCase,
+        task_run_state_reader_mock: MagicMock,
+        latest_status: TaskRunStatus | None,
+        expected: bool,
+    ) -> None:
+        task_run_state_reader_mock.get_latest_task_event.return_value = (
+            TaskRunState(task_method=TaskMethod.FETCH, status=latest_status, event_at=datetime.now(UTC))
+            if latest_status is not None
+            else None
+        )
+
+        assert use_case.is_task_complete("fetch") is expected
+        task_run_state_reader_mock.get_latest_task_event.assert_called_once_with(task_method=TaskMethod.FETCH)
+        task_run_state_reader_mock.snapshot.assert_not_called()
+
     def test_get_task_started_at_returns_queued_timestamp(
         self,
         use_case: GetAdminTaskStatusUseCase,
         task_run_state_reader_mock: MagicMock,
     ) -> None:
         now = datetime.now(UTC)
-        from datetime import timedelta
-
         queued_event = TaskRunState(
             task_method=TaskMethod.FETCH,
             status=TaskRunStatus.QUEUED,
@@ -0,0 +1,101 @@
+"""Unit tests for MaterializeRollupsUseCase."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.materialize_rollups_use_case import MaterializeRollupsUseCase
+from src.domain.models import VideoPoint, VideoRollup
+from src.domain.ports import TimeSeriesStreamReader
+
+
+class _InMemoryRollupStore:
+    def __init__(self) -> None:
+        self.daily: dict[date, list[VideoRollup]] = {}
+        self.weekly: dict[date, list[VideoRollup]] = {}
+
+    def read_daily(self, day: date) -> list[VideoRollup] | None:
+        return self.daily.get(day)
+
+    def read_weekly(self, day: date) -> list[VideoRollup] | None:
+        return self.weekly.get(day)
+
+    def write_daily(self, day: date, rollups: list[VideoRollup]) -> None:
+        self.daily[day] = list(rollups)
+
+    def write_weekly(self, day: date, rollups: list[VideoRollup]) -> None:
+        self.weekly[day] = list(rollups)
+
+
+def make_reader(points: list[VideoPoint]) -> TimeSeriesStreamReader:
+    reader = MagicMock(spec=TimeSeriesStreamReader)
+    reader.iter_video_points.side_effect = lambda start, end, **_: (
+        point for point in points if start < point.time < end
+    )
+    return reader
+
+
+def make_point(video_id: str, day: date, views: int, hour: int = 12) -> VideoPoint:
+    return VideoPoint(
+        time=datetime(day.year, day.month, day.day, hour, tzinfo=UTC),
+        video_id=video_id,
+        views=views,
+        likes=0,
+    )
+
+
+class TestMaterializeRollupsUseCase:
+    def test_writes_daily_close_and_growth_from_raw_baselines(self) -> None:
+        day = date(2026, 3, 31)
+        points = [
+            make_point("v1", day - timedelta(days=30), 100),
+            make_point("v1", day - timedelta(days=7), 600),
+            make_point("v1", day, 900, hour=8),
+            make_point("v1", day, 1000, hour=20),
+        ]
+        store = _InMemoryRollupStore()
+
+        result = MaterializeRollupsUseCase(make_reader(points), store, store).execute(day)
+
+        [close] = store.daily[day]
+        assert (close.views, close.views_growth_7d, close.views_growth_30d) == (1000, 400, 900)
+        assert result.days == 1
+        assert result.daily_rows == 1
+        assert result.weeks == ("2026-W14",)
+        # Baselines outside the range are read, never written.
+        assert set(store.daily) == {day}
+
+    def test_prefers_stored_baseline_closes(self) -> None:
+        day = date(2026, 3, 31)
+        store = _InMemoryRollupStore()
+        store.daily[day - timedelta(days=7)] = [
+            VideoRollup(video_id="v1", close_time=datetime(2026, 3, 24, tzinfo=UTC), views=10)
+        ]
+        reader = make_reader([make_point("v1", day, 50)])
+
+        MaterializeRollupsUseCase(reader, store, store).execute(day)
+
+        assert store.daily[day][0].views_growth_7d == 40
+        assert reader.iter_video_points.call_count == 2  # the day itself + 30-day baseline
+
+    def test_recomputes_range_and_weekly_close(self) -> None:
+        monday, sunday = date(2026, 3, 30), date(2026, 4, 5)
+        points = [make_point("v1", monday + timedelta(days=offset), 100 * (offset + 1)) for offset in range(7)]
+        store = _InMemoryRollupStore()
+
+        result = MaterializeRollupsUseCase(make_reader(points), store, store).execute(monday, sunday)
+
+        assert result.days == 7
+        assert store.daily[sunday][0].views_growth_7d is None
+        assert store.daily[sunday - timedelta(days=1)][0].views == 600
+        [weekly_close] = store.weekly[monday]
+        assert weekly_close.views == 700
+
+    def test_rejects_inverted_range(self) -> None:
+        store = _InMemoryRollupStore()
+
+        with pytest.raises(ValueError, match="before start_day"):
+            MaterializeRollupsUseCase(make_reader([]), store, store).execute(date(2026, 3, 31), date(2026, 3, 1))
@@ -0,0 +1,77 @@
+"""Unit tests for domain.services.rollup_service module."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+from src.domain.models import VideoPoint, VideoRollup, VideoScoreStatus
+from src.domain.services.rollup_service import build_daily_rollups, build_weekly_rollups, week_days, week_key
+
+
+def make_point(video_id: str, views: int, hour: int, score: int | None = None) -> VideoPoint:
+    return VideoPoint(
+        time=datetime(2026, 3, 31, hour, tzinfo=UTC),
+        video_id=video_id,
+        views=views,
+        likes=1,
+        score=score,
+        score_status=VideoScoreStatus.UP if score else None,
+    )
+
+
+def make_rollup(video_id: str, views: int, close_time: datetime) -> VideoRollup:
+    return VideoRollup(video_id=video_id, close_time=close_time, views=views)
+
+
+class TestBuildDailyRollups:
+    def test_keeps_latest_point_per_video_as_close(self) -> None:
+        points = [make_point("v1", 300, hour=18, score=2), make_point("v1", 100, hour=9), make_point("v2", 50, 12)]
+
+        rollups = {rollup.video_id: rollup for rollup in build_daily_rollups(points, {}, {})}
+
+        assert rollups["v1"].views == 300
+        assert rollups["v1"].score == 2
+        assert rollups["v1"].score_status == VideoScoreStatus.UP
+        assert rollups["v1"].close_time == datetime(2026, 3, 31, 18, tzinfo=UTC)
+        assert rollups["v2"].views == 50
+
+    def test_growth_compares_with_baseline_closes(self) -> None:
+        points = [make_point("v1", 1000, hour=12), make_point("new", 10, hour=12)]
+        week_ago = {"v1": make_rollup("v1", 700, datetime(2026, 3, 24, 12, tzinfo=UTC))}
+        month_ago = {"v1": make_rollup("v1", 100, datetime(2026, 3, 1, 12, tzinfo=UTC))}
+
+        rollups = {rollup.video_id: rollup for rollup in build_daily_rollups(points, week_ago, month_ago)}
+
+        assert rollups["v1"].views_growth_7d == 300
+        assert rollups["v1"].views_growth_30d == 900
+        assert rollups["new"].views_growth_7d is None
+        assert rollups["new"].views_growth_30d is None
+
+
+class TestBuildWeeklyRollups:
+    def test_keeps_latest_daily_close_per_video(self) -> None:
+        monday = [make_rollup("v1", 10, datetime(2026, 3, 30, 12, tzinfo=UTC))]
+        tuesday = [
+            make_rollup("v1", 20, datetime(2026, 3, 31, 12, tzinfo=UTC)),
+            make_rollup("v2", 5, datetime(2026, 3, 31, 12, tzinfo=UTC)),
+        ]
+
+        rollups = build_weekly_rollups([tuesday, monday])
+
+        assert [(rollup.video_id, rollup.views) for rollup in rollups] == [("v1", 20), ("v2", 5)]
+
+
+def test_week_helpers_follow_iso_calendar() -> None:
+    assert week_key(date(2026, 1, 1)) == "2026-W01"
+    assert week_key(date(2027, 1, 1)) == "2026-W53"
+    days = week_days(date(2026, 4, 2))
+    assert days[0] == date(2026, 3, 30)
+    assert days[-1] == date(2026, 4, 5)
+
+
+def test_rollup_converts_to_ranking_baseline_record() -> None:
+    rollup = VideoRollup(video_id="v1", close_time=datetime(2026, 3, 31, tzinfo=UTC), views=10, likes=2, score=3)
+
+    record = rollup.to_record()
+
+    assert (record.video_id, record.views, record.likes, record.score) == ("v1", 10, 2, 3)
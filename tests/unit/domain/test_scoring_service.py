@@ -7,7 +7,7 @@ from datetime import UTC, date, datetime
 import pytest
 
 from src.domain.exceptions import ScoringError
-from src.domain.models import CanonicalVideo, Channel, Video, VideoPoint, VideoScoreStatus
+from src.domain.models import CanonicalVideo, Channel, Video, VideoPoint, VideoPointRecord, VideoScoreStatus
 from src.domain.services.scoring_service import (
     calculate_score_status,
     calculate_views_growth,
@@ -15,6 +15,7 @@ from src.domain.services.scoring_service import (
     rank_videos_by_score,
     score_and_rank,
     score_and_rank_video_points,
+    score_and_rank_video_records,
 )
 
 
@@ -259,6 +260,50 @@ class TestScoreAndRankVideoPoints:
         assert ranked[1] is not current[1]
 
 
+class TestScoreAndRankVideoRecords:
+    @staticmethod
+    def _point(video_id: str, views: int, views_growth: int | None = None, score: int | None = None) -> VideoPoint:
+        return VideoPoint(
+            time=datetime(2026, 3, 31, 12, 0, 0, tzinfo=UTC),
+            video_id=video_id,
+            views=views,
+            views_growth=views_growth,
+            score=score,
+        )
+
+    @staticmethod
+    def _record(point: VideoPoint) -> VideoPointRecord:
+        return VideoPointRecord(
+            time=point.time,
+            video_id=point.video_id,
+            views=point.views,
+            likes=point.likes,
+            views_growth=point.views_growth,
+            score=point.score,
+        )
+
+    def test_matches_score_and_rank_video_points(self) -> None:
+        previous = [self._point("a", 100, score=1), self._point("b", 400, score=2), self._point("b", 450, score=4)]
+        current = [
+            self._point("a", 600),
+            self._point("b", 500),
+            self._point("new", 70, views_growth=30),
+            self._point("tie", 50),
+        ]
+
+        expected = score_and_rank_video_points(current, previous)
+        ranked = score_and_rank_video_records(
+            [self._record(point) for point in current],
+            [self._record(point) for point in previous],
+        )
+
+        assert [record.to_video_point().model_dump() for record in ranked] == [p.model_dump() for p in expected]
+
+    def test_raises_on_empty_current(self) -> None:
+        with pytest.raises(ScoringError):
+            score_and_rank_video_records([], [])
+
+
 class TestRankVideosByScore:
     def _video(self, video_id: str, score: int | None) -> Video:
         return Video(
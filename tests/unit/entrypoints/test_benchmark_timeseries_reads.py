@@ -0,0 +1,19 @@
+"""Unit tests for the benchmark-timeseries-reads command."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.entrypoints.benchmark_timeseries_reads import benchmark_timeseries_reads
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_benchmark_reports_both_read_paths(tmp_path: Path) -> None:
+    results = benchmark_timeseries_reads(tmp_path, [300])
+
+    by_method = {result.method: result for result in results}
+    assert set(by_method) == {"video_points", "video_records"}
+    assert all(result.rows == 300 and result.seconds > 0 for result in results)
+    assert by_method["video_records"].peak_bytes < by_method["video_points"].peak_bytes
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from tinyflux import Point, TinyFlux
+
+from src.config.settings import AppSettings
+from src.domain.models import TaskMethod, TaskRunStatus, VideoPoint, VideoScoreStatus
+from src.entrypoints.compact_timeseries import (
+    CompactionPolicy,
+    _compaction_targets,
+    compact_timeseries,
+    compact_timeseries_file,
+)
+from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
+from src.infrastructure.storage.task_run_state_repository import TaskErrorMessageLog, TaskRunStateRepository
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NOW = datetime(2026, 6, 30, 12, tzinfo=UTC)
+POLICY = CompactionPolicy(
+    video_full_resolution_cutoff=datetime(2026, 4, 1, tzinfo=UTC),
+    retention_cutoffs={"Operational metrics": NOW - timedelta(days=30)},
+)
+
+
+def _video_point(video_id: str, point_time: datetime, views: int) -> Point:
+    return Point(
+        measurement="Video visualizations",
+        time=point_time,
+        tags={"video_id": video_id, "score_status": "NEW"},
+        fields={"views": views, "likes": 1, "views_growth": 0, "score": 1},
+    )
+
+
+def _metric_point(point_time: datetime) -> Point:
+    return Point(
+        measurement="Operational metrics",
+        time=point_time,
+        tags={"stage": "fetch", "outcome": "success"},
+        fields={"count": 1},
+    )
+
+
+def _seed(path: Path, points: list[Point]) -> None:
+    db = TinyFlux(str(path))
+    try:
+        db.insert_multiple(points)
+    finally:
+        db.close()
+
+
+def test_drops_expired_metrics_and_keeps_recent_ones(tmp_path: Path) -> None:
+    path = tmp_path / "db_metrics.csv"
+    _seed(path, [_metric_point(NOW - timedelta(days=40)), _metric_point(NOW - timedelta(days=1))])
+
+    summary = compact_timeseries_file(path, POLICY, apply_changes=True)
+
+    assert (summary.rows_before, summary.rows_after, summary.expired_rows) == (2, 1, 1)
+    assert summary.bytes_reclaimed > 0
+    assert path.stat().st_size == summary.bytes_after
+
+
+def test_downsamples_old_video_points_to_daily_closes(tmp_path: Path) -> None:
+    path = tmp_path / "db_timeseries.csv"
+    old_day = datetime(2026, 3, 1, tzinfo=UTC)
+    recent_day = datetime(2026, 6, 1, tzinfo=UTC)
+    _seed(
+        path,
+        [
+            _video_point("v1", old_day + timedelta(hours=8), 100),
+            _video_point("v2", old_day + timedelta(hours=9), 5),
+            _video_point("v1", old_day + timedelta(hours=20), 300),
+            _video_point("v1", recent_day + timedelta(hours=8), 900),
+            _video_point("v1", recent_day + timedelta(hours=20), 1000),
+        ],
+    )
+
+    summary = compact_timeseries_file(path, POLICY, apply_changes=True)
+
+    assert summary.downsampled_rows == 1
+    repo = TimeSeriesRepository(str(path))
+    try:
+        old_points = repo.get_video_points_by_date_range(old_day, old_day + timedelta(days=1))
+        recent_points = repo.get_video_points_by_date_range(recent_day, recent_day + timedelta(days=1))
+    finally:
+        repo.close()
+    assert sorted((point.video_id, point.views) for point in old_points) == [("v1", 300), ("v2", 5)]
+    assert [point.views for point in recent_points] == [900, 1000]
+
+
+def test_removes_duplicate_points_keeping_the_last_write(tmp_path: Path) -> None:
+    path = tmp_path / "db_timeseries.csv"
+    point_time = datetime(2026, 6, 1, 12, tzinfo=UTC)
+    _seed(path, [_video_point("v1", point_time, 10), _video_point("v2", point_time, 20)])
+    _seed(path, [_video_point("v1", point_time, 11)])
+
+    summary = compact_timeseries_file(path, POLICY, apply_changes=True)
+
+    assert summary.duplicate_rows == 1
+    repo = TimeSeriesRepository(str(path))
+    try:
+        points = repo.get_video_points_by_date_range(point_time - timedelta(hours=1), point_time + timedelta(hours=1))
+    finally:
+        repo.close()
+    assert sorted((point.video_id, point.views) for point in points) == [("v1", 11), ("v2", 20)]
+
+
+def test_dry_run_reports_without_writing(tmp_path: Path) -> None:
+    path = tmp_path / "db_metrics.csv"
+    _seed(path, [_metric_point(NOW - timedelta(days=40)), _metric_point(NOW - timedelta(days=1))])
+    original = path.read_bytes()
+
+    summary = compact_timeseries([path, tmp_path / "missing.csv"], POLICY, apply_changes=False)
+
+    assert path.read_bytes() == original
+    assert [file_summary.path for file_summary in summary.files] == [path]
+    assert summary.rows_removed == 1
+    assert summary.bytes_reclaimed > 0
+    assert summary.elapsed_seconds >= 0
+
+
+def test_policy_from_settings_aligns_video_cutoff_to_midnight() -> None:
+    settings = AppSettings(
+        env="development",
+        yt_search_region_code="US",
+        operational_metrics_retention_days=30,
+        task_run_state_retention_days=0,
+        timeseries_video_full_resolution_days=90,
+    )
+
+    policy = CompactionPolicy.from_settings(settings, NOW)
+
+    assert policy.video_full_resolution_cutoff == datetime(2026, 4, 1, tzinfo=UTC)
+    assert policy.retention_cutoffs == {"Operational metrics": NOW - timedelta(days=30)}
+
+
+def test_long_lived_repositories_keep_writing_to_the_compacted_file(tmp_path: Path) -> None:
+    metrics_path = tmp_path / "db_metrics.csv"
+    timeseries_path = tmp_path / "db_timeseries.csv"
+    _seed(metrics_path, [_metric_point(NOW - timedelta(days=40)), _metric_point(NOW - timedelta(days=1))])
+    point_time = datetime(2026, 6, 1, 12, tzinfo=UTC)
+    _seed(timeseries_path, [_video_point("v1", point_time, 10), _video_point("v1", point_time, 11)])
+    metrics_repo = OperationalMetricsRepository(str(metrics_path))
+    timeseries_repo = TimeSeriesRepository(str(timeseries_path))
+    try:
+        metrics_repo.record_metric_event(stage="fetch", is_error=False, event_time=NOW - timedelta(hours=2))
+        timeseries_repo.get_video_points_by_date_range(point_time - timedelta(hours=1), point_time)
+
+        compact_timeseries([metrics_path, timeseries_path], POLICY, apply_changes=True)
+
+        metrics_repo.record_metric_event(stage="fetch", is_error=True, event_time=NOW - timedelta(hours=1))
+        timeseries_repo.add_video_point(
+            VideoPoint(
+                video_id="v2",
+                time=point_time + timedelta(hours=1),
+                views=20,
+                likes=2,
+                score=1,
+                score_status=VideoScoreStatus.NEW,
+            )
+        )
+    finally:
+        metrics_repo.close()
+        timeseries_repo.close()
+
+    reopened_metrics = OperationalMetricsRepository(str(metrics_path))
+    reopened_timeseries = TimeSeriesRepository(str(timeseries_path))
+    try:
+        counts = reopened_metrics.get_metric_counts(start_time=NOW - timedelta(days=2), end_time=NOW)
+        points = reopened_timeseries.get_video_points_by_date_range(
+            point_time - timedelta(hours=1), point_time + timedelta(hours=2)
+        )
+    finally:
+        reopened_metrics.close()
+        reopened_timeseries.close()
+    assert counts["fetch"] == {"count": 2, "errors": 1}
+    assert sorted((point.video_id, point.views) for point in points) == [("v1", 11), ("v2", 20)]
+
+
+def test_compacts_the_task_error_log_with_the_task_run_rows(tmp_path: Path) -> None:
+    path = tmp_path / "db_task_runs.csv"
+    repo = TaskRunStateRepository(str(path))
+    for days_ago, task_method, message in [
+        (40, TaskMethod.FETCH, "expired failure"),
+        (2, TaskMethod.DAILY, None),
+        (1, TaskMethod.WEEKLY, "recent failure"),
+    ]:
+        repo.record_task_event(
+            task_method=task_method,
+            status=TaskRunStatus.FAILED if message else TaskRunStatus.SUCCESS,
+            error_message=message,
+            event_time=NOW - timedelta(days=days_ago),
+        )
+    policy = CompactionPolicy(retention_cutoffs={"Task run state": NOW - timedelta(days=30)})
+
+    summary = compact_timeseries_file(path, policy, apply_changes=True)
+
+    try:
+        latest = repo.get_latest_task_event(task_method=TaskMethod.WEEKLY)
+    finally:
+        repo.close()
+    assert summary.expired_rows == 1
+    assert latest is not None
+    assert latest.error_message == "recent failure"
+    assert TaskErrorMessageLog(path).path.read_text().splitlines() == ['{"message": "recent failure"}']
+
+
+def test_compaction_targets_are_the_files_the_repositories_open(tmp_path: Path) -> None:
+    settings = AppSettings(
+        env="development",
+        yt_search_region_code="US",
+        db_timeseries_file=str(tmp_path / "db_timeseries.csv"),
+        db_metrics_file=str(tmp_path / "db_metrics.csv"),
+        db_task_runs_file=str(tmp_path / "db_task_runs.csv"),
+    )
+    targets = _compaction_targets(settings)
+
+    assert targets == [
+        tmp_path / "db_timeseries.csv",
+        tmp_path / "db_metrics.csv.test",
+        tmp_path / "db_task_runs.csv.test",
+    ]
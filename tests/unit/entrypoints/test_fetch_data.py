@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, create_autospec
 import pytest
 
 from src.application.fetch_data_use_case import FetchDataUseCase
-from src.config.settings import AppSettings, Environment
+from src.config.settings import AppSettings, Environment, StorageBackend
 from src.entrypoints import fetch_data as fetch_data_entrypoint
 
 
@@ -45,8 +45,8 @@ async def test_main_async_delegates_to_fetch_data_use_case(monkeypatch: pytest.M
         "FileExecutionLock",
         lambda _path, _operation_name: _FileExecutionLockStub(acquired=True),
     )
-    monkeypatch.setattr(fetch_data_entrypoint, "VideoRepository", lambda _path: MagicMock())
-    monkeypatch.setattr(fetch_data_entrypoint, "TimeSeriesRepository", lambda _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_video_repository", lambda _settings, _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_timeseries_repository", lambda _settings, _path: MagicMock())
     monkeypatch.setattr(fetch_data_entrypoint, "FetchDataUseCase", lambda *args, **kwargs: mock_use_case)
 
     await fetch_data_entrypoint.main_async()
@@ -66,8 +66,8 @@ async def test_main_async_handles_lock_not_acquired(monkeypatch: pytest.MonkeyPa
         "FileExecutionLock",
         lambda _path, _operation_name: _FileExecutionLockStub(acquired=False),
     )
-    monkeypatch.setattr(fetch_data_entrypoint, "VideoRepository", lambda _path: MagicMock())
-    monkeypatch.setattr(fetch_data_entrypoint, "TimeSeriesRepository", lambda _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_video_repository", lambda _settings, _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_timeseries_repository", lambda _settings, _path: MagicMock())
     monkeypatch.setattr(fetch_data_entrypoint, "FetchDataUseCase", lambda *args, **kwargs: mock_use_case)
 
     await fetch_data_entrypoint.main_async()
@@ -93,11 +93,39 @@ async def test_main_async_passes_force_fetch_to_use_case(monkeypatch: pytest.Mon
         "FileExecutionLock",
         lambda _path, _operation_name: _FileExecutionLockStub(acquired=True),
     )
-    monkeypatch.setattr(fetch_data_entrypoint, "VideoRepository", lambda _path: MagicMock())
-    monkeypatch.setattr(fetch_data_entrypoint, "TimeSeriesRepository", lambda _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_video_repository", lambda _settings, _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_timeseries_repository", lambda _settings, _path: MagicMock())
     monkeypatch.setattr(fetch_data_entrypoint, "FetchDataUseCase", _build_use_case)
 
     await fetch_data_entrypoint.main_async(force_fetch=True)
 
     mock_use_case.execute.assert_awaited_once()
     assert received_force == [True]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_writes_no_derived_stores(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_use_case = create_autospec(FetchDataUseCase, instance=True)
+    mock_use_case.execute = AsyncMock(return_value=[])
+    settings = _build_settings()
+    settings.storage_backend = StorageBackend.SQLITE
+    received: list[dict[str, Any]] = []
+
+    def _build_use_case(*args: Any, **kwargs: Any) -> FetchDataUseCase:
+        del args
+        received.append(kwargs)
+        return mock_use_case
+
+    monkeypatch.setattr(fetch_data_entrypoint, "open_video_repository", lambda _settings, _path: MagicMock())
+    monkeypatch.setattr(fetch_data_entrypoint, "open_timeseries_repository", lambda _settings, _path: MagicMock())
+    monkeypatch.setattr(
+        fetch_data_entrypoint, "open_operational_metrics_repository", lambda _settings, _path: MagicMock()
+    )
+    monkeypatch.setattr(fetch_data_entrypoint, "FetchDataUseCase", _build_use_case)
+
+    await fetch_data_entrypoint._run_fetch_data_job(settings)
+
+    assert [
+        (kwargs["snapshot_writer"], kwargs["rollup_reader"], kwargs["rollup_writer"], kwargs["timeseries_export"])
+        for kwargs in received
+    ] == [(None, None, None, None)]
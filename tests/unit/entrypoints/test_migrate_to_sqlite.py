@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import (
+    CanonicalVideo,
+    Release,
+    ReleaseKind,
+    TaskMethod,
+    TaskRunStatus,
+    VideoPoint,
+    VideoScoreStatus,
+    YtAuth,
+)
+from src.entrypoints.migrate_to_sqlite import FileStoreSources, migrate_to_sqlite
+from src.infrastructure.storage.auth_repository import AuthenticationRepository
+from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
+from src.infrastructure.storage.publisher_state_repository import PublisherStateRepository
+from src.infrastructure.storage.release_repository import ReleaseRepository
+from src.infrastructure.storage.sqlite_auth_repository import SqliteAuthenticationRepository
+from src.infrastructure.storage.sqlite_operational_metrics_repository import SqliteOperationalMetricsRepository
+from src.infrastructure.storage.sqlite_publisher_state_repository import SqlitePublisherStateRepository
+from src.infrastructure.storage.sqlite_release_repository import SqliteReleaseRepository
+from src.infrastructure.storage.sqlite_task_run_state_repository import SqliteTaskRunStateRepository
+from src.infrastructure.storage.sqlite_timeseries_repository import SqliteTimeSeriesRepository
+from src.infrastructure.storage.sqlite_video_repository import SqliteVideoRepository
+from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+from src.infrastructure.storage.video_repository import VideoRepository
+
+_NOW = datetime.now(UTC).replace(microsecond=0)
+
+
+def _video(video_id: str) -> CanonicalVideo:
+    return CanonicalVideo(video_id=video_id, title="Song", channel_name="Artist", views=100)
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> FileStoreSources:
+    sources = FileStoreSources(
+        video_db=tmp_path / "db_video.json",
+        auth_db=tmp_path / "db_auth.json",
+        release_db=tmp_path / "db_release.json",
+        publishers_db=tmp_path / "db_publishers.json",
+        timeseries_csv=tmp_path / "db_timeseries.csv",
+        metrics_csv=tmp_path / "db_metrics.csv",
+        task_runs_csv=tmp_path / "db_task_runs.csv",
+    )
+
+    videos = VideoRepository(sources.video_db)
+    videos.upsert_many([_video("v1"), _video("v2")])
+    videos.close()
+
+    timeseries = TimeSeriesRepository(str(sources.timeseries_csv))
+    timeseries.add_video_points(
+        [
+            VideoPoint(time=_NOW - timedelta(days=1), video_id="v1", views=10, likes=1),
+            VideoPoint(
+                time=_NOW, video_id="v1", views=30, likes=2, views_growth=20, score=1, score_status=VideoScoreStatus.UP
+            ),
+        ]
+    )
+    timeseries.close()
+
+    releases = ReleaseRepository(str(sources.release_db))
+    releases.add_or_update_release(
+        Release(
+            platform="YOUTUBE",
+            client_id="creator",
+            release_kind=ReleaseKind.DAILY_VERTICAL.value,
+            release_id="r1",
+            published_at=_NOW.timestamp(),
+        )
+    )
+    releases.close()
+
+    auths = AuthenticationRepository(sources.auth_db)
+    auths.add_or_update_yt_auth(YtAuth(client_id="yt-client", token="token"))
+    auths.close()
+
+    publishers = PublisherStateRepository(str(sources.publishers_db))
+    publishers.set_enabled("tiktok", False)
+    publishers.close()
+
+    task_runs = TaskRunStateRepository(str(sources.task_runs_csv))
+    task_runs.record_task_event(
+        task_method=TaskMethod.FETCH, status=TaskRunStatus.FAILED, error_message="boom", event_time=_NOW
+    )
+    task_runs.close()
+
+    metrics = OperationalMetricsRepository(str(sources.metrics_csv))
+    metrics.record_metric_event(stage="fetch", is_error=False, event_time=_NOW)
+    metrics.record_metric_event(stage="upload", is_error=True, event_time=_NOW)
+    metrics.close()
+
+    return sources
+
+
+def test_dry_run_counts_sources_without_writing(sources: FileStoreSources, tmp_path: Path) -> None:
+    sqlite_db = tmp_path / "db.sqlite3"
+
+    summary = migrate_to_sqlite(sources, sqlite_db, apply_changes=False)
+
+    assert not summary.has_errors
+    assert (summary.videos, summary.video_points, summary.releases, summary.yt_auths) == (2, 2, 1, 1)
+    assert (summary.publisher_states, summary.task_runs, summary.metric_events) == (1, 1, 2)
+    assert not sqlite_db.exists()
+
+
+def test_apply_copies_every_store(sources: FileStoreSources, tmp_path: Path) -> None:
+    sqlite_db = tmp_path / "db.sqlite3"
+
+    summary = migrate_to_sqlite(sources, sqlite_db, apply_changes=True)
+
+    assert not summary.has_errors
+    assert summary.destination_counts == {
+        "video": 2,
+        "video_point": 2,
+        "release": 1,
+        "tiktok_auth": 0,
+        "yt_auth": 1,
+        "publisher_state": 1,
+        "task_run": 1,
+        "operational_metric": 2,
+    }
+
+    videos = SqliteVideoRepository(str(sqlite_db))
+    assert [video.video_id for video in videos.all()] == ["v1", "v2"]
+    timeseries = SqliteTimeSeriesRepository(str(sqlite_db))
+    points = timeseries.get_video_points_by_date_range(_NOW - timedelta(days=2), _NOW + timedelta(hours=1))
+    assert [(point.views, point.score_status) for point in points] == [(10, None), (30, VideoScoreStatus.UP)]
+    release = SqliteReleaseRepository(str(sqlite_db)).get_release(platform="YOUTUBE", client_id="creator")
+    assert release is not None
+    assert release.release_id == "r1"
+    auth = SqliteAuthenticationRepository(sqlite_db).get_yt_auth("yt-client")
+    assert auth is not None
+    assert auth.token == "token"
+    assert SqlitePublisherStateRepository(str(sqlite_db)).get_all() == {"tiktok": False}
+    task_run = SqliteTaskRunStateRepository(str(sqlite_db)).get_latest_task_event(task_method=TaskMethod.FETCH)
+    assert task_run is not None
+    assert (task_run.status, task_run.error_message) == (TaskRunStatus.FAILED, "boom")
+    counts = SqliteOperationalMetricsRepository(str(sqlite_db)).get_metric_counts(
+        start_time=_NOW - timedelta(hours=1), end_time=_NOW
+    )
+    assert counts["fetch"] == {"count": 1, "errors": 0}
+    assert counts["upload"] == {"count": 0, "errors": 1}
+
+
+def test_refuses_destination_that_already_holds_data(sources: FileStoreSources, tmp_path: Path) -> None:
+    sqlite_db = tmp_path / "db.sqlite3"
+    migrate_to_sqlite(sources, sqlite_db, apply_changes=True)
+
+    summary = migrate_to_sqlite(sources, sqlite_db, apply_changes=True)
+
+    assert summary.has_errors
+    assert "already holds data" in summary.errors[0]
+    assert summary.destination_counts["video"] == 2
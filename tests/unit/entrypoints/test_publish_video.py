@@ -7,7 +7,7 @@ from src.entrypoints.publish_video import _run_weekly_publish_job
 
 
 class _ReleaseRepositoryStub:
-    def __init__(self, _db_path: str) -> None:
+    def __init__(self, _settings: object, _db_path: str) -> None:
         self.checked = True
 
     def is_release_at_date(self, platform: str, release_date: object, release_kind: str | None = None) -> bool:
@@ -16,12 +16,12 @@ class _ReleaseRepositoryStub:
 
 
 class _TimeSeriesRepositoryStub:
-    def __init__(self, _db_path: str) -> None:
+    def __init__(self, _settings: object, _db_path: str) -> None:
         return
 
 
 class _VideoRepositoryStub:
-    def __init__(self, _db_path: object) -> None:
+    def __init__(self, _settings: object, _db_path: object) -> None:
         return
 
 
@@ -50,9 +50,9 @@ async def test_weekly_publish_returns_early_when_already_published(monkeypatch:
             _ = request
             return _Result()
 
-    monkeypatch.setattr("src.entrypoints.publish_video.ReleaseRepository", _ReleaseRepositoryStub)
-    monkeypatch.setattr("src.entrypoints.publish_video.TimeSeriesRepository", _TimeSeriesRepositoryStub)
-    monkeypatch.setattr("src.entrypoints.publish_video.VideoRepository", _VideoRepositoryStub)
+    monkeypatch.setattr("src.entrypoints.publish_video.open_release_repository", _ReleaseRepositoryStub)
+    monkeypatch.setattr("src.entrypoints.publish_video.open_timeseries_repository", _TimeSeriesRepositoryStub)
+    monkeypatch.setattr("src.entrypoints.publish_video.open_video_repository", _VideoRepositoryStub)
     monkeypatch.setattr("src.entrypoints.publish_video.WeeklyHorizontalPublishUseCase", _WeeklyUseCaseStub)
 
     await _run_weekly_publish_job(AppSettings(env=Environment.DEVELOPMENT, yt_search_region_code="ES"))
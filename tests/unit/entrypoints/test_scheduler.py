@@ -3,7 +3,18 @@ from __future__ import annotations
 import json
 from datetime import UTC, datetime, timedelta
 
-from src.entrypoints.scheduler import ScheduledJob, _job_is_due, _job_run_key, heartbeat_is_fresh
+import structlog
+
+from src.config.settings import AppSettings
+from src.domain.models import TaskMethod
+from src.entrypoints.scheduler import (
+    ScheduledJob,
+    _build_jobs,
+    _job_is_due,
+    _job_run_key,
+    _run_job,
+    heartbeat_is_fresh,
+)
 
 
 async def _noop() -> None:
@@ -35,3 +46,38 @@ def test_heartbeat_is_fresh_checks_timestamp_window(tmp_path) -> None:
 
     assert heartbeat_is_fresh(heartbeat_file, stale_seconds=60, now=now)
     assert not heartbeat_is_fresh(heartbeat_file, stale_seconds=10, now=now)
+
+
+def test_compaction_job_is_scheduled_weekly() -> None:
+    settings = AppSettings(
+        env="development",
+        yt_search_region_code="US",
+        scheduler_compaction_hour=3,
+        scheduler_compaction_day_of_week=6,
+    )
+
+    [job] = [job for job in _build_jobs(settings) if job.name == "compact_timeseries"]
+
+    assert (job.hour, job.day_of_week) == (3, 6)
+
+
+async def test_run_job_binds_a_run_log_context_per_job(tmp_path) -> None:
+    seen_contexts: list[dict[str, object]] = []
+
+    async def _runner() -> None:
+        seen_contexts.append(structlog.contextvars.get_contextvars())
+
+    fetch_job = ScheduledJob(name="fetch_data", hour=0, minute=0, runner=_runner, task_method=TaskMethod.FETCH)
+    compaction_job = ScheduledJob(name="compact_timeseries", hour=0, minute=0, runner=_runner)
+    heartbeat_file = tmp_path / "heartbeat.json"
+
+    for job in (fetch_job, compaction_job):
+        last_successful = await _run_job(job, datetime.now(UTC), heartbeat_file, last_successful_job_name=None)
+        assert last_successful == job.name
+
+    assert [(context["run_task"], context["run_trigger"]) for context in seen_contexts] == [
+        ("fetch", "scheduler"),
+        ("compact_timeseries", "scheduler"),
+    ]
+    assert seen_contexts[0]["run_id"] != seen_contexts[1]["run_id"]
+    assert structlog.contextvars.get_contextvars() == {}
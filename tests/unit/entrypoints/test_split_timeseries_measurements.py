@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from tinyflux import Point, TinyFlux
+
+from src.domain.models import TaskMethod
+from src.entrypoints.split_timeseries_measurements import split_timeseries_measurements
+from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
+from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _seed_shared_timeseries(path: Path) -> None:
+    db = TinyFlux(str(path))
+    try:
+        db.insert(
+            Point(
+                measurement="Video visualizations",
+                time=datetime(2026, 3, 31, 12, tzinfo=UTC),
+                tags={"video_id": "v1", "score_status": "NEW"},
+                fields={"views": 100, "likes": 1, "views_growth": 0, "score": 1},
+            )
+        )
+        db.insert(
+            Point(
+                measurement="Operational metrics",
+                time=datetime(2026, 3, 31, 12, 5, tzinfo=UTC),
+                tags={"stage": "fetch", "outcome": "success"},
+                fields={"count": 1},
+            )
+        )
+        db.insert(
+            Point(
+                measurement="Task run state",
+                time=datetime(2026, 3, 31, 12, 10, tzinfo=UTC),
+                tags={"task_method": "fetch", "status": "failed", "error_message": "boom, twice"},
+                fields={"count": 1},
+            )
+        )
+    finally:
+        db.close()
+
+
+def test_dry_run_counts_rows_without_writing(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    _seed_shared_timeseries(source)
+    original = source.read_bytes()
+
+    summary = split_timeseries_measurements(
+        source, tmp_path / "db_metrics.csv", tmp_path / "db_task_runs.csv", apply_changes=False
+    )
+
+    assert (summary.metrics_rows, summary.task_run_rows, summary.kept_rows) == (1, 1, 1)
+    assert source.read_bytes() == original
+    assert not (tmp_path / "db_metrics.csv").exists()
+
+
+def test_apply_moves_each_measurement_to_its_own_file(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    metrics = tmp_path / "db_metrics.csv"
+    task_runs = tmp_path / "db_task_runs.csv"
+    _seed_shared_timeseries(source)
+
+    summary = split_timeseries_measurements(source, metrics, task_runs, apply_changes=True)
+
+    assert not summary.has_errors
+    assert summary.error_messages_moved == 1
+    assert summary.backup_path is not None
+    assert source.read_text().count("\n") == 1
+    assert "Video visualizations" in source.read_text()
+    assert "boom" not in task_runs.read_text()
+
+    counts = OperationalMetricsRepository(str(metrics)).get_metric_counts(
+        start_time=datetime(2026, 3, 31, tzinfo=UTC), end_time=datetime(2026, 4, 1, tzinfo=UTC)
+    )
+    latest = TaskRunStateRepository(str(task_runs)).get_latest_task_event(task_method=TaskMethod.FETCH)
+    assert counts["fetch"]["count"] == 1
+    assert latest is not None
+    assert latest.error_message == "boom, twice"
+    assert len(TimeSeriesRepository(str(source)).get_all_points_by_video("v1")) == 1
+
+
+def test_refuses_to_split_into_the_source_file(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    _seed_shared_timeseries(source)
+
+    summary = split_timeseries_measurements(source, source, tmp_path / "db_task_runs.csv", apply_changes=True)
+
+    assert summary.has_errors
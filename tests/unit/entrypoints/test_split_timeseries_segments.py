@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from tinyflux import Point, TinyFlux
+
+from src.config.settings import TimeSeriesSegmentPeriod
+from src.entrypoints.split_timeseries_segments import split_timeseries_segments
+from src.infrastructure.storage.timeseries_repository import TimeSeriesRepository
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _seed_timeseries(path: Path) -> None:
+    db = TinyFlux(str(path))
+    try:
+        for day, video_id in (
+            (datetime(2026, 1, 31, 12, tzinfo=UTC), "v1"),
+            (datetime(2026, 2, 1, 12, tzinfo=UTC), "v2"),
+        ):
+            db.insert(
+                Point(
+                    measurement="Video visualizations",
+                    time=day,
+                    tags={"video_id": video_id, "score_status": "NEW"},
+                    fields={"views": 100, "likes": 1, "views_growth": 0, "score": 1},
+                )
+            )
+        db.insert(
+            Point(
+                measurement="Operational metrics",
+                time=datetime(2026, 2, 1, 13, tzinfo=UTC),
+                tags={"stage": "fetch", "outcome": "success"},
+                fields={"count": 1},
+            )
+        )
+    finally:
+        db.close()
+
+
+def test_dry_run_reports_rows_without_writing(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    _seed_timeseries(source)
+    original = source.read_bytes()
+
+    summary = split_timeseries_segments(source, TimeSeriesSegmentPeriod.MONTH, apply_changes=False)
+
+    assert summary.video_rows == 2
+    assert summary.kept_rows == 1
+    assert summary.segment_rows == {"2026-01": 1, "2026-02": 1}
+    assert source.read_bytes() == original
+    assert not (tmp_path / "db_timeseries.csv.segments").exists()
+
+
+def test_apply_moves_video_rows_and_keeps_other_measurements(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    _seed_timeseries(source)
+    TimeSeriesRepository(str(source)).get_last_timestamp()
+
+    summary = split_timeseries_segments(source, TimeSeriesSegmentPeriod.MONTH, apply_changes=True)
+
+    assert not summary.has_errors
+    assert summary.backup_path is not None
+    assert summary.backup_path.exists()
+    assert "Video visualizations" not in source.read_text()
+    assert "Operational metrics" in source.read_text()
+    assert not (tmp_path / "db_timeseries.csv.watermark.json").exists()
+
+    repo = TimeSeriesRepository(str(source), segment_period=TimeSeriesSegmentPeriod.MONTH)
+    assert [point.tags["video_id"] for point in repo.get_all_points_by_video("v2")] == ["v2"]
+    assert repo.get_last_timestamp() == datetime(2026, 2, 1, 12, tzinfo=UTC)
+    february = repo.get_video_points_by_date_range(datetime(2026, 2, 1, tzinfo=UTC), datetime(2026, 3, 1, tzinfo=UTC))
+    assert [point.video_id for point in february] == ["v2"]
+
+
+def test_apply_merges_rows_into_existing_segments_in_time_order(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    _seed_timeseries(source)
+    repo = TimeSeriesRepository(str(source), segment_period=TimeSeriesSegmentPeriod.MONTH)
+    later = Point(
+        measurement="Video visualizations",
+        time=datetime(2026, 2, 20, 12, tzinfo=UTC),
+        tags={"video_id": "v3", "score_status": "NEW"},
+        fields={"views": 5, "likes": 0, "views_growth": 0, "score": 0},
+    )
+    repo._layout.segment("2026-02").insert_many([later])
+    repo.close()
+
+    split_timeseries_segments(source, TimeSeriesSegmentPeriod.MONTH, apply_changes=True)
+
+    lines = (tmp_path / "db_timeseries.csv.segments" / "2026-02.csv").read_text().splitlines()
+    assert [line.split(",")[0] for line in lines] == ["2026-02-01T12:00:00", "2026-02-20T12:00:00"]
+
+
+def test_none_period_is_rejected(tmp_path: Path) -> None:
+    source = tmp_path / "db_timeseries.csv"
+    _seed_timeseries(source)
+
+    summary = split_timeseries_segments(source, TimeSeriesSegmentPeriod.NONE, apply_changes=True)
+
+    assert summary.has_errors
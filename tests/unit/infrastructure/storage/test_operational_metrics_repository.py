@@ -5,11 +5,17 @@ from datetime import UTC, datetime, timedelta
 import pytest
 
 from src.infrastructure.storage.operational_metrics_repository import OperationalMetricsRepository
+from src.infrastructure.storage.sqlite_operational_metrics_repository import SqliteOperationalMetricsRepository
 
 
-def test_record_and_read_metric_counts(tmp_path) -> None:
+@pytest.fixture(params=[OperationalMetricsRepository, SqliteOperationalMetricsRepository], ids=["files", "sqlite"])
+def repo_class(request: pytest.FixtureRequest) -> type[OperationalMetricsRepository]:
+    return request.param
+
+
+def test_record_and_read_metric_counts(tmp_path, repo_class: type[OperationalMetricsRepository]) -> None:
     db_path = tmp_path / "timeseries.csv"
-    repo = OperationalMetricsRepository(str(db_path))
+    repo = repo_class(str(db_path))
 
     now = datetime.now(UTC)
     repo.record_metric_event(stage="fetch", is_error=False, event_time=now - timedelta(minutes=5))
@@ -26,8 +32,10 @@ def test_record_and_read_metric_counts(tmp_path) -> None:
     repo.close()
 
 
-def test_record_metric_event_rejects_unsupported_stage(tmp_path) -> None:
-    repo = OperationalMetricsRepository(str(tmp_path / "timeseries.csv"))
+def test_record_metric_event_rejects_unsupported_stage(
+    tmp_path, repo_class: type[OperationalMetricsRepository]
+) -> None:
+    repo = repo_class(str(tmp_path / "timeseries.csv"))
 
     with pytest.raises(ValueError, match="Unsupported metrics stage"):
         repo.record_metric_event(stage="unknown", is_error=False)
@@ -35,9 +43,9 @@ def test_record_metric_event_rejects_unsupported_stage(tmp_path) -> None:
     repo.close()
 
 
-def test_retention_prunes_old_metric_events(tmp_path) -> None:
+def test_retention_prunes_old_metric_events(tmp_path, repo_class: type[OperationalMetricsRepository]) -> None:
     db_path = tmp_path / "timeseries.csv"
-    repo = OperationalMetricsRepository(str(db_path), retention_days=30)
+    repo = repo_class(str(db_path), retention_days=30)
 
     now = datetime.now(UTC)
     repo.record_metric_event(stage="fetch", is_error=False, event_time=now - timedelta(days=40))
@@ -50,10 +58,10 @@ def test_retention_prunes_old_metric_events(tmp_path) -> None:
     repo.close()
 
 
-def test_repository_creates_missing_parent_directory(tmp_path) -> None:
+def test_repository_creates_missing_parent_directory(tmp_path, repo_class: type[OperationalMetricsRepository]) -> None:
     db_path = tmp_path / "missing" / "nested" / "timeseries.csv"
 
-    repo = OperationalMetricsRepository(str(db_path))
+    repo = repo_class(str(db_path))
     repo.record_metric_event(stage="fetch", is_error=False)
 
     assert db_path.exists()
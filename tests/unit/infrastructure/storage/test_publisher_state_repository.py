@@ -7,10 +7,13 @@ from pathlib import Path
 import pytest
 
 from src.infrastructure.storage.publisher_state_repository import PublisherStateRepository
+from src.infrastructure.storage.sqlite_publisher_state_repository import SqlitePublisherStateRepository
 
 
-@pytest.fixture
-def repo(tmp_path: Path) -> PublisherStateRepository:
+@pytest.fixture(params=["files", "sqlite"])
+def repo(request: pytest.FixtureRequest, tmp_path: Path) -> PublisherStateRepository:
+    if request.param == "sqlite":
+        return SqlitePublisherStateRepository(str(tmp_path / "db_publishers.sqlite3"))
     db_file = tmp_path / "db_publishers.json"
     return PublisherStateRepository(str(db_file))
 
@@ -2,13 +2,23 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
+import pytest
+from tinyflux import Point, TinyFlux
+
 from src.domain.models import TaskMethod, TaskRunStatus
+from src.infrastructure.storage.sqlite_database import SqliteDatabase, to_time_us
+from src.infrastructure.storage.sqlite_task_run_state_repository import SqliteTaskRunStateRepository
 from src.infrastructure.storage.task_run_state_repository import TaskRunStateRepository
 
 
-def test_record_and_read_latest_task_event(tmp_path) -> None:
+@pytest.fixture(params=[TaskRunStateRepository, SqliteTaskRunStateRepository], ids=["files", "sqlite"])
+def repo_class(request: pytest.FixtureRequest) -> type[TaskRunStateRepository]:
+    return request.param
+
+
+def test_record_and_read_latest_task_event(tmp_path, repo_class: type[TaskRunStateRepository]) -> None:
     db_path = tmp_path / "timeseries.csv"
-    repo = TaskRunStateRepository(str(db_path))
+    repo = repo_class(str(db_path))
 
     now = datetime.now(UTC)
     repo.record_task_event(
@@ -33,8 +43,8 @@ def test_record_and_read_latest_task_event(tmp_path) -> None:
     repo.close()
 
 
-def test_latest_task_event_returns_none_when_absent(tmp_path) -> None:
-    repo = TaskRunStateRepository(str(tmp_path / "timeseries.csv"))
+def test_latest_task_event_returns_none_when_absent(tmp_path, repo_class: type[TaskRunStateRepository]) -> None:
+    repo = repo_class(str(tmp_path / "timeseries.csv"))
 
     latest = repo.get_latest_task_event(task_method=TaskMethod.WEEKLY)
 
@@ -42,8 +52,8 @@ def test_latest_task_event_returns_none_when_absent(tmp_path) -> None:
     repo.close()
 
 
-def test_record_task_event_persists_error_message(tmp_path) -> None:
-    repo = TaskRunStateRepository(str(tmp_path / "timeseries.csv"))
+def test_record_task_event_persists_error_message(tmp_path, repo_class: type[TaskRunStateRepository]) -> None:
+    repo = repo_class(str(tmp_path / "timeseries.csv"))
 
     repo.record_task_event(
         task_method=TaskMethod.DAILY,
@@ -58,3 +68,144 @@ def test_record_task_event_persists_error_message(tmp_path) -> None:
     assert latest.status == TaskRunStatus.FAILED
     assert latest.error_message == "upload failed"
     repo.close()
+
+
+def test_error_message_is_stored_outside_tags(tmp_path) -> None:
+    db_path = tmp_path / "task_runs.csv"
+    repo = TaskRunStateRepository(str(db_path))
+
+    repo.record_task_event(
+        task_method=TaskMethod.FETCH,
+        status=TaskRunStatus.FAILED,
+        error_message="quota exceeded, retry later",
+        event_time=datetime.now(UTC),
+    )
+    repo.close()
+
+    assert "quota exceeded" not in db_path.read_text()
+    assert "quota exceeded" in (tmp_path / "task_runs.csv.errors.jsonl").read_text()
+    events = TaskRunStateRepository(str(db_path)).get_task_events_since(
+        task_method=TaskMethod.FETCH, since=datetime.now(UTC) - timedelta(hours=1)
+    )
+    assert [event.error_message for event in events] == ["quota exceeded, retry later"]
+
+
+def test_reads_legacy_error_message_tag(tmp_path) -> None:
+    db_path = tmp_path / "task_runs.csv"
+    legacy_db = TinyFlux(str(db_path))
+    legacy_db.insert(
+        Point(
+            measurement="Task run state",
+            time=datetime.now(UTC),
+            tags={"task_method": TaskMethod.WEEKLY.value, "status": TaskRunStatus.FAILED.value, "error_message": "old"},
+            fields={"count": 1},
+        )
+    )
+    legacy_db.close()
+
+    latest = TaskRunStateRepository(str(db_path)).get_latest_task_event(task_method=TaskMethod.WEEKLY)
+
+    assert latest is not None
+    assert latest.error_message == "old"
+
+
+def test_snapshot_reads_latest_events_and_window(tmp_path, repo_class: type[TaskRunStateRepository]) -> None:
+    repo = repo_class(str(tmp_path / "task_runs.csv"))
+    now = datetime.now(UTC)
+    since = now - timedelta(days=7)
+    repo.record_task_event(
+        task_method=TaskMethod.WEEKLY,
+        status=TaskRunStatus.FAILED,
+        error_message="old failure",
+        event_time=now - timedelta(days=30),
+    )
+    repo.record_task_event(
+        task_method=TaskMethod.WEEKLY, status=TaskRunStatus.SUCCESS, event_time=now - timedelta(days=20)
+    )
+    repo.record_task_event(
+        task_method=TaskMethod.FETCH, status=TaskRunStatus.QUEUED, event_time=now - timedelta(minutes=2)
+    )
+    repo.record_task_event(
+        task_method=TaskMethod.FETCH,
+        status=TaskRunStatus.FAILED,
+        error_message="quota",
+        event_time=now - timedelta(minutes=1),
+    )
+    repo.record_task_event(task_method=TaskMethod.FETCH, status=TaskRunStatus.QUEUED, event_time=now)
+
+    snapshot = repo.snapshot(since=since)
+
+    for task_method in TaskMethod:
+        for status in (None, *TaskRunStatus):
+            assert snapshot.latest(task_method, status) == repo.get_latest_task_event(
+                task_method=task_method, status=status
+            )
+        assert snapshot.events_since.get(task_method, []) == repo.get_task_events_since(
+            task_method=task_method, since=since
+        )
+    assert snapshot.latest(TaskMethod.FETCH).status == TaskRunStatus.QUEUED
+    assert snapshot.last_error(TaskMethod.FETCH).error_message == "quota"
+    assert snapshot.last_error(TaskMethod.WEEKLY).error_message == "old failure"
+    assert TaskMethod.WEEKLY not in snapshot.events_since
+    repo.close()
+
+
+def test_snapshot_prefers_the_event_recorded_last_on_equal_times(
+    tmp_path, repo_class: type[TaskRunStateRepository]
+) -> None:
+    repo = repo_class(str(tmp_path / "task_runs.csv"))
+    now = datetime.now(UTC)
+    repo.record_task_event(task_method=TaskMethod.DAILY, status=TaskRunStatus.QUEUED, event_time=now)
+    repo.record_task_event(task_method=TaskMethod.DAILY, status=TaskRunStatus.SUCCESS, event_time=now)
+
+    latest = repo.snapshot(since=now - timedelta(hours=1)).latest(TaskMethod.DAILY)
+
+    assert latest is not None
+    assert latest.status == TaskRunStatus.SUCCESS
+    repo.close()
+
+
+def test_data_version_changes_with_every_recorded_event(tmp_path, repo_class: type[TaskRunStateRepository]) -> None:
+    repo = repo_class(str(tmp_path / "task_runs.csv"))
+    now = datetime.now(UTC)
+    repo.record_task_event(task_method=TaskMethod.FETCH, status=TaskRunStatus.QUEUED, event_time=now)
+    before = repo.data_version()
+
+    repo.record_task_event(task_method=TaskMethod.FETCH, status=TaskRunStatus.SUCCESS, event_time=now)
+
+    assert repo.data_version() != before
+    assert repo_class(str(tmp_path / "task_runs.csv")).data_version() == repo.data_version()
+    repo.close()
+
+
+def test_snapshot_skips_events_of_unknown_task_methods(tmp_path, repo_class: type[TaskRunStateRepository]) -> None:
+    db_path = tmp_path / "task_runs.csv"
+    now = datetime.now(UTC)
+    if repo_class is SqliteTaskRunStateRepository:
+        database = SqliteDatabase(db_path)
+        database.execute(
+            "INSERT INTO task_run (time_us, task_method, status, error_message) VALUES (?, ?, ?, ?)",
+            (to_time_us(now), "retired_task", TaskRunStatus.SUCCESS.value, None),
+        )
+        database.close()
+    else:
+        legacy_db = TinyFlux(str(db_path))
+        legacy_db.insert(
+            Point(
+                measurement="Task run state",
+                time=now,
+                tags={"task_method": "retired_task", "status": TaskRunStatus.SUCCESS.value},
+                fields={"count": 1},
+            )
+        )
+        legacy_db.close()
+    repo = repo_class(str(db_path))
+    repo.record_task_event(task_method=TaskMethod.DAILY, status=TaskRunStatus.SUCCESS, event_time=now)
+
+    snapshot = repo.snapshot(since=now - timedelta(hours=1))
+
+    latest = snapshot.latest(TaskMethod.DAILY)
+    assert latest is not None
+    assert latest.status == TaskRunStatus.SUCCESS
+    assert list(snapshot.events_since) == [TaskMethod.DAILY]
+    repo.close()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.exceptions import ScoringError
+from src.domain.models import VideoPoint, VideoScoreStatus
+from src.domain.services.scoring_service import score_and_rank_video_points, score_and_rank_video_records
+from src.infrastructure.storage.video_point_columns import (
+    VideoPointColumns,
+    score_and_rank_video_columns,
+    top_ranked_records,
+)
+
+
+def _point(video_id: str, views: int, views_growth: int | None = None, score: int | None = None) -> VideoPoint:
+    return VideoPoint(
+        time=datetime(2026, 3, 31, 12, 0, 0, tzinfo=UTC),
+        video_id=video_id,
+        views=views,
+        views_growth=views_growth,
+        score=score,
+    )
+
+
+def _random_points(rng: random.Random, video_ids: list[str], *, scored: bool) -> list[VideoPoint]:
+    # Small view ranges and repeated ids make growth ties and "last row wins" lookups common.
+    return [
+        _point(
+            rng.choice(video_ids),
+            rng.randint(0, 20),
+            views_growth=rng.choice([None, rng.randint(1, 20)]),
+            score=rng.choice([None, rng.randint(1, 8)]) if scored else None,
+        )
+        for _ in range(rng.randint(0, 12))
+    ]
+
+
+class TestScoreAndRankVideoColumns:
+    def test_matches_score_and_rank_video_points(self) -> None:
+        previous = [
+            _point("a", 100, score=1),
+            _point("b", 400, score=2),
+            _point("c", 50, score=3),
+            _point("b", 450, score=4),
+        ]
+        current = [
+            _point("a", 600),
+            _point("b", 500),
+            _point("new", 70, views_growth=30),
+            _point("c", 60),
+            _point("tie", 50),
+        ]
+
+        expected = score_and_rank_video_points(current, previous)
+        ranked = score_and_rank_video_columns(
+            VideoPointColumns.from_video_points(current),
+            VideoPointColumns.from_video_points(previous),
+        ).to_video_points()
+
+        assert [p.model_dump() for p in ranked] == [p.model_dump() for p in expected]
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_points_records_and_columns_rankers_agree(self, seed: int) -> None:
+        rng = random.Random(seed)  # noqa: S311 - reproducible test data
+        video_ids = [f"v{index}" for index in range(rng.randint(1, 6))]
+        previous = _random_points(rng, video_ids, scored=True)
+        current = _random_points(rng, video_ids, scored=False) or [_point(video_ids[0], rng.randint(0, 20))]
+
+        by_points = [point.model_dump() for point in score_and_rank_video_points(current, previous)]
+        by_records = [
+            record.to_video_point().model_dump()
+            for record in score_and_rank_video_records(
+                VideoPointColumns.from_video_points(current).to_records(),
+                VideoPointColumns.from_video_points(previous).to_records(),
+            )
+        ]
+        ranked_columns = score_and_rank_video_columns(
+            VideoPointColumns.from_video_points(current),
+            VideoPointColumns.from_video_points(previous),
+        )
+        by_columns = [
+            record.to_video_point().model_dump() for record in top_ranked_records(ranked_columns, len(current))
+        ]
+
+        assert by_records == by_points
+        assert by_columns == by_points
+
+    def test_without_previous_day_marks_all_new(self) -> None:
+        current = [_point("a", 10), _point("b", 30)]
+
+        ranked = score_and_rank_video_columns(
+            VideoPointColumns.from_video_points(current),
+            VideoPointColumns.from_video_points([]),
+        ).to_video_points()
+
+        assert [p.video_id for p in ranked] == ["b", "a"]
+        assert {p.score_status for p in ranked} == {VideoScoreStatus.NEW}
+
+    def test_raises_on_empty_current(self) -> None:
+        with pytest.raises(ScoringError):
+            score_and_rank_video_columns(
+                VideoPointColumns.from_video_points([]),
+                VideoPointColumns.from_video_points([_point("a", 1)]),
+            )
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Generator
 from datetime import UTC, date, datetime
+from unittest.mock import patch
 
 import pytest
+from tinydb.table import Table
 
 from src.domain.models import Platform, Release, ReleaseKind
 from src.infrastructure.storage.release_repository import ReleaseRepository
+from src.infrastructure.storage.sqlite_release_repository import SqliteReleaseRepository
 
 
-def test_add_or_update_release_keeps_daily_and_weekly_records_separate(tmp_path) -> None:
-    repo = ReleaseRepository(str(tmp_path / "db.json"))
+@pytest.fixture(params=[ReleaseRepository, SqliteReleaseRepository], ids=["files", "sqlite"])
+def repo_class(request: pytest.FixtureRequest) -> type[ReleaseRepository]:
+    return request.param
+
+
+def test_add_or_update_release_keeps_daily_and_weekly_records_separate(
+    tmp_path, repo_class: type[ReleaseRepository]
+) -> None:
+    repo = repo_class(str(tmp_path / "db.json"))
     published_at = datetime(2026, 3, 31, tzinfo=UTC).timestamp()
 
     try:
@@ -52,8 +63,10 @@ def test_add_or_update_release_keeps_daily_and_weekly_records_separate(tmp_path)
         repo.close()
 
 
-def test_is_release_at_date_accepts_legacy_unscoped_release_for_transition(tmp_path) -> None:
-    repo = ReleaseRepository(str(tmp_path / "db.json"))
+def test_is_release_at_date_accepts_legacy_unscoped_release_for_transition(
+    tmp_path, repo_class: type[ReleaseRepository]
+) -> None:
+    repo = repo_class(str(tmp_path / "db.json"))
     release_date = date(2026, 3, 31)
 
     try:
@@ -75,8 +88,8 @@ def test_is_release_at_date_accepts_legacy_unscoped_release_for_transition(tmp_p
         repo.close()
 
 
-def test_get_latest_release_returns_latest_by_published_at(tmp_path) -> None:
-    repo = ReleaseRepository(str(tmp_path / "db.json"))
+def test_get_latest_release_returns_latest_by_published_at(tmp_path, repo_class: type[ReleaseRepository]) -> None:
+    repo = repo_class(str(tmp_path / "db.json"))
     try:
         repo.add_or_update_release(
             Release(
@@ -122,11 +135,17 @@ class TestAddOrUpdateRelease:
     """
 
     @pytest.fixture()
-    def repo(self, tmp_path) -> Generator[ReleaseRepository]:
-        r = ReleaseRepository(str(tmp_path / "db.json"))
+    def repo(self, tmp_path, repo_class: type[ReleaseRepository]) -> Generator[ReleaseRepository]:
+        r = repo_class(str(tmp_path / "db.json"))
         yield r
         r.close()
 
+    @staticmethod
+    def _stored_rows(repo: ReleaseRepository) -> list[dict[str, object]]:
+        if isinstance(repo, SqliteReleaseRepository):
+            return [json.loads(row["data"]) for row in repo._db.fetch_all("SELECT data FROM release ORDER BY id")]
+        return repo._db.table("release").all()
+
     def _make_release(
         self,
         *,
@@ -166,7 +185,7 @@ class TestAddOrUpdateRelease:
                 )
             )
 
-        rows = repo._db.table("release").all()
+        rows = self._stored_rows(repo)
         assert len(rows) == 3
         stored_ids = {r["release_id"] for r in rows}
         assert stored_ids == set(ids)
@@ -176,7 +195,7 @@ class TestAddOrUpdateRelease:
         release = self._make_release()
         for _ in range(4):
             repo.add_or_update_release(release)
-        assert len(repo._db.table("release").all()) == 4
+        assert len(self._stored_rows(repo)) == 4
 
     # TC-04 — duplicate stored twice but is_release_at_date still returns True
     def test_duplicate_release_id_stored_twice_but_is_release_at_date_still_true(self, repo: ReleaseRepository) -> None:
@@ -187,7 +206,7 @@ class TestAddOrUpdateRelease:
         repo.add_or_update_release(release)
         repo.add_or_update_release(release)  # simulates upstream guard not blocking
 
-        assert len(repo._db.table("release").all()) == 2
+        assert len(self._stored_rows(repo)) == 2
         assert (
             repo.is_release_at_date(
                 platform=Platform.YOUTUBE.value,
@@ -207,7 +226,7 @@ class TestAddOrUpdateRelease:
     # TC-06 — Release with all fields None is stored without error
     def test_all_none_fields_stored_without_error(self, repo: ReleaseRepository) -> None:
         repo.add_or_update_release(Release())
-        rows = repo._db.table("release").all()
+        rows = self._stored_rows(repo)
         assert len(rows) == 1
         row = rows[0]
         assert row["platform"] is None
@@ -273,4 +292,124 @@ class TestAddOrUpdateRelease:
         assert result_a.release_id == "id-A"
         assert result_b is not None
         assert result_b.release_id == "id-B"
-        assert len(repo._db.table("release").all()) == 2
+        assert len(self._stored_rows(repo)) == 2
+
+
+# ---------------------------------------------------------------------------
+# is_release_at_date / get_latest_release index
+# ---------------------------------------------------------------------------
+
+
+def _release(release_id: str, published_at: datetime | None, release_kind: str | None = None) -> Release:
+    return Release(
+        platform=Platform.YOUTUBE.value,
+        client_id="creator",
+        release_kind=release_kind,
+        release_id=release_id,
+        published_at=published_at.timestamp() if published_at is not None else None,
+    )
+
+
+class TestReleaseLookups:
+    @pytest.fixture()
+    def repo(self, tmp_path, repo_class: type[ReleaseRepository]) -> Generator[ReleaseRepository]:
+        r = repo_class(str(tmp_path / "db.json"))
+        yield r
+        r.close()
+
+    def test_latest_prefers_later_insert_among_equal_timestamps(self, repo: ReleaseRepository) -> None:
+        published_at = datetime(2026, 3, 31, 9, 0, tzinfo=UTC)
+        repo.add_or_update_release(_release("first", published_at))
+        repo.add_or_update_release(_release("second", published_at))
+        repo.add_or_update_release(_release("undated", None))
+
+        latest = repo.get_latest_release(Platform.YOUTUBE.value)
+
+        assert latest is not None
+        assert latest.release_id == "second"
+
+    def test_latest_falls_back_to_last_undated_release(self, repo: ReleaseRepository) -> None:
+        repo.add_or_update_release(_release("first", None))
+        repo.add_or_update_release(_release("second", None))
+
+        latest = repo.get_latest_release(Platform.YOUTUBE.value)
+
+        assert latest is not None
+        assert latest.release_id == "second"
+
+    def test_latest_is_scoped_by_exact_kind(self, repo: ReleaseRepository) -> None:
+        repo.add_or_update_release(_release("unscoped", datetime(2026, 3, 31, 9, 0, tzinfo=UTC)))
+
+        assert repo.get_latest_release(Platform.YOUTUBE.value, ReleaseKind.DAILY_VERTICAL.value) is None
+        assert repo.get_latest_release(Platform.TIKTOK.value) is None
+
+    def test_lookups_follow_updates_and_deletes(self, repo: ReleaseRepository) -> None:
+        kind = ReleaseKind.DAILY_VERTICAL.value
+        repo.add_or_update_release(_release("moved", datetime(2026, 3, 31, 9, 0, tzinfo=UTC), kind))
+        repo.update_release(_release("moved", datetime(2026, 4, 2, 9, 0, tzinfo=UTC), kind))
+
+        assert not repo.is_release_at_date(Platform.YOUTUBE.value, date(2026, 3, 31), kind)
+        assert repo.is_release_at_date(Platform.YOUTUBE.value, date(2026, 4, 2), kind)
+
+        repo.clear_releases_for_platform(Platform.YOUTUBE.value)
+
+        assert not repo.is_release_at_date(Platform.YOUTUBE.value, date(2026, 4, 2))
+        assert repo.get_latest_release(Platform.YOUTUBE.value, kind) is None
+
+
+def test_release_lookups_do_not_scan_the_table(tmp_path) -> None:
+    repo = ReleaseRepository(str(tmp_path / "db.json"))
+    kind = ReleaseKind.DAILY_VERTICAL.value
+    repo.add_or_update_release(_release("r1", datetime(2026, 3, 31, 9, 0, tzinfo=UTC), kind))
+
+    with patch.object(Table, "search", side_effect=AssertionError("table scan")):
+        repo.add_or_update_release(_release("r2", datetime(2026, 4, 1, 9, 0, tzinfo=UTC), kind))
+        published = repo.is_release_at_date(Platform.YOUTUBE.value, date(2026, 4, 1), kind)
+        latest = repo.get_latest_release(Platform.YOUTUBE.value, kind)
+
+    assert published
+    assert latest is not None
+    assert latest.release_id == "r2"
+
+
+def test_release_index_is_shared_by_repositories_of_the_process(tmp_path) -> None:
+    first = ReleaseRepository(str(tmp_path / "db.json"))
+    first.add_or_update_release(_release("r1", datetime(2026, 3, 31, 9, 0, tzinfo=UTC)))
+
+    with patch.object(Table, "all", side_effect=AssertionError("table scan")):
+        second = ReleaseRepository(str(tmp_path / "db.json"))
+        assert second.is_release_at_date(Platform.YOUTUBE.value, date(2026, 3, 31))
+        second.add_or_update_release(_release("r2", datetime(2026, 4, 1, 9, 0, tzinfo=UTC)))
+        assert first.is_release_at_date(Platform.YOUTUBE.value, date(2026, 4, 1))
+        latest = ReleaseRepository(str(tmp_path / "db.json")).get_latest_release(Platform.YOUTUBE.value)
+
+    assert latest is not None
+    assert latest.release_id == "r2"
+
+
+def test_release_index_follows_writes_from_other_instances(tmp_path) -> None:
+    reader = ReleaseRepository(str(tmp_path / "db.json"))
+    writer = ReleaseRepository(str(tmp_path / "db.json"))
+    assert not reader.is_release_at_date(Platform.YOUTUBE.value, date(2026, 3, 31))
+
+    writer.add_or_update_release(_release("r1", datetime(2026, 3, 31, 9, 0, tzinfo=UTC)))
+
+    assert reader.is_release_at_date(Platform.YOUTUBE.value, date(2026, 3, 31))
+    latest = reader.get_latest_release(Platform.YOUTUBE.value)
+    assert latest is not None
+    assert latest.release_id == "r1"
+
+
+def test_release_index_drops_writes_discarded_by_buffered_block(tmp_path) -> None:
+    repo = ReleaseRepository(str(tmp_path / "db.json"))
+
+    def publish_then_fail() -> None:
+        with repo.buffered():
+            repo.add_or_update_release(_release("r1", datetime(2026, 3, 31, 9, 0, tzinfo=UTC)))
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        publish_then_fail()
+
+    assert not repo.is_release_at_date(Platform.YOUTUBE.value, date(2026, 3, 31))
+    assert repo.get_latest_release(Platform.YOUTUBE.value) is None
@@ -0,0 +1,157 @@
+"""Tests for the rendered video artifact registry."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.models import VideoArtifactKind
+from src.infrastructure.video.artifact_registry import VideoArtifactRegistry, artifact_kind
+
+
+def _write(path: Path, *, mtime: float, content: bytes = b"mp4") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected"),
+    [
+        ("abc123_format.mp4", VideoArtifactKind.HORIZONTAL),
+        ("abc123_vertical_format.mp4", VideoArtifactKind.VERTICAL),
+        ("20260515_format.mp4", VideoArtifactKind.HORIZONTAL_COMPILATION),
+        ("20260515_vertical_format.mp4", VideoArtifactKind.VERTICAL_COMPILATION),
+        ("abc123.mp4", None),
+        ("abc123_format.mp4.part", None),
+    ],
+)
+def test_artifact_kind(file_name: str, expected: VideoArtifactKind | None) -> None:
+    assert artifact_kind(file_name) == expected
+
+
+def test_latest_prefers_the_newest_dated_folder(tmp_path: Path) -> None:
+    videos = tmp_path / "videos"
+    _write(videos / "20260514" / "late_format.mp4", mtime=2_000)
+    newest = _write(videos / "20260515" / "20260515_vertical_format.mp4", mtime=1_000)
+    _write(videos / "yt" / "source.mp4", mtime=3_000)
+
+    latest = VideoArtifactRegistry(videos).latest_artifact()
+
+    assert latest is not None
+    assert latest.path == str(newest)
+    assert (latest.kind, latest.size, latest.mtime) == (VideoArtifactKind.VERTICAL_COMPILATION, 3, 1_000)
+    assert [artifact.path for artifact in VideoArtifactRegistry(videos).artifacts()] == [
+        str(newest),
+        str(videos / "20260514" / "late_format.mp4"),
+    ]
+
+
+def test_missing_folder_has_no_artifacts(tmp_path: Path) -> None:
+    registry = VideoArtifactRegistry(tmp_path / "videos")
+
+    assert registry.latest_artifact() is None
+    assert not registry.index_path.exists()
+
+
+def test_lookups_rescan_only_changed_directories(tmp_path: Path) -> None:
+    videos = tmp_path / "videos"
+    first = _write(videos / "20260515" / "a_format.mp4", mtime=1_000)
+    registry = VideoArtifactRegistry(videos)
+    assert registry.latest_artifact() is not None
+    assert registry.index_path == tmp_path / "videos.artifacts.json"
+
+    second = _write(videos / "20260515" / "b_format.mp4", mtime=2_000)
+    latest = registry.latest_artifact()
+    assert latest is not None
+    assert latest.path == str(second)
+
+    second.unlink()
+    latest = registry.latest_artifact()
+    assert latest is not None
+    assert latest.path == str(first)
+
+    first.unlink()
+    assert registry.latest_artifact() is None
+
+
+def test_lookups_only_stat_the_root_and_the_newest_dated_folder(tmp_path: Path) -> None:
+    videos = tmp_path / "videos"
+    for day in range(10, 16):
+        _write(videos / f"202605{day}" / "a_format.mp4", mtime=1_000 + day)
+    _write(videos / "20260515" / "parts" / "b_format.mp4", mtime=500)
+    registry = VideoArtifactRegistry(videos)
+    assert registry.latest_artifact() is not None
+
+    real_stat = Path.stat
+    statted: list[Path] = []
+
+    def spy_stat(path: Path, **kwargs: Any) -> os.stat_result:
+        statted.append(path)
+        return real_stat(path, **kwargs)
+
+    with patch.object(Path, "stat", spy_stat):
+        latest = registry.latest_artifact()
+
+    assert latest is not None
+    assert latest.path == str(videos / "20260515" / "a_format.mp4")
+    directories = {path for path in statted if path != registry.index_path}
+    assert directories == {videos, videos / "20260515", videos / "20260515" / "parts"}
+
+
+def test_new_dated_folder_rechecks_older_folders(tmp_path: Path) -> None:
+    videos = tmp_path / "videos"
+    old = _write(videos / "20260514" / "a_format.mp4", mtime=1_000)
+    _write(videos / "20260515" / "b_format.mp4", mtime=2_000)
+    registry = VideoArtifactRegistry(videos)
+    assert len(registry.artifacts()) == 2
+
+    old.unlink()
+    newest = _write(videos / "20260516" / "c_format.mp4", mtime=3_000)
+
+    assert [artifact.path for artifact in registry.artifacts()] == [
+        str(videos / "20260515" / "b_format.mp4"),
+        str(newest),
+    ]
+
+
+def test_record_keeps_duration_until_the_file_changes(tmp_path: Path) -> None:
+    videos = tmp_path / "videos"
+    path = _write(videos / "20260515" / "a_vertical_format.mp4", mtime=1_000)
+    registry = VideoArtifactRegistry(videos)
+
+    recorded = registry.record(path, duration=42.5)
+    _write(videos / "20260515" / "b_format.mp4", mtime=500)
+
+    assert recorded is not None
+    assert recorded.duration == 42.5
+    assert VideoArtifactRegistry(videos).latest_artifact() == recorded
+    assert registry.record(tmp_path / "elsewhere_format.mp4") is None
+    assert registry.record(videos / "20260515" / "notes.txt") is None
+
+    # Rewriting a file leaves its directory mtime alone: the renderer records it again.
+    _write(path, mtime=3_000, content=b"re-rendered")
+    rerecorded = registry.record(path)
+    assert rerecorded is not None
+    assert (rerecorded.size, rerecorded.duration) == (len(b"re-rendered"), None)
+
+
+def test_rebuild_recovers_a_corrupt_index(tmp_path: Path) -> None:
+    videos = tmp_path / "videos"
+    path = _write(videos / "20260515" / "a_format.mp4", mtime=1_000)
+    registry = VideoArtifactRegistry(videos)
+    registry.record(path, duration=10.0)
+    assert registry.rebuild() == 1
+    assert registry.latest_artifact().duration == 10.0  # type: ignore[union-attr]
+
+    registry.index_path.write_text("{not json")
+
+    assert registry.rebuild() == 1
+    latest = VideoArtifactRegistry(videos).latest_artifact()
+    assert latest is not None
+    assert (latest.path, latest.duration) == (str(path), None)
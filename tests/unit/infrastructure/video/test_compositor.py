@@ -5,7 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import AsyncMock
 
-from src.domain.models import Channel, Video
+from src.domain.models import Channel, Video, VideoArtifactKind
+from src.infrastructure.video.artifact_registry import VideoArtifactRegistry
 from src.infrastructure.video.asset_manager import VideoAssetManager
 from src.infrastructure.video.compositor import VideoCompositor
 from src.infrastructure.video.renderer import VideoRenderer
@@ -223,3 +224,21 @@ class TestVideoCompositor:
         assert kwargs["codec"] == "libx264"
         assert kwargs["threads"] == 1
         assert kwargs["preset"] == "ultrafast"
+
+    async def test_render_clip_records_output_in_artifact_registry(self, tmp_path: Path, monkeypatch) -> None:
+        asset_manager = _make_asset_manager(tmp_path)
+        compositor = VideoCompositor(asset_manager, VideoRenderer(asset_manager))
+        clip = _RecordedCompositeClip([])
+        clip.duration = 12.5
+        monkeypatch.setattr(clip, "write_videofile", lambda path, **_kwargs: Path(path).write_bytes(b"mp4"))
+
+        class _Settings:
+            threads_workers = 2
+
+        monkeypatch.setattr("src.infrastructure.video.compositor.get_app_settings", lambda: _Settings())
+
+        result = await compositor._render_clip(clip, "fresh_vertical")
+
+        latest = VideoArtifactRegistry(asset_manager.video_generated_base_folder).latest_artifact()
+        assert latest is not None
+        assert (latest.path, latest.kind, latest.duration) == (result, VideoArtifactKind.VERTICAL, 12.5)
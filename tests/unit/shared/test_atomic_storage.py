@@ -5,7 +5,7 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
-from src.shared.atomic_storage import AtomicFileStorage
+from src.shared.atomic_storage import AtomicFileStorage, JournalOp
 
 
 class TestAtomicFileStorageBasic:
@@ -89,3 +89,86 @@ class TestAtomicFileStorageBasic:
             storage = AtomicFileStorage(str(file_path))
             result = storage.read_json()
             assert result == {}
+
+
+class TestAtomicFileStorageJournal:
+    """Verify the journaled mode: appended changes, replay and compaction."""
+
+    def test_append_ops_journals_without_rewriting_snapshot(self, tmp_path: Path) -> None:
+        """Small changes should only append to the journal."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True)
+        storage.write_json({"items": {"a": 1, "b": 2}, "version": 1})
+        snapshot = (tmp_path / "test.json").read_bytes()
+
+        storage.append_ops([JournalOp(("items", "a"), 10), JournalOp(("items", "b"), delete=True)])
+        storage.append_ops([JournalOp(("items", "c", "nested"), True)])
+
+        assert (tmp_path / "test.json").read_bytes() == snapshot
+        assert storage.read_json() == {"items": {"a": 10, "c": {"nested": True}}, "version": 1}
+        assert AtomicFileStorage(str(tmp_path / "test.json"), journal=True).read_json() == storage.read_json()
+
+    def test_expect_drops_records_whose_condition_no_longer_holds(self, tmp_path: Path) -> None:
+        """A record conditioned on a top-level value should only apply while it holds."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True)
+        storage.write_json({"stamp": 1, "items": {}})
+
+        storage.append_ops([JournalOp(("stamp",), 2), JournalOp(("items", "a"), 1)], expect={"stamp": 1})
+        storage.append_ops([JournalOp(("stamp",), 3), JournalOp(("items", "b"), 1)], expect={"stamp": 1})
+
+        assert storage.read_json() == {"stamp": 2, "items": {"a": 1}}
+
+    def test_write_json_resets_journal(self, tmp_path: Path) -> None:
+        """A full write should supersede every journaled change."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True)
+        storage.append_ops([JournalOp(("old",), 1)])
+
+        storage.write_json({"new": 1})
+
+        assert storage.read_json() == {"new": 1}
+
+    def test_journal_of_replaced_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        """A journal left over from a crash after the snapshot was replaced should not be replayed."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True)
+        storage.write_json({"value": 1})
+        storage.append_ops([JournalOp(("value",), 2)])
+        stale_journal = (tmp_path / "test.json.journal").read_bytes()
+
+        storage.write_json({"value": 3})
+        (tmp_path / "test.json.journal").write_bytes(stale_journal)
+
+        assert storage.read_json() == {"value": 3}
+
+    def test_torn_record_is_skipped(self, tmp_path: Path) -> None:
+        """An interrupted append should not hide records appended after it."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True)
+        storage.write_json({})
+        storage.append_ops([JournalOp(("a",), 1)])
+        with (tmp_path / "test.json.journal").open("ab") as journal:
+            journal.write(b'{"ops":[{"p":["b"],')
+
+        storage.append_ops([JournalOp(("c",), 3)])
+
+        assert storage.read_json() == {"a": 1, "c": 3}
+
+    def test_compacts_once_journal_outgrows_threshold(self, tmp_path: Path) -> None:
+        """The journal should be folded into the snapshot past the size threshold."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True, compact_bytes=200)
+
+        for index in range(20):
+            storage.append_ops([JournalOp(("items", str(index)), index)])
+
+        assert (tmp_path / "test.json.journal").stat().st_size <= 200
+        assert len(AtomicFileStorage(str(tmp_path / "test.json")).read_json()["items"]) > 0
+        assert storage.read_json() == {"items": {str(index): index for index in range(20)}}
+
+    def test_locked_read_write_journals_changed_keys(self, tmp_path: Path) -> None:
+        """locked_read_write should append only the changed top-level keys."""
+        storage = AtomicFileStorage(str(tmp_path / "test.json"), journal=True)
+        storage.write_json({"keep": {"big": "x" * 1000}, "counter": 1, "gone": True})
+
+        with storage.locked_read_write() as data:
+            data["counter"] = 2
+            del data["gone"]
+
+        assert storage.read_json() == {"keep": {"big": "x" * 1000}, "counter": 2}
+        assert (tmp_path / "test.json.journal").stat().st_size < 200
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.shared import json_codec
+
+
+def test_dumps_is_compact_utf8_by_default() -> None:
+    assert json_codec.dumps({"a": [1, 2], "b": "ñ"}) == '{"a":[1,2],"b":"ñ"}'.encode()
+
+
+def test_dumps_with_indent_is_readable_by_stdlib() -> None:
+    encoded = json_codec.dumps({"a": {"b": 1}}, indent=2)
+
+    assert b'\n  "a"' in encoded
+    assert json.loads(encoded) == {"a": {"b": 1}}
+
+
+def test_loads_accepts_bytes_and_str() -> None:
+    assert json_codec.loads(b'{"a":1}') == json_codec.loads('{"a":1}') == {"a": 1}
+
+
+def test_loads_raises_json_decode_error() -> None:
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads(b"{not json")
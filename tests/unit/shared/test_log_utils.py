@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 
-from src.shared.log_utils import classify_log_line, read_log_lines_since
+from src.shared.log_utils import (
+    LogCursor,
+    LogTailer,
+    classify_log_line,
+    format_run_log_record,
+    latest_run_log,
+    read_log_lines_since,
+)
 
 
 def test_classify_log_line_error() -> None:
@@ -81,3 +89,113 @@ def test_read_log_lines_since_respects_max_lines() -> None:
         assert "line 99" in result[-1]["text"]
     finally:
         Path(path).unlink()
+
+
+def test_log_cursor_round_trips_and_rejects_malformed_tokens() -> None:
+    cursor = LogCursor(inode=42, offset=1024)
+
+    assert LogCursor.parse(str(cursor)) == cursor
+    assert LogCursor.parse(None) is None
+    assert LogCursor.parse("42") is None
+    assert LogCursor.parse("42--1") is None
+
+
+def test_tail_reads_backwards_only_as_far_as_needed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("src.shared.log_utils.TAIL_BLOCK_SIZE", 64)
+    log_path = tmp_path / "app.log"
+    log_path.write_text("".join(f"2026-05-16 10:00:00 [info] line {i}\n" for i in range(1000)) + "half")
+    reads: list[int] = []
+    original_open = Path.open
+
+    def counting_open(self: Path, *args: object, **kwargs: object):
+        handle = original_open(self, *args, **kwargs)
+        read = handle.read
+        handle.read = lambda size=-1: reads.append(size) or read(size)  # type: ignore[method-assign]
+        return handle
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    lines, cursor = LogTailer(log_path).tail(3)
+
+    assert [line["text"][-8:] for line in lines] == ["line 997", "line 998", "line 999"]
+    assert cursor is not None
+    assert cursor.offset == log_path.stat().st_size - len("half")
+    assert sum(reads) <= 4 * 64
+
+
+def test_read_from_returns_only_complete_appended_lines(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("old line\n")
+    tailer = LogTailer(log_path)
+    _lines, cursor = tailer.tail(10)
+    assert cursor is not None
+
+    with log_path.open("a") as log_file:
+        log_file.write("new error line\nhalf")
+    lines, cursor = tailer.read_from(cursor)
+    assert lines == [{"text": "new error line", "level": "error"}]
+
+    with log_path.open("a") as log_file:
+        log_file.write(" done\n")
+    lines, cursor = tailer.read_from(cursor)
+    assert [line["text"] for line in lines] == ["half done"]
+    assert tailer.read_from(cursor) == ([], cursor)
+
+
+def test_read_from_caps_each_read(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("")
+    tailer = LogTailer(log_path, max_read_bytes=16)
+    _lines, cursor = tailer.tail(10)
+    assert cursor is not None
+    log_path.write_text("aaaa\nbbbb\ncccc\ndddd\n")
+
+    first, cursor = tailer.read_from(cursor)
+    second, cursor = tailer.read_from(cursor)
+
+    assert [line["text"] for line in first] == ["aaaa", "bbbb", "cccc"]
+    assert [line["text"] for line in second] == ["dddd"]
+
+
+def test_read_from_follows_rollover_and_truncation(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("first\n")
+    tailer = LogTailer(log_path)
+    _lines, cursor = tailer.tail(10)
+    assert cursor is not None
+
+    # TimedRotatingFileHandler renames the file at midnight and opens a new one.
+    with log_path.open("a") as log_file:
+        log_file.write("last of the day")
+    log_path.rename(tmp_path / "app.log.2026-05-16")
+    log_path.write_text("next day\n")
+    lines, cursor = tailer.read_from(cursor)
+    assert [line["text"] for line in lines] == ["last of the day", "next day"]
+    assert cursor.inode == log_path.stat().st_ino
+
+    log_path.write_text("rewritten\n")
+    lines, _cursor = tailer.read_from(LogCursor(inode=log_path.stat().st_ino, offset=1_000))
+    assert [line["text"] for line in lines] == ["rewritten"]
+
+
+def test_latest_run_log_picks_the_newest_run_of_the_task(tmp_path: Path) -> None:
+    (tmp_path / "fetch").mkdir()
+    for run_id in ("20260516T100000Z-aaaa", "20260517T090000Z-bbbb"):
+        (tmp_path / "fetch" / f"{run_id}.jsonl").touch()
+
+    assert latest_run_log(tmp_path, "fetch") == tmp_path / "fetch" / "20260517T090000Z-bbbb.jsonl"
+    assert latest_run_log(tmp_path, "daily") is None
+
+
+def test_format_run_log_record_renders_like_the_main_log() -> None:
+    record = {
+        "event": "fetch.saved",
+        "videos": 3,
+        "run_id": "r1",
+        "run_task": "fetch",
+        "run_trigger": "admin",
+        "level": "warning",
+        "timestamp": "2026-05-16 10:00:00",
+    }
+
+    assert format_run_log_record(json.dumps(record)) == "2026-05-16 10:00:00 [warning] fetch.saved videos=3"
+    assert format_run_log_record("not json") == "not json"
@@ -1,7 +1,12 @@
 """Unit tests for explicit logging setup helpers."""
 
+import asyncio
+import json
+import logging
 from pathlib import Path
 
+import structlog
+
 from src.shared import logging as logging_module
 
 
@@ -19,16 +24,74 @@ def test_setup_logging_replaces_owned_handlers_without_duplication(tmp_path: Pat
         logging_module.setup_logging(first_log_file)
         first_handlers = list(logging_module._configured_handlers)
 
-        assert len(first_handlers) == 2
+        assert len(first_handlers) == 3
         assert all(handler in logging_module.logging.root.handlers for handler in first_handlers)
         assert first_log_file.exists()
 
         second_log_file = tmp_path / "second" / "app.log"
         logging_module.setup_logging(second_log_file)
 
-        assert len(logging_module._configured_handlers) == 2
+        assert len(logging_module._configured_handlers) == 3
         assert second_log_file.exists()
         assert all(handler not in logging_module.logging.root.handlers for handler in first_handlers)
         assert all(handler in logging_module.logging.root.handlers for handler in logging_module._configured_handlers)
     finally:
         _cleanup_configured_handlers()
+
+
+def test_run_log_context_writes_each_run_to_its_own_segment(tmp_path: Path) -> None:
+    _cleanup_configured_handlers()
+    log_file = tmp_path / "app.log"
+    logger = logging_module.get_logger("tests.run_logs")
+    run_ids: dict[str, str] = {}
+
+    async def run(task: str) -> None:
+        with logging_module.run_log_context(task, trigger="admin") as run_id:
+            run_ids[task] = run_id
+            for step in range(2):
+                logger.info("job.step", task=task, step=step)
+                logging.getLogger("tests.stdlib").warning("stdlib line from %s", task)
+                await asyncio.sleep(0)
+
+    async def run_overlapping() -> None:
+        await asyncio.gather(run("fetch"), run("daily"))
+
+    try:
+        logging_module.setup_logging(log_file)
+        logger.info("outside.any.run")
+        asyncio.run(run_overlapping())
+
+        for task in ("fetch", "daily"):
+            segment = logging_module.run_logs_folder(log_file) / task / f"{run_ids[task]}.jsonl"
+            records = [json.loads(line) for line in segment.read_text().splitlines()]
+            assert [record["event"] for record in records] == [
+                "job.step",
+                f"stdlib line from {task}",
+                "job.step",
+                f"stdlib line from {task}",
+            ]
+            assert {(record["run_id"], record["run_task"], record["run_trigger"]) for record in records} == {
+                (run_ids[task], task, "admin")
+            }
+        assert f"run_id={run_ids['fetch']}" in log_file.read_text()
+        assert structlog.contextvars.get_contextvars() == {}
+    finally:
+        _cleanup_configured_handlers()
+
+
+def test_run_log_context_prunes_old_segments(tmp_path: Path, monkeypatch) -> None:
+    _cleanup_configured_handlers()
+    monkeypatch.setattr(logging_module, "RUN_LOGS_KEPT", 2)
+    task_folder = logging_module.run_logs_folder(tmp_path / "app.log") / "weekly"
+    task_folder.mkdir(parents=True)
+    for stamp in ("20260101T000000Z-a", "20260102T000000Z-b", "20260103T000000Z-c"):
+        (task_folder / f"{stamp}.jsonl").touch()
+
+    try:
+        logging_module.setup_logging(tmp_path / "app.log")
+        with logging_module.run_log_context("weekly", trigger="scheduler") as run_id:
+            pass
+    finally:
+        _cleanup_configured_handlers()
+
+    assert sorted(path.name for path in task_folder.iterdir()) == ["20260103T000000Z-c.jsonl", f"{run_id}.jsonl"]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import re
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
 
@@ -11,7 +14,14 @@ from src.application.get_admin_task_status_use_case import TaskStatusResult
 from src.application.get_operational_metrics_use_case import OperationalMetricsResult
 from src.application.get_setup_page_use_case import GetSetupPageResult
 from src.config.settings import AppSettings
-from src.domain.models import IntegrationCheckResult, IntegrationCheckStatus, IntegrationPlatform
+from src.domain.models import (
+    IntegrationCheckResult,
+    IntegrationCheckStatus,
+    IntegrationPlatform,
+    TaskMethod,
+    TaskRunState,
+    TaskRunStatus,
+)
 from src.web.dependencies import (
     get_admin_task_status_use_case,
     get_check_platform_connection_use_case,
@@ -51,10 +61,18 @@ class _OperationalMetricsUseCaseStub:
 @dataclass
 class _AdminTaskStatusUseCaseStub:
     result: TaskStatusResult
+    executions: int = 0
 
     def execute(self) -> TaskStatusResult:
+        self.executions += 1
         return self.result
 
+    def data_version(self) -> str:
+        return "stub"
+
+    def is_task_complete(self, task_method: str) -> bool:
+        return self.result.latest_status_by_method.get(task_method) not in ("queued", None)
+
     def get_task_started_at(self, _task_method: str) -> float | None:
         return None
 
@@ -614,6 +632,102 @@ def test_admin_tasks_status_shows_running_indicator(monkeypatch) -> None:
     assert "Task running" in response.text
 
 
+def test_admin_tasks_status_returns_304_while_status_is_unchanged(monkeypatch) -> None:
+    monkeypatch.setenv("TOP_MUSIC_ADMIN_PASSWORD", "admin-pass")
+    app = create_app(AppSettings(yt_search_region_code="ES", app_secret_key="session-secret"))
+    stub = _AdminTaskStatusUseCaseStub(
+        TaskStatusResult(
+            fetch_last_timestamp=None,
+            daily_last_timestamp=None,
+            weekly_last_timestamp=None,
+            latest_status_by_method={"fetch": "success"},
+        )
+    )
+    app.dependency_overrides[get_admin_task_status_use_case] = lambda: stub
+
+    with TestClient(app) as client:
+        client.post("/admin/login", data={"password": "admin-pass"}, follow_redirects=False)
+        # Pin the clock so the requests fall in the same minute.
+        with patch("src.web.routes.admin.time.time", return_value=time.time()):
+            first = client.get("/admin/tasks/status")
+            etag = first.headers["etag"]
+            revalidated = client.get("/admin/tasks/status", headers={"If-None-Match": etag})
+            delta_revalidated = client.get("/admin/tasks/status?since=1", headers={"If-None-Match": etag})
+
+    app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert delta_revalidated.status_code == 200
+    # The 304 is answered from data_version() alone.
+    assert stub.executions == 2
+
+
+def test_admin_tasks_status_with_since_renders_only_new_timeline_events(monkeypatch) -> None:
+    monkeypatch.setenv("TOP_MUSIC_ADMIN_PASSWORD", "admin-pass")
+    now = datetime.now(UTC).timestamp()
+    app = create_app(AppSettings(yt_search_region_code="ES", app_secret_key="session-secret"))
+    app.dependency_overrides[get_admin_task_status_use_case] = lambda: _AdminTaskStatusUseCaseStub(
+        TaskStatusResult(
+            fetch_last_timestamp=now - 60,
+            daily_last_timestamp=None,
+            weekly_last_timestamp=None,
+            latest_status_by_method={"fetch": "failed"},
+            latest_error_by_method={"fetch": "quota"},
+            timeline_data={
+                "fetch": [
+                    {"status": "success", "timestamp": now - 3600, "error_message": None},
+                    {"status": "failed", "timestamp": now - 60, "error_message": "quota"},
+                ]
+            },
+        )
+    )
+
+    with TestClient(app) as client:
+        client.post("/admin/login", data={"password": "admin-pass"}, follow_redirects=False)
+        full = client.get("/admin/tasks/status")
+        delta = client.get("/admin/tasks/status", params={"since": now - 3600})
+
+    app.dependency_overrides.clear()
+
+    assert full.text.count('class="timeline-event"') == 2
+    assert f'name="since" value="{now - 60}"' in full.text
+    assert delta.status_code == 200
+    assert 'id="tasks-timeline" class="tasks-grid__fullrow" hx-preserve="true"' in delta.text
+    assert delta.text.count('class="timeline-event"') == 1
+    assert 'hx-swap-oob="beforeend:#timeline-events-fetch"' in delta.text
+    assert "2 events" in delta.text
+
+
+def test_admin_tasks_status_swaps_in_the_whole_timeline_once_events_age_out(monkeypatch) -> None:
+    monkeypatch.setenv("TOP_MUSIC_ADMIN_PASSWORD", "admin-pass")
+    now = datetime.now(UTC).timestamp()
+    app = create_app(AppSettings(yt_search_region_code="ES", app_secret_key="session-secret"))
+    app.dependency_overrides[get_admin_task_status_use_case] = lambda: _AdminTaskStatusUseCaseStub(
+        TaskStatusResult(
+            fetch_last_timestamp=now - 60,
+            daily_last_timestamp=None,
+            weekly_last_timestamp=None,
+            latest_status_by_method={"fetch": "success"},
+            timeline_data={"fetch": [{"status": "success", "timestamp": now - 60, "error_message": None}]},
+        )
+    )
+
+    with TestClient(app) as client:
+        client.post("/admin/login", data={"password": "admin-pass"}, follow_redirects=False)
+        # The client still shows an event from 8 days ago, which left the window.
+        response = client.get("/admin/tasks/status", params={"since": now - 60, "oldest": now - 8 * 86400})
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert "hx-preserve" not in response.text
+    assert response.text.count('class="timeline-event"') == 1
+    assert f'name="oldest" value="{now - 60}"' in response.text
+
+
 def test_admin_task_logs_requires_authenticated_session() -> None:
     app = create_app(AppSettings(yt_search_region_code="ES", app_secret_key="session-secret"))
 
@@ -705,3 +819,84 @@ def test_admin_task_trigger_fetch_rejects_publisher_filter(monkeypatch) -> None:
     assert login_response.status_code == 303
     assert response.status_code == 400
     assert "only supported for daily task" in response.text
+
+
+def test_admin_task_logs_stream_sends_appended_lines_then_completes(monkeypatch, tmp_path) -> None:
+    log_path = tmp_path / "top_music.log"
+    log_path.write_text("2026-05-16 10:00:00 [info] before\n")
+    monkeypatch.setenv("TOP_MUSIC_ADMIN_PASSWORD", "admin-pass")
+    app = create_app(
+        AppSettings(yt_search_region_code="ES", app_secret_key="session-secret", log_file_path=str(log_path))
+    )
+    task_status = _AdminTaskStatusUseCaseStub(
+        TaskStatusResult(
+            fetch_last_timestamp=None,
+            daily_last_timestamp=None,
+            weekly_last_timestamp=None,
+            latest_status_by_method={"fetch": "queued"},
+        )
+    )
+    app.dependency_overrides[get_admin_task_status_use_case] = lambda: task_status
+    task_runs = MagicMock(spec=["get_latest_task_event", "close"])
+    task_runs.get_latest_task_event.return_value = TaskRunState(
+        task_method=TaskMethod.FETCH, status=TaskRunStatus.SUCCESS, event_at=datetime.now(UTC)
+    )
+    monkeypatch.setattr("src.web.routes.admin.get_task_run_state_repo", lambda _settings: task_runs)
+
+    with TestClient(app) as client:
+        client.post("/admin/login", data={"password": "admin-pass"}, follow_redirects=False)
+        panel = client.get("/admin/tasks/logs/fetch")
+        cursor = re.search(r"cursor=([\d-]+)", panel.text)
+        with log_path.open("a") as log_file:
+            log_file.write("2026-05-16 10:00:01 [error] <boom> failed\n2026-05-16 10:00:02 [info] partial")
+        stream = client.get("/admin/tasks/logs/fetch/stream", headers={"Last-Event-ID": cursor[1] if cursor else ""})
+
+    app.dependency_overrides.clear()
+
+    assert "before" in panel.text
+    assert 'data-log-stream="/admin/tasks/logs/fetch/stream?cursor=' in panel.text
+    assert stream.headers["content-type"].startswith("text/event-stream")
+    events = stream.text.split("\n\n")
+    assert events[0].startswith("event: lines\nid: ")
+    assert "log-line--error" in events[0]
+    assert "&lt;boom&gt; failed" in events[0]
+    assert "before" not in stream.text
+    assert "partial" not in stream.text
+    assert events[1] == "event: complete\ndata: "
+    # The stream polls the latest event of its own store instead of building the whole task status.
+    task_runs.get_latest_task_event.assert_called_once_with(task_method=TaskMethod.FETCH)
+    task_runs.close.assert_called_once_with()
+    assert task_status.executions == 0
+
+
+def test_admin_task_logs_reads_the_latest_run_segment(monkeypatch, tmp_path) -> None:
+    log_path = tmp_path / "top_music.log"
+    log_path.write_text("2026-05-16 10:00:00 [info] interleaved line of another job\n")
+    segment = tmp_path / "runs" / "weekly" / "20260516T100000Z-abcd1234.jsonl"
+    segment.parent.mkdir(parents=True)
+    segment.write_text(
+        '{"event": "weekly.rendered", "clips": 5, "run_id": "20260516T100000Z-abcd1234", "run_task": "weekly",'
+        ' "level": "info", "timestamp": "2026-05-16 10:00:01"}\n'
+    )
+    monkeypatch.setenv("TOP_MUSIC_ADMIN_PASSWORD", "admin-pass")
+    app = create_app(
+        AppSettings(yt_search_region_code="ES", app_secret_key="session-secret", log_file_path=str(log_path))
+    )
+    app.dependency_overrides[get_admin_task_status_use_case] = lambda: _AdminTaskStatusUseCaseStub(
+        TaskStatusResult(
+            fetch_last_timestamp=None,
+            daily_last_timestamp=None,
+            weekly_last_timestamp=None,
+            latest_status_by_method={"weekly": "success"},
+        )
+    )
+
+    with TestClient(app) as client:
+        client.post("/admin/login", data={"password": "admin-pass"}, follow_redirects=False)
+        response = client.get("/admin/tasks/logs/weekly")
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert "2026-05-16 10:00:01 [info] weekly.rendered clips=5" in response.text
+    assert "another job" not in response.text
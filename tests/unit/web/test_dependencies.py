@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+from pathlib import Path
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
+from src.config.settings import StorageBackend, TimeSeriesSegmentPeriod
+from src.domain.models import TaskMethod
+from src.infrastructure.storage.sqlite_database import close_shared_databases
+from src.infrastructure.storage.sqlite_task_run_state_repository import SqliteTaskRunStateRepository
+from src.infrastructure.storage.timeseries_export import TimeSeriesExport, TimeSeriesSnapshotReader
+from src.infrastructure.storage.timeseries_rollup_store import TimeSeriesRollupStore
+from src.infrastructure.storage.timeseries_snapshot_store import DailySnapshotStore
 from src.web.dependencies import (
+    get_daily_snapshot_reader,
     get_operational_metrics_repo,
     get_operational_metrics_use_case,
+    get_task_run_state_repo,
+    get_timeseries_repo,
+    get_timeseries_rollup_reader,
     get_yt_client,
 )
 
@@ -29,6 +41,16 @@ class _OperationalMetricsRepo:
         self.retention_days = retention_days
 
 
+class _TaskRunStateRepo:
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+
+
+class _TimeSeriesRepo:
+    def __init__(self, db_path: str, **_kwargs: object) -> None:
+        self.db_path = db_path
+
+
 class _OperationalMetricsUseCase:
     def __init__(self, metrics_repo: object, *, window_hours: int = 24) -> None:
         self.metrics_repo = metrics_repo
@@ -58,32 +80,40 @@ def test_get_yt_client_returns_fake_client(monkeypatch: pytest.MonkeyPatch) -> N
 
 
 def test_get_operational_metrics_repo_uses_production_path(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("src.web.dependencies.TinyFluxOperationalMetricsRepository", _OperationalMetricsRepo)
+    monkeypatch.setattr(
+        "src.infrastructure.storage.storage_backend.OperationalMetricsRepository", _OperationalMetricsRepo
+    )
     settings = SimpleNamespace(
+        storage_service_socket=None,
+        storage_backend=StorageBackend.FILES,
         is_production_env=True,
-        db_timeseries_file="db/db_timeseries.csv",
+        db_metrics_file="db/db_metrics.csv",
         operational_metrics_retention_days=90,
     )
 
     repo = get_operational_metrics_repo(settings)
 
     assert isinstance(repo, _OperationalMetricsRepo)
-    assert repo.db_path == "db/db_timeseries.csv"
+    assert repo.db_path == "db/db_metrics.csv"
     assert repo.retention_days == 90
 
 
 def test_get_operational_metrics_repo_uses_test_path_in_non_production(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("src.web.dependencies.TinyFluxOperationalMetricsRepository", _OperationalMetricsRepo)
+    monkeypatch.setattr(
+        "src.infrastructure.storage.storage_backend.OperationalMetricsRepository", _OperationalMetricsRepo
+    )
     settings = SimpleNamespace(
+        storage_service_socket=None,
+        storage_backend=StorageBackend.FILES,
         is_production_env=False,
-        db_timeseries_file="db/db_timeseries.csv",
+        db_metrics_file="db/db_metrics.csv",
         operational_metrics_retention_days=30,
     )
 
     repo = get_operational_metrics_repo(settings)
 
     assert isinstance(repo, _OperationalMetricsRepo)
-    assert repo.db_path == "db/db_timeseries.csv.test"
+    assert repo.db_path == "db/db_metrics.csv.test"
     assert repo.retention_days == 30
 
 
@@ -97,3 +127,81 @@ def test_get_operational_metrics_use_case_uses_configured_window(monkeypatch: py
     assert isinstance(use_case, _OperationalMetricsUseCase)
     assert use_case.metrics_repo is repo
     assert use_case.window_hours == 48
+
+
+def test_get_task_run_state_repo_uses_dedicated_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.infrastructure.storage.storage_backend.TaskRunStateRepository", _TaskRunStateRepo)
+    settings = SimpleNamespace(
+        storage_service_socket=None,
+        storage_backend=StorageBackend.FILES,
+        is_production_env=True,
+        db_task_runs_file="db/db_task_runs.csv",
+    )
+
+    repo = get_task_run_state_repo(settings)
+
+    assert isinstance(repo, _TaskRunStateRepo)
+    assert repo.db_path == "db/db_task_runs.csv"
+
+
+def test_get_task_run_state_repo_uses_sqlite_backend(tmp_path: Path) -> None:
+    settings = SimpleNamespace(
+        storage_service_socket=None,
+        storage_backend=StorageBackend.SQLITE,
+        is_production_env=False,
+        db_sqlite_file=str(tmp_path / "db.sqlite3"),
+    )
+
+    try:
+        repo = get_task_run_state_repo(settings)
+        other = get_task_run_state_repo(settings)
+        repo.close()
+
+        assert isinstance(repo, SqliteTaskRunStateRepository)
+        # Every request runs on the process-wide connection, which a repository's close() leaves open.
+        assert other.get_latest_task_event(task_method=TaskMethod.FETCH) is None
+        assert (tmp_path / "db.sqlite3.test").exists()
+        assert not (tmp_path / "db.sqlite3").exists()
+    finally:
+        close_shared_databases()
+
+
+def test_get_timeseries_repo_prefers_shared_export_reader(tmp_path: Path) -> None:
+    db_timeseries_file = str(tmp_path / "db_timeseries.csv")
+    TimeSeriesExport.for_timeseries_file(db_timeseries_file).rebuild([])
+    settings = SimpleNamespace(
+        storage_backend=StorageBackend.FILES,
+        db_timeseries_file=db_timeseries_file,
+        timeseries_segment_period=TimeSeriesSegmentPeriod.NONE,
+    )
+
+    first = get_timeseries_repo(settings)
+    second = get_timeseries_repo(settings)
+
+    assert isinstance(first, TimeSeriesSnapshotReader)
+    assert first is second
+
+
+def test_get_timeseries_repo_falls_back_to_tinyflux_without_export(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.infrastructure.storage.storage_backend.TimeSeriesRepository", _TimeSeriesRepo)
+    settings = SimpleNamespace(
+        storage_backend=StorageBackend.FILES,
+        db_timeseries_file=str(tmp_path / "db_timeseries.csv"),
+        timeseries_segment_period=TimeSeriesSegmentPeriod.NONE,
+    )
+
+    repo = get_timeseries_repo(settings)
+
+    assert isinstance(repo, _TimeSeriesRepo)
+
+
+def test_snapshot_and_rollup_readers_only_exist_for_the_files_backend(tmp_path: Path) -> None:
+    files = SimpleNamespace(storage_backend=StorageBackend.FILES, db_timeseries_file=str(tmp_path / "ts.csv"))
+    sqlite = SimpleNamespace(storage_backend=StorageBackend.SQLITE, db_timeseries_file=str(tmp_path / "ts.csv"))
+
+    assert isinstance(get_daily_snapshot_reader(files), DailySnapshotStore)
+    assert isinstance(get_timeseries_rollup_reader(files), TimeSeriesRollupStore)
+    assert get_daily_snapshot_reader(sqlite) is None
+    assert get_timeseries_rollup_reader(sqlite) is None
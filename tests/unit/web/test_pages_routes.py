@@ -8,8 +8,9 @@ from fastapi.testclient import TestClient
 
 from src.application.get_top_videos_dashboard_use_case import GetTopVideosDashboardResult, GetTopVideosDashboardUseCase
 from src.config.settings import AppSettings
-from src.domain.models import Channel, Video
-from src.web.dependencies import get_top_videos_dashboard_use_case
+from src.domain.models import CanonicalVideo, Channel, Video
+from src.infrastructure.storage.video_repository import VideoRepository
+from src.web.dependencies import get_top_videos_dashboard_use_case, get_video_repo
 from src.web.main import create_app
 
 
@@ -131,3 +132,25 @@ def test_index_renders_dashboard_error_message() -> None:
     assert response.status_code == 200
     assert "timeseries-error" in response.text
     assert "No video timeseries for today; run fetch script first" in response.text
+
+
+def test_search_videos_returns_matching_videos() -> None:
+    searcher = create_autospec(VideoRepository, instance=True)
+    searcher.search_text.return_value = [
+        CanonicalVideo(video_id="video-1", title="A Sample Song", channel_name="Channel A", views=1234)
+    ]
+    app = create_app(AppSettings(env="prod", yt_search_region_code="ES"))
+    app.dependency_overrides[get_video_repo] = lambda: searcher
+
+    with TestClient(app) as client:
+        response = client.get("/videos/search", params={"q": "sample", "limit": 5})
+        invalid = client.get("/videos/search", params={"q": ""})
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"video_id": "video-1", "title": "A Sample Song", "channel_name": "Channel A", "views": 1234}
+    ]
+    searcher.search_text.assert_called_once_with("sample", limit=5)
+    assert invalid.status_code == 422
@@ -208,6 +208,67 @@ def test_build_admin_tasks_view_model_enriches_timeline_error_summary() -> None:
     assert event["timestamp_full"].endswith("+00:00")
 
 
+def _timeline_result(timeline_data: dict[str, list[dict]]) -> TaskStatusResult:
+    return TaskStatusResult(
+        fetch_last_timestamp=None,
+        daily_last_timestamp=None,
+        weekly_last_timestamp=None,
+        timeline_data=timeline_data,
+    )
+
+
+def test_build_admin_tasks_view_model_timeline_delta_appends_new_events_and_refreshes_open_run() -> None:
+    now = datetime.now(UTC).timestamp()
+    fetch_events = [
+        {"status": "queued", "timestamp": now - 600, "error_message": None},
+        {"status": "success", "timestamp": now - 540, "error_message": None},
+        {"status": "queued", "timestamp": now - 120, "error_message": None},
+        {"status": "failed", "timestamp": now - 60, "error_message": "quota"},
+    ]
+    daily_events = [{"status": "success", "timestamp": now - 3600, "error_message": None}]
+    result = _timeline_result({"fetch": fetch_events, "daily": daily_events})
+    full_vm = build_admin_tasks_view_model(result)
+
+    # The client last saw the second fetch run while it was still queued.
+    tasks_vm = build_admin_tasks_view_model(result, since=now - 120)
+
+    delta = tasks_vm.timeline_delta
+    assert delta is not None
+    assert tasks_vm.timeline_data == {}
+    assert tasks_vm.timeline_cursor == now - 60
+    assert delta.refreshed == {"fetch": [full_vm.timeline_data["fetch"][2]]}
+    assert delta.refreshed["fetch"][0]["duration_label"] is None
+    assert delta.appended == {"fetch": [full_vm.timeline_data["fetch"][3]]}
+    assert delta.appended["fetch"][0]["run_label"] == "Run 02"
+    assert delta.counts == {"fetch": 4}
+
+
+def test_build_admin_tasks_view_model_timeline_delta_is_empty_when_nothing_changed() -> None:
+    now = datetime.now(UTC).timestamp()
+    result = _timeline_result({"fetch": [{"status": "success", "timestamp": now - 60, "error_message": None}]})
+
+    tasks_vm = build_admin_tasks_view_model(result, since=now - 60)
+
+    assert tasks_vm.timeline_delta is not None
+    assert not tasks_vm.timeline_delta.appended
+    assert not tasks_vm.timeline_delta.refreshed
+
+
+def test_build_admin_tasks_view_model_falls_back_to_full_timeline_for_a_new_card() -> None:
+    now = datetime.now(UTC).timestamp()
+    result = _timeline_result(
+        {
+            "fetch": [{"status": "success", "timestamp": now - 600, "error_message": None}],
+            "weekly": [{"status": "queued", "timestamp": now - 10, "error_message": None}],
+        }
+    )
+
+    tasks_vm = build_admin_tasks_view_model(result, since=now - 600)
+
+    assert tasks_vm.timeline_delta is None
+    assert set(tasks_vm.timeline_data) == {"fetch", "weekly"}
+
+
 # ---------------------------------------------------------------------------
 # build_admin_publishers_view_model — exhaustive coverage
 # ---------------------------------------------------------------------------